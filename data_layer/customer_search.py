@@ -0,0 +1,188 @@
+"""
+SaleFlex.PyPOS - Customer full-text search index
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import column, literal_column, table
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CUSTOMER_SEARCH_TABLE = "customer_search"
+
+# Separators cashiers type inside phone numbers; stripped in SQL so the
+# ``phone`` column holds digit runs only.
+_PHONE_SEPARATORS = (" ", "-", "(", ")", "+", ".", "/")
+
+
+def _phone_digits_sql(expr: str) -> str:
+    for sep in _PHONE_SEPARATORS:
+        expr = f"replace({expr}, '{sep}', '')"
+    return expr
+
+
+# One FTS5 row per searchable customer, stored under the customer's SQLite rowid.
+# ``phone`` holds the normalized key and the digits of the number as entered,
+# so both "+90 532 ..." and "0532..." style queries prefix-match.
+_CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {CUSTOMER_SEARCH_TABLE} USING fts5(
+    name, last_name, email, phone,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+_SELECT_COLUMNS = f"""
+    SELECT c.rowid, c.name, c.last_name, lower(c.email_address),
+           trim(coalesce(c.phone_normalized, '') || ' ' || coalesce({_phone_digits_sql('c.phone_number')}, ''))
+      FROM customer c
+"""
+
+_LIVE_FILTER = "c.is_deleted = 0 AND c.is_walkin = 0"
+
+_REINDEX_SQL = f"""
+    DELETE FROM {CUSTOMER_SEARCH_TABLE} WHERE rowid = {{rowid}};
+    INSERT INTO {CUSTOMER_SEARCH_TABLE} (rowid, name, last_name, email, phone)
+    {_SELECT_COLUMNS}
+     WHERE c.rowid = {{rowid}} AND {_LIVE_FILTER};
+"""
+
+_TRIGGERS = {
+    "trg_customer_search_ai":
+        "AFTER INSERT ON customer BEGIN"
+        + _REINDEX_SQL.format(rowid="NEW.rowid") + " END",
+    "trg_customer_search_au":
+        "AFTER UPDATE OF name, last_name, email_address, phone_number, phone_normalized,"
+        " is_deleted, is_walkin ON customer BEGIN"
+        + _REINDEX_SQL.format(rowid="NEW.rowid") + " END",
+    "trg_customer_search_ad":
+        f"AFTER DELETE ON customer BEGIN DELETE FROM {CUSTOMER_SEARCH_TABLE} WHERE rowid = OLD.rowid; END",
+}
+
+_REBUILD_SQL = f"""
+    INSERT INTO {CUSTOMER_SEARCH_TABLE} (rowid, name, last_name, email, phone)
+    {_SELECT_COLUMNS}
+     WHERE {_LIVE_FILTER}
+"""
+
+# Set by ensure_customer_search_index(); None until checked.
+_available: Optional[bool] = None
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_PHONE_LIKE_RE = re.compile(r"^[\d\s+\-().\/]+$")
+_MIN_PHONE_DIGITS = 3
+
+search_table = table(CUSTOMER_SEARCH_TABLE, column("rowid"), column("rank"))
+
+
+def ensure_customer_search_index(connection) -> bool:
+    """
+    Create the FTS5 table, its sync triggers and the list ordering index, and
+    (re)fill the table when it does not match the searchable customer count.
+    Returns False when SQLite lacks FTS5.
+    """
+    global _available
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='customer'"
+    ).fetchone()
+    if not exists:
+        return False
+
+    # The unfiltered list is paged in (last_name, name) order
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS idx_customer_last_name_name ON customer (last_name, name)"
+    )
+    try:
+        connection.exec_driver_sql(_CREATE_TABLE)
+    except SQLAlchemyError as exc:
+        logger.warning("Customer full-text search unavailable (FTS5 missing?): %s", exc)
+        _available = False
+        return False
+
+    for name, body in _TRIGGERS.items():
+        connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    indexed = connection.exec_driver_sql(f"SELECT count(*) FROM {CUSTOMER_SEARCH_TABLE}").scalar()
+    live = connection.exec_driver_sql(f"SELECT count(*) FROM customer c WHERE {_LIVE_FILTER}").scalar()
+    if indexed != live:
+        rebuild_customer_search_index(connection)
+        logger.info("✓ Customer search index rebuilt (%s customers)", live)
+    _available = True
+    return True
+
+
+def rebuild_customer_search_index(connection) -> None:
+    """Refill the FTS5 table from customer."""
+    connection.exec_driver_sql(f"DELETE FROM {CUSTOMER_SEARCH_TABLE}")
+    connection.exec_driver_sql(_REBUILD_SQL)
+
+
+def is_available(session=None) -> bool:
+    """Whether the FTS5 table exists (checked once via ``session`` if not yet known)."""
+    global _available
+    if _available is None and session is not None:
+        _available = bool(session.connection().exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (CUSTOMER_SEARCH_TABLE,)
+        ).fetchone())
+    return bool(_available)
+
+
+def match_expression(search_term: str, normalized_phone: Optional[str] = None) -> Optional[str]:
+    """
+    FTS5 query for ``search_term``.
+
+    A term made of digits and phone punctuation (at least three digits) is
+    matched as a prefix of the ``phone`` column, either as typed or as
+    ``normalized_phone`` (``LoyaltyService.normalize_phone`` of the term). Any
+    other term needs every word to prefix-match a name, last name or e-mail
+    token, e.g. ``"ann smi"`` -> ``{name last_name email} : "ann"* ...``.
+    None when the term has no words.
+    """
+    term = (search_term or "").strip()
+    digits = "".join(ch for ch in term if ch.isdigit())
+    if _PHONE_LIKE_RE.match(term) and len(digits) >= _MIN_PHONE_DIGITS:
+        keys = dict.fromkeys(k for k in (digits, normalized_phone) if k)
+        return "phone : (" + " OR ".join(f'"{k}"*' for k in keys) + ")"
+
+    tokens = _TOKEN_RE.findall(term)
+    if not tokens:
+        return None
+    return " ".join(f'{{name last_name email}} : "{token}"*' for token in tokens)
+
+
+def filter_customers(query, customer_model, search_term: str, normalized_phone: Optional[str] = None):
+    """Restrict a ``Customer`` query to FTS matches of ``search_term``."""
+    expression = match_expression(search_term, normalized_phone)
+    return query.join(
+        search_table,
+        search_table.c.rowid == literal_column(f"{customer_model.__tablename__}.rowid"),
+    ).filter(literal_column(CUSTOMER_SEARCH_TABLE).match(expression))
+
+
+__all__ = [
+    "CUSTOMER_SEARCH_TABLE",
+    "ensure_customer_search_index",
+    "filter_customers",
+    "is_available",
+    "match_expression",
+    "rebuild_customer_search_index",
+    "search_table",
+]
@@ -114,6 +114,72 @@ def _ensure_cashier_schema(temp_engine: Engine) -> None:
             )
 
 
+def _ensure_sync_queue_schema(temp_engine: Engine) -> None:
+    """Add the outbox retry-scheduling column to existing sync_queue_item tables."""
+    with temp_engine.engine.begin() as connection:
+        columns = {
+            row[1]
+            for row in connection.exec_driver_sql("PRAGMA table_info(sync_queue_item)").fetchall()
+        }
+        if columns and "next_attempt_at" not in columns:
+            connection.exec_driver_sql(
+                "ALTER TABLE sync_queue_item ADD COLUMN next_attempt_at DATETIME"
+            )
+
+
+def _ensure_coupon_lookup_indexes(temp_engine: Engine) -> None:
+    """
+    Create coupon lookup indexes on existing databases.
+
+    metadata.create_all() only adds indexes together with a new table; databases
+    created before the indexes were declared get them here.
+    """
+    with temp_engine.engine.begin() as connection:
+        tables = {
+            row[0]
+            for row in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ).fetchall()
+        }
+        if "coupon" in tables:
+            connection.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_coupon_code_upper ON coupon (upper(code))"
+            )
+            connection.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_coupon_barcode ON coupon (barcode)"
+            )
+        if "coupon_usage" in tables:
+            connection.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_coupon_usage_coupon_customer "
+                "ON coupon_usage (fk_coupon_id, fk_customer_id)"
+            )
+
+
+def _ensure_product_search_index(temp_engine: Engine) -> None:
+    """
+    Create the product FTS5 search table and its sync triggers.
+
+    The table is filled from the product tables whenever it is out of step with
+    them (first run on an existing database); afterwards the triggers keep it
+    current.
+    """
+    from data_layer.product_search import ensure_product_search_index
+
+    with temp_engine.engine.begin() as connection:
+        ensure_product_search_index(connection)
+
+
+def _ensure_customer_search_index(temp_engine: Engine) -> None:
+    """
+    Create the customer FTS5 search table (name, last name, e-mail and phone
+    digits) and its sync triggers, filling it on first run like the product index.
+    """
+    from data_layer.customer_search import ensure_customer_search_index
+
+    with temp_engine.engine.begin() as connection:
+        ensure_customer_search_index(connection)
+
+
 def _is_new_database() -> bool:
     """
     Return True when the configured SQLite database file does not yet exist.
@@ -139,7 +205,7 @@ def _seed_from_office(temp_engine: Engine) -> bool:
         OfficeConnectionError,
         OfficeAuthError,
     )
-    from data_layer.office_seeder import seed_from_office_data
+    from data_layer.office_seeder import seed_from_office_stream
 
     try:
         client = OfficeClient()
@@ -154,10 +220,10 @@ def _seed_from_office(temp_engine: Engine) -> bool:
             return False
 
         logger.info("Fetching initialization data from SaleFlex.OFFICE...")
-        init_data = client.fetch_init_data()
+        resources = client.stream_init_data()
 
         logger.info("Populating local database from OFFICE data...")
-        seed_from_office_data(temp_engine, init_data)
+        seed_from_office_stream(temp_engine, resources)
         return True
 
     except OfficeConnectionError as exc:
@@ -196,6 +262,10 @@ def init_db():
         metadata.create_all(bind=temp_engine.engine)
         _ensure_cashier_schema(temp_engine)
         _ensure_office_push_queue_schema(temp_engine)
+        _ensure_sync_queue_schema(temp_engine)
+        _ensure_coupon_lookup_indexes(temp_engine)
+        _ensure_product_search_index(temp_engine)
+        _ensure_customer_search_index(temp_engine)
         logger.info("✓ Tables created successfully")
 
         if is_new_db:
@@ -249,6 +319,10 @@ def create_tables():
         metadata.create_all(bind=temp_engine.engine)
         _ensure_cashier_schema(temp_engine)
         _ensure_office_push_queue_schema(temp_engine)
+        _ensure_sync_queue_schema(temp_engine)
+        _ensure_coupon_lookup_indexes(temp_engine)
+        _ensure_product_search_index(temp_engine)
+        _ensure_customer_search_index(temp_engine)
         logger.info("✓ Tables created successfully")
         
         return True
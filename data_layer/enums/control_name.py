@@ -112,10 +112,10 @@ class ControlName(enum.Enum):
     
     Closure History Controls:
     ------------------------
-    CLOSURE: DataGrid in the CLOSURE form listing historical closures; stores _closure_ids for selection.
+    CLOSURE: DataGrid in the CLOSURE form listing historical closures; get_selected_key() returns the selected closure id.
     CLOSURE_DETAIL_GRID: Key/value DataGrid in CLOSURE_DETAIL form showing selected closure summary.
     CLOSURE_RECEIPTS_DATAGRID: DataGrid in CLOSURE_RECEIPTS form listing receipts for a closure;
-                                stores _receipt_ids for selection.
+                                get_selected_key() returns the selected receipt id.
     CLOSURE_RECEIPT_DETAIL_GRID: Key/value DataGrid in CLOSURE_RECEIPT_DETAIL form showing receipt
                                   header fields (dates, totals, status, currency).
     CLOSURE_RECEIPT_ITEMS_GRID:  DataGrid in CLOSURE_RECEIPT_DETAIL form listing sold line items
@@ -135,4 +135,5 @@ from data_layer.model.definition.sync_queue_item import SyncQueueItem
 from data_layer.model.definition.gate_notification import GateNotification
 from data_layer.model.definition.office_push_queue import OfficePushQueue
 from data_layer.model.definition.office_closure_push_queue import OfficeClosurePushQueue
+from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
 
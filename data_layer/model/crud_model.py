@@ -63,40 +63,70 @@ class CRUD:
         try:
             engine = self._get_engine()
             with engine.get_session() as session:
-                if hasattr(self, 'id') and self.id is None:
-                    self.id = uuid4()
+                self._save_in_session(session)
+                session.commit()
+                return True
+        except SQLAlchemyError as e:
+            logger.error("Save operation error: %s", e)
+            raise DatabaseError(f"Save operation failed: {e}") from e
 
-                # Build a dict of all non-PK column values for the UPDATE
-                try:
-                    mapper = sa_inspect(type(self))
-                    update_dict = {
-                        col.key: getattr(self, col.key)
-                        for col in mapper.column_attrs
-                        if col.key != 'id' and hasattr(self, col.key)
-                    }
-                except Exception:
-                    update_dict = {}
-
-                if update_dict and hasattr(self, 'id') and self.id is not None:
-                    # Try UPDATE first
-                    result = session.execute(
-                        sql_update(type(self))
-                        .where(type(self).id == self.id)
-                        .values(**update_dict)
-                    )
-                    session.flush()
-                    if result.rowcount == 0:
-                        # Record not in DB yet — INSERT it
-                        session.add(self)
-                else:
-                    session.add(self)
+    @staticmethod
+    def save_all(records, session=None) -> bool:
+        """
+        Saves several records (any mix of models) in one transaction.
 
+        Same UPDATE-then-INSERT strategy as save(); all records are committed
+        together or not at all.  Records are written in list order, so a row
+        may reference one listed before it.  With *session* the records are
+        written into the caller's open session and persisted by its commit.
+        """
+        records = [r for r in records if r is not None]
+        if not records:
+            return True
+        try:
+            if session is not None:
+                for record in records:
+                    record._save_in_session(session)
+                return True
+            engine = records[0]._get_engine()
+            with engine.get_session() as session:
+                for record in records:
+                    record._save_in_session(session)
                 session.commit()
                 return True
         except SQLAlchemyError as e:
             logger.error("Save operation error: %s", e)
             raise DatabaseError(f"Save operation failed: {e}") from e
 
+    def _save_in_session(self, session) -> None:
+        if hasattr(self, 'id') and self.id is None:
+            self.id = uuid4()
+
+        # Build a dict of all non-PK column values for the UPDATE
+        try:
+            mapper = sa_inspect(type(self))
+            update_dict = {
+                col.key: getattr(self, col.key)
+                for col in mapper.column_attrs
+                if col.key != 'id' and hasattr(self, col.key)
+            }
+        except Exception:
+            update_dict = {}
+
+        if update_dict and hasattr(self, 'id') and self.id is not None:
+            # Try UPDATE first
+            result = session.execute(
+                sql_update(type(self))
+                .where(type(self).id == self.id)
+                .values(**update_dict)
+            )
+            session.flush()
+            if result.rowcount == 0:
+                # Record not in DB yet — INSERT it
+                session.add(self)
+        else:
+            session.add(self)
+
     def create(self) -> bool:
         """
         Creates a new record.
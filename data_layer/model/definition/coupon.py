@@ -16,7 +16,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, UUID, Text, ForeignKey, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, UUID, Text, ForeignKey, Integer, Index
 from sqlalchemy.sql import func
 from uuid import uuid4
 
@@ -97,3 +97,8 @@ class Coupon(Model, CRUD, AuditMixin, SoftDeleteMixin):
     def __repr__(self):
         return f"<Coupon(code='{self.code}', name='{self.name}', type='{self.coupon_type}')>"
 
+    __table_args__ = (
+        # Case-insensitive code lookup and barcode scans (CouponActivationService.find_coupon_by_raw)
+        Index('idx_coupon_code_upper', func.upper(code)),
+        Index('idx_coupon_barcode', 'barcode'),
+    )
@@ -16,7 +16,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, UUID, ForeignKey, Numeric, Text
+from sqlalchemy import Column, String, Boolean, DateTime, UUID, ForeignKey, Numeric, Text, Index
 from sqlalchemy.sql import func
 from uuid import uuid4
 
@@ -62,3 +62,6 @@ class CouponUsage(Model, CRUD, AuditMixin, SoftDeleteMixin):
     def __repr__(self):
         return f"<CouponUsage(coupon_id='{self.fk_coupon_id}', customer_id='{self.fk_customer_id}', amount={self.discount_amount})>"
 
+    __table_args__ = (
+        Index('idx_coupon_usage_coupon_customer', 'fk_coupon_id', 'fk_customer_id'),
+    )
@@ -103,13 +103,13 @@ class GateNotification(Model, CRUD):
         Returns:
             List of GateNotification instances with is_read=False.
         """
-        # TODO: Implement DB query.
-        # with Engine().get_session() as session:
-        #     return (session.query(cls)
-        #             .filter(cls.is_read == False)
-        #             .order_by(cls.received_at)
-        #             .all())
-        return []
+        from data_layer.engine import Engine
+
+        with Engine().get_session() as session:
+            return (session.query(cls)
+                    .filter(cls.is_read.is_(False))
+                    .order_by(cls.received_at)
+                    .all())
 
     def mark_read(self) -> None:
         """Mark this notification as read and record the timestamp."""
@@ -10,6 +10,10 @@ Status values
 pending  – Created, not yet sent to OFFICE.
 sent     – Successfully received and acknowledged by OFFICE.
 failed   – Last attempt failed; will be retried.
+unconfirmed – OFFICE accepted part of the batch without saying which
+           transactions; not retried automatically, since re-sending could
+           post a sale twice.  Reconcile with OFFICE, then set back to
+           pending (or sent).
 Copyright (C) 2025-2026 Mousavi.Tech
 
 This program is free software: you can redistribute it and/or modify
@@ -69,7 +73,7 @@ class OfficePushQueue(Model, CRUD, AuditMixin, SoftDeleteMixin):
     )
     transaction_unique_id = Column(String(50), nullable=False, index=True)
 
-    # Synchronisation state: 'pending' | 'sent' | 'failed'
+    # Synchronisation state: 'pending' | 'sent' | 'failed' | 'unconfirmed'
     status = Column(String(20), nullable=False, default="pending", index=True)
 
     retry_count     = Column(Integer,  nullable=False, default=0)
@@ -0,0 +1,47 @@
+"""
+SaleFlex.PyPOS - Office Sync Watermark Model
+
+Remembers, per master-data resource (``products``, ``cashiers`` …), the opaque
+change watermark SaleFlex.OFFICE returned with the last applied sync, so the
+next refresh only asks OFFICE for rows changed or deleted since then.
+SaleFlex.GATE pulls keep their positions here too, under ``gate.*`` keys.
+"""
+
+from sqlalchemy import Column, String, DateTime, UUID
+from uuid import uuid4
+
+from data_layer.model.crud_model import Model
+from data_layer.model.crud_model import CRUD
+from data_layer.model.mixins import AuditMixin, SoftDeleteMixin
+
+
+class OfficeSyncWatermark(Model, CRUD, AuditMixin, SoftDeleteMixin):
+    """
+    One row per OFFICE resource key of the ``/pos/init`` payload.
+
+    Written by the office seeder after a full seed / reseed (when OFFICE sends
+    watermarks) and after every applied delta sync, and by GatePullService
+    after a product / campaign pull or a notification long-poll.
+    """
+
+    def __init__(self, resource: str = None, watermark: str = None, synced_at=None):
+        Model.__init__(self)
+        CRUD.__init__(self)
+
+        self.resource  = resource
+        self.watermark = watermark
+        self.synced_at = synced_at
+
+    __tablename__ = "office_sync_watermark"
+
+    id = Column(UUID, primary_key=True, default=uuid4)
+
+    resource  = Column(String(100), nullable=False, unique=True)
+    watermark = Column(String(200), nullable=True)
+    synced_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<OfficeSyncWatermark(resource='{self.resource}', "
+            f"watermark='{self.watermark}')>"
+        )
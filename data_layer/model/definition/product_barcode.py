@@ -16,7 +16,7 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UUID, Numeric
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UUID, Numeric, Index
 from sqlalchemy.sql import func
 from uuid import uuid4
 
@@ -48,5 +48,9 @@ class ProductBarcode(Model, CRUD, AuditMixin, SoftDeleteMixin):
     purchase_price = Column(Numeric(precision=15, scale=4), nullable=True, default=0)
     sale_price = Column(Numeric(precision=15, scale=4), nullable=True, default=0)
 
+    __table_args__ = (
+        Index('idx_product_barcode_product', 'fk_product_id'),
+    )
+
     def __repr__(self):
         return f"<ProductBarcode(barcode='{self.barcode}', sale_price='{self.sale_price}')>"
@@ -5,7 +5,8 @@ Implements the offline outbox pattern for the integration layer.
 Every event that must be sent to an external system (GATE, ERP, payment
 gateway) is first written as a SyncQueueItem row with status="pending".
 SyncWorker processes the queue in the background and updates the status to
-"sent" on success or increments retry_count on failure.
+"sent" on success, or increments retry_count and schedules the next attempt
+on failure; items that exhaust their retries are dead-lettered.
 Copyright (C) 2025-2026 Mousavi.Tech
 
 This program is free software: you can redistribute it and/or modify
@@ -26,9 +27,10 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, or_
 from sqlalchemy.sql import func
 
 from data_layer.model.crud_model import Model, CRUD
@@ -39,9 +41,10 @@ class SyncQueueItem(Model, CRUD):
     Offline outbox record for the integration layer.
 
     Status flow:
-        pending → sent       (happy path)
-        pending → failed     (all retries exhausted)
-        failed  → pending    (manual reset for retry)
+        pending     → sent         (happy path)
+        pending     → pending      (rejected; retried from next_attempt_at)
+        pending     → dead_letter  (max_retries exhausted)
+        dead_letter → pending      (manual requeue, see requeue_dead_letters)
 
     Connector types:
         "gate"          → SaleFlex.GATE (transactions, closures, warehouse)
@@ -60,6 +63,10 @@ class SyncQueueItem(Model, CRUD):
 
     __tablename__ = "sync_queue_item"
 
+    STATUS_PENDING     = "pending"
+    STATUS_SENT        = "sent"
+    STATUS_DEAD_LETTER = "dead_letter"
+
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
 
     # Routing fields
@@ -74,6 +81,8 @@ class SyncQueueItem(Model, CRUD):
     retry_count   = Column(Integer, nullable=False, default=0)
     max_retries   = Column(Integer, nullable=False, default=3)
     error_message = Column(Text, nullable=True)
+    # Earliest time of the next push attempt (NULL = as soon as possible)
+    next_attempt_at = Column(DateTime, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime, server_default=func.now())
@@ -86,7 +95,8 @@ class SyncQueueItem(Model, CRUD):
 
     @classmethod
     def create_pending(cls, connector_type: str, event_type: str,
-                       payload: dict) -> "SyncQueueItem":
+                       payload: dict, max_retries: int = 3,
+                       session=None) -> "SyncQueueItem":
         """
         Create and persist a new pending outbox item.
 
@@ -94,37 +104,89 @@ class SyncQueueItem(Model, CRUD):
             connector_type: Routing key ("gate", "gate_erp", "erp", …).
             event_type:     Event category ("transaction", "closure", …).
             payload:        Data dict to be serialised as JSON.
+            max_retries:    Rejected attempts before the item is dead-lettered.
+            session:        Open session to add the item to; the caller's commit
+                            then persists it together with its own changes.
+                            Without one the item is saved immediately.
 
         Returns:
-            Persisted SyncQueueItem instance.
+            SyncQueueItem instance.
         """
         item = cls()
+        item.id = str(uuid4())
         item.connector_type = connector_type
         item.event_type = event_type
-        item.payload = json.dumps(payload)
-        item.status = "pending"
-        item.save()
+        item.payload = cls.encode_payload(payload)
+        item.status = cls.STATUS_PENDING
+        item.retry_count = 0
+        item.max_retries = max_retries
+        # UTC like the column default, but to the microsecond so items queued
+        # within the same second keep their enqueue order
+        item.created_at = datetime.utcnow()
+        if session is not None:
+            session.add(item)
+        else:
+            item.save()
         return item
 
+    @staticmethod
+    def encode_payload(payload: dict) -> str:
+        """Serialise *payload* canonically, so equal payloads compare equal as text."""
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
     @classmethod
-    def get_pending(cls, connector_type: str | None = None):
+    def get_pending(cls, connector_type: str | None = None,
+                    limit: Optional[int] = None,
+                    due_before: Optional[datetime] = None):
         """
-        Return all pending items, optionally filtered by connector_type.
+        Return pending items in enqueue order, optionally filtered by connector_type.
 
         Args:
             connector_type: If provided, filter by this connector.
+            limit:          Maximum number of items returned.
+            due_before:     Only items whose next attempt is due by this time.
 
         Returns:
             List of SyncQueueItem instances with status="pending".
         """
-        # TODO: Implement DB query using SQLAlchemy session.
-        # Example:
-        # with Engine().get_session() as session:
-        #     q = session.query(cls).filter(cls.status == "pending")
-        #     if connector_type:
-        #         q = q.filter(cls.connector_type == connector_type)
-        #     return q.order_by(cls.created_at).all()
-        return []
+        from data_layer.engine import Engine
+
+        with Engine().get_session() as session:
+            q = session.query(cls).filter(cls.status == cls.STATUS_PENDING)
+            if connector_type:
+                q = q.filter(cls.connector_type == connector_type)
+            if due_before is not None:
+                q = q.filter(or_(cls.next_attempt_at.is_(None),
+                                 cls.next_attempt_at <= due_before))
+            q = q.order_by(cls.created_at, cls.id)
+            if limit:
+                q = q.limit(limit)
+            return q.all()
+
+    @classmethod
+    def requeue_dead_letters(cls, connector_type: str | None = None) -> int:
+        """
+        Move dead-lettered items back to pending with a fresh retry budget.
+
+        Returns:
+            Number of items requeued.
+        """
+        from data_layer.engine import Engine
+
+        with Engine().get_session() as session:
+            q = session.query(cls).filter(cls.status == cls.STATUS_DEAD_LETTER)
+            if connector_type:
+                q = q.filter(cls.connector_type == connector_type)
+            count = q.update(
+                {
+                    cls.status: cls.STATUS_PENDING,
+                    cls.retry_count: 0,
+                    cls.next_attempt_at: None,
+                },
+                synchronize_session=False,
+            )
+            session.commit()
+            return count
 
     def get_payload_dict(self) -> dict:
         """Deserialise the stored JSON payload to a dict."""
@@ -135,19 +197,22 @@ class SyncQueueItem(Model, CRUD):
 
     def mark_sent(self) -> None:
         """Update status to 'sent' and record the transmission timestamp."""
-        self.status = "sent"
+        self.status = self.STATUS_SENT
         self.sent_at = datetime.utcnow()
         self.save()
 
-    def increment_retry(self, error_message: str = "") -> None:
+    def increment_retry(self, error_message: str = "",
+                        next_attempt_at: Optional[datetime] = None) -> None:
         """
-        Increment retry_count.  Mark as 'failed' when max_retries is reached.
+        Increment retry_count.  Dead-letter the item when max_retries is reached.
 
         Args:
-            error_message: Description of the failure for diagnostics.
+            error_message:   Description of the failure for diagnostics.
+            next_attempt_at: Earliest time of the next attempt (backoff).
         """
         self.retry_count += 1
         self.error_message = error_message
+        self.next_attempt_at = next_attempt_at
         if self.retry_count >= self.max_retries:
-            self.status = "failed"
+            self.status = self.STATUS_DEAD_LETTER
         self.save()
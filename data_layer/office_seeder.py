@@ -25,13 +25,18 @@ from a SaleFlex.OFFICE instance.  Called in place of the default
 The seeder preserves all primary-key UUIDs received from OFFICE so that every
 foreign-key reference inside the payload remains internally consistent after
 being written into the local SQLite database.
+
+Later refreshes use :func:`apply_office_changes`, which applies only the rows
+OFFICE reports as changed or deleted since the stored per-resource watermarks
+(``sync_watermarks`` in the init payload, ``watermark`` per delta resource).
 """
 
 from __future__ import annotations
 
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, date, time
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from sqlalchemy import DateTime, Date, Time, String, Text
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
@@ -46,11 +51,6 @@ logger = get_logger(__name__)
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _get_column_names(model_class) -> set[str]:
-    """Return the set of column names defined in the underlying table."""
-    return {col.name for col in model_class.__table__.columns}
-
-
 def _get_column_types(model_class) -> dict[str, Any]:
     """Return a mapping of column name → SQLAlchemy type instance."""
     return {col.name: col.type for col in model_class.__table__.columns}
@@ -139,54 +139,150 @@ def _coerce_datetime(value: Any) -> Any:
     return value  # Give up — SQLAlchemy will surface the error with context.
 
 
-def _prepare_row(
-    row: dict[str, Any],
-    allowed_columns: set[str],
-    col_types: dict[str, Any],
-) -> dict[str, Any]:
+# Rows per executemany statement; a failing chunk is retried row by row
+_WRITE_CHUNK_ROWS = 1000
+
+_row_preparers: dict[type, Any] = {}
+
+
+def _column_coercer(name: str, col_type: Any):
+    """
+    Return the value conversion for one column (see :func:`_row_preparer`),
+    or None when values are passed through unchanged.
     """
-    Filter *row* to only the keys present in *allowed_columns*, normalise
-    sentinel strings, and coerce values to the types that SQLAlchemy expects.
+    is_text = isinstance(col_type, (String, Text))
+    if isinstance(col_type, Time):
+        coerce = _coerce_time
+    elif isinstance(col_type, (DateTime, Date)):
+        coerce = _coerce_datetime
+    elif name == "id" or name.endswith("_id") or name.endswith("_by"):
+        coerce = lambda value: _coerce_uuid(value) if isinstance(value, str) else value
+    else:
+        coerce = None
+
+    if is_text:
+        return coerce
+
+    def convert(value):
+        # Guard against legacy "None" string serialisation
+        if value is None or value == "None":
+            return None
+        return coerce(value) if coerce else value
+
+    return convert
+
+
+def _row_preparer(model_class):
+    """
+    Return ``prepare(row)`` for *model_class*: it keeps only the keys that are
+    columns of the table, normalises sentinel strings, and coerces values to
+    the types that SQLAlchemy expects.  Conversions are picked once per column.
 
     Normalisation
     -------------
     * The string ``"None"`` → ``None``.  Defensive guard against older OFFICE
       instances whose ``to_dict()`` serialised Python ``None`` as ``"None"``.
+      String / Text columns keep it: there ``"None"`` is a legitimate value.
 
     Type coercion
     -------------
+    * Time columns              → Python ``time`` objects.
     * DateTime / Date columns   → Python ``datetime`` / ``date`` objects.
     * UUID columns (``"id"``, ``*_id``, ``*_by``) → ``uuid.UUID`` objects.
     """
-    result: dict[str, Any] = {}
-    for key, value in row.items():
-        if key not in allowed_columns:
-            continue
+    prepare = _row_preparers.get(model_class)
+    if prepare is None:
+        coercers = {
+            name: _column_coercer(name, col_type)
+            for name, col_type in _get_column_types(model_class).items()
+        }
+
+        def prepare(row: dict[str, Any]) -> dict[str, Any]:
+            result: dict[str, Any] = {}
+            for key, value in row.items():
+                if key not in coercers:
+                    continue
+                coerce = coercers[key]
+                result[key] = coerce(value) if coerce is not None and value is not None else value
+            return result
+
+        _row_preparers[model_class] = prepare
+    return prepare
+
+
+def _write_rows(
+    conn,
+    model_class,
+    records: list[dict[str, Any]],
+    label: str,
+    upsert: bool,
+) -> tuple[int, int]:
+    """
+    Insert (``upsert=False``: ``INSERT OR IGNORE``) or upsert *records* in
+    chunks of ``_WRITE_CHUNK_ROWS`` rows, one executemany statement per chunk
+    and column set, each chunk inside a **savepoint**.
 
-        # Guard against legacy "None" string serialisation.
-        # Only convert the literal string "None" to Python None for non-text
-        # column types (UUID foreign keys, integers, etc.).  For String / Text
-        # columns the value "None" is a legitimate display name and must be
-        # preserved as-is.
-        if value == "None":
-            col_type_check = col_types.get(key)
-            if not isinstance(col_type_check, (String, Text)):
-                value = None
+    Only when a chunk fails is it rolled back and replayed row by row, each
+    row in its own savepoint, so a single bad row is skipped without losing
+    the rest of the chunk or corrupting the surrounding transaction.
 
-        if value is not None:
-            col_type = col_types.get(key)
+    Returns ``(written, skipped)``; for inserts *written* counts the rows that
+    were actually inserted, for upserts every row that was applied.
+    """
+    table    = model_class.__table__
+    prepare  = _row_preparer(model_class)
+    pk_names = [col.name for col in table.primary_key.columns]
+    written  = 0
+    skipped  = 0
+
+    def statement(columns):
+        stmt = sqlite_insert(table)
+        update_cols = [c for c in columns if c not in pk_names]
+        if upsert and update_cols:
+            return stmt.on_conflict_do_update(
+                index_elements=pk_names,
+                set_={col: stmt.excluded[col] for col in update_cols},
+            )
+        return stmt.on_conflict_do_nothing()
+
+    def execute(rows):
+        result = conn.execute(statement(rows[0].keys()), rows)
+        return len(rows) if upsert else max(result.rowcount, 0)
+
+    for start in range(0, len(records), _WRITE_CHUNK_ROWS):
+        # executemany needs one column set per statement; OFFICE rows of a
+        # resource normally share one.
+        groups: dict[tuple, list[dict[str, Any]]] = {}
+        for row in records[start:start + _WRITE_CHUNK_ROWS]:
+            prepared = prepare(row)
+            if prepared:
+                groups.setdefault(tuple(prepared), []).append(prepared)
+
+        for rows in groups.values():
+            sp = conn.begin_nested()   # SAVEPOINT – isolates this chunk
+            try:
+                count = execute(rows)
+                sp.commit()            # RELEASE SAVEPOINT
+                written += count
+                continue
+            except Exception:
+                sp.rollback()          # ROLLBACK TO SAVEPOINT – replay row by row
 
-            if isinstance(col_type, Time):
-                value = _coerce_time(value)
-            elif isinstance(col_type, (DateTime, Date)):
-                value = _coerce_datetime(value)
-            elif isinstance(value, str) and (
-                key == "id" or key.endswith("_id") or key.endswith("_by")
-            ):
-                value = _coerce_uuid(value)
+            for prepared in rows:
+                sp = conn.begin_nested()
+                try:
+                    count = execute([prepared])
+                    sp.commit()
+                    written += count
+                except Exception as exc:
+                    sp.rollback()
+                    skipped += 1
+                    logger.warning(
+                        "  ✗ Skipping %s %s row – %s: %s",
+                        label, "upsert" if upsert else "insert", type(exc).__name__, exc,
+                    )
 
-        result[key] = value
-    return result
+    return written, skipped
 
 
 def _seed_table(
@@ -198,44 +294,16 @@ def _seed_table(
     """
     Bulk-insert *records* into the table backing *model_class*.
 
-    Uses ``INSERT OR IGNORE`` (SQLite ``on_conflict_do_nothing``) wrapped in
-    a per-row **savepoint** so that a single bad row never corrupts the
-    surrounding transaction and subsequent rows / tables are still processed.
+    Uses ``INSERT OR IGNORE`` (SQLite ``on_conflict_do_nothing``) in chunked
+    executemany statements (see :func:`_write_rows`); a bad row is skipped
+    without affecting the rest of the import.
 
     Returns the number of rows that were actually inserted.
     """
     if not records:
         return 0
 
-    allowed   = _get_column_names(model_class)
-    col_types = _get_column_types(model_class)
-    inserted  = 0
-    skipped   = 0
-
-    for row in records:
-        prepared = _prepare_row(row, allowed, col_types)
-        if not prepared:
-            continue
-        try:
-            stmt = (
-                sqlite_insert(model_class.__table__)
-                .values(**prepared)
-                .on_conflict_do_nothing()
-            )
-            sp = conn.begin_nested()   # SAVEPOINT – isolates this single row
-            try:
-                result = conn.execute(stmt)
-                sp.commit()            # RELEASE SAVEPOINT
-                inserted += result.rowcount
-            except Exception:
-                sp.rollback()          # ROLLBACK TO SAVEPOINT
-                raise
-        except Exception as exc:
-            skipped += 1
-            logger.warning(
-                "  ✗ Skipping %s row – %s: %s", label, type(exc).__name__, exc
-            )
-
+    inserted, skipped = _write_rows(conn, model_class, records, label, upsert=False)
     if skipped:
         logger.warning("  %s: %d row(s) skipped due to errors", label, skipped)
 
@@ -253,7 +321,8 @@ def _reseed_table(
 
     Uses ``INSERT OR REPLACE`` (SQLite ``on_conflict_do_update``) so that rows
     which already exist in the local database are overwritten with the latest
-    values from OFFICE.  New rows are inserted normally.
+    values from OFFICE.  New rows are inserted normally.  Rows are written in
+    chunked executemany statements (see :func:`_write_rows`).
 
     Unlike :func:`_seed_table` (which silently skips existing rows), this
     function is intended for **post-closure refreshes** where OFFICE is the
@@ -264,63 +333,38 @@ def _reseed_table(
     if not records:
         return 0, 0
 
-    allowed   = _get_column_names(model_class)
-    col_types = _get_column_types(model_class)
-    upserted  = 0
-    skipped   = 0
-
-    # Collect all non-PK column names for the SET clause.
-    pk_names  = {col.name for col in model_class.__table__.primary_key.columns}
-    update_cols = [c for c in allowed if c not in pk_names]
-
-    for row in records:
-        prepared = _prepare_row(row, allowed, col_types)
-        if not prepared:
-            continue
-        try:
-            stmt = sqlite_insert(model_class.__table__).values(**prepared)
-            if update_cols:
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=list(pk_names),
-                    set_={col: stmt.excluded[col] for col in update_cols if col in prepared},
-                )
-            else:
-                stmt = stmt.on_conflict_do_nothing()
-
-            sp = conn.begin_nested()
-            try:
-                conn.execute(stmt)
-                sp.commit()
-                upserted += 1
-            except Exception:
-                sp.rollback()
-                raise
-        except Exception as exc:
-            skipped += 1
-            logger.warning(
-                "  ✗ Skipping %s upsert row – %s: %s", label, type(exc).__name__, exc
-            )
-
+    upserted, skipped = _write_rows(conn, model_class, records, label, upsert=True)
     if skipped:
         logger.warning("  %s: %d row(s) skipped during upsert", label, skipped)
 
     return upserted, skipped
 
 
+@contextmanager
+def _import_transaction(engine: Engine):
+    """
+    ``engine.begin()`` that is atomic on SQLite.
+
+    pysqlite only opens a transaction implicitly before DML, so a SAVEPOINT
+    issued first becomes the outermost transaction and its RELEASE commits
+    everything written so far.  Starting with an explicit BEGIN keeps the
+    per-chunk savepoints nested, so an error – e.g. a download interrupted
+    half way through a streamed payload – rolls the whole import back.
+    """
+    with engine.engine.begin() as conn:
+        conn.exec_driver_sql("BEGIN")
+        yield conn
+
+
 # ---------------------------------------------------------------------------
-# Public entry point
+# Sync plan
 # ---------------------------------------------------------------------------
 
-def seed_from_office_data(engine: Engine, data: dict[str, Any]) -> None:
+def _office_plan() -> list[tuple[str, type]]:
     """
-    Populate the local SQLite database using *data* received from OFFICE.
-
-    Parameters
-    ----------
-    engine:
-        The already-initialised Engine instance (tables must already exist).
-    data:
-        The ``"data"`` dict from the OFFICE ``/api/v1/pos/init`` response.
+    Return the ``(payload key, model)`` pairs of the OFFICE init / change
+    payloads in insertion order: parent tables come before child tables to
+    satisfy SQLite foreign-key constraints.
     """
     # Lazy imports keep startup time low when the module is not used
     # (standalone / gate modes) and prevent circular import issues.
@@ -368,9 +412,7 @@ def seed_from_office_data(engine: Engine, data: dict[str, Any]) -> None:
     from data_layer.model.definition.customer_segment import CustomerSegment
     from data_layer.model.definition.customer import Customer
 
-    # Insertion order matters: parent tables must be populated before child
-    # tables to satisfy SQLite foreign-key constraints.
-    SEED_PLAN: list[tuple[str, type]] = [
+    return [
         ("cashiers",                    Cashier),
         ("countries",                   Country),
         ("country_regions",             CountryRegion),
@@ -416,37 +458,133 @@ def seed_from_office_data(engine: Engine, data: dict[str, Any]) -> None:
         ("customers",                   Customer),
     ]
 
-    total_inserted = 0
-    total_received = 0
 
+# ---------------------------------------------------------------------------
+# Public entry point
+# ---------------------------------------------------------------------------
+
+def _payload_resources(data: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """Yield an in-memory ``data`` dict as ``(resource, value)`` pairs in plan order."""
+    for key, _model_cls in _office_plan():
+        if key in data and data[key] is not None:
+            yield key, data[key]
+    yield "sync_watermarks", data.get("sync_watermarks")
+
+
+def _ingest_resources(
+    conn,
+    resources: Iterable[tuple[str, Any]],
+    upsert: bool,
+) -> tuple[int, int, int]:
+    """
+    Write ``(resource, value)`` pairs inside the open transaction on *conn*.
+
+    A resource may arrive as several consecutive row lists (see
+    :meth:`OfficeClient.stream_init_data`); each list is written as soon as it
+    arrives, so only one chunk is held at a time.  Resources are written in
+    the order received – the local SQLite connection does not enforce foreign
+    keys and the whole import commits or rolls back as one transaction.
+    ``sync_watermarks`` is saved last, except for resources with skipped rows:
+    their stored watermark is cleared so the next delta sync requests them in
+    full.  Keys without a model are ignored.
+
+    Returns ``(received, written, skipped)`` row totals.
+    """
+    models = dict(_office_plan())
+    watermarks: dict[str, Any] = {}
+    seen: set[str] = set()
+    incomplete: set[str] = set()
+    totals = [0, 0, 0]
+    current: list[Any] = [None, 0, 0, 0]   # resource, received, written, skipped
+
+    def report() -> None:
+        key, received, written, skipped = current
+        if key is None:
+            return
+        if upsert:
+            logger.info("  %-35s %4d upserted, %d skipped", key, written, skipped)
+        else:
+            logger.info("  %-35s %4d / %4d record(s) inserted", key, written, received)
+
+    for key, value in resources:
+        if key == "sync_watermarks":
+            watermarks.update(value or {})
+            continue
+        model_cls = models.get(key)
+        if model_cls is None:
+            if key not in seen:
+                logger.debug("  %-35s (unknown resource – ignored)", key)
+                seen.add(key)
+            continue
+        if key != current[0]:
+            report()
+            current[:] = [key, 0, 0, 0]
+            seen.add(key)
+        if value is None:
+            continue
+
+        # OFFICE returns the store as a single dict; normalise to a list.
+        records: list[dict[str, Any]] = [value] if isinstance(value, dict) else value
+        if upsert:
+            written, skipped = _reseed_table(conn, model_cls, records, label=key)
+        else:
+            written = _seed_table(conn, model_cls, records, label=key)
+            skipped = len(records) - written
+        if skipped:
+            incomplete.add(key)
+        current[1] += len(records)
+        current[2] += written
+        current[3] += skipped
+        totals[0] += len(records)
+        totals[1] += written
+        totals[2] += skipped
+
+    report()
+    for key in models:
+        if key not in seen:
+            logger.debug("  %-35s (not in payload – skipped)", key)
+
+    _save_sync_watermarks(conn, {k: v for k, v in watermarks.items() if k not in incomplete})
+    _clear_sync_watermarks(conn, incomplete)
+    return totals[0], totals[1], totals[2]
+
+
+def seed_from_office_data(engine: Engine, data: dict[str, Any]) -> None:
+    """
+    Populate the local SQLite database using *data* received from OFFICE.
+
+    Parameters
+    ----------
+    engine:
+        The already-initialised Engine instance (tables must already exist).
+    data:
+        The ``"data"`` dict from the OFFICE ``/api/v1/pos/init`` response.
+    """
+    seed_from_office_stream(engine, _payload_resources(data))
+
+
+def seed_from_office_stream(engine: Engine, resources: Iterable[tuple[str, Any]]) -> None:
+    """
+    Populate the local SQLite database from ``(resource, value)`` pairs, as
+    yielded by :meth:`OfficeClient.stream_init_data`.
+
+    Rows are written chunk by chunk while the payload downloads, so memory
+    use does not grow with the catalogue.  An error raised by *resources*
+    (including a failed OFFICE status at the end of the body) rolls the whole
+    import back.
+    """
     logger.info("Starting OFFICE data seeding...")
 
     # Use a single engine-level connection wrapped in one transaction so that
     # every table is committed atomically.  Per-row savepoints inside
     # _seed_table isolate individual bad rows without rolling back the whole
     # import.
-    with engine.engine.begin() as conn:
-        for key, model_cls in SEED_PLAN:
-            raw = data.get(key)
-            if raw is None:
-                logger.debug("  %-35s (not in payload – skipped)", key)
-                continue
-
-            # OFFICE returns the store as a single dict; normalise to a list.
-            records: list[dict[str, Any]] = [raw] if isinstance(raw, dict) else raw
-            received = len(records)
-            total_received += received
-
-            count = _seed_table(conn, model_cls, records, label=key)
-            total_inserted += count
-            logger.info(
-                "  %-35s %4d / %4d record(s) inserted",
-                key, count, received,
-            )
+    with _import_transaction(engine) as conn:
+        received, inserted, _skipped = _ingest_resources(conn, resources, upsert=False)
 
     logger.info(
         "✓ Office seeding complete – %d of %d total records inserted",
-        total_inserted, total_received,
+        inserted, received,
     )
 
 
@@ -475,119 +613,209 @@ def reseed_from_office_data(engine: Engine, data: dict[str, Any]) -> dict[str, i
     -------
     dict with keys ``"upserted"`` and ``"skipped"`` containing aggregate counts.
     """
-    from data_layer.model.definition.cashier import Cashier
-    from data_layer.model.definition.country import Country
-    from data_layer.model.definition.country_region import CountryRegion
-    from data_layer.model.definition.city import City
-    from data_layer.model.definition.district import District
-    from data_layer.model.definition.store import Store
-    from data_layer.model.definition.currency import Currency
-    from data_layer.model.definition.currency_table import CurrencyTable
-    from data_layer.model.definition.payment_type import PaymentType
-    from data_layer.model.definition.vat import Vat
-    from data_layer.model.definition.product_unit import ProductUnit
-    from data_layer.model.definition.product_manufacturer import ProductManufacturer
-    from data_layer.model.definition.department_main_group import DepartmentMainGroup
-    from data_layer.model.definition.department_sub_group import DepartmentSubGroup
-    from data_layer.model.definition.product import Product
-    from data_layer.model.definition.product_variant import ProductVariant
-    from data_layer.model.definition.product_attribute import ProductAttribute
-    from data_layer.model.definition.product_barcode import ProductBarcode
-    from data_layer.model.definition.product_barcode_mask import ProductBarcodeMask
-    from data_layer.model.definition.warehouse import Warehouse
-    from data_layer.model.definition.warehouse_location import WarehouseLocation
-    from data_layer.model.definition.warehouse_product_stock import WarehouseProductStock
-    from data_layer.model.definition.transaction_discount_type import TransactionDiscountType
-    from data_layer.model.definition.transaction_document_type import TransactionDocumentType
-    from data_layer.model.definition.transaction_sequence import TransactionSequence
-    from data_layer.model.definition.form import Form
-    from data_layer.model.definition.form_control import FormControl
-    from data_layer.model.definition.label_value import LabelValue
-    from data_layer.model.definition.pos_settings import PosSettings
-    from data_layer.model.definition.pos_virtual_keyboard import PosVirtualKeyboard
-    from data_layer.model.definition.cashier_performance_target import CashierPerformanceTarget
-    from data_layer.model.definition.campaign_type import CampaignType
-    from data_layer.model.definition.campaign import Campaign
-    from data_layer.model.definition.campaign_rule import CampaignRule
-    from data_layer.model.definition.campaign_product import CampaignProduct
-    from data_layer.model.definition.coupon import Coupon
-    from data_layer.model.definition.loyalty_program import LoyaltyProgram
-    from data_layer.model.definition.loyalty_tier import LoyaltyTier
-    from data_layer.model.definition.loyalty_earn_rule import LoyaltyEarnRule
-    from data_layer.model.definition.loyalty_redemption_policy import LoyaltyRedemptionPolicy
-    from data_layer.model.definition.loyalty_program_policy import LoyaltyProgramPolicy
-    from data_layer.model.definition.customer_segment import CustomerSegment
-    from data_layer.model.definition.customer import Customer
+    return reseed_from_office_stream(engine, _payload_resources(data))
 
-    RESEED_PLAN: list[tuple[str, type]] = [
-        ("cashiers",                    Cashier),
-        ("countries",                   Country),
-        ("country_regions",             CountryRegion),
-        ("store",                       Store),
-        ("cities",                      City),
-        ("districts",                   District),
-        ("currencies",                  Currency),
-        ("currency_table",              CurrencyTable),
-        ("payment_types",               PaymentType),
-        ("vat_rates",                   Vat),
-        ("product_units",               ProductUnit),
-        ("product_manufacturers",       ProductManufacturer),
-        ("department_main_groups",      DepartmentMainGroup),
-        ("department_sub_groups",       DepartmentSubGroup),
-        ("products",                    Product),
-        ("product_variants",            ProductVariant),
-        ("product_attributes",          ProductAttribute),
-        ("product_barcodes",            ProductBarcode),
-        ("product_barcode_masks",       ProductBarcodeMask),
-        ("warehouses",                  Warehouse),
-        ("warehouse_locations",         WarehouseLocation),
-        ("warehouse_product_stock",     WarehouseProductStock),
-        ("transaction_discount_types",  TransactionDiscountType),
-        ("transaction_document_types",  TransactionDocumentType),
-        ("transaction_sequences",       TransactionSequence),
-        ("forms",                       Form),
-        ("form_controls",               FormControl),
-        ("label_values",                LabelValue),
-        ("pos_settings",                PosSettings),
-        ("pos_virtual_keyboards",       PosVirtualKeyboard),
-        ("cashier_performance_targets", CashierPerformanceTarget),
-        ("campaign_types",              CampaignType),
-        ("campaigns",                   Campaign),
-        ("campaign_rules",              CampaignRule),
-        ("campaign_products",           CampaignProduct),
-        ("coupons",                     Coupon),
-        ("loyalty_programs",            LoyaltyProgram),
-        ("loyalty_tiers",               LoyaltyTier),
-        ("loyalty_earn_rules",          LoyaltyEarnRule),
-        ("loyalty_redemption_policies", LoyaltyRedemptionPolicy),
-        ("loyalty_program_policies",    LoyaltyProgramPolicy),
-        ("customer_segments",           CustomerSegment),
-        ("customers",                   Customer),
-    ]
-
-    total_upserted = 0
-    total_skipped  = 0
 
+def reseed_from_office_stream(
+    engine: Engine, resources: Iterable[tuple[str, Any]]
+) -> dict[str, int]:
+    """
+    Streaming form of :func:`reseed_from_office_data`: upsert ``(resource,
+    value)`` pairs as yielded by :meth:`OfficeClient.stream_init_data`,
+    chunk by chunk, in one transaction.
+    """
     logger.info("[OfficeReseed] Starting post-closure data refresh from OFFICE...")
 
+    with _import_transaction(engine) as conn:
+        _received, upserted, skipped = _ingest_resources(conn, resources, upsert=True)
+
+    logger.info(
+        "[OfficeReseed] ✓ Refresh complete – %d row(s) upserted, %d skipped",
+        upserted, skipped,
+    )
+    return {"upserted": upserted, "skipped": skipped}
+
+
+# ---------------------------------------------------------------------------
+# Delta sync
+# ---------------------------------------------------------------------------
+
+def load_sync_watermarks(engine: Engine) -> dict[str, str]:
+    """Return the stored OFFICE change watermark per resource key."""
+    from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
+
+    table = OfficeSyncWatermark.__table__
+    with engine.engine.connect() as conn:
+        rows = conn.execute(
+            table.select().where(table.c.watermark.is_not(None))
+        ).fetchall()
+    return {row.resource: row.watermark for row in rows}
+
+
+def save_sync_watermarks(engine: Engine, watermarks: dict[str, Any]) -> None:
+    """Store *watermarks* (resource key → watermark) in their own transaction."""
     with engine.engine.begin() as conn:
-        for key, model_cls in RESEED_PLAN:
-            raw = data.get(key)
-            if raw is None:
-                logger.debug("  %-35s (not in payload – skipped)", key)
-                continue
+        _save_sync_watermarks(conn, watermarks)
+
+
+def _save_sync_watermarks(conn, watermarks: dict[str, Any]) -> None:
+    """Upsert *watermarks* (resource key → watermark) inside the open transaction."""
+    from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
+
+    if not watermarks:
+        return
+    table = OfficeSyncWatermark.__table__
+    now = datetime.now()
+    for resource, watermark in watermarks.items():
+        if watermark is None:
+            continue
+        stmt = sqlite_insert(table).values(
+            id=uuid.uuid4(),
+            resource=resource,
+            watermark=str(watermark),
+            synced_at=now,
+            is_deleted=False,
+        )
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["resource"],
+            set_={"watermark": stmt.excluded.watermark, "synced_at": stmt.excluded.synced_at},
+        ))
+
+
+def _clear_sync_watermarks(conn, resources: Iterable[str]) -> None:
+    """Forget the stored watermark of *resources*, so they are next requested in full."""
+    from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
+
+    resources = list(resources)
+    if not resources:
+        return
+    table = OfficeSyncWatermark.__table__
+    conn.execute(
+        table.update().where(table.c.resource.in_(resources)).values(watermark=None)
+    )
+
+
+def _delete_rows(conn, model_class, ids: list, label: str) -> int | None:
+    """
+    Remove rows OFFICE reported as deleted: soft-delete when the model has
+    ``is_deleted`` (documents may still reference them), delete otherwise.
 
+    Returns the number of rows removed, or None when the statement failed.
+    """
+    table = model_class.__table__
+    ids = [_coerce_uuid(value) for value in ids if value is not None]
+    if not ids:
+        return 0
+    if "is_deleted" in table.c:
+        values = {"is_deleted": True}
+        if "deleted_at" in table.c:
+            values["deleted_at"] = datetime.now()
+        stmt = table.update().where(table.c.id.in_(ids)).values(**values)
+    else:
+        stmt = table.delete().where(table.c.id.in_(ids))
+    sp = conn.begin_nested()
+    try:
+        count = conn.execute(stmt).rowcount
+        sp.commit()
+        return count
+    except Exception as exc:
+        sp.rollback()
+        logger.warning("  ✗ Could not delete %s rows – %s: %s", label, type(exc).__name__, exc)
+        return None
+
+
+def apply_office_changes(
+    engine: Engine,
+    changes: dict[str, Any],
+    only: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Apply a delta from OFFICE (``/pos/changes``) to the local database.
+
+    *changes* has the form::
+
+        {"resources": {
+            "products": {"changed": [row, ...], "deleted": [id, ...], "watermark": "..."},
+            ...
+        }}
+
+    Changed rows are upserted like :func:`reseed_from_office_data` (parents
+    first), deleted rows are removed children first, and the new watermarks
+    are stored in the same transaction so a failed sync is simply repeated.
+    A resource with skipped rows or a failed delete keeps its old watermark,
+    so OFFICE sends those rows again next time.  With *only*, resources with
+    other keys are ignored (GATE pulls use the same layout for a few tables).
+
+    Returns
+    -------
+    dict with the aggregate ``"upserted"``, ``"deleted"`` and ``"skipped"``
+    counts, ``"changed"``: model class name → ids of the rows that were
+    upserted or deleted (used to patch the in-memory caches), and
+    ``"incomplete"``: keys of the resources that were not fully applied.
+    """
+    resources: dict[str, Any] = changes.get("resources") or {}
+    if only is not None:
+        only = set(only)
+        resources = {key: value for key, value in resources.items() if key in only}
+    plan = [(key, model_cls) for key, model_cls in _office_plan() if key in resources]
+
+    total_upserted = 0
+    total_deleted  = 0
+    total_skipped  = 0
+    changed_ids: dict[str, list] = {}
+    incomplete: set[str] = set()
+
+    logger.info("[OfficeDelta] Applying changes for %d resource(s)...", len(plan))
+
+    with _import_transaction(engine) as conn:
+        for key, model_cls in plan:
+            raw = resources[key].get("changed") or []
             records: list[dict[str, Any]] = [raw] if isinstance(raw, dict) else raw
+            if not records:
+                continue
             upserted, skipped = _reseed_table(conn, model_cls, records, label=key)
+            if skipped:
+                incomplete.add(key)
             total_upserted += upserted
             total_skipped  += skipped
-            logger.info(
-                "  %-35s %4d upserted, %d skipped",
-                key, upserted, skipped,
+            changed_ids.setdefault(model_cls.__name__, []).extend(
+                _coerce_uuid(row.get("id")) for row in records if row.get("id") is not None
             )
+            logger.info("  %-35s %4d upserted, %d skipped", key, upserted, skipped)
+
+        for key, model_cls in reversed(plan):
+            deleted_ids = resources[key].get("deleted") or []
+            if not deleted_ids:
+                continue
+            count = _delete_rows(conn, model_cls, deleted_ids, label=key)
+            if count is None:
+                incomplete.add(key)
+                count = 0
+            total_deleted += count
+            changed_ids.setdefault(model_cls.__name__, []).extend(
+                _coerce_uuid(value) for value in deleted_ids
+            )
+            logger.info("  %-35s %4d deleted", key, count)
+
+        if incomplete:
+            logger.warning(
+                "[OfficeDelta] Keeping the previous watermark of %s (rows not applied)",
+                ", ".join(sorted(incomplete)),
+            )
+        _save_sync_watermarks(conn, {
+            key: resource.get("watermark")
+            for key, resource in resources.items()
+            if key not in incomplete
+        })
 
     logger.info(
-        "[OfficeReseed] ✓ Refresh complete – %d row(s) upserted, %d skipped",
-        total_upserted, total_skipped,
+        "[OfficeDelta] ✓ %d row(s) upserted, %d deleted, %d skipped",
+        total_upserted, total_deleted, total_skipped,
     )
-    return {"upserted": total_upserted, "skipped": total_skipped}
+    return {
+        "upserted": total_upserted,
+        "deleted":  total_deleted,
+        "skipped":  total_skipped,
+        "changed":  changed_ids,
+        "incomplete": sorted(incomplete),
+    }
@@ -0,0 +1,181 @@
+"""
+SaleFlex.PyPOS - Product full-text search index
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import column, literal_column, table
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRODUCT_SEARCH_TABLE = "product_search"
+
+# One FTS5 row per live product, stored under the product's SQLite rowid so the
+# triggers and the search join work on rowids instead of scanning UUID text.
+_CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {PRODUCT_SEARCH_TABLE} USING fts5(
+    name, short_name, code, barcodes, description,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+"""
+
+# Re-index one product (by its rowid) from product + product_barcode.
+_REINDEX_SQL = f"""
+    DELETE FROM {PRODUCT_SEARCH_TABLE} WHERE rowid = {{rowid}};
+    INSERT INTO {PRODUCT_SEARCH_TABLE} (rowid, name, short_name, code, barcodes, description)
+    SELECT p.rowid, p.name, p.short_name, p.code,
+           (SELECT group_concat(b.barcode, ' ') FROM product_barcode b
+             WHERE b.fk_product_id = p.id AND b.is_deleted = 0),
+           p.description
+      FROM product p
+     WHERE p.rowid = {{rowid}} AND p.is_deleted = 0;
+"""
+
+_PRODUCT_ROWID = "(SELECT rowid FROM product WHERE id = {ref}.fk_product_id)"
+
+_TRIGGERS = {
+    "trg_product_search_ai":
+        "AFTER INSERT ON product BEGIN"
+        + _REINDEX_SQL.format(rowid="NEW.rowid") + " END",
+    "trg_product_search_au":
+        "AFTER UPDATE OF name, short_name, code, description, is_deleted ON product BEGIN"
+        + _REINDEX_SQL.format(rowid="NEW.rowid") + " END",
+    "trg_product_search_ad":
+        f"AFTER DELETE ON product BEGIN DELETE FROM {PRODUCT_SEARCH_TABLE} WHERE rowid = OLD.rowid; END",
+    "trg_product_barcode_search_ai":
+        "AFTER INSERT ON product_barcode BEGIN"
+        + _REINDEX_SQL.format(rowid=_PRODUCT_ROWID.format(ref="NEW")) + " END",
+    "trg_product_barcode_search_au":
+        "AFTER UPDATE OF barcode, fk_product_id, is_deleted ON product_barcode BEGIN"
+        + _REINDEX_SQL.format(rowid=_PRODUCT_ROWID.format(ref="OLD"))
+        + _REINDEX_SQL.format(rowid=_PRODUCT_ROWID.format(ref="NEW")) + " END",
+    "trg_product_barcode_search_ad":
+        "AFTER DELETE ON product_barcode BEGIN"
+        + _REINDEX_SQL.format(rowid=_PRODUCT_ROWID.format(ref="OLD")) + " END",
+}
+
+_REBUILD_SQL = f"""
+    INSERT INTO {PRODUCT_SEARCH_TABLE} (rowid, name, short_name, code, barcodes, description)
+    SELECT p.rowid, p.name, p.short_name, p.code, b.barcodes, p.description
+      FROM product p
+      LEFT JOIN (SELECT fk_product_id, group_concat(barcode, ' ') AS barcodes
+                   FROM product_barcode WHERE is_deleted = 0
+                  GROUP BY fk_product_id) b ON b.fk_product_id = p.id
+     WHERE p.is_deleted = 0
+"""
+
+# Set by ensure_product_search_index(); None until checked.
+_available: Optional[bool] = None
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+search_table = table(PRODUCT_SEARCH_TABLE, column("rowid"), column("rank"))
+
+
+def ensure_product_search_index(connection) -> bool:
+    """
+    Create the FTS5 table and its sync triggers, and (re)fill it when it does not
+    match the live product count (new table, or product rows loaded before the
+    triggers existed). Returns False when SQLite lacks FTS5.
+    """
+    global _available
+    tables = {
+        row[0]
+        for row in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        ).fetchall()
+    }
+    if "product" not in tables or "product_barcode" not in tables:
+        return False
+    try:
+        connection.exec_driver_sql(_CREATE_TABLE)
+    except SQLAlchemyError as exc:
+        logger.warning("Product full-text search unavailable (FTS5 missing?): %s", exc)
+        _available = False
+        return False
+
+    # The triggers collect a product's barcodes by fk_product_id
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS idx_product_barcode_product ON product_barcode (fk_product_id)"
+    )
+    for name, body in _TRIGGERS.items():
+        connection.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    indexed = connection.exec_driver_sql(f"SELECT count(*) FROM {PRODUCT_SEARCH_TABLE}").scalar()
+    live = connection.exec_driver_sql("SELECT count(*) FROM product WHERE is_deleted = 0").scalar()
+    if indexed != live:
+        rebuild_product_search_index(connection)
+        logger.info("✓ Product search index rebuilt (%s products)", live)
+    _available = True
+    return True
+
+
+def rebuild_product_search_index(connection) -> None:
+    """Refill the FTS5 table from product and product_barcode."""
+    connection.exec_driver_sql(f"DELETE FROM {PRODUCT_SEARCH_TABLE}")
+    connection.exec_driver_sql(_REBUILD_SQL)
+
+
+def is_available(session=None) -> bool:
+    """Whether the FTS5 table exists (checked once via ``session`` if not yet known)."""
+    global _available
+    if _available is None and session is not None:
+        _available = bool(session.connection().exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (PRODUCT_SEARCH_TABLE,)
+        ).fetchone())
+    return bool(_available)
+
+
+def match_expression(search_term: str) -> Optional[str]:
+    """
+    FTS5 query for ``search_term``: every word must match as a token prefix,
+    e.g. ``"tea bag"`` -> ``"tea"* "bag"*``. None when the term has no words.
+    """
+    tokens = _TOKEN_RE.findall(search_term or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def filter_products(query, product_model, search_term: str):
+    """
+    Restrict a ``Product`` query to FTS matches of ``search_term``.
+
+    Order the result by ``search_table.c.rank`` (bm25, best first) for relevance.
+    """
+    expression = match_expression(search_term)
+    query = query.join(
+        search_table,
+        search_table.c.rowid == literal_column(f"{product_model.__tablename__}.rowid"),
+    ).filter(literal_column(PRODUCT_SEARCH_TABLE).match(expression))
+    return query
+
+
+__all__ = [
+    "PRODUCT_SEARCH_TABLE",
+    "ensure_product_search_index",
+    "filter_products",
+    "is_available",
+    "match_expression",
+    "rebuild_product_search_index",
+    "search_table",
+]
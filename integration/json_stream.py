@@ -0,0 +1,181 @@
+"""
+SaleFlex.PyPOS - Incremental JSON reader for large OFFICE responses
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+# Consumed text kept in the buffer before it is dropped
+_COMPACT_AT = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Text after a decoded number that may still belong to it
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+
+
+class ResourceStream:
+    """
+    Read an OFFICE envelope ``{"status": ..., "data": {"<resource>": [...], ...}}``
+    from byte chunks without holding the whole document in memory.
+
+    Iterating yields ``(resource, value)`` pairs in document order.  A list
+    resource is yielded as consecutive lists of at most ``chunk_rows`` rows
+    (an empty list once when it has no rows); any other value (e.g. the single
+    ``store`` dict) is yielded whole.  Members outside ``data`` are collected
+    in :attr:`header` and complete once iteration has finished.
+
+    Memory is bounded by one row chunk plus the network read size.  Parsing
+    uses the standard library decoder one value at a time.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], data_key: str = "data", chunk_rows: int = 1000):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._data_key = data_key
+        self._chunk_rows = max(1, chunk_rows)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.header: dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    # Buffer
+    # ------------------------------------------------------------------
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer; False at end of input."""
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_AT:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode one complete JSON value, reading more input as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                # Grow by at least the pending text so a large value is not
+                # re-parsed once per network chunk.
+                pending = len(self._buf) - self._pos
+                while len(self._buf) - self._pos < 2 * pending and self._read():
+                    pass
+                continue
+            # A number can be cut at the buffer edge: "12" of "123", or "12" of
+            # "12.5" when the chunk ends right after the "." / "e" / "E"
+            if (not self._eof and isinstance(value, (int, float))
+                    and _NUMBER_TAIL.match(self._buf, end)):
+                self._read()
+                continue
+            self._pos = end
+            return value
+
+    def _members(self) -> Iterator[str]:
+        """Iterate the keys of the object at the cursor, leaving it on each value."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            yield key
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self._pos - 1}, found {separator!r}")
+
+    # ------------------------------------------------------------------
+    # Iteration
+    # ------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for key in self._members():
+            if key == self._data_key and self._peek() == "{":
+                yield from self._resources()
+            else:
+                self.header[key] = self._value()
+        if self._peek() != "":
+            raise ValueError(f"Unexpected data after JSON document at offset {self._pos}")
+
+    def _resources(self) -> Iterator[tuple[str, Any]]:
+        for resource in self._members():
+            if self._peek() != "[":
+                yield resource, self._value()
+                continue
+
+            self._pos += 1
+            rows: list[Any] = []
+            yielded = False
+            if self._peek() == "]":
+                self._pos += 1
+            else:
+                while True:
+                    rows.append(self._value())
+                    if len(rows) >= self._chunk_rows:
+                        yield resource, rows
+                        rows, yielded = [], True
+                    separator = self._peek()
+                    self._pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(
+                            f"Expected ',' or ']' at offset {self._pos - 1}, found {separator!r}"
+                        )
+            if rows or not yielded:
+                yield resource, rows
+
+
+__all__ = ["ResourceStream"]
@@ -18,15 +18,79 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-from typing import Any
+import gzip
+import json
+import threading
+from typing import Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core.logger import get_logger
+from integration.json_stream import ResourceStream
 from settings.settings import Settings
 
 logger = get_logger(__name__)
 
+# Connections kept open to OFFICE (push worker, notification poller, UI refresh)
+_POOL_MAXSIZE = 8
+# Statuses worth retrying; urllib3 only retries idempotent methods on them, so
+# a POST is never re-sent once OFFICE may have received it.
+_RETRY_STATUSES = (502, 503, 504)
+# Read size while streaming a large response body
+_STREAM_READ_BYTES = 64 * 1024
+
+# A 400 only counts as a refused gzip body when its text names the encoding;
+# any other 400 is an ordinary validation error for the caller to handle
+_ENCODING_WORDS = ("gzip", "encoding")
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+# Set once OFFICE refused a gzip request body; later uploads are sent plain
+_gzip_refused = False
+
+
+def _refuses_gzip(response: requests.Response) -> bool:
+    """Whether OFFICE answered a gzip request body with "cannot decode this encoding"."""
+    if response.status_code == 415:
+        return True
+    if response.status_code != 400:
+        return False
+    text = (response.text or "").lower()
+    return any(word in text for word in _ENCODING_WORDS)
+
+
+def _shared_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive session used by every OfficeClient.
+
+    Connections are pooled, so consecutive pushes reuse one TCP/TLS connection
+    instead of a handshake per request.  Failed connects (and idempotent
+    requests answered with a gateway error) are retried with exponential
+    backoff up to ``[office] retry_attempts`` times.  requests already asks
+    for gzip/deflate responses and decompresses them.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            attempts = Settings().office_retry_attempts
+            retry = Retry(
+                total=attempts,
+                connect=attempts,
+                read=attempts,
+                status=attempts,
+                backoff_factor=0.5,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
 
 class OfficeConnectionError(Exception):
     """Raised when the OFFICE server cannot be reached."""
@@ -59,6 +123,59 @@ class OfficeClient:
         self._store_code   = settings.store_code
         self._terminal_code = settings.terminal_code
         self._timeout      = settings.office_timeout_seconds
+        self._compress_min_bytes = settings.office_compress_min_bytes
+        self._session      = _shared_session()
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Issue a request on the shared session, translating transport failures
+        into OfficeConnectionError.
+        """
+        try:
+            return self._session.request(method, url, timeout=self._timeout, **kwargs)
+        except requests.ConnectionError as exc:
+            raise OfficeConnectionError(
+                f"Cannot connect to SaleFlex.OFFICE at {self._base_url}: {exc}"
+            ) from exc
+        except requests.Timeout as exc:
+            raise OfficeConnectionError(
+                f"Connection to SaleFlex.OFFICE timed out after {self._timeout}s"
+            ) from exc
+        except requests.RequestException as exc:
+            raise OfficeConnectionError(
+                f"Network error while contacting SaleFlex.OFFICE: {exc}"
+            ) from exc
+
+    def _post_json(self, url: str, payload: dict) -> requests.Response:
+        """
+        POST ``payload`` as JSON; bodies of at least ``[office]
+        compress_min_bytes`` are sent gzip-compressed (0 disables compression).
+
+        When OFFICE refuses a compressed body (415, or a 400 naming the
+        encoding) the request is sent once more uncompressed, and compression
+        stays off for the rest of the process.
+        """
+        global _gzip_refused
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self._compress_min_bytes and len(body) >= self._compress_min_bytes and not _gzip_refused:
+            response = self._send(
+                "POST", url, data=gzip.compress(body, compresslevel=6),
+                headers={**headers, "Content-Encoding": "gzip"},
+            )
+            if not _refuses_gzip(response):
+                return response
+            logger.warning(
+                "OFFICE refused a gzip-compressed request (HTTP %s) – "
+                "sending uploads uncompressed from now on",
+                response.status_code,
+            )
+            _gzip_refused = True
+        return self._send("POST", url, data=body, headers=headers)
 
     # ------------------------------------------------------------------
     # Public API
@@ -72,28 +189,17 @@ class OfficeClient:
         """
         url = f"{self._base_url}{self._api_prefix}/health"
         try:
-            response = requests.get(url, timeout=self._timeout)
+            response = self._session.get(url, timeout=self._timeout)
             return response.status_code == 200
         except requests.RequestException as exc:
             logger.warning("OFFICE health check failed: %s", exc)
             return False
 
-    def fetch_init_data(self) -> dict[str, Any]:
+    def _request_init(self, stream: bool = False) -> requests.Response:
         """
-        Pull all initialization data from OFFICE for this terminal.
-
-        Returns the ``data`` dict from the OFFICE response on success.
+        GET ``/pos/init`` for this terminal and check the HTTP status.
 
-        Raises
-        ------
-        OfficeConnectionError
-            When the OFFICE server cannot be reached within the configured
-            timeout, or when an unexpected network error occurs.
-        OfficeAuthError
-            When OFFICE rejects the (office_code, store_code, terminal_code)
-            combination (HTTP 404 or 403).
-        RuntimeError
-            When OFFICE returns an unexpected HTTP status code.
+        With ``stream=True`` the body is left unread for the caller.
         """
         url = f"{self._base_url}{self._api_prefix}/pos/init"
         params = {
@@ -110,20 +216,7 @@ class OfficeClient:
             self._terminal_code,
         )
 
-        try:
-            response = requests.get(url, params=params, timeout=self._timeout)
-        except requests.ConnectionError as exc:
-            raise OfficeConnectionError(
-                f"Cannot connect to SaleFlex.OFFICE at {self._base_url}: {exc}"
-            ) from exc
-        except requests.Timeout as exc:
-            raise OfficeConnectionError(
-                f"Connection to SaleFlex.OFFICE timed out after {self._timeout}s"
-            ) from exc
-        except requests.RequestException as exc:
-            raise OfficeConnectionError(
-                f"Network error while contacting SaleFlex.OFFICE: {exc}"
-            ) from exc
+        response = self._send("GET", url, params=params, stream=stream)
 
         if response.status_code in (403, 404):
             body = response.json() if response.content else {}
@@ -137,8 +230,28 @@ class OfficeClient:
                 f"Unexpected OFFICE response HTTP {response.status_code}: "
                 f"{response.text[:200]}"
             )
+        return response
 
-        payload = response.json()
+    def fetch_init_data(self) -> dict[str, Any]:
+        """
+        Pull all initialization data from OFFICE for this terminal.
+
+        Returns the ``data`` dict from the OFFICE response on success.  The
+        whole catalogue is held in memory; use :meth:`stream_init_data` to
+        seed large stores.
+
+        Raises
+        ------
+        OfficeConnectionError
+            When the OFFICE server cannot be reached within the configured
+            timeout, or when an unexpected network error occurs.
+        OfficeAuthError
+            When OFFICE rejects the (office_code, store_code, terminal_code)
+            combination (HTTP 404 or 403).
+        RuntimeError
+            When OFFICE returns an unexpected HTTP status code.
+        """
+        payload = self._request_init().json()
         if payload.get("status") != "ok":
             raise RuntimeError(
                 f"OFFICE returned error status: {payload.get('message', 'unknown')}"
@@ -151,6 +264,118 @@ class OfficeClient:
         )
         return data
 
+    def stream_init_data(self, chunk_rows: int = 1000) -> Iterator[tuple[str, Any]]:
+        """
+        Pull the initialization data like :meth:`fetch_init_data`, parsing the
+        response body while it downloads.
+
+        The request is sent (and credentials checked) before this returns.
+        The returned iterator yields ``(resource, value)`` pairs in payload
+        order: list resources arrive as consecutive lists of at most
+        ``chunk_rows`` rows, other values (``store``, ``sync_watermarks``)
+        whole.  Once the body is exhausted it raises RuntimeError when OFFICE
+        reported an error status, so a caller writing inside a transaction
+        rolls back.  Transport failures while reading surface as
+        OfficeConnectionError.
+
+        Raises
+        ------
+        OfficeConnectionError, OfficeAuthError, RuntimeError – as fetch_init_data.
+        """
+        response = self._request_init(stream=True)
+        return self._iter_init_resources(response, chunk_rows)
+
+    def _iter_init_resources(
+        self, response: requests.Response, chunk_rows: int
+    ) -> Iterator[tuple[str, Any]]:
+        with response:
+            resources = ResourceStream(
+                response.iter_content(chunk_size=_STREAM_READ_BYTES),
+                chunk_rows=chunk_rows,
+            )
+            count = 0
+            previous = None
+            try:
+                for resource, value in resources:
+                    if resource != previous:
+                        count += 1
+                        previous = resource
+                    yield resource, value
+            except requests.RequestException as exc:
+                raise OfficeConnectionError(
+                    f"Download from SaleFlex.OFFICE interrupted: {exc}"
+                ) from exc
+
+        if resources.header.get("status") != "ok":
+            raise RuntimeError(
+                f"OFFICE returned error status: {resources.header.get('message', 'unknown')}"
+            )
+        logger.info(
+            "✓ Init data streamed from OFFICE (%d resource types)",
+            count,
+        )
+
+    def fetch_changes(self, watermarks: dict[str, str]) -> dict[str, Any] | None:
+        """
+        Pull master-data changes since the given per-resource watermarks.
+
+        Sends ``{"watermarks": {"products": "<watermark>", ...}}`` to
+        ``/pos/changes``; resources without a watermark are requested in full.
+        OFFICE answers with only the rows changed or deleted since then::
+
+            {"resources": {"products": {"changed": [...], "deleted": [...],
+                                        "watermark": "..."}, ...},
+             "full_resync": false}
+
+        Returns the ``data`` dict, or None when this OFFICE does not offer the
+        endpoint (the caller then falls back to :meth:`fetch_init_data`).
+
+        Raises
+        ------
+        OfficeConnectionError, OfficeAuthError, RuntimeError – as fetch_init_data.
+        """
+        url = f"{self._base_url}{self._api_prefix}/pos/changes"
+        payload = {
+            "office_code":   self._office_code,
+            "store_code":    self._store_code,
+            "terminal_code": self._terminal_code,
+            "watermarks":    watermarks,
+        }
+
+        response = self._post_json(url, payload)
+
+        if response.status_code in (404, 405, 501):
+            logger.info(
+                "OFFICE does not support delta sync (HTTP %d)", response.status_code
+            )
+            return None
+
+        if response.status_code == 403:
+            body = response.json() if response.content else {}
+            message = body.get("message", f"HTTP {response.status_code}")
+            raise OfficeAuthError(
+                f"OFFICE rejected terminal credentials – {message}"
+            )
+
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Unexpected OFFICE response HTTP {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+
+        result = response.json()
+        if result.get("status") != "ok":
+            raise RuntimeError(
+                f"OFFICE returned error status: {result.get('message', 'unknown')}"
+            )
+
+        data = result.get("data", {})
+        logger.info(
+            "✓ Changes received from OFFICE (%d resource type(s))",
+            len(data.get("resources") or {}),
+        )
+        return data
+
     def push_transactions(
         self,
         pos_id: int,
@@ -173,7 +398,9 @@ class OfficeClient:
 
         Returns
         -------
-        dict with keys: status, accepted, rejected
+        dict with keys: status, accepted, rejected, and optionally results –
+        one {"transaction_unique_id", "status", "message"} entry per
+        transaction in the batch.
 
         Raises
         ------
@@ -197,24 +424,7 @@ class OfficeClient:
             len(transactions), pos_id,
         )
 
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                timeout=self._timeout,
-            )
-        except requests.ConnectionError as exc:
-            raise OfficeConnectionError(
-                f"Cannot connect to SaleFlex.OFFICE at {self._base_url}: {exc}"
-            ) from exc
-        except requests.Timeout as exc:
-            raise OfficeConnectionError(
-                f"Connection to SaleFlex.OFFICE timed out after {self._timeout}s"
-            ) from exc
-        except requests.RequestException as exc:
-            raise OfficeConnectionError(
-                f"Network error while contacting SaleFlex.OFFICE: {exc}"
-            ) from exc
+        response = self._post_json(url, payload)
 
         if response.status_code not in (200, 201):
             raise RuntimeError(
@@ -258,20 +468,7 @@ class OfficeClient:
             "sequences":     sequences,
         }
 
-        try:
-            response = requests.post(url, json=payload, timeout=self._timeout)
-        except requests.ConnectionError as exc:
-            raise OfficeConnectionError(
-                f"Cannot connect to SaleFlex.OFFICE at {self._base_url}: {exc}"
-            ) from exc
-        except requests.Timeout as exc:
-            raise OfficeConnectionError(
-                f"Connection to SaleFlex.OFFICE timed out after {self._timeout}s"
-            ) from exc
-        except requests.RequestException as exc:
-            raise OfficeConnectionError(
-                f"Network error while contacting SaleFlex.OFFICE: {exc}"
-            ) from exc
+        response = self._post_json(url, payload)
 
         if response.status_code not in (200, 201):
             raise RuntimeError(
@@ -308,20 +505,7 @@ class OfficeClient:
             len(closures), pos_id,
         )
 
-        try:
-            response = requests.post(url, json=payload, timeout=self._timeout)
-        except requests.ConnectionError as exc:
-            raise OfficeConnectionError(
-                f"Cannot connect to SaleFlex.OFFICE at {self._base_url}: {exc}"
-            ) from exc
-        except requests.Timeout as exc:
-            raise OfficeConnectionError(
-                f"Connection to SaleFlex.OFFICE timed out after {self._timeout}s"
-            ) from exc
-        except requests.RequestException as exc:
-            raise OfficeConnectionError(
-                f"Network error while contacting SaleFlex.OFFICE: {exc}"
-            ) from exc
+        response = self._post_json(url, payload)
 
         if response.status_code not in (200, 201):
             raise RuntimeError(
@@ -1,9 +1,9 @@
 """
 SaleFlex.PyPOS - SaleFlex.GATE authentication manager.
 
-Handles API token acquisition, storage, and renewal.  The current
-implementation is a stub: token logic is logged and safe defaults are
-returned until real GATE credentials are configured.
+Handles API token acquisition, storage, and renewal.  Tokens are requested
+from GATE's auth endpoint with the configured API key and cached in memory
+until shortly before they expire.
 Copyright (C) 2025-2026 Mousavi.Tech
 
 This program is free software: you can redistribute it and/or modify
@@ -22,10 +22,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
 
+import requests
+
 from core.logger import get_logger
+from core.exceptions import GATEConnectionError
 
 logger = get_logger(__name__)
 
@@ -39,20 +43,27 @@ class GateAuth:
     - Cache the token in memory together with its expiry timestamp.
     - Provide a valid (non-expired) token on every request via get_token().
     - Silently renew the token when it is about to expire.
-
-    All network calls are stubs until a real GATE instance is configured.
     """
 
     # Renew the token this many seconds before it officially expires.
     _RENEWAL_BUFFER_SECONDS: int = 60
-
-    def __init__(self, base_url: str, api_key: str, terminal_id: str) -> None:
-        self._base_url = base_url
+    # Token lifetime assumed when GATE does not send expires_in.
+    _DEFAULT_EXPIRES_IN_SECONDS: int = 3600
+    _TOKEN_ENDPOINT: str = "api/auth/token/"
+
+    def __init__(self, base_url: str, api_key: str, terminal_id: str,
+                 session: Optional[requests.Session] = None,
+                 timeout_seconds: int = 10) -> None:
+        self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._terminal_id = terminal_id
+        self._session = session or requests.Session()
+        self._timeout = timeout_seconds
 
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        # The push worker and the UI thread may both need a token.
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -65,9 +76,10 @@ class GateAuth:
         Returns:
             Bearer token string, or None when authentication is not possible.
         """
-        if self._token_is_valid():
-            return self._token
-        return self._acquire_token()
+        with self._lock:
+            if self._token_is_valid():
+                return self._token
+            return self._acquire_token()
 
     def invalidate(self) -> None:
         """Force the next get_token() call to re-authenticate."""
@@ -89,15 +101,44 @@ class GateAuth:
         """
         Authenticate against GATE and store the returned token.
 
-        TODO: Replace stub with real HTTP POST to GATE's auth endpoint:
-              POST {base_url}/api/auth/token/
-              Body: {"api_key": self._api_key, "terminal_id": self._terminal_id}
+        POST {base_url}/api/auth/token/ with ``{"api_key", "terminal_id"}``;
+        GATE answers ``{"access": "<token>", "expires_in": <seconds>}``.
 
         Returns:
-            Token string on success, None on failure.
+            Token string on success, None when GATE rejects the credentials.
+
+        Raises:
+            GATEConnectionError: When GATE cannot be reached.
         """
-        logger.info("[GateAuth] _acquire_token (stub) — no real request made")
-        # Stub: real implementation uses the requests library here.
-        # self._token = response_json["access"]
-        # self._token_expiry = datetime.utcnow() + timedelta(seconds=response_json["expires_in"])
-        return None
+        if not self._base_url or not self._api_key:
+            return None
+        url = f"{self._base_url}/{self._TOKEN_ENDPOINT}"
+        try:
+            response = self._session.post(
+                url,
+                json={"api_key": self._api_key, "terminal_id": self._terminal_id},
+                timeout=self._timeout,
+            )
+        except requests.RequestException as e:
+            raise GATEConnectionError(f"GATE auth request failed: {e}") from e
+
+        if response.status_code >= 500:
+            raise GATEConnectionError(f"GATE auth endpoint returned HTTP {response.status_code}")
+        if response.status_code != 200:
+            logger.warning("[GateAuth] token request rejected: HTTP %s", response.status_code)
+            return None
+        try:
+            body = response.json()
+        except ValueError:
+            logger.warning("[GateAuth] token response is not JSON")
+            return None
+
+        token = body.get("access") or body.get("token")
+        if not token:
+            logger.warning("[GateAuth] token response carries no access token")
+            return None
+        expires_in = int(body.get("expires_in") or self._DEFAULT_EXPIRES_IN_SECONDS)
+        self._token = token
+        self._token_expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+        logger.info("[GateAuth] token acquired (expires in %ds)", expires_in)
+        return token
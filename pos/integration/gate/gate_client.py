@@ -1,8 +1,9 @@
 """
 SaleFlex.PyPOS - SaleFlex.GATE HTTP client.
 
-Low-level transport layer that wraps the `requests` library.  All methods
-are log-only stubs until a real GATE instance is configured via settings.toml.
+Low-level transport layer that wraps the `requests` library.  Requests go
+through one pooled keep-alive session; the client stays inert (empty
+responses) until GATE is configured in settings.toml.
 Copyright (C) 2025-2026 Mousavi.Tech
 
 This program is free software: you can redistribute it and/or modify
@@ -21,10 +22,15 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core.logger import get_logger
-from core.exceptions import GATEConnectionError, GATEAuthError
+from core.exceptions import GATEConnectionError, GATEAuthError, GATESyncError
 from pos.integration.external_device import ExternalDevice
 from pos.integration.gate.gate_auth import GateAuth
 
@@ -33,6 +39,42 @@ logger = get_logger(__name__)
 # Module-level default instance (same pattern as get_default_pos_printer).
 _default_gate_client: "GateClient | None" = None
 
+# Connections kept open to GATE (sync worker, campaign lookups)
+_POOL_MAXSIZE = 4
+# Gateway errors retried by urllib3; only idempotent requests are retried on
+# them, so a POST is never re-sent once GATE may have received it.
+_RETRY_STATUSES = (502, 503, 504)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _shared_session(retry_attempts: int) -> requests.Session:
+    """
+    Return the process-wide keep-alive session for GATE requests.
+
+    Failed connects (and idempotent requests answered with a gateway error)
+    are retried with exponential backoff up to *retry_attempts* times.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=retry_attempts,
+                connect=retry_attempts,
+                read=retry_attempts,
+                status=retry_attempts,
+                backoff_factor=0.5,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
 
 class GateClient(ExternalDevice):
     """
@@ -40,12 +82,11 @@ class GateClient(ExternalDevice):
 
     Responsibilities:
     - Build authenticated request headers using GateAuth.
-    - Execute GET / POST requests with configurable timeout and retry logic.
-    - Raise GATEConnectionError / GATEAuthError on unrecoverable failures.
+    - Execute GET / POST requests on a pooled session with a configurable
+      timeout; connects are retried with backoff.
+    - Raise GATEConnectionError / GATEAuthError when GATE is unreachable or
+      rejects the terminal, GATESyncError when it rejects a request.
     - Return empty dicts when GATE is disabled, so callers never crash.
-
-    All network calls are stubs.  Replace the TODO sections with real
-    `requests` calls once GATE credentials are available in settings.toml.
     """
 
     def __init__(
@@ -57,10 +98,17 @@ class GateClient(ExternalDevice):
         retry_attempts: int = 3,
     ) -> None:
         super().__init__(logical_name="GateClient")
-        self._base_url = base_url.rstrip("/")
+        base_url = base_url.rstrip("/")
+        # Ensure the URL has a scheme so requests doesn't reject it.
+        if base_url and not base_url.startswith(("http://", "https://")):
+            base_url = f"http://{base_url}"
+        self._base_url = base_url
+        self._terminal_id = terminal_id
         self._timeout = timeout_seconds
         self._retry_attempts = retry_attempts
-        self._auth = GateAuth(base_url, api_key, terminal_id)
+        self._session = _shared_session(retry_attempts)
+        self._auth = GateAuth(base_url, api_key, terminal_id,
+                              session=self._session, timeout_seconds=timeout_seconds)
         self._enabled = bool(base_url and api_key)
 
     # ------------------------------------------------------------------
@@ -72,7 +120,11 @@ class GateClient(ExternalDevice):
         if not self._enabled:
             logger.info("[GateClient] connect skipped — GATE not configured")
             return False
-        token = self._auth.get_token()
+        try:
+            token = self._auth.get_token()
+        except GATEConnectionError as e:
+            logger.warning("[GateClient] connect failed — %s", e)
+            return False
         if token:
             self._connected = True
             logger.info("[GateClient] connected to %s", self._base_url)
@@ -87,57 +139,130 @@ class GateClient(ExternalDevice):
         """Return True when GATE is configured and enabled in settings."""
         return self._enabled
 
+    @property
+    def terminal_id(self) -> str:
+        """This terminal's identifier as registered in GATE."""
+        return self._terminal_id
+
     def push(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         HTTP POST *payload* to the endpoint specified in payload["_endpoint"].
 
         The special key ``_endpoint`` is removed before serialisation.
 
-        TODO: Replace stub with:
-              import requests
-              url = f"{self._base_url}/{endpoint}"
-              headers = self._build_headers()
-              resp = requests.post(url, json=payload, headers=headers,
-                                   timeout=self._timeout)
-              resp.raise_for_status()
-              return resp.json()
-
         Returns:
-            Response dict from GATE, or empty dict on stub/error.
+            Response dict from GATE, or empty dict when GATE is disabled.
+
+        Raises:
+            GATEConnectionError: GATE unreachable or answering 5xx.
+            GATEAuthError:       Terminal credentials rejected.
+            GATESyncError:       GATE rejected the payload (other 4xx).
         """
         endpoint = payload.pop("_endpoint", "unknown")
-        logger.info("[GateClient] POST (stub) %s/%s payload_keys=%s",
-                    self._base_url, endpoint, list(payload.keys()))
-        return {}
+        if not self._enabled:
+            return {}
+        response = self._request("POST", endpoint, json=payload)
+        return self._json(response)
+
+    def push_batch(self, endpoint: str, payloads: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        POST several payloads for *endpoint* in one request.
+
+        The items go to ``{endpoint}batch/`` as ``{"items": [...]}``.  GATE
+        may answer with ``{"results": [{"status": "ok" | "error",
+        "error": "..."}, ...]}`` in item order; without ``results`` a 2xx
+        answer accepts every item.
+
+        Returns:
+            One entry per payload: None when accepted, else GATE's error text.
+
+        Raises:
+            GATEConnectionError, GATEAuthError – as push().  A rejection of
+            the whole request (4xx) is reported per item instead of raised.
+        """
+        if not self._enabled or not payloads:
+            return [None] * len(payloads)
+        items = [{k: v for k, v in p.items() if k != "_endpoint"} for p in payloads]
+        try:
+            response = self._request("POST", f"{endpoint.rstrip('/')}/batch/", json={"items": items})
+        except GATEAuthError:
+            raise
+        except GATESyncError as e:
+            return [str(e)] * len(payloads)
+
+        results = self._json(response).get("results")
+        if not isinstance(results, list) or len(results) != len(payloads):
+            return [None] * len(payloads)
+        outcome: List[Optional[str]] = []
+        for result in results:
+            if isinstance(result, dict) and result.get("status", "ok") != "ok":
+                outcome.append(str(result.get("error") or result.get("message") or "rejected"))
+            else:
+                outcome.append(None)
+        return outcome
 
     def pull(self, resource: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         HTTP GET *resource* from GATE.
 
-        TODO: Replace stub with:
-              import requests
-              url = f"{self._base_url}/{resource}"
-              headers = self._build_headers()
-              resp = requests.get(url, params=params, headers=headers,
-                                  timeout=self._timeout)
-              resp.raise_for_status()
-              return resp.json()
-
         Returns:
-            Response dict from GATE, or empty dict on stub/error.
+            Response dict from GATE, or empty dict when GATE is disabled.
+
+        Raises:
+            GATEConnectionError, GATEAuthError, GATESyncError – as push().
         """
-        logger.info("[GateClient] GET (stub) %s/%s params=%s",
-                    self._base_url, resource, params)
-        return {}
+        if not self._enabled:
+            return {}
+        response = self._request("GET", resource, params=params)
+        return self._json(response)
 
-    def health_check(self) -> bool:
+    def wait_for_notifications(
+        self, cursor: Optional[str], wait_seconds: int
+    ) -> Optional[tuple[List[Dict[str, Any]], Optional[str]]]:
         """
-        Lightweight liveness probe — GET /api/health/.
+        Long-poll GATE for notifications newer than *cursor*.
 
-        TODO: Replace stub with a real GET request.
+        GET ``api/notifications/subscribe/?terminal_id=…&cursor=…&wait=N``;
+        GATE holds the request open until a notification exists or *wait_seconds*
+        pass, then answers ``{"results": [...], "cursor": "<next cursor>"}``
+        (an empty list on timeout).
+
+        Returns:
+            ``(notifications, next_cursor)``, or None when GATE offers no
+            subscription endpoint (callers fall back to polling).
+
+        Raises:
+            GATEConnectionError, GATEAuthError – as push().
         """
-        logger.info("[GateClient] health_check (stub) %s", self._base_url)
-        return False
+        if not self._enabled:
+            return [], cursor
+        params: Dict[str, Any] = {"terminal_id": self._terminal_id, "wait": wait_seconds}
+        if cursor:
+            params["cursor"] = cursor
+        try:
+            response = self._request(
+                "GET", "api/notifications/subscribe/",
+                params=params, timeout=wait_seconds + self._timeout,
+            )
+        except GATEAuthError:
+            raise
+        except GATESyncError as e:
+            logger.info("[GateClient] notification subscription unavailable: %s", e)
+            return None
+        body = self._json(response)
+        results = body.get("results")
+        return (results if isinstance(results, list) else []), body.get("cursor") or cursor
+
+    def health_check(self) -> bool:
+        """Lightweight liveness probe — GET /api/health/."""
+        if not self._enabled:
+            return False
+        try:
+            response = self._session.get(f"{self._base_url}/api/health/", timeout=self._timeout)
+            return response.status_code == 200
+        except requests.RequestException as e:
+            logger.warning("[GateClient] health check failed: %s", e)
+            return False
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -154,6 +279,46 @@ class GateClient(ExternalDevice):
             "Accept": "application/json",
         }
 
+    def _request(self, method: str, endpoint: str, timeout: Optional[float] = None,
+                 **kwargs) -> requests.Response:
+        """
+        Send an authenticated request and map failures to GATE exceptions.
+
+        An expired token (HTTP 401) is renewed once and the request repeated.
+        """
+        url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        for attempt in range(2):
+            try:
+                response = self._session.request(
+                    method, url, headers=self._build_headers(),
+                    timeout=timeout or self._timeout, **kwargs
+                )
+            except requests.RequestException as e:
+                raise GATEConnectionError(f"{method} {url} failed: {e}") from e
+            if response.status_code == 401 and attempt == 0:
+                self._auth.invalidate()
+                continue
+            break
+
+        status = response.status_code
+        if status in (401, 403):
+            raise GATEAuthError(f"GATE rejected terminal credentials: HTTP {status}")
+        if status >= 500:
+            raise GATEConnectionError(f"GATE unavailable: HTTP {status}")
+        if status >= 400:
+            raise GATESyncError(f"GATE rejected {method} {endpoint}: HTTP {status} {response.text[:200]}")
+        return response
+
+    @staticmethod
+    def _json(response: requests.Response) -> Dict[str, Any]:
+        if not response.content:
+            return {}
+        try:
+            body = response.json()
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {"results": body}
+
 
 # ---------------------------------------------------------------------------
 # Module-level factory  (same pattern as pos/peripherals)
@@ -22,7 +22,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from core.logger import get_logger
 from pos.integration.gate.gate_client import get_default_gate_client
@@ -34,18 +34,31 @@ logger = get_logger(__name__)
 
 _default_gate_pull: "GatePullService | None" = None
 
+# Keys of the positions kept in OfficeSyncWatermark, so a restart resumes
+# where the last pull / long-poll stopped instead of from the beginning
+_PRODUCT_WATERMARK = "gate.products"
+_CAMPAIGN_WATERMARK = "gate.campaigns"
+_NOTIFICATION_CURSOR = "gate.notifications"
+
 
 class GatePullService:
     """
     Inbound pull service for SaleFlex.GATE.
 
     Each pull_*() method fetches a specific resource from GATE and applies
-    the update locally (cache refresh, DB write, or notification dispatch).
-    All methods are stubs that log the intended operation.
+    the update locally (DB write or notification dispatch); the caller patches
+    the in-memory caches with the rows reported as changed.  Product and
+    campaign pulls ask for changes since the watermark GATE returned last
+    time; notifications are received through GATE's long-poll subscription
+    (or polled).  Watermarks and the subscription cursor are persisted.
     """
 
     def __init__(self) -> None:
         self._client = get_default_gate_client()
+        # Position in GATE's notification stream, advanced by each long-poll;
+        # loaded from the database on first use
+        self._notification_cursor: Optional[str] = None
+        self._cursor_loaded = False
 
     # ------------------------------------------------------------------
     # Public: enable check
@@ -59,47 +72,112 @@ class GatePullService:
     # Pull methods  (called by SyncWorker and hooks.pull_updates_from_gate)
     # ------------------------------------------------------------------
 
-    def pull_product_updates(self) -> List[Dict[str, Any]]:
+    def pull_product_updates(self) -> Dict[str, List[Any]]:
         """
-        Fetch product and pricing updates from GATE since the last sync.
+        Fetch product and pricing updates from GATE since the last sync and
+        write them to the local database.
 
-        After retrieval the local product_data cache should be invalidated
-        and rebuilt so that price changes take effect immediately.
+        GET ``api/products/updates/?terminal_id=…&since=<watermark>``; see
+        ProductSerializer.apply_updates for the answer's layout.
 
         Returns:
-            List of product update dicts from GATE.
+            Model class name → ids of the rows written, for patching the
+            product_data cache (empty when nothing changed).
         """
-        logger.info("[GatePullService] pull_product_updates (stub)")
-        # TODO: raw = self._client.pull("api/products/updates/", {"since": last_sync_ts})
-        # TODO: ProductSerializer.apply_updates(raw.get("results", []))
-        return []
+        return self._pull_changes(
+            "api/products/updates/", _PRODUCT_WATERMARK, ProductSerializer.apply_updates
+        )
 
-    def pull_campaign_updates(self) -> List[Dict[str, Any]]:
+    def pull_campaign_updates(self) -> Dict[str, List[Any]]:
         """
-        Fetch active campaign and promotion definitions from GATE.
+        Fetch campaign and promotion definitions changed on GATE since the
+        last sync and write them to the local database.
+
+        GET ``api/campaigns/updates/?terminal_id=…&since=<watermark>``.
 
         Returns:
-            List of campaign dicts from GATE.
+            Model class name → ids of the rows written (empty when nothing changed).
+        """
+        return self._pull_changes(
+            "api/campaigns/updates/", _CAMPAIGN_WATERMARK, CampaignSerializer.apply_updates
+        )
+
+    def _pull_changes(self, resource: str, watermark_key: str, apply) -> Dict[str, List[Any]]:
+        """
+        GET *resource* since the stored *watermark_key*, apply the answer with
+        *apply* and store GATE's new ``watermark`` – only when every row was
+        applied, so rows that failed are asked for again next time.
         """
-        logger.info("[GatePullService] pull_campaign_updates (stub)")
-        # TODO: raw = self._client.pull("api/campaigns/active/")
-        # TODO: CampaignSerializer.apply_updates(raw.get("results", []))
-        return []
+        from data_layer.engine import Engine
+        from data_layer.office_seeder import load_sync_watermarks, save_sync_watermarks
+
+        engine = Engine()
+        params: Dict[str, Any] = {"terminal_id": self._client.terminal_id}
+        since = load_sync_watermarks(engine).get(watermark_key)
+        if since:
+            params["since"] = since
+        raw = self._client.pull(resource, params)
+        if not raw:
+            return {}
+        result = apply(raw)
+        watermark = raw.get("watermark")
+        if result["incomplete"]:
+            logger.warning(
+                "[GatePullService] %s: %s not fully applied – keeping watermark %s",
+                resource, ", ".join(result["incomplete"]), since,
+            )
+        elif watermark is not None:
+            save_sync_watermarks(engine, {watermark_key: watermark})
+        if result["changed"]:
+            logger.info(
+                "[GatePullService] %s: %s", resource,
+                ", ".join(f"{name} {len(ids)}" for name, ids in result["changed"].items()),
+            )
+        return result["changed"]
 
     def pull_notifications(self) -> List[Dict[str, Any]]:
         """
         Fetch pending terminal notifications and inter-POS messages from GATE.
 
-        Notifications are written to the local GateNotification table and
-        surfaced to the UI via the NotificationWorker signal.
+        Polling counterpart of :meth:`listen_for_notifications`, used when GATE
+        offers no subscription endpoint.
+
+        Returns:
+            List of processed notification dicts (see NotificationSerializer).
+        """
+        raw = self._client.pull("api/notifications/", {"terminal_id": self._client.terminal_id})
+        return NotificationSerializer.save_and_dispatch(raw.get("results", []))
+
+    def listen_for_notifications(self, wait_seconds: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Block until GATE delivers notifications or *wait_seconds* pass.
+
+        Uses GATE's long-poll subscription and remembers the returned cursor
+        (also across restarts), so every notification is delivered once.
+        The cursor is stored only after the notifications were saved.
 
         Returns:
-            List of notification dicts from GATE.
+            List of processed notification dicts (empty on timeout), or None
+            when GATE has no subscription endpoint.
+
+        Raises:
+            GATEConnectionError: When GATE cannot be reached.
         """
-        logger.info("[GatePullService] pull_notifications (stub)")
-        # TODO: raw = self._client.pull("api/notifications/", {"terminal_id": terminal_id})
-        # TODO: NotificationSerializer.save_and_dispatch(raw.get("results", []))
-        return []
+        from data_layer.engine import Engine
+        from data_layer.office_seeder import load_sync_watermarks, save_sync_watermarks
+
+        if not self._cursor_loaded:
+            self._notification_cursor = load_sync_watermarks(Engine()).get(_NOTIFICATION_CURSOR)
+            self._cursor_loaded = True
+        result = self._client.wait_for_notifications(self._notification_cursor, wait_seconds)
+        if result is None:
+            return None
+        notifications, cursor = result
+        processed = NotificationSerializer.save_and_dispatch(notifications) if notifications else []
+        if cursor != self._notification_cursor:
+            save_sync_watermarks(Engine(), {_NOTIFICATION_CURSOR: cursor})
+            self._notification_cursor = cursor
+        return processed
 
     def get_campaign_discounts(self, cart_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -24,10 +24,15 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-from typing import List
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
 from core.logger import get_logger
-from core.exceptions import GATESyncError
+from core.exceptions import GATEConnectionError, GATESyncError
 from pos.integration.gate.gate_client import get_default_gate_client
 from pos.integration.gate.serializers.transaction_serializer import TransactionSerializer
 from pos.integration.gate.serializers.closure_serializer import ClosureSerializer
@@ -37,6 +42,21 @@ logger = get_logger(__name__)
 
 _default_gate_sync: "GateSyncService | None" = None
 
+# Connector types delivered through GATE (see SyncQueueItem)
+GATE_CONNECTORS = ("gate", "gate_erp", "gate_payment")
+
+
+def backoff_delay(failures: int, base_seconds: float, max_seconds: float) -> float:
+    """
+    Delay before the next attempt after *failures* consecutive failures.
+
+    Exponential (base, 2×base, 4×base … capped at *max_seconds*) with "equal
+    jitter": a random value between half and all of that step, so terminals
+    that failed together do not retry in lockstep.
+    """
+    step = min(max_seconds, base_seconds * (2 ** max(0, failures - 1)))
+    return random.uniform(step / 2, step)
+
 
 class GateSyncService:
     """
@@ -47,16 +67,32 @@ class GateSyncService:
     a background QThread so the UI is never blocked.
 
     Offline outbox flow:
-        1. queue_transaction(head_id)  ← called by PaymentEvent hook
+        1. queue_transaction(head_id)  ← called by the payment hooks
         2. SyncQueueItem row is written with status="pending"
-        3. SyncWorker calls flush_pending_queue() on its schedule
-        4. Each pending item is serialised and pushed via GateClient
-        5. Successful items are marked status="sent"; failures increment
-           retry_count and are retried on the next cycle.
+        3. SyncWorker calls flush_pending_queue() when woken or on schedule
+        4. Due items are serialised and pushed via GateClient in batches of
+           ``[gate] push_batch_size`` per endpoint
+        5. Accepted items are marked status="sent"; rejected ones increment
+           retry_count and wait an exponentially growing, jittered delay
+           (next_attempt_at); after ``[gate] retry_attempts`` rejections they
+           are dead-lettered (status="dead_letter").
+
+    When GATE is unreachable no retry is consumed: the connector type as a
+    whole backs off (same jittered schedule) and its items stay due.
     """
 
     def __init__(self) -> None:
+        from settings.settings import Settings
+
         self._client = get_default_gate_client()
+        settings = Settings()
+        self._batch_size = settings.gate_push_batch_size
+        self._max_retries = settings.gate_retry_attempts
+        self._backoff_base = settings.gate_retry_backoff_seconds
+        self._backoff_max = settings.gate_retry_backoff_max_seconds
+        # connector_type -> (consecutive connection failures, monotonic retry time)
+        self._connector_backoff: Dict[str, tuple[int, float]] = {}
+        self._flush_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public: enable check
@@ -70,32 +106,35 @@ class GateSyncService:
     # Public: queue methods  (called from hooks.py)
     # ------------------------------------------------------------------
 
-    def queue_transaction(self, transaction_head_id: str) -> None:
+    def queue_transaction(self, transaction_head_id: str, session=None) -> None:
         """
         Add a completed transaction to the outbox for upload to GATE.
 
         Args:
             transaction_head_id: UUID of the TransactionHead record.
+            session:             Optional open session to enqueue in (see _enqueue).
         """
-        self._enqueue("gate", "transaction", {"head_id": transaction_head_id})
+        self._enqueue("gate", "transaction", {"head_id": str(transaction_head_id)}, session)
 
-    def queue_closure(self, closure_id: str) -> None:
+    def queue_closure(self, closure_id: str, session=None) -> None:
         """
         Add a completed end-of-day closure to the outbox.
 
         Args:
             closure_id: UUID of the Closure record.
+            session:    Optional open session to enqueue in (see _enqueue).
         """
-        self._enqueue("gate", "closure", {"closure_id": closure_id})
+        self._enqueue("gate", "closure", {"closure_id": str(closure_id)}, session)
 
-    def queue_warehouse_movement(self, movement_id: str) -> None:
+    def queue_warehouse_movement(self, movement_id: str, session=None) -> None:
         """
         Add a stock movement event to the outbox.
 
         Args:
             movement_id: UUID of the WarehouseStockMovement record.
+            session:     Optional open session to enqueue in (see _enqueue).
         """
-        self._enqueue("gate", "warehouse_movement", {"movement_id": movement_id})
+        self._enqueue("gate", "warehouse_movement", {"movement_id": str(movement_id)}, session)
 
     def queue_erp_payload(self, payload: dict) -> None:
         """
@@ -123,45 +162,346 @@ class GateSyncService:
     # Public: flush  (called by SyncWorker)
     # ------------------------------------------------------------------
 
-    def flush_pending_queue(self) -> None:
+    def flush_pending_queue(self) -> Dict[str, int]:
         """
-        Process all SyncQueueItem rows with status='pending'.
+        Push every due outbox item of the GATE connectors.
+
+        Items are taken in enqueue order, grouped per connector type and GATE
+        endpoint, and sent ``push_batch_size`` at a time.  A connector that is
+        in connection backoff is skipped; when GATE turns out unreachable the
+        connector stops for this flush and its items stay due.
 
-        Iterates the local outbox, serialises each record, pushes it to GATE,
-        and updates the item status to 'sent' or 'failed'.
+        Returns:
+            Counts ``{"sent", "retried", "dead_letter"}`` for this flush.
 
-        TODO: Implement the DB query and push loop once SyncQueueItem model
-              is registered in data_layer/model/__init__.py.
+        Raises:
+            GATEConnectionError: After the flush when a connector could not
+                reach GATE (the other connectors were still processed).
+        """
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        counts = {"sent": 0, "retried": 0, "dead_letter": 0}
+        if not self.is_enabled():
+            return counts
+
+        with self._flush_lock:
+            started = time.monotonic()
+            unreachable: Optional[GATEConnectionError] = None
+            for connector_type in GATE_CONNECTORS:
+                if self._in_backoff(connector_type):
+                    continue
+                items = SyncQueueItem.get_pending(connector_type, due_before=datetime.now())
+                if not items:
+                    continue
+                try:
+                    self._flush_connector(connector_type, items, counts)
+                    self._connector_backoff.pop(connector_type, None)
+                except GATEConnectionError as e:
+                    failures = self._connector_backoff.get(connector_type, (0, 0.0))[0] + 1
+                    delay = backoff_delay(failures, self._backoff_base, self._backoff_max)
+                    self._connector_backoff[connector_type] = (failures, time.monotonic() + delay)
+                    logger.warning(
+                        "[GateSyncService] %s unreachable (%s) – next attempt in %.0fs",
+                        connector_type, e, delay,
+                    )
+                    unreachable = e
+
+            if any(counts.values()):
+                metrics = self.backlog_metrics()
+                logger.info(
+                    "[GateSyncService] flush: %d sent, %d retried, %d dead-lettered in %.2fs – "
+                    "backlog %d pending (oldest %.0fs), %d dead-letter",
+                    counts["sent"], counts["retried"], counts["dead_letter"],
+                    time.monotonic() - started, metrics["pending"],
+                    metrics["oldest_pending_age_seconds"], metrics["dead_letter"],
+                )
+        if unreachable is not None:
+            raise unreachable
+        return counts
+
+    def seconds_until_due(self) -> Optional[float]:
+        """
+        Seconds until the next outbox item may be attempted (0 = due now),
+        or None when nothing is pending.  Connector backoff is taken into
+        account, so the SyncWorker can sleep exactly until then.
         """
-        logger.info("[GateSyncService] flush_pending_queue (stub)")
-        # Stub outline:
-        # items = SyncQueueItem.get_pending()
-        # for item in items:
-        #     try:
-        #         payload = self._build_payload(item)
-        #         self._client.push(payload)
-        #         item.mark_sent()
-        #     except GATESyncError as e:
-        #         item.increment_retry(str(e))
+        from sqlalchemy import func
+        from data_layer.engine import Engine
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        now = datetime.now()
+        soonest: Optional[float] = None
+        with Engine().get_session() as session:
+            rows = (
+                session.query(
+                    SyncQueueItem.connector_type,
+                    func.count(SyncQueueItem.id),
+                    func.min(SyncQueueItem.next_attempt_at),
+                    func.sum(SyncQueueItem.next_attempt_at.is_(None)),
+                )
+                .filter(
+                    SyncQueueItem.status == SyncQueueItem.STATUS_PENDING,
+                    SyncQueueItem.connector_type.in_(GATE_CONNECTORS),
+                )
+                .group_by(SyncQueueItem.connector_type)
+                .all()
+            )
+        for connector_type, count, next_attempt, unscheduled in rows:
+            if not count:
+                continue
+            wait = 0.0 if unscheduled or next_attempt is None else max(
+                0.0, (next_attempt - now).total_seconds()
+            )
+            backoff = self._connector_backoff.get(connector_type)
+            if backoff:
+                wait = max(wait, backoff[1] - time.monotonic())
+            soonest = wait if soonest is None else min(soonest, wait)
+        return soonest
+
+    def backlog_metrics(self) -> Dict[str, Any]:
+        """
+        Return outbox backlog figures for monitoring.
+
+        Keys: ``pending``, ``dead_letter``, ``oldest_pending_age_seconds``,
+        ``by_connector`` ({connector: {status: count}}) and
+        ``connector_backoff_seconds`` ({connector: seconds until retry}).
+        """
+        from sqlalchemy import func
+        from data_layer.engine import Engine
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        with Engine().get_session() as session:
+            rows = (
+                session.query(
+                    SyncQueueItem.connector_type,
+                    SyncQueueItem.status,
+                    func.count(SyncQueueItem.id),
+                    func.min(SyncQueueItem.created_at),
+                )
+                .filter(SyncQueueItem.status != SyncQueueItem.STATUS_SENT)
+                .group_by(SyncQueueItem.connector_type, SyncQueueItem.status)
+                .all()
+            )
+
+        by_connector: Dict[str, Dict[str, int]] = defaultdict(dict)
+        totals = {SyncQueueItem.STATUS_PENDING: 0, SyncQueueItem.STATUS_DEAD_LETTER: 0}
+        oldest: Optional[datetime] = None
+        for connector_type, status, count, first_created in rows:
+            by_connector[connector_type][status] = count
+            totals[status] = totals.get(status, 0) + count
+            if status == SyncQueueItem.STATUS_PENDING and first_created is not None:
+                oldest = first_created if oldest is None else min(oldest, first_created)
+
+        now_mono = time.monotonic()
+        return {
+            "pending": totals[SyncQueueItem.STATUS_PENDING],
+            "dead_letter": totals[SyncQueueItem.STATUS_DEAD_LETTER],
+            "oldest_pending_age_seconds": (
+                # created_at is SQLite's CURRENT_TIMESTAMP, i.e. UTC
+                max(0.0, (datetime.utcnow() - oldest).total_seconds()) if oldest else 0.0
+            ),
+            "by_connector": dict(by_connector),
+            "connector_backoff_seconds": {
+                connector: max(0.0, until - now_mono)
+                for connector, (_failures, until) in self._connector_backoff.items()
+                if until > now_mono
+            },
+        }
+
+    def requeue_dead_letters(self, connector_type: Optional[str] = None) -> int:
+        """Give dead-lettered items a fresh retry budget; returns how many."""
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        count = SyncQueueItem.requeue_dead_letters(connector_type)
+        if count:
+            logger.info("[GateSyncService] %d dead-lettered item(s) requeued", count)
+        return count
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _enqueue(self, connector_type: str, event_type: str, data: dict) -> None:
+    def _enqueue(self, connector_type: str, event_type: str, data: dict, session=None) -> None:
         """
         Write a new SyncQueueItem row to the local database outbox.
 
+        The same event (connector, type and payload) is not queued twice
+        while it is pending or sent.  With *session* the row is added to the
+        caller's open session and committed together with the caller's
+        records; otherwise it is committed immediately.
+
         Args:
             connector_type: "gate" | "gate_erp" | "gate_payment"
             event_type:     "transaction" | "closure" | "warehouse_movement" | …
             data:           Dict that will be stored as JSON payload.
         """
-        logger.info("[GateSyncService] enqueue connector=%s event=%s data_keys=%s",
-                    connector_type, event_type, list(data.keys()))
-        # TODO: Create and save a SyncQueueItem record here.
-        # from data_layer.model.definition.sync_queue_item import SyncQueueItem
-        # SyncQueueItem.create(connector_type, event_type, data)
+        from data_layer.engine import Engine
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        def enqueue_in(db_session) -> bool:
+            duplicate = (
+                db_session.query(SyncQueueItem.id)
+                .filter(
+                    SyncQueueItem.connector_type == connector_type,
+                    SyncQueueItem.event_type == event_type,
+                    SyncQueueItem.payload == SyncQueueItem.encode_payload(data),
+                    SyncQueueItem.status.in_(
+                        [SyncQueueItem.STATUS_PENDING, SyncQueueItem.STATUS_SENT]
+                    ),
+                )
+                .first()
+            )
+            if duplicate:
+                return False
+            SyncQueueItem.create_pending(
+                connector_type, event_type, data,
+                max_retries=self._max_retries, session=db_session,
+            )
+            return True
+
+        if session is not None:
+            added = enqueue_in(session)
+        else:
+            with Engine().get_session() as own_session:
+                added = enqueue_in(own_session)
+                own_session.commit()
+
+        if added:
+            logger.info("[GateSyncService] enqueued connector=%s event=%s", connector_type, event_type)
+        else:
+            logger.debug("[GateSyncService] already queued connector=%s event=%s",
+                         connector_type, event_type)
+
+    def _in_backoff(self, connector_type: str) -> bool:
+        backoff = self._connector_backoff.get(connector_type)
+        return bool(backoff) and backoff[1] > time.monotonic()
+
+    def _flush_connector(self, connector_type: str, items: list, counts: Dict[str, int]) -> None:
+        """Serialise *items*, group them per endpoint and push them in batches."""
+        by_endpoint: Dict[str, List[tuple[Any, dict]]] = defaultdict(list)
+        errors: Dict[str, str] = {}
+        for item, payload in self._build_payloads(items, errors):
+            by_endpoint[payload.get("_endpoint", f"api/{item.event_type}/")].append((item, payload))
+
+        try:
+            for endpoint, entries in by_endpoint.items():
+                for start in range(0, len(entries), self._batch_size):
+                    batch = entries[start:start + self._batch_size]
+                    results = self._client.push_batch(endpoint, [payload for _item, payload in batch])
+                    sent = [item.id for (item, _payload), error in zip(batch, results) if error is None]
+                    for (item, _payload), error in zip(batch, results):
+                        if error is not None:
+                            errors[item.id] = error
+                    self._mark_sent(sent)
+                    counts["sent"] += len(sent)
+        finally:
+            # Rejections collected so far are recorded even when GATE went away
+            retried, dead = self._mark_failed(items, errors)
+            counts["retried"] += retried
+            counts["dead_letter"] += dead
+
+    @staticmethod
+    def _mark_sent(item_ids: List[str]) -> None:
+        from data_layer.engine import Engine
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        if not item_ids:
+            return
+        with Engine().get_session() as session:
+            session.query(SyncQueueItem).filter(SyncQueueItem.id.in_(item_ids)).update(
+                {
+                    SyncQueueItem.status: SyncQueueItem.STATUS_SENT,
+                    SyncQueueItem.sent_at: datetime.utcnow(),
+                    SyncQueueItem.error_message: None,
+                    SyncQueueItem.next_attempt_at: None,
+                },
+                synchronize_session=False,
+            )
+            session.commit()
+
+    def _mark_failed(self, items: list, errors: Dict[str, str]) -> tuple[int, int]:
+        """
+        Count a rejection for each failed item: schedule its retry with
+        jittered exponential backoff, or dead-letter it when its retry budget
+        is spent.  Returns ``(retried, dead_lettered)``.
+        """
+        from data_layer.engine import Engine
+        from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+        failed = [item for item in items if item.id in errors]
+        if not failed:
+            return 0, 0
+        now = datetime.now()
+        retried = dead = 0
+        with Engine().get_session() as session:
+            for item in failed:
+                retry_count = (item.retry_count or 0) + 1
+                values = {
+                    SyncQueueItem.retry_count: retry_count,
+                    SyncQueueItem.error_message: errors[item.id][:2000],
+                }
+                if retry_count >= (item.max_retries or self._max_retries):
+                    values[SyncQueueItem.status] = SyncQueueItem.STATUS_DEAD_LETTER
+                    values[SyncQueueItem.next_attempt_at] = None
+                    dead += 1
+                    logger.warning(
+                        "[GateSyncService] dead-lettered %s/%s item %s after %d attempt(s): %s",
+                        item.connector_type, item.event_type, item.id, retry_count, errors[item.id],
+                    )
+                else:
+                    delay = backoff_delay(retry_count, self._backoff_base, self._backoff_max)
+                    values[SyncQueueItem.next_attempt_at] = now + timedelta(seconds=delay)
+                    retried += 1
+                session.query(SyncQueueItem).filter(SyncQueueItem.id == item.id).update(
+                    values, synchronize_session=False
+                )
+            session.commit()
+        return retried, dead
+
+    def _build_payloads(self, items: list, errors: Dict[str, str]) -> List[tuple[Any, dict]]:
+        """
+        Serialise SyncQueueItems into GATE API payloads, in queue order.
+
+        Transactions are loaded together (one set of queries for the whole
+        flush); other event types go through their serializer one by one.
+        An item that cannot be serialised – e.g. its record is missing – is
+        left out and its error recorded in *errors*, so it is retried and
+        eventually dead-lettered rather than marked sent.
+        """
+        transactions: Dict[str, Optional[dict]] = {}
+        head_ids = [
+            item.get_payload_dict().get("head_id")
+            for item in items
+            if item.event_type == "transaction"
+        ]
+        if head_ids:
+            try:
+                transactions = TransactionSerializer.serialize_many(
+                    [head_id for head_id in head_ids if head_id]
+                )
+            except Exception as e:
+                logger.error("[GateSyncService] transaction serialisation failed: %s", e)
+                for item in items:
+                    if item.event_type == "transaction":
+                        errors[item.id] = f"serialisation failed: {e}"
+
+        built: List[tuple[Any, dict]] = []
+        for item in items:
+            if item.id in errors:
+                continue
+            try:
+                if item.event_type == "transaction":
+                    head_id = item.get_payload_dict().get("head_id")
+                    payload = transactions.get(str(head_id))
+                    if payload is None:
+                        raise LookupError(f"TransactionHead {head_id} not found")
+                else:
+                    payload = self._build_payload(item)
+            except Exception as e:
+                errors[item.id] = f"serialisation failed: {e}"
+                continue
+            built.append((item, payload))
+        return built
 
     def _build_payload(self, queue_item) -> dict:
         """
@@ -170,7 +510,7 @@ class GateSyncService:
         Selects the appropriate serializer based on the item's event_type.
         """
         event_type = queue_item.event_type
-        data = queue_item.payload
+        data = queue_item.get_payload_dict()
 
         if event_type == "transaction":
             return TransactionSerializer.serialize(data["head_id"])
@@ -28,6 +28,15 @@ from pos.service.campaign.cart_snapshot import normalize_cart_data_for_campaign_
 
 logger = get_logger(__name__)
 
+# Resources (OFFICE change-feed keys) a GATE campaign pull may write
+CAMPAIGN_RESOURCES = (
+    "campaign_types",
+    "campaigns",
+    "campaign_rules",
+    "campaign_products",
+    "coupons",
+)
+
 
 class CampaignSerializer:
     """
@@ -39,19 +48,32 @@ class CampaignSerializer:
     """
 
     @staticmethod
-    def apply_updates(campaigns: List[Dict[str, Any]]) -> None:
+    def apply_updates(updates: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Persist active campaign definitions received from GATE to local DB.
+        Persist campaign definitions received from GATE to the local DB.
+
+        Same layout as :meth:`ProductSerializer.apply_updates`: a
+        ``{"resources": {...}}`` change feed or ``{"results": [campaign, ...]}``;
+        only the campaign tables (:data:`CAMPAIGN_RESOURCES`) are written.
+        ActiveCampaignCache is reloaded when anything changed.
 
         Args:
-            campaigns: List of campaign dicts from GATE.
+            updates: Response body of GATE's campaign update endpoint.
 
-        TODO: Upsert each into Campaign, CampaignRule, CampaignProduct tables.
+        Returns:
+            The ``apply_office_changes`` summary (see ProductSerializer.apply_updates).
         """
-        logger.info("[CampaignSerializer] apply_updates (stub) count=%d", len(campaigns))
+        from data_layer.engine import Engine
+        from data_layer.office_seeder import apply_office_changes
         from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
 
-        ActiveCampaignCache.reload_safely()
+        resources = updates.get("resources")
+        if resources is None:
+            resources = {"campaigns": {"changed": updates.get("results") or []}}
+        result = apply_office_changes(Engine(), {"resources": resources}, only=CAMPAIGN_RESOURCES)
+        if result["changed"]:
+            ActiveCampaignCache.reload_safely()
+        return result
 
     @staticmethod
     def build_discount_request(cart_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -33,7 +33,8 @@ class ClosureSerializer:
     Serialise a Closure record into the GATE API payload format.
 
     Includes high-level totals and all summary breakdown tables
-    (VAT, payment types, departments, discounts, cashiers, currencies).
+    (VAT, payment types, departments, discounts, cashiers, currencies) – the
+    same document the OFFICE push sends, tagged with ``closure_id``.
     """
 
     _ENDPOINT: str = "api/closures/"
@@ -49,16 +50,16 @@ class ClosureSerializer:
         Returns:
             Dict ready to be passed to GateClient.push().
 
-        TODO: Load Closure and all ClosureSummary* records from DB.
+        Raises:
+            LookupError: the closure is not in the local database.
         """
-        logger.info("[ClosureSerializer] serialize (stub) closure_id=%s", closure_id)
+        from pos.integration.office.office_push_service import _build_closure_payload
+
+        data = _build_closure_payload(closure_id)
+        if data is None:
+            raise LookupError(f"Closure {closure_id} not found")
         return {
             "_endpoint": ClosureSerializer._ENDPOINT,
-            "closure_id": closure_id,
-            "vat_summary": [],
-            "payment_summary": [],
-            "department_summary": [],
-            "discount_summary": [],
-            "cashier_summary": [],
-            "currency_summary": [],
+            "closure_id": str(closure_id),
+            **data,
         }
@@ -2,7 +2,7 @@
 SaleFlex.PyPOS - GATE notification serializer.
 
 Converts inbound GATE notification payloads to local GateNotification records
-and prepares them for dispatch to the UI via NotificationWorker signals.
+and prepares them for dispatch to the UI via SyncWorker signals.
 
 Notification types supported by GATE:
     - "product_update"    → trigger product_data cache refresh
@@ -37,6 +37,9 @@ logger = get_logger(__name__)
 # Known notification types that trigger a local cache refresh.
 CACHE_REFRESH_TYPES = {"product_update", "campaign_update", "price_change"}
 
+# Notification type -> name of the cache it invalidates
+CACHE_NAMES = {"product_update": "product", "price_change": "price", "campaign_update": "campaign"}
+
 
 class NotificationSerializer:
     """
@@ -47,31 +50,88 @@ class NotificationSerializer:
     def save_and_dispatch(notifications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Persist notifications to the local GateNotification table and return
-        a list of processed records for the NotificationWorker to dispatch.
+        a list of processed records for the SyncWorker to dispatch.
+
+        GATE's notification id (``id``) is stored in ``gate_notification_id``;
+        a notification already stored – GATE redelivering after a lost cursor
+        or a repeated poll – is neither stored nor dispatched again, which is
+        what acknowledges it locally.
 
         Args:
             notifications: Raw notification dicts from GATE's notifications endpoint.
 
         Returns:
             List of processed notification dicts with at minimum:
-            {"type": str, "title": str, "body": str}
-
-        TODO: Create GateNotification DB records for each item.
-              Mark items as "read" on GATE after processing.
+            {"type": str, "title": str, "body": str, "ids": list, "record_id": str}
         """
-        logger.info("[NotificationSerializer] save_and_dispatch (stub) count=%d",
-                    len(notifications))
+        from data_layer.engine import Engine
+        from data_layer.model.definition.gate_notification import GateNotification
+
+        gate_ids = [str(n["id"]) for n in notifications if n.get("id") is not None]
         processed = []
-        for notif in notifications:
-            processed.append({
-                "type": notif.get("type", "unknown"),
-                "title": notif.get("title", ""),
-                "body": notif.get("body", ""),
-                "source_terminal_id": notif.get("source_terminal_id"),
-            })
+        with Engine().get_session() as session:
+            known = set()
+            if gate_ids:
+                known = {
+                    row.gate_notification_id
+                    for row in session.query(GateNotification.gate_notification_id)
+                    .filter(GateNotification.gate_notification_id.in_(gate_ids))
+                }
+            for notif in notifications:
+                gate_id = notif.get("id")
+                gate_id = None if gate_id is None else str(gate_id)
+                if gate_id is not None:
+                    if gate_id in known:
+                        continue
+                    known.add(gate_id)
+                record = GateNotification()
+                record.notification_type    = notif.get("type", "unknown")
+                record.title                = notif.get("title", "")
+                record.body                 = notif.get("body", "")
+                record.source_terminal_id   = notif.get("source_terminal_id")
+                record.gate_notification_id = gate_id
+                record.is_read              = False
+                session.add(record)
+                session.flush()
+                processed.append({
+                    "type": record.notification_type,
+                    "title": record.title,
+                    "body": record.body,
+                    "source_terminal_id": record.source_terminal_id,
+                    # Ids of the changed records, when GATE names them
+                    "ids": list(notif.get("ids") or []),
+                    "record_id": record.id,
+                })
+            session.commit()
+        if len(processed) != len(notifications):
+            logger.info(
+                "[NotificationSerializer] %d of %d notification(s) already received – skipped",
+                len(notifications) - len(processed), len(notifications),
+            )
         return processed
 
+    @staticmethod
+    def mark_read(record_ids: List[str]) -> None:
+        """Mark the given GateNotification rows read (their cache refresh is done)."""
+        from datetime import datetime
+        from data_layer.engine import Engine
+        from data_layer.model.definition.gate_notification import GateNotification
+
+        if not record_ids:
+            return
+        with Engine().get_session() as session:
+            session.query(GateNotification).filter(GateNotification.id.in_(record_ids)).update(
+                {GateNotification.is_read: True, GateNotification.read_at: datetime.utcnow()},
+                synchronize_session=False,
+            )
+            session.commit()
+
     @staticmethod
     def requires_cache_refresh(notification_type: str) -> bool:
         """Return True when a notification type triggers a local cache refresh."""
         return notification_type in CACHE_REFRESH_TYPES
+
+    @staticmethod
+    def cache_name(notification_type: str) -> str:
+        """Return the cache ("product" | "price" | "campaign") a notification type invalidates."""
+        return CACHE_NAMES.get(notification_type, notification_type.replace("_update", ""))
@@ -28,6 +28,21 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Resources (OFFICE change-feed keys) a GATE product / price pull may write
+PRODUCT_RESOURCES = (
+    "vat_rates",
+    "product_units",
+    "product_manufacturers",
+    "department_main_groups",
+    "department_sub_groups",
+    "products",
+    "product_variants",
+    "product_attributes",
+    "product_barcodes",
+    "product_barcode_masks",
+    "warehouse_product_stock",
+)
+
 
 class ProductSerializer:
     """
@@ -59,17 +74,29 @@ class ProductSerializer:
         }
 
     @staticmethod
-    def apply_updates(updates: List[Dict[str, Any]]) -> None:
+    def apply_updates(updates: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply product updates received from GATE to the local database.
 
-        After applying updates the product_data cache must be rebuilt so
-        that the new prices and stock levels are used immediately.
+        GATE answers in the layout of OFFICE's change feed,
+        ``{"resources": {"products": {"changed": [...], "deleted": [...]}, ...}}``,
+        or with a bare ``{"results": [product, ...]}`` list of changed products.
+        Only the product tables (:data:`PRODUCT_RESOURCES`) are written.
+
+        The caller patches the product_data cache with the returned ``changed``
+        ids so that the new prices and stock levels are used immediately.
 
         Args:
-            updates: List of product update dicts returned by GATE.
+            updates: Response body of GATE's product update endpoint.
 
-        TODO: Upsert each update into the local Product / ProductBarcode tables,
-              then call CacheManager.populate_product_data() to refresh memory.
+        Returns:
+            The ``apply_office_changes`` summary (``changed``: model class
+            name → ids written, ``incomplete``: resources not fully applied).
         """
-        logger.info("[ProductSerializer] apply_updates (stub) count=%d", len(updates))
+        from data_layer.engine import Engine
+        from data_layer.office_seeder import apply_office_changes
+
+        resources = updates.get("resources")
+        if resources is None:
+            resources = {"products": {"changed": updates.get("results") or []}}
+        return apply_office_changes(Engine(), {"resources": resources}, only=PRODUCT_RESOURCES)
@@ -21,7 +21,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Optional
 
 from core.logger import get_logger
 
@@ -32,6 +32,9 @@ class TransactionSerializer:
     """
     Serialise a TransactionHead record into the GATE API payload format.
 
+    The body is the same document the OFFICE push sends (``head`` plus one
+    list per line table and ``fiscal``), tagged with ``transaction_id``.
+
     Usage:
         payload = TransactionSerializer.serialize(transaction_head_id)
         gate_client.push(payload)
@@ -40,14 +43,37 @@ class TransactionSerializer:
     # GATE REST endpoint that receives this payload.
     _ENDPOINT: str = "api/transactions/"
 
+    @staticmethod
+    def serialize_many(transaction_head_ids: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Build the GATE payloads of several completed transactions at once.
+
+        Every table is read once for the whole set (see
+        ``office_push_service._build_transaction_payloads``), so a flush costs
+        a fixed number of queries instead of one set per receipt.
+
+        Args:
+            transaction_head_ids: UUIDs of the TransactionHead records.
+
+        Returns:
+            ``{str(head id): payload}``; None for a head missing from the local DB.
+        """
+        from pos.integration.office.office_push_service import _build_transaction_payloads
+
+        return {
+            head_id: None if data is None else {
+                "_endpoint": TransactionSerializer._ENDPOINT,
+                "transaction_id": head_id,
+                **data,
+            }
+            for head_id, data in _build_transaction_payloads(transaction_head_ids).items()
+        }
+
     @staticmethod
     def serialize(transaction_head_id: str) -> Dict[str, Any]:
         """
         Build the GATE payload for a single completed transaction.
 
-        Loads TransactionHead, its product lines, payments, taxes, and discounts
-        from the local database and converts them to the GATE wire format.
-
         Args:
             transaction_head_id: UUID of the TransactionHead record.
 
@@ -55,15 +81,12 @@ class TransactionSerializer:
             Dict ready to be passed to GateClient.push().
             The special key ``_endpoint`` tells GateClient which URL to use.
 
-        TODO: Load real data from DB and map to GATE field names.
+        Raises:
+            LookupError: the transaction is not in the local database.
         """
-        logger.info("[TransactionSerializer] serialize (stub) head_id=%s",
-                    transaction_head_id)
-        return {
-            "_endpoint": TransactionSerializer._ENDPOINT,
-            "transaction_id": transaction_head_id,
-            "lines": [],
-            "payments": [],
-            "taxes": [],
-            "discounts": [],
-        }
+        payload = TransactionSerializer.serialize_many([transaction_head_id]).get(
+            str(transaction_head_id)
+        )
+        if payload is None:
+            raise LookupError(f"TransactionHead {transaction_head_id} not found")
+        return payload
@@ -43,14 +43,20 @@ class WarehouseSerializer:
         Returns:
             Dict ready for GateClient.push().
 
-        TODO: Load WarehouseStockMovement from DB and map fields.
+        Raises:
+            LookupError: the movement is not in the local database.
         """
-        logger.info("[WarehouseSerializer] serialize (stub) movement_id=%s", movement_id)
-        return {
-            "_endpoint": WarehouseSerializer._ENDPOINT,
-            "movement_id": movement_id,
-            "product_id": None,
-            "warehouse_id": None,
-            "quantity": 0,
-            "movement_type": None,
-        }
+        from uuid import UUID
+        from data_layer.engine import Engine
+        from data_layer.model.definition.warehouse_stock_movement import WarehouseStockMovement
+        from pos.integration.office.office_push_service import _row_to_dict
+
+        with Engine().get_session() as session:
+            movement = session.get(WarehouseStockMovement, UUID(str(movement_id)))
+            if movement is None:
+                raise LookupError(f"WarehouseStockMovement {movement_id} not found")
+            return {
+                "_endpoint": WarehouseSerializer._ENDPOINT,
+                "movement_id": str(movement_id),
+                "movement": _row_to_dict(movement),
+            }
@@ -45,27 +45,65 @@ def _gate_pull():
     return get_default_gate_pull()
 
 
+def _wake_sync_worker() -> None:
+    """Ask the running SyncWorker to flush the outbox now (no-op when not running)."""
+    from pos.manager.sync_worker import get_sync_worker
+    worker = get_sync_worker()
+    if worker is not None:
+        worker.wake()
+
+
+def _wake_sync_worker_after_commit(session) -> None:
+    """Wake the SyncWorker once *session* has committed the outbox row (not after a rollback)."""
+    from sqlalchemy import event
+
+    if "wake_sync_worker" not in session.info:
+        event.listen(session, "after_commit", _on_outbox_commit)
+        event.listen(session, "after_rollback", _on_outbox_rollback)
+    session.info["wake_sync_worker"] = True
+
+
+def _on_outbox_commit(session) -> None:
+    if session.info.get("wake_sync_worker"):
+        session.info["wake_sync_worker"] = False
+        _wake_sync_worker()
+
+
+def _on_outbox_rollback(session) -> None:
+    session.info["wake_sync_worker"] = False
+
+
 # ---------------------------------------------------------------------------
 # Transaction hooks  (called from PaymentEvent)
 # ---------------------------------------------------------------------------
 
-def push_transaction_to_gate(app: Any, transaction_head_id: str) -> None:
+def push_transaction_to_gate(app: Any, transaction_head_id: str, session=None) -> None:
     """
     Queue a completed transaction for upload to SaleFlex.GATE.
 
-    Called by PaymentEvent after a sale document is fully paid and closed.
+    Called while a sale document's permanent records are being written: with
+    *session* the outbox row is added to that session, so it is committed
+    together with the sale or not at all, and errors propagate to roll the
+    sale back.  The SyncWorker is woken once the session commits.  Without a
+    session the row is committed on its own and failures are only logged.
     Silently skips when GATE integration is disabled.
 
     Args:
         app:                 Application singleton (not used directly; kept for
                              consistency with the peripherals/hooks signature).
         transaction_head_id: UUID of the completed TransactionHead record.
+        session:             Open session writing the sale, or None.
     """
     sync = _gate_sync()
     if not sync.is_enabled():
         return
+    if session is not None:
+        sync.queue_transaction(transaction_head_id, session=session)
+        _wake_sync_worker_after_commit(session)
+        return
     try:
         sync.queue_transaction(transaction_head_id)
+        _wake_sync_worker()
     except Exception as e:
         logger.warning("push_transaction_to_gate failed (non-fatal): %s", e)
 
@@ -74,22 +112,29 @@ def push_transaction_to_gate(app: Any, transaction_head_id: str) -> None:
 # Closure hooks  (called from ClosureEvent)
 # ---------------------------------------------------------------------------
 
-def push_closure_to_gate(app: Any, closure_id: str) -> None:
+def push_closure_to_gate(app: Any, closure_id: str, session=None) -> None:
     """
     Queue a completed end-of-day closure for upload to SaleFlex.GATE.
 
-    Called by ClosureEvent after a closure has been successfully persisted
-    to the local database.  Silently skips when GATE is disabled.
+    Called by ClosureEvent while the closure records are being written; with
+    *session* the outbox row commits together with them (see
+    push_transaction_to_gate).  Silently skips when GATE is disabled.
 
     Args:
         app:        Application singleton.
         closure_id: UUID of the completed Closure record.
+        session:    Open session writing the closure, or None.
     """
     sync = _gate_sync()
     if not sync.is_enabled():
         return
+    if session is not None:
+        sync.queue_closure(closure_id, session=session)
+        _wake_sync_worker_after_commit(session)
+        return
     try:
         sync.queue_closure(closure_id)
+        _wake_sync_worker()
     except Exception as e:
         logger.warning("push_closure_to_gate failed (non-fatal): %s", e)
 
@@ -111,6 +156,7 @@ def push_warehouse_movement_to_gate(app: Any, movement_id: str) -> None:
         return
     try:
         sync.queue_warehouse_movement(movement_id)
+        _wake_sync_worker()
     except Exception as e:
         logger.warning("push_warehouse_movement_to_gate failed (non-fatal): %s", e)
 
@@ -133,8 +179,11 @@ def pull_updates_from_gate(app: Any) -> None:
     if not pull.is_enabled():
         return
     try:
-        pull.pull_product_updates()
-        pull.pull_campaign_updates()
+        changed = dict(pull.pull_product_updates())
+        for model_name, ids in pull.pull_campaign_updates().items():
+            changed.setdefault(model_name, []).extend(ids)
+        if changed and hasattr(app, "patch_cached_rows"):
+            app.patch_cached_rows(changed)
         pull.pull_notifications()
     except Exception as e:
         logger.warning("pull_updates_from_gate failed (non-fatal): %s", e)
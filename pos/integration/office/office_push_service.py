@@ -17,9 +17,15 @@ OfficePushService.enqueue_closure(closure_id)
     the closure queue and triggers a non-blocking push attempt.
 
 OfficePushService.flush_pending()
-    Push every 'pending' or 'failed' document and closure queue entry to OFFICE.
+    Push every 'pending' or 'failed' document and closure queue entry to OFFICE,
+    transactions in batches of [office] push_batch_size per request.
     Returns True when all items were dispatched successfully, False otherwise.
 
+OfficePushService.has_pending() -> bool
+    True when unsent items are queued.  Answered from an in-memory counter
+    kept up to date by enqueue() and flush_pending(); the queue tables are
+    only counted when that counter is unknown.
+
 OfficePushService.is_office_mode() -> bool
     Returns True only when the app is running in 'office' mode.
 Copyright (C) 2025-2026 Mousavi.Tech
@@ -40,6 +46,9 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -84,81 +93,153 @@ def _row_to_dict(obj) -> dict[str, Any] | None:
         return {}
 
 
-def _build_transaction_payload(transaction_head_id) -> dict[str, Any] | None:
+# Payload key -> line-item model (module, class) of a transaction, each
+# linked to its head through fk_transaction_head_id.
+_TRANSACTION_LINE_MODELS = (
+    ("products",       "transaction_product",       "TransactionProduct"),
+    ("payments",       "transaction_payment",       "TransactionPayment"),
+    ("discounts",      "transaction_discount",      "TransactionDiscount"),
+    ("departments",    "transaction_department",    "TransactionDepartment"),
+    ("taxes",          "transaction_tax",           "TransactionTax"),
+    ("tips",           "transaction_tip",           "TransactionTip"),
+    ("surcharges",     "transaction_surcharge",     "TransactionSurcharge"),
+    ("notes",          "transaction_note",          "TransactionNote"),
+    ("loyalty",        "Transaction_loyalty",       "TransactionLoyalty"),
+    ("refunds",        "transaction_refund",        "TransactionRefund"),
+    ("changes",        "transaction_change",        "TransactionChange"),
+    ("deliveries",     "transaction_delivery",      "TransactionDelivery"),
+    ("kitchen_orders", "transaction_kitchen_order", "TransactionKitchenOrder"),
+)
+
+# Head ids per IN (...) list, well below SQLite's bound-parameter limit
+_PAYLOAD_ID_CHUNK = 500
+
+_row_serialisers: dict[type, Any] = {}
+
+
+def _json_value(value):
+    """Same conversion as CRUD.to_dict for a value of unknown type."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _column_converter(column):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return _json_value
+    if hasattr(python_type, "isoformat"):
+        return lambda value: None if value is None else value.isoformat()
+    if issubclass(python_type, (bool, int, float)):
+        return _json_value
+    return lambda value: None if value is None else str(value)
+
+
+def _row_serialiser(model_cls):
     """
-    Load a completed TransactionHead and all its line-item children from the
-    local database and return a single transaction dict ready for the OFFICE
-    REST API.
+    Return ``(table, serialise)`` for ``model_cls``; ``serialise(row)`` turns a
+    Core row of the table into the dict CRUD.to_dict would produce, using
+    converters picked once per column from its type.
+    """
+    cached = _row_serialisers.get(model_cls)
+    if cached is None:
+        table = model_cls.__table__
+        keys = [column.name for column in table.columns]
+        converters = [_column_converter(column) for column in table.columns]
 
-    Returns None when the head cannot be found.
+        def serialise(row):
+            return {
+                key: convert(value)
+                for key, convert, value in zip(keys, converters, row)
+            }
+
+        cached = _row_serialisers[model_cls] = (table, serialise)
+    return cached
+
+
+def _build_transaction_payloads(transaction_head_ids) -> dict[str, dict[str, Any] | None]:
     """
+    Load TransactionHeads and their line-item children for several receipts at
+    once and return ``{str(head id): payload}`` (None for a head that cannot be
+    found or an invalid id).
+
+    Every table is read once per chunk of heads with ``IN (...)`` and the rows
+    are grouped in memory, so a batch costs a fixed number of queries instead
+    of one query per table and receipt.
+    """
+    from importlib import import_module
     from uuid import UUID
+    from sqlalchemy import select
     from data_layer.engine import Engine
     from data_layer.model.definition.transaction_head import TransactionHead
-    from data_layer.model.definition.transaction_product import TransactionProduct
-    from data_layer.model.definition.transaction_payment import TransactionPayment
-    from data_layer.model.definition.transaction_discount import TransactionDiscount
-    from data_layer.model.definition.transaction_department import TransactionDepartment
-    from data_layer.model.definition.transaction_tax import TransactionTax
-    from data_layer.model.definition.transaction_tip import TransactionTip
-    from data_layer.model.definition.transaction_surcharge import TransactionSurcharge
-    from data_layer.model.definition.transaction_note import TransactionNote
-    from data_layer.model.definition.Transaction_loyalty import TransactionLoyalty
     from data_layer.model.definition.transaction_fiscal import TransactionFiscal
-    from data_layer.model.definition.transaction_refund import TransactionRefund
-    from data_layer.model.definition.transaction_change import TransactionChange
-    from data_layer.model.definition.transaction_delivery import TransactionDelivery
-    from data_layer.model.definition.transaction_kitchen_order import TransactionKitchenOrder
 
-    try:
-        head_uuid = UUID(str(transaction_head_id))
-    except (ValueError, AttributeError):
-        logger.error("[OfficePushService] Invalid head id: %s", transaction_head_id)
-        return None
+    payloads: dict[str, dict[str, Any] | None] = {}
+    head_uuids = []
+    for head_id in transaction_head_ids:
+        try:
+            head_uuid = UUID(str(head_id))
+        except (ValueError, AttributeError):
+            logger.error("[OfficePushService] Invalid head id: %s", head_id)
+            payloads[str(head_id)] = None
+            continue
+        payloads[str(head_uuid)] = None
+        head_uuids.append(head_uuid)
+
+    line_models = [
+        (key, getattr(import_module(f"data_layer.model.definition.{module}"), class_name))
+        for key, module, class_name in _TRANSACTION_LINE_MODELS
+    ]
 
     with Engine().get_session() as session:
-        head = (
-            session.query(TransactionHead)
-            .filter(TransactionHead.id == head_uuid)
-            .first()
-        )
-        if head is None:
-            logger.error(
-                "[OfficePushService] TransactionHead not found: %s", head_uuid
+        for offset in range(0, len(head_uuids), _PAYLOAD_ID_CHUNK):
+            chunk = head_uuids[offset:offset + _PAYLOAD_ID_CHUNK]
+
+            table, serialise = _row_serialiser(TransactionHead)
+            for row in session.execute(select(table).where(table.c.id.in_(chunk))):
+                payload = {"head": serialise(row)}
+                payload.update((key, []) for key, _model in line_models)
+                payload["fiscal"] = None
+                payloads[str(row.id)] = payload
+
+            for key, model_cls in line_models:
+                table, serialise = _row_serialiser(model_cls)
+                rows = session.execute(
+                    select(table).where(table.c.fk_transaction_head_id.in_(chunk))
+                )
+                for row in rows:
+                    payload = payloads.get(str(row.fk_transaction_head_id))
+                    if payload is not None:
+                        payload[key].append(serialise(row))
+
+            table, serialise = _row_serialiser(TransactionFiscal)
+            rows = session.execute(
+                select(table).where(table.c.fk_transaction_head_id.in_(chunk))
             )
-            return None
+            for row in rows:
+                payload = payloads.get(str(row.fk_transaction_head_id))
+                if payload is not None and payload["fiscal"] is None:
+                    payload["fiscal"] = serialise(row)
 
-        def _load_lines(model_cls, fk_field):
-            return [
-                _row_to_dict(r)
-                for r in session.query(model_cls)
-                .filter(getattr(model_cls, fk_field) == head_uuid)
-                .all()
-            ]
+    for head_uuid in head_uuids:
+        if payloads[str(head_uuid)] is None:
+            logger.error("[OfficePushService] TransactionHead not found: %s", head_uuid)
+    return payloads
 
-        fiscal_row = (
-            session.query(TransactionFiscal)
-            .filter(TransactionFiscal.fk_transaction_head_id == head_uuid)
-            .first()
-        )
 
-        return {
-            "head":           _row_to_dict(head),
-            "products":       _load_lines(TransactionProduct,     "fk_transaction_head_id"),
-            "payments":       _load_lines(TransactionPayment,     "fk_transaction_head_id"),
-            "discounts":      _load_lines(TransactionDiscount,    "fk_transaction_head_id"),
-            "departments":    _load_lines(TransactionDepartment,  "fk_transaction_head_id"),
-            "taxes":          _load_lines(TransactionTax,         "fk_transaction_head_id"),
-            "tips":           _load_lines(TransactionTip,         "fk_transaction_head_id"),
-            "surcharges":     _load_lines(TransactionSurcharge,   "fk_transaction_head_id"),
-            "notes":          _load_lines(TransactionNote,        "fk_transaction_head_id"),
-            "loyalty":        _load_lines(TransactionLoyalty,     "fk_transaction_head_id"),
-            "refunds":        _load_lines(TransactionRefund,      "fk_transaction_head_id"),
-            "changes":        _load_lines(TransactionChange,      "fk_transaction_head_id"),
-            "deliveries":     _load_lines(TransactionDelivery,    "fk_transaction_head_id"),
-            "kitchen_orders": _load_lines(TransactionKitchenOrder, "fk_transaction_head_id"),
-            "fiscal":         _row_to_dict(fiscal_row),
-        }
+def _build_transaction_payload(transaction_head_id) -> dict[str, Any] | None:
+    """
+    Load a completed TransactionHead and all its line-item children from the
+    local database and return a single transaction dict ready for the OFFICE
+    REST API.
+
+    Returns None when the head cannot be found.
+    """
+    payloads = _build_transaction_payloads([transaction_head_id])
+    return next(iter(payloads.values()), None)
 
 
 def _build_closure_payload(closure_id) -> dict[str, Any] | None:
@@ -259,45 +340,136 @@ def _get_pos_id() -> int:
 # OfficePushQueue helpers
 # ---------------------------------------------------------------------------
 
-def _mark_queue_sent(queue_id) -> None:
-    from uuid import UUID
+def _mark_queue_sent(queue_ids) -> None:
+    """Mark the given OfficePushQueue rows 'sent' with a single UPDATE."""
     from data_layer.engine import Engine
     from data_layer.model.definition.office_push_queue import OfficePushQueue
 
+    queue_ids = list(queue_ids)
+    if not queue_ids:
+        return
     now = datetime.now(timezone.utc)
     try:
         with Engine().get_session() as session:
-            q = session.query(OfficePushQueue).filter(
-                OfficePushQueue.id == queue_id
-            ).first()
-            if q:
-                q.status          = "sent"
-                q.sent_at         = now
-                q.last_attempt_at = now
-                q.error_message   = None
-                session.commit()
+            session.query(OfficePushQueue).filter(
+                OfficePushQueue.id.in_(queue_ids)
+            ).update(
+                {
+                    OfficePushQueue.status:          "sent",
+                    OfficePushQueue.sent_at:         now,
+                    OfficePushQueue.last_attempt_at: now,
+                    OfficePushQueue.error_message:   None,
+                },
+                synchronize_session=False,
+            )
+            session.commit()
     except Exception as exc:
-        logger.warning("[OfficePushService] Could not mark queue item sent: %s", exc)
+        logger.warning("[OfficePushService] Could not mark queue items sent: %s", exc)
 
 
-def _mark_queue_failed(queue_id, error: str) -> None:
+def _mark_queue_unconfirmed(queue_ids) -> None:
+    """
+    Mark OfficePushQueue rows 'unconfirmed': OFFICE may have posted them, so
+    they are not retried automatically.
+    """
     from data_layer.engine import Engine
     from data_layer.model.definition.office_push_queue import OfficePushQueue
 
+    queue_ids = list(queue_ids)
+    if not queue_ids:
+        return
     now = datetime.now(timezone.utc)
     try:
         with Engine().get_session() as session:
-            q = session.query(OfficePushQueue).filter(
-                OfficePushQueue.id == queue_id
-            ).first()
-            if q:
-                q.status          = "failed"
-                q.last_attempt_at = now
-                q.retry_count     = (q.retry_count or 0) + 1
-                q.error_message   = str(error)[:500]
-                session.commit()
+            session.query(OfficePushQueue).filter(
+                OfficePushQueue.id.in_(queue_ids)
+            ).update(
+                {
+                    OfficePushQueue.status:          "unconfirmed",
+                    OfficePushQueue.last_attempt_at: now,
+                    OfficePushQueue.error_message:   "Partial accept without per-item results",
+                },
+                synchronize_session=False,
+            )
+            session.commit()
     except Exception as exc:
-        logger.warning("[OfficePushService] Could not mark queue item failed: %s", exc)
+        logger.warning("[OfficePushService] Could not mark queue items unconfirmed: %s", exc)
+
+
+def _mark_queue_failed(errors: dict) -> None:
+    """
+    Mark OfficePushQueue rows 'failed'. ``errors`` maps queue id -> error
+    message; rows sharing a message are updated together in one transaction.
+    """
+    from sqlalchemy import func
+    from data_layer.engine import Engine
+    from data_layer.model.definition.office_push_queue import OfficePushQueue
+
+    if not errors:
+        return
+    by_message: dict[str, list] = {}
+    for queue_id, error in errors.items():
+        by_message.setdefault(str(error)[:500], []).append(queue_id)
+
+    now = datetime.now(timezone.utc)
+    try:
+        with Engine().get_session() as session:
+            for message, queue_ids in by_message.items():
+                session.query(OfficePushQueue).filter(
+                    OfficePushQueue.id.in_(queue_ids)
+                ).update(
+                    {
+                        OfficePushQueue.status:          "failed",
+                        OfficePushQueue.last_attempt_at: now,
+                        OfficePushQueue.retry_count:     func.coalesce(OfficePushQueue.retry_count, 0) + 1,
+                        OfficePushQueue.error_message:   message,
+                    },
+                    synchronize_session=False,
+                )
+            session.commit()
+    except Exception as exc:
+        logger.warning("[OfficePushService] Could not mark queue items failed: %s", exc)
+
+
+def _batch_outcome(result: dict, items: list[dict]) -> tuple[list, dict] | None:
+    """
+    Split a push_transactions response into (sent queue ids, {queue id: error}).
+
+    Per-item results are read from ``result["results"]`` when OFFICE provides
+    them (entries matched on transaction_unique_id).  Without them the outcome
+    is only known when the whole batch was accepted or the request as a whole
+    failed; None is returned for a partial accept, whose accepted
+    transactions cannot be told apart from the rejected ones.
+    """
+    if result.get("status") != "ok":
+        message = result.get("message", "OFFICE rejected transactions")
+        return [], {item["id"]: message for item in items}
+
+    per_item = result.get("results")
+    if isinstance(per_item, list) and per_item:
+        by_uid = {
+            str(entry.get("transaction_unique_id")): entry
+            for entry in per_item
+            if isinstance(entry, dict)
+        }
+        sent, failed = [], {}
+        for item in items:
+            entry = by_uid.get(str(item["transaction_unique_id"]))
+            if entry is None:
+                failed[item["id"]] = "Transaction missing from OFFICE response"
+            elif entry.get("status", "ok") in ("ok", "accepted", "duplicate"):
+                sent.append(item["id"])
+            else:
+                failed[item["id"]] = entry.get("message", "OFFICE rejected transaction")
+        return sent, failed
+
+    accepted = int(result.get("accepted", 0) or 0)
+    if accepted == len(items):
+        return [item["id"] for item in items], {}
+    if accepted == 0:
+        message = result.get("message", "OFFICE rejected transaction")
+        return [], {item["id"]: message for item in items}
+    return None
 
 
 def _mark_closure_queue_sent(queue_id) -> None:
@@ -340,6 +512,169 @@ def _mark_closure_queue_failed(queue_id, error: str) -> None:
         logger.warning("[OfficePushService] Could not mark closure queue item failed: %s", exc)
 
 
+def _push_transaction_batch(client, pos_id: int, batch: list[tuple[dict, dict]],
+                            sequences: list[dict], sent: list, failed: dict,
+                            unconfirmed: list) -> None:
+    """
+    Send ``batch`` ((queue item, payload) pairs) in one push_transactions request,
+    adding the queue ids to ``sent``, ``failed`` ({queue id: error}) or
+    ``unconfirmed``.
+
+    A partial accept must carry per-item ``results``: without them some of the
+    batch is already posted in OFFICE and re-sending any of it could post a
+    sale twice, so the whole batch goes to ``unconfirmed`` instead of being
+    retried.  OfficeConnectionError is left to the caller; outcomes recorded
+    before it stay in the collections.
+    """
+    items = [item for item, _payload in batch]
+    try:
+        result = client.push_transactions(
+            pos_id=pos_id,
+            transactions=[payload for _item, payload in batch],
+            sequences=sequences,
+        )
+    except RuntimeError as exc:
+        # Unexpected HTTP status: the request as a whole was refused
+        failed.update({item["id"]: str(exc) for item in items})
+        return
+
+    outcome = _batch_outcome(result, items)
+    if outcome is None:
+        logger.error(
+            "[OfficePushService] OFFICE accepted %s of %d transaction(s) without per-item "
+            "results – holding the batch as unconfirmed: %s",
+            result.get("accepted"), len(items),
+            ", ".join(str(item["transaction_unique_id"]) for item in items),
+        )
+        unconfirmed.extend(item["id"] for item in items)
+        return
+    sent.extend(outcome[0])
+    failed.update(outcome[1])
+
+
+def _flush_transaction_lane(client, pos_id: int, items: list[dict], batch_size: int,
+                            db_lock: threading.Lock, stop: threading.Event) -> tuple[int, bool]:
+    """
+    Push one lane of queued transactions (one closure, in receipt order) batch
+    by batch and record each outcome.  Returns (number sent, all succeeded).
+
+    The lane stops at its first failed or unconfirmed document: what follows it
+    stays queued, so no later receipt of the closure reaches OFFICE before an
+    earlier one.  Documents of the same batch that were already sent with it
+    keep their outcome.  Queue rows without a local head (closure unknown) have
+    no order to keep and are all attempted.
+
+    Only one lane at a time reads or writes SQLite (``db_lock``), so parallel
+    uploads overlap on the network, not on the database the till is using.
+    Sets ``stop`` and returns when OFFICE is unreachable; lanes check it before
+    every batch and leave their remaining items queued.
+    """
+    from integration.office_client import OfficeConnectionError
+
+    in_order = bool(items) and items[0]["closure_number"] is not None
+    sent_total = 0
+    all_success = True
+    for start in range(0, len(items), batch_size):
+        if stop.is_set():
+            return sent_total, False
+        batch_items = items[start:start + batch_size]
+        batch: list[tuple[dict, dict]] = []
+        failed: dict = {}
+        with db_lock:
+            try:
+                payloads = _build_transaction_payloads(
+                    [item["fk_transaction_head_id"] for item in batch_items]
+                )
+                sequences = _get_current_sequences()
+            except Exception as exc:
+                logger.error("[OfficePushService] Error building transaction payloads: %s", exc)
+                payloads, sequences = {}, []
+                failed = {item["id"]: f"Payload build error: {exc}" for item in batch_items}
+        for item in batch_items:
+            if item["id"] in failed:
+                break
+            payload = payloads.get(str(item["fk_transaction_head_id"]))
+            if payload is None:
+                logger.warning(
+                    "[OfficePushService] TransactionHead not found for queue item %s "
+                    "(tx=%s) – marking failed",
+                    item["id"], item["transaction_unique_id"],
+                )
+                failed[item["id"]] = "TransactionHead not found in local DB"
+                if in_order:
+                    break
+                continue
+            batch.append((item, payload))
+
+        sent: list = []
+        unconfirmed: list = []
+        if batch:
+            try:
+                _push_transaction_batch(client, pos_id, batch, sequences, sent, failed, unconfirmed)
+            except Exception as exc:
+                if isinstance(exc, OfficeConnectionError):
+                    logger.warning("[OfficePushService] OFFICE unreachable: %s", exc)
+                    stop.set()
+                else:
+                    logger.error("[OfficePushService] Transaction push error: %s", exc, exc_info=True)
+                done = set(sent) | set(failed) | set(unconfirmed)
+                failed.update({
+                    item["id"]: str(exc) for item, _payload in batch if item["id"] not in done
+                })
+
+        with db_lock:
+            _mark_queue_sent(sent)
+            _mark_queue_failed(failed)
+            _mark_queue_unconfirmed(unconfirmed)
+        sent_total += len(sent)
+        if failed or unconfirmed:
+            all_success = False
+            if in_order:
+                return sent_total, False
+    return sent_total, all_success
+
+
+# ---------------------------------------------------------------------------
+# Queue state
+# ---------------------------------------------------------------------------
+
+class _QueueState:
+    """
+    In-memory view of the push queues, so OfficePushWorker can tell an empty
+    queue from a busy one without querying SQLite.
+
+    ``pending`` is the number of unsent (pending / failed) rows, or None when
+    unknown – at start-up and after a flush that left rows behind – in which
+    case it is counted once from the database.  ``enqueued`` grows with every
+    insert, so a count taken while a document was being queued is recognised
+    as stale and discarded.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending: int | None = None
+        self.enqueued = 0
+        self.office_unreachable = False
+
+    def note_enqueued(self) -> None:
+        with self.lock:
+            self.enqueued += 1
+            if self.pending is not None:
+                self.pending += 1
+
+    def snapshot(self) -> int:
+        with self.lock:
+            return self.enqueued
+
+    def settle(self, snapshot: int, pending: int | None) -> None:
+        """Record ``pending`` unless an item was enqueued since ``snapshot``."""
+        with self.lock:
+            self.pending = pending if self.enqueued == snapshot else None
+
+
+_queue_state = _QueueState()
+
+
 # ---------------------------------------------------------------------------
 # Public service
 # ---------------------------------------------------------------------------
@@ -390,7 +725,7 @@ class OfficePushService:
                     session.query(OfficePushQueue)
                     .filter(
                         OfficePushQueue.fk_transaction_head_id == transaction_head_id,
-                        OfficePushQueue.status.in_(["pending", "sent"]),
+                        OfficePushQueue.status.in_(["pending", "sent", "unconfirmed"]),
                     )
                     .first()
                 )
@@ -408,6 +743,7 @@ class OfficePushService:
                 )
                 session.add(q)
                 session.commit()
+            _queue_state.note_enqueued()
 
             logger.info(
                 "[OfficePushService] Enqueued transaction: %s", transaction_unique_id
@@ -456,6 +792,7 @@ class OfficePushService:
                 )
                 session.add(q)
                 session.commit()
+            _queue_state.note_enqueued()
 
             logger.info("[OfficePushService] Enqueued closure: %s", closure_unique_id)
         except Exception as exc:
@@ -470,10 +807,19 @@ class OfficePushService:
         """
         Push all 'pending' and 'failed' documents and closures to OFFICE.
 
-        Each queue item is sent in its own REST request.  This keeps retry
-        status precise: one bad document or closure does not hide the result of
-        the remaining queue.  Current sequence counters are included with every
-        request.
+        Transactions are sent in batches of ``[office] push_batch_size`` per
+        REST request with one sequence snapshot per batch; each queue row is
+        marked sent or failed from the per-item outcome, so one bad document
+        does not hide the result of the rest of its batch.  A partial accept
+        without per-item results leaves its batch 'unconfirmed' (never
+        re-sent automatically).  Documents of
+        different closures upload in parallel (up to ``[office] push_workers``
+        requests in flight) while each closure's documents go in receipt order;
+        a closure's upload stops at its first failed or unconfirmed document.
+        Closures are sent one per request once all documents were attempted.
+        When OFFICE is unreachable the flush stops and the remaining items stay
+        queued for the next cycle; office_unreachable() reports it until the
+        next flush.
 
         Returns
         -------
@@ -492,16 +838,34 @@ class OfficePushService:
         from data_layer.engine import Engine
         from data_layer.model.definition.office_push_queue import OfficePushQueue
         from data_layer.model.definition.office_closure_push_queue import OfficeClosurePushQueue
+        from data_layer.model.definition.transaction_head import TransactionHead
         from integration.office_client import OfficeClient, OfficeConnectionError
+        from settings.settings import Settings
 
         transaction_items: list[dict] = []
         closure_items: list[dict] = []
+        snapshot = _queue_state.snapshot()
         try:
             with Engine().get_session() as session:
+                # Closure / receipt order of the queued documents; queue rows
+                # whose head is missing sort last and fail at payload build.
                 tx_rows = (
-                    session.query(OfficePushQueue)
+                    session.query(
+                        OfficePushQueue,
+                        TransactionHead.closure_number,
+                        TransactionHead.receipt_number,
+                    )
+                    .outerjoin(
+                        TransactionHead,
+                        TransactionHead.id == OfficePushQueue.fk_transaction_head_id,
+                    )
                     .filter(OfficePushQueue.status.in_(["pending", "failed"]))
-                    .order_by(OfficePushQueue.created_at.asc())
+                    .order_by(
+                        TransactionHead.closure_number.is_(None),
+                        TransactionHead.closure_number.asc(),
+                        TransactionHead.receipt_number.asc(),
+                        OfficePushQueue.created_at.asc(),
+                    )
                     .all()
                 )
                 closure_rows = (
@@ -510,11 +874,13 @@ class OfficePushService:
                     .order_by(OfficeClosurePushQueue.created_at.asc())
                     .all()
                 )
-                for row in tx_rows:
+                for row, closure_number, _receipt_number in tx_rows:
                     transaction_items.append({
                         "id":                      row.id,
                         "fk_transaction_head_id":  row.fk_transaction_head_id,
                         "transaction_unique_id":   row.transaction_unique_id,
+                        "closure_number":          closure_number,
+                        "created_at":              row.created_at,
                     })
                 for row in closure_rows:
                     closure_items.append({
@@ -527,6 +893,8 @@ class OfficePushService:
             return False, False
 
         if not transaction_items and not closure_items:
+            _queue_state.office_unreachable = False
+            _queue_state.settle(snapshot, 0)
             return True, False
 
         logger.info(
@@ -542,50 +910,54 @@ class OfficePushService:
         # caller can decide whether to trigger a post-closure data refresh.
         closure_sent = False
 
+        settings = Settings()
+        # One lane per closure: a lane is sent strictly in receipt order, and
+        # up to [office] push_workers lanes upload in parallel.
+        lanes: dict[Any, list[dict]] = {}
         for item in transaction_items:
-            tx_id = item["transaction_unique_id"]
-            try:
-                payload = _build_transaction_payload(item["fk_transaction_head_id"])
-            except Exception as exc:
-                logger.error(
-                    "[OfficePushService] Error building payload for %s: %s", tx_id, exc
-                )
-                _mark_queue_failed(item["id"], f"Payload build error: {exc}")
-                all_success = False
-                continue
-
-            if payload is None:
-                logger.warning(
-                    "[OfficePushService] TransactionHead not found for queue item %s "
-                    "(tx=%s) – marking failed",
-                    item["id"], tx_id,
-                )
-                _mark_queue_failed(item["id"], "TransactionHead not found in local DB")
-                all_success = False
-                continue
-
-            try:
-                result = client.push_transactions(
-                    pos_id=pos_id,
-                    transactions=[payload],
-                    sequences=_get_current_sequences(),
-                )
-                if result.get("status") == "ok" and int(result.get("accepted", 0)) == 1:
-                    _mark_queue_sent(item["id"])
-                    logger.info("[OfficePushService] Transaction sent to OFFICE: %s", tx_id)
-                else:
-                    error_msg = result.get("message", "OFFICE rejected transaction")
-                    _mark_queue_failed(item["id"], error_msg)
-                    all_success = False
-            except OfficeConnectionError as exc:
-                logger.warning("[OfficePushService] OFFICE unreachable: %s", exc)
-                _mark_queue_failed(item["id"], str(exc))
-                all_success = False
-            except Exception as exc:
-                logger.error("[OfficePushService] Transaction push error: %s", exc, exc_info=True)
-                _mark_queue_failed(item["id"], str(exc))
-                all_success = False
+            lanes.setdefault(item["closure_number"], []).append(item)
+        db_lock = threading.Lock()
+        stop = threading.Event()
+        started = time.monotonic()
+
+        def run_lane(lane_items):
+            return _flush_transaction_lane(
+                client, pos_id, lane_items, settings.office_push_batch_size, db_lock, stop
+            )
 
+        workers = min(settings.office_push_workers, len(lanes))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="office-push") as pool:
+                results = list(pool.map(run_lane, lanes.values()))
+        else:
+            results = [run_lane(lane_items) for lane_items in lanes.values()]
+
+        if transaction_items:
+            elapsed = max(time.monotonic() - started, 1e-6)
+            sent_count = sum(sent for sent, _ok in results)
+            oldest = min(
+                (item["created_at"] for item in transaction_items if item["created_at"]),
+                default=None,
+            )
+            backlog_age = (
+                (datetime.now(timezone.utc).replace(tzinfo=None) - oldest).total_seconds()
+                if oldest else 0.0
+            )
+            logger.info(
+                "[OfficePushService] %d/%d transaction(s) sent in %.1fs (%.1f/s, %d lane(s), "
+                "oldest queued %.0fs ago)",
+                sent_count, len(transaction_items), elapsed, sent_count / elapsed,
+                len(lanes), backlog_age,
+            )
+        if not all(ok for _sent, ok in results):
+            all_success = False
+        if stop.is_set():
+            # OFFICE went away: closures must not overtake their documents
+            _queue_state.office_unreachable = True
+            _queue_state.settle(snapshot, None)
+            return False, closure_sent
+
+        unreachable = False
         for item in closure_items:
             closure_uid = item["closure_unique_id"]
             try:
@@ -623,18 +995,26 @@ class OfficePushService:
                 logger.warning("[OfficePushService] OFFICE unreachable: %s", exc)
                 _mark_closure_queue_failed(item["id"], str(exc))
                 all_success = False
+                unreachable = True
             except Exception as exc:
                 logger.error("[OfficePushService] Closure push error: %s", exc, exc_info=True)
                 _mark_closure_queue_failed(item["id"], str(exc))
                 all_success = False
 
+        _queue_state.office_unreachable = unreachable
+        # Everything read was delivered; rows left behind are recounted
+        _queue_state.settle(snapshot, 0 if all_success else None)
         return all_success, closure_sent
 
     @staticmethod
-    def refresh_from_office() -> bool:
+    def office_unreachable() -> bool:
+        """Return True when the last flush stopped because OFFICE could not be reached."""
+        return _queue_state.office_unreachable
+
+    @staticmethod
+    def refresh_from_office() -> tuple[bool, dict[str, list] | None]:
         """
-        Pull a fresh copy of all initialisation data from OFFICE and upsert it
-        into the local SQLite database.
+        Bring the local master data up to date with OFFICE.
 
         This is called automatically after a flush cycle in which at least one
         closure was successfully delivered to OFFICE — it is intentionally
@@ -643,17 +1023,29 @@ class OfficePushService:
         rules, sequences, etc.) are reflected locally before the next sales
         period begins.
 
-        Returns True when the refresh completed without errors, False otherwise.
-        The caller should emit a cache-refresh signal so the in-memory caches
-        (pos_data, product_data, ActiveCampaignCache …) are rebuilt from the
-        newly written database rows.
+        The terminal first asks ``/pos/changes`` for the rows changed or
+        deleted since its stored per-resource watermarks and applies only
+        those.  When OFFICE does not offer delta sync or requests a full
+        resync, the complete ``/pos/init`` dataset is pulled and upserted.
+
+        Returns
+        -------
+        (ok, changed) : tuple[bool, dict | None]
+            ok      – True when the refresh completed without errors.
+            changed – model class name → ids of the rows changed by a delta
+                      sync, so the caller can patch just those cache entries;
+                      None after a full reseed (every cache must be rebuilt).
         """
         if not OfficePushService.is_office_mode():
-            return True
+            return True, {}
 
         from integration.office_client import OfficeClient, OfficeConnectionError
         from data_layer.engine import Engine
-        from data_layer.office_seeder import reseed_from_office_data
+        from data_layer.office_seeder import (
+            apply_office_changes,
+            load_sync_watermarks,
+            reseed_from_office_stream,
+        )
 
         logger.info("[OfficePushService] Starting post-closure data refresh from OFFICE...")
 
@@ -664,36 +1056,55 @@ class OfficePushService:
                 logger.warning(
                     "[OfficePushService] OFFICE is unreachable – skipping post-closure refresh"
                 )
-                return False
-
-            init_data = client.fetch_init_data()
+                return False, None
 
             engine = Engine()
-            reseed_from_office_data(engine, init_data)
+            changes = client.fetch_changes(load_sync_watermarks(engine))
+            if changes is not None and not changes.get("full_resync"):
+                result = apply_office_changes(engine, changes)
+                logger.info(
+                    "[OfficePushService] ✓ Delta refresh from OFFICE succeeded "
+                    "(%d upserted, %d deleted)",
+                    result["upserted"], result["deleted"],
+                )
+                return True, result["changed"]
+
+            reseed_from_office_stream(engine, client.stream_init_data())
 
             logger.info("[OfficePushService] ✓ Post-closure data refresh from OFFICE succeeded")
-            return True
+            return True, None
 
         except OfficeConnectionError as exc:
             logger.warning(
                 "[OfficePushService] Cannot reach OFFICE for refresh: %s", exc
             )
-            return False
+            return False, None
         except Exception as exc:
             logger.error(
                 "[OfficePushService] Unexpected error during OFFICE refresh: %s",
                 exc,
                 exc_info=True,
             )
-            return False
+            return False, None
 
     @staticmethod
     def has_pending() -> bool:
-        """Return True when there are unsent document or closure queue items."""
+        """
+        Return True when there are unsent document or closure queue items.
+
+        Answered from the in-memory counter without touching the database;
+        the queue tables are only counted when the counter is unknown.
+        """
+        with _queue_state.lock:
+            pending = _queue_state.pending
+        if pending is not None:
+            return pending > 0
+
         from data_layer.engine import Engine
         from data_layer.model.definition.office_push_queue import OfficePushQueue
         from data_layer.model.definition.office_closure_push_queue import OfficeClosurePushQueue
 
+        snapshot = _queue_state.snapshot()
         try:
             with Engine().get_session() as session:
                 tx_count = (
@@ -706,6 +1117,7 @@ class OfficePushService:
                     .filter(OfficeClosurePushQueue.status.in_(["pending", "failed"]))
                     .count()
                 )
-                return (tx_count + closure_count) > 0
+            _queue_state.settle(snapshot, tx_count + closure_count)
+            return (tx_count + closure_count) > 0
         except Exception:
             return False
@@ -163,6 +163,9 @@ class Application(CurrentStatus, CurrentData, EventHandler, IntegrationMixin):
         about.update_message("Loading active campaign cache...")
         self.app.processEvents()
         self.refresh_active_campaign_cache()
+        # The campaign time-window timer must not fire into a closing application
+        from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
+        self.app.aboutToQuit.connect(ActiveCampaignCache.stop_schedule)
 
         # Set application icon from settings.toml
         # Icon path is configured in settings.toml under app.icon
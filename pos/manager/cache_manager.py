@@ -37,6 +37,7 @@ from data_layer.model import (
     District,
     Form,
     FormControl,
+    FormControlTab,
     LabelValue,
     PaymentType,
     PosSettings,
@@ -63,6 +64,19 @@ from data_layer.model import (
     WarehouseStockMovement,
 )
 
+# product_data models covered by the product lookup index
+_PRODUCT_LOOKUP_MODELS = ("Product", "ProductBarcode", "ProductBarcodeMask")
+
+# pos_data models compiled into the form layout cache
+_FORM_LAYOUT_MODELS = ("Form", "FormControl", "FormControlTab")
+
+# Models read by ActiveCampaignCache
+_CAMPAIGN_MODELS = ("Campaign", "CampaignRule", "CampaignProduct", "CampaignType")
+
+# Above this many changed rows of one model the model is reloaded instead of
+# patched row by row
+_ROW_PATCH_LIMIT = 200
+
 
 class CacheManager:
     """
@@ -93,6 +107,7 @@ class CacheManager:
         - District: District/region master data
         - Form: Dynamic form definitions
         - FormControl: Form controls (buttons, textboxes, etc.)
+        - FormControlTab: Tab pages of TabControl form controls
         - LabelValue: Label/value pairs for translations
         - PaymentType: Payment method definitions
         - PosSettings: POS system-wide settings
@@ -122,6 +137,7 @@ class CacheManager:
             District,
             Form,
             FormControl,
+            FormControlTab,
             LabelValue,
             PaymentType,
             PosSettings,
@@ -160,6 +176,7 @@ class CacheManager:
                 self.pos_data[model_name] = []
         
         logger.debug("[DEBUG] pos_data populated with %s model types", len(self.pos_data))
+        self._form_layouts = {}
     
     def populate_product_data(self, progress_callback=None):
         """
@@ -231,6 +248,7 @@ class CacheManager:
                 self.product_data[model_name] = []
         
         logger.debug("[DEBUG] product_data populated with %s model types", len(self.product_data))
+        self._invalidate_product_lookup()
     
     def update_pos_data_cache(self, model_instance):
         """
@@ -251,6 +269,9 @@ class CacheManager:
         # Only update cache for models that are in pos_data
         if model_name not in self.pos_data:
             return
+
+        if model_name in _FORM_LAYOUT_MODELS:
+            self._form_layouts = {}
         
         # If instance is soft-deleted, remove from cache
         if hasattr(model_instance, 'is_deleted') and model_instance.is_deleted:
@@ -299,6 +320,8 @@ class CacheManager:
         try:
             # Reload from database
             self.pos_data[model_name] = model_class.get_all()
+            if model_name in _FORM_LAYOUT_MODELS:
+                self._form_layouts = {}
             
             # Special handling for PosSettings
             if model_name == "PosSettings" and len(self.pos_data[model_name]) > 0:
@@ -327,6 +350,9 @@ class CacheManager:
         # Only update cache for models that are in product_data
         if model_name not in self.product_data:
             return
+
+        if model_name in _PRODUCT_LOOKUP_MODELS:
+            self._invalidate_product_lookup()
         
         # If instance is soft-deleted, remove from cache
         if hasattr(model_instance, 'is_deleted') and model_instance.is_deleted:
@@ -369,11 +395,111 @@ class CacheManager:
         try:
             # Reload from database
             self.product_data[model_name] = model_class.get_all()
+            if model_name in _PRODUCT_LOOKUP_MODELS:
+                self._invalidate_product_lookup()
             
             logger.debug("[DEBUG] Refreshed %s in product_data cache: %s records", model_name, len(self.product_data[model_name]))
         except Exception as e:
             logger.error("[DEBUG] Error refreshing %s in product_data cache: %s", model_name, e)
 
+    def patch_cached_rows(self, changed):
+        """
+        Bring the caches up to date after rows were written outside the app
+        (e.g. an OFFICE delta sync) without rebuilding them.
+
+        Args:
+            changed: Model class name -> ids of rows that were inserted,
+                     updated or deleted. Those rows are re-read and patched into
+                     pos_data / product_data; models with many changes are
+                     reloaded, and campaign changes reload ActiveCampaignCache.
+        """
+        import data_layer.model as models
+        from data_layer.engine import Engine
+
+        for model_name, ids in changed.items():
+            if model_name in self.pos_data:
+                cache, update, refresh = self.pos_data, self.update_pos_data_cache, self.refresh_pos_data_model
+            elif model_name in self.product_data:
+                cache, update, refresh = self.product_data, self.update_product_data_cache, self.refresh_product_data_model
+            else:
+                continue
+            model_class = getattr(models, model_name, None)
+            if model_class is None:
+                continue
+            if len(ids) > _ROW_PATCH_LIMIT:
+                refresh(model_class)
+                continue
+
+            with Engine().get_session() as session:
+                rows = session.query(model_class).filter(model_class.id.in_(ids)).all()
+            for row in rows:
+                update(row)
+
+            # Rows deleted outright no longer exist to be re-read
+            missing = set(ids) - {row.id for row in rows}
+            if missing:
+                cache[model_name] = [item for item in cache[model_name] if item.id not in missing]
+                if model_name in _FORM_LAYOUT_MODELS:
+                    self._form_layouts = {}
+                if model_name in _PRODUCT_LOOKUP_MODELS:
+                    self._invalidate_product_lookup()
+            logger.debug("[DEBUG] Patched %s %s row(s) in cache", len(ids), model_name)
+
+        if any(model_name in _CAMPAIGN_MODELS for model_name in changed):
+            self.refresh_active_campaign_cache()
+
+    def _invalidate_product_lookup(self):
+        """Drop the product lookup index and bump ``product_data_version``."""
+        self._product_lookup_index = None
+        self.product_data_version = getattr(self, "product_data_version", 0) + 1
+
+    def product_lookup_index(self):
+        """
+        Barcode / product code / barcode-mask index over ``product_data``.
+
+        Built on first use after ``product_data`` was (re)loaded and dropped whenever
+        ``Product``, ``ProductBarcode`` or ``ProductBarcodeMask`` entries change.
+        """
+        index = getattr(self, "_product_lookup_index", None)
+        if index is None:
+            from pos.service.product_lookup_index import ProductLookupIndex
+
+            index = ProductLookupIndex(self.product_data)
+            self._product_lookup_index = index
+            logger.debug(
+                "[DEBUG] Product lookup index built: %s barcodes, %s codes, %s masks",
+                len(index.barcodes), len(index.products_by_code), index.masks.size,
+            )
+        return index
+
+    def form_layout(self, form_id=None, form_name=None):
+        """
+        Compiled ``FormLayout`` (settings, toolbar settings, design list) of a form.
+
+        Layouts are built from ``pos_data`` on first use and kept per form id and
+        name, so redrawing a form (e.g. SALE <-> PAYMENT) needs no database access.
+        The cache is dropped whenever ``Form``, ``FormControl`` or ``FormControlTab``
+        entries change.
+        """
+        from user_interface.render.dynamic_renderer import DynamicFormRenderer
+
+        layouts = getattr(self, "_form_layouts", None)
+        if layouts is None:
+            layouts = self._form_layouts = {}
+        key = ("id", str(form_id)) if form_id else ("name", form_name)
+        layout = layouts.get(key)
+        if layout is None:
+            layout = DynamicFormRenderer(
+                form_id=form_id, form_name=form_name, pos_data=self.pos_data
+            ).compile()
+            if layout.form is None:
+                # Unknown form: not cached, so a form added later is still found
+                return layout
+            layouts[("id", str(layout.form.id))] = layout
+            layouts[("name", layout.form.name)] = layout
+            logger.debug("[DEBUG] Form layout compiled: %s (%s controls)", layout.form.name, len(layout.design))
+        return layout
+
     def refresh_active_campaign_cache(self) -> None:
         """
         Reload the in-memory active campaign snapshot used by ``CampaignService``.
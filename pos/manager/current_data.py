@@ -196,36 +196,23 @@ class CurrentData(DocumentManager, CacheManager, ClosureManager):
             return True
         
         try:
-            # Save head using CRUD.save()
-            head = unwrapped.get("head")
-            if head:
+            from data_layer.model.crud_model import CRUD
+
+            def _models(item):
                 # Unwrap if it's an AutoSaveModel
-                if isinstance(head, AutoSaveModel):
-                    head = head.unwrap()
-                if hasattr(head, 'save'):
-                    head.save()
-            
-            # Save all related temp models using CRUD.save()
+                model = item.unwrap() if isinstance(item, AutoSaveModel) else item
+                return [model] if model is not None and hasattr(model, 'save') else []
+
+            # Head, all related temp models and fiscal, written in one transaction
+            records = _models(unwrapped.get("head"))
             for model_list_name in ["products", "payments", "discounts", "departments", 
                                    "deliveries", "kitchen_orders", "loyalty", "notes",
                                    "refunds", "surcharges", "taxes", "tips"]:
-                models = unwrapped.get(model_list_name, [])
-                for model in models:
+                for model in unwrapped.get(model_list_name, []):
                     if model:
-                        # Unwrap if it's an AutoSaveModel
-                        if isinstance(model, AutoSaveModel):
-                            model = model.unwrap()
-                        if hasattr(model, 'save'):
-                            model.save()
-            
-            # Save fiscal if exists using CRUD.save()
-            fiscal = unwrapped.get("fiscal")
-            if fiscal:
-                # Unwrap if it's an AutoSaveModel
-                if isinstance(fiscal, AutoSaveModel):
-                    fiscal = fiscal.unwrap()
-                if hasattr(fiscal, 'save'):
-                    fiscal.save()
+                        records.extend(_models(model))
+            records.extend(_models(unwrapped.get("fiscal")))
+            CRUD.save_all(records)
             
             return True
         except Exception as e:
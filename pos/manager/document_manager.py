@@ -742,8 +742,8 @@ class DocumentManager:
                     setattr(head, key, getattr(head_temp, key))
             head.id = uuid4()  # New ID for permanent record
             
-            # Create permanent head using CRUD.create()
-            head.create()
+            # The head and its lines are written in one transaction below
+            records = [head]
             
             # Copy all related temp models to permanent models
             # Store mapping of temp IDs to permanent IDs for foreign key updates
@@ -766,8 +766,7 @@ class DocumentManager:
                             setattr(prod, key, getattr(prod_temp, key))
                 prod.id = uuid4()
                 product_id_map[temp_id] = prod.id
-                # Create using CRUD.create()
-                prod.create()
+                records.append(prod)
             
             # Payments
             for pay_temp in self.document_data.get("payments", []):
@@ -784,8 +783,7 @@ class DocumentManager:
                             setattr(pay, key, getattr(pay_temp, key))
                 pay.id = uuid4()
                 payment_id_map[temp_id] = pay.id
-                # Create using CRUD.create()
-                pay.create()
+                records.append(pay)
             
             # Departments
             for dept_temp in self.document_data.get("departments", []):
@@ -802,8 +800,7 @@ class DocumentManager:
                             setattr(dept, key, getattr(dept_temp, key))
                 dept.id = uuid4()
                 total_id_map[temp_id] = dept.id
-                # Create using CRUD.create()
-                dept.create()
+                records.append(dept)
             
             # Discounts
             for disc_temp in self.document_data.get("discounts", []):
@@ -831,8 +828,7 @@ class DocumentManager:
                         else:
                             setattr(disc, key, getattr(disc_temp, key))
                 disc.id = uuid4()
-                # Create using CRUD.create()
-                disc.create()
+                records.append(disc)
             
             # Deliveries
             for del_temp in self.document_data.get("deliveries", []):
@@ -847,8 +843,7 @@ class DocumentManager:
                         else:
                             setattr(del_rec, key, getattr(del_temp, key))
                 del_rec.id = uuid4()
-                # Create using CRUD.create()
-                del_rec.create()
+                records.append(del_rec)
             
             # Kitchen Orders
             for ko_temp in self.document_data.get("kitchen_orders", []):
@@ -866,8 +861,7 @@ class DocumentManager:
                         else:
                             setattr(ko, key, getattr(ko_temp, key))
                 ko.id = uuid4()
-                # Create using CRUD.create()
-                ko.create()
+                records.append(ko)
             
             # Loyalty
             for loy_temp in self.document_data.get("loyalty", []):
@@ -882,8 +876,7 @@ class DocumentManager:
                         else:
                             setattr(loy, key, getattr(loy_temp, key))
                 loy.id = uuid4()
-                # Create using CRUD.create()
-                loy.create()
+                records.append(loy)
             
             # Notes
             for note_temp in self.document_data.get("notes", []):
@@ -898,8 +891,7 @@ class DocumentManager:
                         else:
                             setattr(note, key, getattr(note_temp, key))
                 note.id = uuid4()
-                # Create using CRUD.create()
-                note.create()
+                records.append(note)
             
             # Fiscal
             if self.document_data.get("fiscal"):
@@ -915,8 +907,7 @@ class DocumentManager:
                         else:
                             setattr(fiscal, key, getattr(fiscal_temp, key))
                 fiscal.id = uuid4()
-                # Create using CRUD.create()
-                fiscal.create()
+                records.append(fiscal)
             
             # Refunds
             for ref_temp in self.document_data.get("refunds", []):
@@ -934,8 +925,7 @@ class DocumentManager:
                         else:
                             setattr(ref, key, getattr(ref_temp, key))
                 ref.id = uuid4()
-                # Create using CRUD.create()
-                ref.create()
+                records.append(ref)
             
             # Surcharges
             for sur_temp in self.document_data.get("surcharges", []):
@@ -950,8 +940,7 @@ class DocumentManager:
                         else:
                             setattr(sur, key, getattr(sur_temp, key))
                 sur.id = uuid4()
-                # Create using CRUD.create()
-                sur.create()
+                records.append(sur)
             
             # Taxes
             for tax_temp in self.document_data.get("taxes", []):
@@ -969,8 +958,7 @@ class DocumentManager:
                         else:
                             setattr(tax, key, getattr(tax_temp, key))
                 tax.id = uuid4()
-                # Create using CRUD.create()
-                tax.create()
+                records.append(tax)
             
             # Tips
             for tip_temp in self.document_data.get("tips", []):
@@ -988,9 +976,20 @@ class DocumentManager:
                         else:
                             setattr(tip, key, getattr(tip_temp, key))
                 tip.id = uuid4()
-                # Create using CRUD.create()
-                tip.create()
+                records.append(tip)
             
+            # ---- Persist the document, GATE outbox row included ----
+            # The outbox row commits with the document or not at all; GATE is
+            # a no-op unless configured.
+            from data_layer.engine import Engine
+            from data_layer.model.crud_model import CRUD
+            from pos.integration.hooks import push_transaction_to_gate
+
+            with Engine().get_session() as session:
+                CRUD.save_all(records, session=session)
+                push_transaction_to_gate(self, head.id, session=session)
+                session.commit()
+
             logger.info("[DEBUG] Completed document: %s", head_temp.transaction_unique_id)
 
             # ---- OFFICE push – enqueue completed document ----
@@ -55,12 +55,8 @@ class CampaignEvent:
         if not self._require_admin_campaign_access():
             return False
         try:
-            from sqlalchemy import or_
-
             from user_interface.control import DataGrid, TextBox
-
-            from data_layer.engine import Engine
-            from data_layer.model.definition.campaign import Campaign
+            from user_interface.window.datagrid_source import CAMPAIGN_LIST_COLUMNS, campaign_list_source
 
             window = self.interface.window
             if not window:
@@ -72,47 +68,20 @@ class CampaignEvent:
                 if isinstance(child, TextBox):
                     name = getattr(child, "name", "") or getattr(child, "__name__", "")
                     if name == ControlName.CAMPAIGN_SEARCH_TEXTBOX.value:
+                        search = getattr(child, "incremental_search", None)
+                        if search and search.search_now():
+                            return True
                         search_term = child.text().strip()
                         break
 
-            engine = Engine()
-            with engine.get_session() as session:
-                q = session.query(Campaign).filter(Campaign.is_deleted.is_(False))
-                if search_term:
-                    like = f"%{search_term}%"
-                    q = q.filter(
-                        or_(
-                            Campaign.code.ilike(like),
-                            Campaign.name.ilike(like),
-                        )
-                    )
-                rows = q.order_by(Campaign.code).limit(500).all()
-
-            columns = ["Code", "Name", "Active", "Type id", "Priority", "Coupon"]
-            grid_rows = []
-            campaign_ids = []
-            for c in rows:
-                grid_rows.append(
-                    [
-                        c.code or "",
-                        c.name or "",
-                        "Y" if c.is_active else "N",
-                        str(c.fk_campaign_type_id) if c.fk_campaign_type_id else "",
-                        str(c.priority) if c.priority is not None else "",
-                        "Y" if c.requires_coupon else "N",
-                    ]
-                )
-                campaign_ids.append(str(c.id))
-
             for child in window.children():
                 if isinstance(child, DataGrid):
                     if getattr(child, "name", "") == ControlName.CAMPAIGN_LIST_DATAGRID.value:
-                        child.set_columns(columns)
-                        child.set_data(grid_rows)
-                        child._campaign_ids = campaign_ids
+                        child.set_columns(CAMPAIGN_LIST_COLUMNS)
+                        child.set_source(campaign_list_source(search_term))
                         break
 
-            logger.info("[CAMPAIGN_SEARCH] Listed %s campaign(s)", len(grid_rows))
+            logger.info("[CAMPAIGN_SEARCH] Listed campaigns for query '%s'", search_term)
             return True
         except Exception as exc:
             logger.error("[CAMPAIGN_SEARCH] Error: %s", exc)
@@ -135,10 +104,7 @@ class CampaignEvent:
             for child in window.children():
                 if isinstance(child, DataGrid):
                     if getattr(child, "name", "") == ControlName.CAMPAIGN_LIST_DATAGRID.value:
-                        idx = child.get_selected_row_index()
-                        ids = getattr(child, "_campaign_ids", [])
-                        if 0 <= idx < len(ids):
-                            campaign_id = ids[idx]
+                        campaign_id = child.get_selected_key()
                         break
 
             if not campaign_id:
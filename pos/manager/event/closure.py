@@ -19,6 +19,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from decimal import Decimal
 from datetime import date, datetime
 from collections import defaultdict
+from uuid import uuid4
 
 from core.logger import get_logger
 from data_layer.engine import Engine
@@ -197,15 +198,26 @@ class ClosureEvent:
 
             closure_id = closure.id
 
-            # Create summary records
-            self._create_closure_vat_summaries(closure_id, head_ids, totals)
-            self._create_closure_tip_summaries(closure_id, head_ids, totals)
-            self._create_closure_discount_summaries(closure_id, head_ids, totals)
-            self._create_closure_payment_type_summaries(closure_id, head_ids, totals)
-            self._create_closure_document_type_summaries(closure_id, heads, totals)
-            self._create_closure_department_summaries(closure_id, head_ids, totals)
-            self._create_closure_currency_summaries(closure_id, head_ids, totals, base_currency_id)
-            self._create_closure_cashier_summary(closure_id, totals)
+            # Summary records are collected with the closure and saved together
+            records = [closure]
+            self._create_closure_vat_summaries(closure_id, head_ids, totals, records)
+            self._create_closure_tip_summaries(closure_id, head_ids, totals, records)
+            self._create_closure_discount_summaries(closure_id, head_ids, totals, records)
+            self._create_closure_payment_type_summaries(closure_id, head_ids, totals, records)
+            self._create_closure_document_type_summaries(closure_id, heads, totals, records)
+            self._create_closure_department_summaries(closure_id, head_ids, totals, records)
+            self._create_closure_currency_summaries(closure_id, head_ids, totals, base_currency_id, records)
+            self._create_closure_cashier_summary(closure_id, totals, records)
+
+            # Persist the closure, its summaries and the GATE outbox row in one
+            # transaction; GATE is a no-op unless configured.
+            from data_layer.model.crud_model import CRUD
+            from pos.integration.hooks import push_closure_to_gate
+
+            with Engine().get_session() as session:
+                CRUD.save_all(records, session=session)
+                push_closure_to_gate(self, closure_id, session=session)
+                session.commit()
 
             # Update sequences: ClosureNumber += 1, ReceiptNumber = 1
             if not self._update_closure_sequences(current_closure_number):
@@ -492,7 +504,7 @@ class ClosureEvent:
 
     def _create_closure_record(self, closure_number, store_id, pos_id, base_currency_id,
                                 closure_start_time, closure_end_time, totals):
-        """Create or update the main Closure record.
+        """Build the main Closure record; the caller saves it with its summaries.
 
         If an open (closure_end_time IS NULL) closure record already exists for
         this closure_number (created by create_empty_closure at startup), it is
@@ -517,6 +529,7 @@ class ClosureEvent:
 
             if c is None:
                 c = Closure()
+                c.id = uuid4()
                 c.closure_unique_id = closure_unique_id
                 c.closure_number = closure_number
                 c.fk_store_id = store_id
@@ -539,18 +552,13 @@ class ClosureEvent:
             c.return_transaction_count = totals["return_transaction_count"]
             c.suspended_transaction_count = totals.get("suspended_transaction_count", 0)
             c.expected_cash_amount = totals["expected_cash_amount"]
-
-            if c.id:
-                c.save()
-            else:
-                c.create()
             return c
         except Exception as e:
             logger.error("[CLOSURE] Create closure record error: %s", e)
             return None
 
-    def _create_closure_vat_summaries(self, closure_id, head_ids, totals):
-        """Create ClosureVATSummary records from tax aggregation."""
+    def _create_closure_vat_summaries(self, closure_id, head_ids, totals, records):
+        """Add ClosureVATSummary records from tax aggregation."""
         for key, data in totals["by_tax"].items():
             if isinstance(key, (tuple, list)) and len(key) >= 3:
                 rate, name, juris = key[0], key[1], key[2]
@@ -572,10 +580,10 @@ class ClosureEvent:
             s.transaction_count = data["transaction_count"]
             s.exempt_amount = data.get("exempt_amount", Decimal("0"))
             s.exempt_count = data.get("exempt_count", 0)
-            s.create()
+            records.append(s)
 
-    def _create_closure_tip_summaries(self, closure_id, head_ids, totals):
-        """Create ClosureTipSummary for each payment type that has tips."""
+    def _create_closure_tip_summaries(self, closure_id, head_ids, totals, records):
+        """Add ClosureTipSummary for each payment type that has tips."""
         payment_types = self.pos_data.get("PaymentType", []) if self.pos_data else []
         type_by_name = {pt.type_name: pt.id for pt in payment_types}
         for pt_name, data in totals["by_tip_payment_type"].items():
@@ -593,10 +601,10 @@ class ClosureEvent:
             s.total_tip_amount = data["total_tip_amount"]
             s.average_tip_amount = (data["total_tip_amount"] / data["tip_count"]) if data["tip_count"] else Decimal("0")
             s.average_tip_percentage = Decimal("0")
-            s.create()
+            records.append(s)
 
-    def _create_closure_discount_summaries(self, closure_id, head_ids, totals):
-        """Create ClosureDiscountSummary by discount type."""
+    def _create_closure_discount_summaries(self, closure_id, head_ids, totals, records):
+        """Add ClosureDiscountSummary by discount type."""
         for dt_id, data in totals["by_discount_type"].items():
             if data["count"] == 0 and data["amount"] == 0:
                 continue
@@ -617,10 +625,10 @@ class ClosureEvent:
             s.discount_count = data["count"]
             s.total_discount_amount = data["amount"]
             s.affected_amount = data.get("affected_amount", Decimal("0"))
-            s.create()
+            records.append(s)
 
-    def _create_closure_payment_type_summaries(self, closure_id, head_ids, totals):
-        """Create ClosurePaymentTypeSummary for each payment type."""
+    def _create_closure_payment_type_summaries(self, closure_id, head_ids, totals, records):
+        """Add ClosurePaymentTypeSummary for each payment type."""
         payment_types = self.pos_data.get("PaymentType", []) if self.pos_data else []
         type_by_name = {pt.type_name: pt.id for pt in payment_types}
         for pt_name, data in totals["by_payment_type"].items():
@@ -634,10 +642,10 @@ class ClosureEvent:
             s.fk_payment_type_id = pt_id
             s.total_count = data["count"]
             s.total_amount = data["amount"]
-            s.create()
+            records.append(s)
 
-    def _create_closure_document_type_summaries(self, closure_id, heads, totals):
-        """Create ClosureDocumentTypeSummary by document type."""
+    def _create_closure_document_type_summaries(self, closure_id, heads, totals, records):
+        """Add ClosureDocumentTypeSummary by document type."""
         doc_types = self.pos_data.get("TransactionDocumentType", []) if self.pos_data else []
         type_by_name = {getattr(dt, "name", ""): dt.id for dt in doc_types}
         for doc_name, data in totals["by_document_type"].items():
@@ -655,10 +663,10 @@ class ClosureEvent:
             s.canceled_count = data["canceled_count"]
             s.canceled_amount = data["canceled_amount"]
             s.canceled_tax_amount = data["canceled_tax"]
-            s.create()
+            records.append(s)
 
-    def _create_closure_department_summaries(self, closure_id, head_ids, totals):
-        """Create ClosureDepartmentSummary by department."""
+    def _create_closure_department_summaries(self, closure_id, head_ids, totals, records):
+        """Add ClosureDepartmentSummary by department."""
         for dept_id, data in totals["by_department"].items():
             s = ClosureDepartmentSummary()
             s.fk_closure_id = closure_id
@@ -668,10 +676,10 @@ class ClosureEvent:
             s.tax_amount = data["tax_amount"]
             s.net_amount = data["net_amount"]
             s.discount_amount = data.get("discount_amount", Decimal("0"))
-            s.create()
+            records.append(s)
 
-    def _create_closure_currency_summaries(self, closure_id, head_ids, totals, base_currency_id):
-        """Create ClosureCurrency for each currency used."""
+    def _create_closure_currency_summaries(self, closure_id, head_ids, totals, base_currency_id, records):
+        """Add ClosureCurrency for each currency used."""
         currencies = self.product_data.get("Currency", []) if self.product_data else []
         currency_by_code = {getattr(c, "currency_code", None) or getattr(c, "sign", ""): c for c in currencies}
         for code, data in totals["by_currency"].items():
@@ -686,10 +694,10 @@ class ClosureEvent:
             s.currency_amount = data["currency_amount"]
             s.exchange_rate = data.get("exchange_rate", Decimal("1"))
             s.base_currency_amount = data["base_currency_amount"]
-            s.create()
+            records.append(s)
 
-    def _create_closure_cashier_summary(self, closure_id, totals):
-        """Create one ClosureCashierSummary for the closing cashier with period totals."""
+    def _create_closure_cashier_summary(self, closure_id, totals, records):
+        """Add one ClosureCashierSummary for the closing cashier with period totals."""
         cashier_id = self.cashier_data.id
         valid = totals["valid_transaction_count"]
         total_sales = totals["gross_sales_amount"]
@@ -702,7 +710,7 @@ class ClosureEvent:
         s.void_count = totals.get("void_count", 0)
         s.void_amount = totals.get("void_amount", Decimal("0"))
         s.correction_count = totals.get("correction_count", 0)
-        s.create()
+        records.append(s)
 
     def _update_closure_sequences(self, current_closure_number):
         """Increment ClosureNumber by 1 and set ReceiptNumber to 1 in transaction_sequence."""
@@ -768,8 +776,8 @@ class ClosureEvent:
         Read the currently selected row from the CLOSURE datagrid on the main
         CLOSURE form and return the corresponding closure UUID string.
 
-        The datagrid stores the ordered list of closure IDs as ``_closure_ids``
-        (set by BaseWindow._create_datagrid when populating the CLOSURE grid).
+        Each row of the CLOSURE datagrid is keyed by its closure ID (see
+        ``closure_list_source`` used by BaseWindow._create_datagrid).
 
         Returns:
             str | None: UUID string of the selected closure, or None if nothing
@@ -785,10 +793,7 @@ class ClosureEvent:
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.CLOSURE.value:
-                        idx = child.get_selected_row_index()
-                        ids = getattr(child, "_closure_ids", [])
-                        if 0 <= idx < len(ids):
-                            return ids[idx]
+                        return child.get_selected_key()
             return None
         except Exception as exc:
             logger.error("[CLOSURE_DETAIL] Error reading selected closure: %s", exc)
@@ -876,10 +881,7 @@ class ClosureEvent:
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.CLOSURE_RECEIPTS_DATAGRID.value:
-                        idx = child.get_selected_row_index()
-                        ids = getattr(child, "_receipt_ids", [])
-                        if 0 <= idx < len(ids):
-                            receipt_id = ids[idx]
+                        receipt_id = child.get_selected_key()
                         break
 
             if not receipt_id:
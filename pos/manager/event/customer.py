@@ -113,11 +113,14 @@ class CustomerEvent:
         Read the search textbox on the Customer List form, query the database
         and populate the customer datagrid with matching results.
 
-        Matching logic:
-            - Returns customers whose ``name``, ``last_name``, ``phone_number``,
-              or ``email_address`` contains the search term (case-insensitive).
-            - An empty search term returns all active non-deleted customers
-              (capped at 500 rows).
+        Matching logic (see ``customer_list_source``):
+            - Every word must prefix-match a first name, last name or e-mail
+              token through the ``customer_search`` FTS5 index; a phone-like
+              term prefix-matches the number as typed or normalized.
+            - An empty search term lists all active non-deleted customers;
+              rows are paged from the database as the grid scrolls.
+            - When the textbox has search-as-you-type attached the query runs
+              on its search thread instead of the UI thread.
             - Walk-in customer is excluded from results.
 
         Returns:
@@ -139,64 +142,24 @@ class CustomerEvent:
                 if isinstance(child, TextBox):
                     name = getattr(child, "name", "") or getattr(child, "__name__", "")
                     if name == ControlName.CUSTOMER_SEARCH_TEXTBOX.value:
+                        search = getattr(child, "incremental_search", None)
+                        if search and search.search_now():
+                            return True
                         search_term = child.text().strip()
                         break
 
-            # 2. Query the database
-            from data_layer.model.definition.customer import Customer
-            from data_layer.engine import Engine
-            from sqlalchemy import or_
-
-            engine = Engine()
-            with engine.get_session() as session:
-                query = session.query(Customer).filter(
-                    Customer.is_deleted.is_(False),
-                    Customer.is_walkin.is_(False),
-                )
-
-                if search_term:
-                    like_term = f"%{search_term}%"
-                    from pos.service.loyalty_service import LoyaltyService
-
-                    or_clauses = [
-                        Customer.name.ilike(like_term),
-                        Customer.last_name.ilike(like_term),
-                        Customer.phone_number.ilike(like_term),
-                        Customer.email_address.ilike(like_term),
-                    ]
-                    cc = LoyaltyService.default_phone_country_for_search()
-                    normalized = LoyaltyService.normalize_phone(search_term, cc)
-                    if normalized:
-                        or_clauses.append(Customer.phone_normalized == normalized)
-                    query = query.filter(or_(*or_clauses))
-
-                customers = query.order_by(Customer.last_name, Customer.name).limit(500).all()
-
-            # 3. Populate the datagrid
-            columns = ["First Name", "Last Name", "Phone", "E-mail", "City"]
-            rows = []
-            customer_ids = []
-            for c in customers:
-                rows.append([
-                    c.name or "",
-                    c.last_name or "",
-                    c.phone_number or "",
-                    c.email_address or "",
-                    c.address_line_3 or "",
-                ])
-                customer_ids.append(str(c.id))
+            # 2. Page matching customers from the database into the datagrid
+            from user_interface.window.datagrid_source import CUSTOMER_LIST_COLUMNS, customer_list_source
 
             for child in window.children():
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.CUSTOMER_LIST_DATAGRID.value:
-                        child.set_columns(columns)
-                        child.set_data(rows)
-                        child._customer_ids = customer_ids
+                        child.set_columns(CUSTOMER_LIST_COLUMNS)
+                        child.set_source(customer_list_source(search_term))
                         break
 
-            logger.info("[CUSTOMER_SEARCH] Found %s customer(s) for query '%s'",
-                        len(rows), search_term)
+            logger.info("[CUSTOMER_SEARCH] Listed customers for query '%s'", search_term)
             return True
 
         except Exception as exc:
@@ -240,10 +203,7 @@ class CustomerEvent:
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.CUSTOMER_LIST_DATAGRID.value:
-                        selected_index = child.get_selected_row_index()
-                        customer_ids = getattr(child, "_customer_ids", [])
-                        if 0 <= selected_index < len(customer_ids):
-                            customer_id = customer_ids[selected_index]
+                        customer_id = child.get_selected_key()
                         break
 
             if not customer_id:
@@ -479,10 +439,7 @@ class CustomerEvent:
                     if isinstance(child, DataGrid):
                         name = getattr(child, "name", "")
                         if name == ControlName.CUSTOMER_LIST_DATAGRID.value:
-                            selected_index = child.get_selected_row_index()
-                            customer_ids = getattr(child, "_customer_ids", [])
-                            if 0 <= selected_index < len(customer_ids):
-                                customer_id = customer_ids[selected_index]
+                            customer_id = child.get_selected_key()
                             break
 
             # Priority 2 — customer created via ADD on this form
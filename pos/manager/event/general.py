@@ -386,6 +386,10 @@ class GeneralEvent:
             # Default to LOGIN form
             self.current_form_type = FormName.LOGIN
             self.interface.redraw(form_name=FormName.LOGIN.name)
+
+        # Forms kept alive were built for the cashier who just left (redraw above
+        # parked the one being left), so none of them can be restored any more
+        self.interface.window.discard_kept_forms()
         
         return True
 
@@ -463,16 +467,14 @@ class GeneralEvent:
         
         logger.debug("[BACK] Previous form from history: %s", previous_form_type.name)
         
-        # Find the form from database by name
-        from data_layer.model import Form
-        forms = Form.filter_by(name=previous_form_type.name, is_deleted=False)
+        # Find the form by name (compiled layout cache, loaded from pos_data)
+        previous_form = self.form_layout(form_name=previous_form_type.name).form
         
-        if not forms or len(forms) == 0:
+        if previous_form is None:
             logger.error("[BACK] Form not found in database: %s", previous_form_type.name)
             return False
         
-        previous_form = forms[0]
-        logger.debug("[BACK] Found form in database: %s (ID: %s)", previous_form.name, previous_form.id)
+        logger.debug("[BACK] Found form: %s (ID: %s)", previous_form.name, previous_form.id)
         
         # Update current form without adding to history
         # We need to temporarily set the form directly to avoid adding to history again
@@ -1253,10 +1255,8 @@ class GeneralEvent:
             bool: True if navigation successful, False otherwise
         """
         try:
-            from data_layer.model import Form
-            
-            # Get the target form
-            target_form = Form.get_by_id(target_form_id)
+            # Get the target form (compiled layout cache, loaded from pos_data)
+            target_form = self.form_layout(form_id=target_form_id).form
             
             if not target_form:
                 logger.error("Form not found: %s", target_form_id)
@@ -62,10 +62,16 @@ class ProductEvent:
         and populate the product datagrid with matching results.
 
         Matching logic:
-            - Returns products whose ``name`` or ``short_name`` contains the
-              search term (case-insensitive LIKE), or an exact prefix match.
-            - An empty search term returns all non-deleted products (capped at
-              500 rows to avoid performance problems on large catalogues).
+            - Every word of the search term must be a prefix of a word in the
+              product's name, short name, code, barcodes or description
+              (FTS5 ``product_search`` index), best matches first.
+            - Without FTS5 support, falls back to a case-insensitive LIKE on
+              ``name`` / ``short_name``.
+            - An empty search term returns all non-deleted products.
+            - Rows are loaded page by page as the grid scrolls, so large
+              catalogues are not read up front.
+            - When the textbox has search-as-you-type attached the query runs
+              on its search thread instead of the UI thread.
 
         Returns:
             bool: True on success, False on error or missing authentication.
@@ -86,57 +92,28 @@ class ProductEvent:
                 if isinstance(child, TextBox):
                     name = getattr(child, "name", "") or getattr(child, "__name__", "")
                     if name == ControlName.PRODUCT_SEARCH_TEXTBOX.value:
+                        search = getattr(child, "incremental_search", None)
+                        if search and search.search_now():
+                            return True
                         search_term = child.text().strip()
                         break
 
-            # 2. Query the database
-            from data_layer.model.definition.product import Product
-            from data_layer.engine import Engine
-
-            engine = Engine()
-            with engine.get_session() as session:
-                query = session.query(Product).filter(
-                    Product.is_deleted.is_(False)
-                )
-
-                if search_term:
-                    like_term = f"%{search_term}%"
-                    from sqlalchemy import or_
-                    query = query.filter(
-                        or_(
-                            Product.name.ilike(like_term),
-                            Product.short_name.ilike(like_term),
-                        )
-                    )
-
-                products = query.order_by(Product.name).limit(500).all()
-
-            # 3. Populate the datagrid
-            columns = ["Code", "Name", "Short Name", "Sale Price", "Stock"]
-            rows = []
-            product_ids = []
-            for p in products:
-                rows.append([
-                    p.code or "",
-                    p.name or "",
-                    p.short_name or "",
-                    str(p.sale_price) if p.sale_price is not None else "",
-                    str(p.stock) if p.stock is not None else "",
-                ])
-                product_ids.append(str(p.id))
+            # 2. Page the matching products into the datagrid
+            from user_interface.window.datagrid_source import PRODUCT_LIST_COLUMNS, product_list_source
 
+            row_count = 0
             for child in window.children():
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.PRODUCT_LIST_DATAGRID.value:
-                        child.set_columns(columns)
-                        child.set_data(rows)
-                        # Store product IDs on the datagrid for later retrieval
-                        child._product_ids = product_ids
+                        child.set_columns(PRODUCT_LIST_COLUMNS)
+                        # Rows are keyed by product ID for later retrieval
+                        child.set_source(product_list_source(search_term))
+                        row_count = child.grid_model.rowCount()
                         break
 
-            logger.info("[PRODUCT_SEARCH] Found %s product(s) for query '%s'",
-                        len(rows), search_term)
+            logger.info("[PRODUCT_SEARCH] Showing first %s product(s) for query '%s'",
+                        row_count, search_term)
             return True
 
         except Exception as exc:
@@ -180,10 +157,7 @@ class ProductEvent:
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.PRODUCT_LIST_DATAGRID.value:
-                        selected_index = child.get_selected_row_index()
-                        product_ids = getattr(child, "_product_ids", [])
-                        if 0 <= selected_index < len(product_ids):
-                            product_id = product_ids[selected_index]
+                        product_id = child.get_selected_key()
                         break
 
             if not product_id:
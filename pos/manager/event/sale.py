@@ -178,6 +178,54 @@ class SaleEvent:
             logger.error("[UPDATE_DOCUMENT_DATA] Error updating document_data: %s", e)
             return False
     
+    def _update_document_data_for_sales(self, sales):
+        """
+        Add several PLU lines to document_data at once (scanner batches).
+
+        Delegates to SaleService.add_sales_to_document, which writes all lines in one
+        transaction and recomputes totals and campaigns once.
+
+        Args:
+            sales: List of dicts as returned by _resolve_plu_sale
+
+        Returns:
+            list: Created TransactionProductTemp records (empty on failure)
+        """
+        try:
+            from pos.service import SaleService
+
+            if not self.document_data or not self.document_data.get("head"):
+                logger.debug("[UPDATE_DOCUMENT_DATA] No document_data or head found")
+                return []
+
+            current_currency = self.current_currency if hasattr(self, 'current_currency') and self.current_currency else None
+            cashier_data = self.cashier_data if hasattr(self, 'cashier_data') and self.cashier_data else None
+
+            product_temps = SaleService.add_sales_to_document(
+                document_data=self.document_data,
+                items=[
+                    (sale["product"], sale["quantity"], sale["unit_price"], sale["product_barcode"])
+                    for sale in sales
+                ],
+                product_data=self.product_data,
+                current_currency=current_currency,
+                closure=self.closure if hasattr(self, 'closure') else None,
+                cashier_data=cashier_data
+            )
+
+            if product_temps:
+                # Save document_data (AutoSaveDescriptor will handle saving)
+                self.document_data = self.document_data
+                logger.info("[UPDATE_DOCUMENT_DATA] ✓ Updated document_data with %s PLU lines", len(product_temps))
+                from pos.peripherals.hooks import sync_line_display_from_document
+                sync_line_display_from_document(self, self.document_data)
+
+            return product_temps
+
+        except Exception as e:
+            logger.error("[UPDATE_DOCUMENT_DATA] Error updating document_data: %s", e)
+            return []
+
     # ==================== DEPARTMENT SALES EVENTS ====================
     
     def _sale_department_event(self, button=None):
@@ -826,37 +874,17 @@ class SaleEvent:
 
     def _resolve_product_by_barcode_or_code(self, lookup_text):
         """
-        Match ProductBarcode.barcode then Product.code (same order as numpad sale).
+        Match ProductBarcode.barcode then Product.code (same order as numpad sale),
+        then a ProductBarcodeMask with an embedded PLU (scale labels).
 
         Returns:
             tuple: (product, product_barcode_or_none, sale_type) where sale_type is
                    'PLU_BARCODE', 'PLU_CODE', or None if not found.
         """
-        lookup_text = (lookup_text or "").strip()
-        if not lookup_text:
+        found = self.product_lookup_index().resolve(lookup_text)
+        if found is None:
             return None, None, None
-
-        barcode_records = [
-            pb for pb in self.product_data.get("ProductBarcode", [])
-            if pb.barcode == lookup_text and not (hasattr(pb, "is_deleted") and pb.is_deleted)
-        ]
-        if barcode_records:
-            product_barcode = barcode_records[0]
-            products = [
-                p for p in self.product_data.get("Product", [])
-                if p.id == product_barcode.fk_product_id
-            ]
-            if products:
-                return products[0], product_barcode, "PLU_BARCODE"
-
-        code_matches = [
-            p for p in self.product_data.get("Product", [])
-            if p.code == lookup_text and not (hasattr(p, "is_deleted") and p.is_deleted)
-        ]
-        if code_matches:
-            return code_matches[0], None, "PLU_CODE"
-
-        return None, None, None
+        return found.product, found.product_barcode, found.sale_type
 
     def _warehouse_stock_summary_text(self, product_id):
         """
@@ -1092,7 +1120,9 @@ class SaleEvent:
         Search order:
           1. ProductBarcode.barcode  → exact match
           2. Product.code            → exact match
-        Uses pending_quantity (set by X button) if > 1, otherwise defaults to 1.
+          3. ProductBarcodeMask      → embedded PLU, weight / quantity / price
+        Uses pending_quantity (set by X button) if > 1, otherwise defaults to 1;
+        a weight or piece count decoded from a masked barcode overrides it.
 
         Parameters:
             text: String entered on the numpad before Enter was pressed
@@ -1144,40 +1174,10 @@ class SaleEvent:
 
             lookup_text = text.strip()
 
-            # --- Step 1: search ProductBarcode ---
-            barcode_records = [
-                pb for pb in self.product_data.get("ProductBarcode", [])
-                if pb.barcode == lookup_text and not (hasattr(pb, 'is_deleted') and pb.is_deleted)
-            ]
-
-            product = None
-            product_barcode = None
-            sale_type = None
-
-            if barcode_records:
-                product_barcode = barcode_records[0]
-                products = [
-                    p for p in self.product_data.get("Product", [])
-                    if p.id == product_barcode.fk_product_id
-                ]
-                if products:
-                    product = products[0]
-                    sale_type = "PLU_BARCODE"
-                    logger.debug("[NUMPAD_ENTER] Found via barcode: %s", product.name)
-
-            # --- Step 2: search Product.code if barcode not found ---
-            if product is None:
-                code_matches = [
-                    p for p in self.product_data.get("Product", [])
-                    if p.code == lookup_text and not (hasattr(p, 'is_deleted') and p.is_deleted)
-                ]
-                if code_matches:
-                    product = code_matches[0]
-                    sale_type = "PLU_CODE"
-                    logger.debug("[NUMPAD_ENTER] Found via product code: %s", product.name)
+            plu_sale = self._resolve_plu_sale(lookup_text, window)
 
             # --- Product not found ---
-            if product is None:
+            if plu_sale is None:
                 logger.debug("[NUMPAD_ENTER] No product found for: '%s'", lookup_text)
                 try:
                     from data_layer.model import LabelValue
@@ -1188,14 +1188,11 @@ class SaleEvent:
                     MessageForm.show_error(window, f"Product not found: {lookup_text}", "")
                 return False
 
-            # Determine sale price
-            if sale_type == "PLU_BARCODE" and product_barcode and product_barcode.sale_price:
-                sale_price = float(product_barcode.sale_price)
-            else:
-                sale_price = float(product.sale_price) if product.sale_price else 0.0
-
-            # Determine quantity: pending_quantity takes priority
-            quantity = self._get_and_reset_pending_quantity(window)
+            product = plu_sale["product"]
+            product_barcode = plu_sale["product_barcode"]
+            sale_type = plu_sale["sale_type"]
+            quantity = plu_sale["quantity"]
+            sale_price = plu_sale["unit_price"]
 
             # Stock availability check
             if not self._check_stock_for_sale(product, quantity, window):
@@ -1209,7 +1206,7 @@ class SaleEvent:
                 product_name=product_name,
                 quantity=quantity,
                 unit_price=sale_price,
-                barcode=lookup_text if sale_type == "PLU_BARCODE" else "",
+                barcode=plu_sale["barcode"],
                 reference_id=str(product_barcode.id) if product_barcode else str(product.id),
                 plu_no=product.code
             )
@@ -1229,13 +1226,7 @@ class SaleEvent:
                 if self.document_data and self.document_data.get("products") and sale_list.custom_sales_data_list:
                     sale_list.custom_sales_data_list[-1].reference_id = str(self.document_data["products"][-1].id)
 
-                if hasattr(window, 'amount_table') and window.amount_table:
-                    from pos.service import SaleService
-                    if self.document_data and self.document_data.get("head"):
-                        SaleService.update_amount_table_from_document(
-                            window.amount_table,
-                            self.document_data["head"]
-                        )
+                self._refresh_sale_amount_table(window)
 
                 # Clear numpad after successful sale
                 if numpad:
@@ -1251,6 +1242,178 @@ class SaleEvent:
             logger.error("[NUMPAD_ENTER] Error: %s", str(e))
             return False
 
+    def _refresh_sale_amount_table(self, window):
+        if hasattr(window, 'amount_table') and window.amount_table:
+            from pos.service import SaleService
+            if self.document_data and self.document_data.get("head"):
+                SaleService.update_amount_table_from_document(
+                    window.amount_table,
+                    self.document_data["head"]
+                )
+
+    def _resolve_plu_sale(self, lookup_text, window=None):
+        """
+        Resolve a numpad / scanner code to the line it would sell.
+
+        Consumes the pending quantity (X button or numpad). A weight or piece count
+        decoded from a masked barcode overrides it.
+
+        Returns:
+            dict or None: product, product_barcode, sale_type, quantity, unit_price and
+                          the barcode to show on the sale list; None if not found
+        """
+        found = self.product_lookup_index().resolve(lookup_text)
+        if found is None:
+            return None
+        product = found.product
+        product_barcode = found.product_barcode
+        sale_type = found.sale_type
+        scale = found.scale
+        logger.debug("[PLU_RESOLVE] Found via %s%s: %s",
+                     sale_type, " (barcode mask)" if scale else "", product.name)
+
+        # Determine sale price
+        if sale_type == "PLU_BARCODE" and product_barcode and product_barcode.sale_price:
+            sale_price = float(product_barcode.sale_price)
+        else:
+            sale_price = float(product.sale_price) if product.sale_price else 0.0
+
+        # Determine quantity: pending_quantity takes priority
+        quantity = self._get_and_reset_pending_quantity(window)
+
+        # Masked (scale / price-embedded) barcode: quantity and price come from the label
+        if scale is not None:
+            quantity, sale_price = self._scale_barcode_quantity_and_price(scale, quantity, sale_price)
+
+        return {
+            "product": product,
+            "product_barcode": product_barcode,
+            "sale_type": sale_type,
+            "quantity": quantity,
+            "unit_price": sale_price,
+            "barcode": lookup_text if sale_type == "PLU_BARCODE" or scale is not None else "",
+        }
+
+    def _sale_plu_scan_batch_event(self, barcodes):
+        """
+        Book barcodes read by a keyboard-wedge scanner (NumPad ScannerInputStage).
+
+        All codes are resolved first, then added to the document with one
+        SaleService.add_sales_to_document call (one write, one totals / campaign
+        pass) and to the sale list with window repaints suspended. Unknown codes are
+        reported in a single message after the batch.
+
+        Parameters:
+            barcodes: List of scanned barcode strings, oldest first
+
+        Returns:
+            bool: True if at least one product was sold
+        """
+        if not self.login_succeed:
+            self._logout()
+            return False
+        if not barcodes:
+            return False
+
+        # An armed PLU inquiry consumes the first scan; the rest are sold.
+        if getattr(self, "awaiting_plu_inquiry", False):
+            self._sale_plu_numpad_enter_event(barcodes[0])
+            barcodes = barcodes[1:]
+            if not barcodes:
+                return False
+
+        if not self._ensure_document_open():
+            logger.error("[SCAN_BATCH] Failed to ensure document is open")
+            return False
+
+        try:
+            from user_interface.control.sale_list.sale_list import SaleList
+            from user_interface.form.message_form import MessageForm
+
+            window = self.interface.window if hasattr(self, 'interface') else None
+            if not window:
+                logger.error("[SCAN_BATCH] No window found")
+                return False
+            sale_list = getattr(window, 'sale_list', None)
+            if not sale_list:
+                sale_lists = window.findChildren(SaleList)
+                sale_list = sale_lists[0] if sale_lists else None
+            if not sale_list:
+                logger.error("[SCAN_BATCH] SaleList not found")
+                return False
+
+            not_found = []
+            sales = []
+            for barcode in barcodes:
+                lookup_text = (barcode or "").strip()
+                plu_sale = self._resolve_plu_sale(lookup_text, window) if lookup_text else None
+                if plu_sale is None:
+                    not_found.append(lookup_text)
+                    continue
+                if not self._check_stock_for_sale(plu_sale["product"], plu_sale["quantity"], window):
+                    continue
+                sales.append(plu_sale)
+
+            product_temps = self._update_document_data_for_sales(sales) if sales else []
+
+            window.setUpdatesEnabled(False)
+            try:
+                for plu_sale, product_temp in zip(sales, product_temps):
+                    product = plu_sale["product"]
+                    # reference_id is the DB record ID so REPEAT/DELETE can find the line later
+                    sale_list.add_product(
+                        product_name=product.short_name if product.short_name else product.name,
+                        quantity=plu_sale["quantity"],
+                        unit_price=plu_sale["unit_price"],
+                        barcode=plu_sale["barcode"],
+                        reference_id=str(product_temp.id),
+                        plu_no=product.code
+                    )
+            finally:
+                window.setUpdatesEnabled(True)
+
+            if product_temps:
+                self._refresh_sale_amount_table(window)
+            logger.info("[SCAN_BATCH] ✓ Sold %s of %s scanned barcode(s)", len(product_temps), len(barcodes))
+
+            if not_found:
+                error_msg = "Product not found"
+                try:
+                    from data_layer.model import LabelValue
+                    label_values = LabelValue.filter_by(key="ProductNotFound", culture_info="en-GB", is_deleted=False)
+                    if label_values:
+                        error_msg = label_values[0].value
+                except Exception:
+                    pass
+                MessageForm.show_error(window, f"{error_msg}: {', '.join(not_found)}", "")
+            return bool(product_temps)
+
+        except Exception as e:
+            logger.error("[SCAN_BATCH] Error: %s", str(e))
+            return False
+
+    def _scale_barcode_quantity_and_price(self, scale, quantity, sale_price):
+        """
+        Quantity and unit price for a barcode decoded with a ProductBarcodeMask.
+
+        Weight (kg) or piece count from the label replaces the entered quantity. An
+        embedded price is the line total; with a weight the unit price is derived from it.
+        """
+        from pos.service.vat_service import VatService
+
+        sign = self.current_currency if hasattr(self, "current_currency") and self.current_currency else None
+        decimals = VatService.get_currency_decimal_places(sign, self.product_data)
+        label_price = scale.price(decimals)
+
+        label_quantity = scale.weight or scale.quantity
+        if label_quantity:
+            quantity = float(label_quantity)
+            if label_price is not None:
+                sale_price = float(label_price / label_quantity)
+        elif label_price is not None:
+            sale_price = float(label_price)
+        return quantity, sale_price
+
     # ==================== QUANTITY HELPER ====================
 
     def _get_and_reset_pending_quantity(self, window=None):
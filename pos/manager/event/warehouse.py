@@ -88,8 +88,8 @@ class WarehouseEvent:
         """
         Execute a stock search on the STOCK_INQUIRY form.
 
-        Reads STOCK_SEARCH_TEXTBOX, queries Product + WarehouseProductStock
-        and populates STOCK_INQUIRY_DATAGRID with results:
+        Reads STOCK_SEARCH_TEXTBOX and pages matching products into
+        STOCK_INQUIRY_DATAGRID (see ``stock_inquiry_source``):
             Code | Name | Short Name | Sale Price | Total Stock | Low Stock Alert
         """
         if not self.login_succeed:
@@ -97,6 +97,7 @@ class WarehouseEvent:
 
         try:
             from user_interface.control import TextBox, DataGrid
+            from user_interface.window.datagrid_source import STOCK_INQUIRY_COLUMNS, stock_inquiry_source
             window = self.interface.window
             if not window:
                 return False
@@ -106,61 +107,21 @@ class WarehouseEvent:
                 if isinstance(child, TextBox):
                     name = getattr(child, "name", "")
                     if name == ControlName.STOCK_SEARCH_TEXTBOX.value:
+                        search = getattr(child, "incremental_search", None)
+                        if search and search.search_now():
+                            return True
                         search_term = child.text().strip()
                         break
 
-            from data_layer.model.definition.product import Product
-            from data_layer.model.definition.warehouse_product_stock import WarehouseProductStock
-            from data_layer.engine import Engine
-
-            with Engine().get_session() as session:
-                query = session.query(Product).filter(
-                    Product.is_deleted.is_(False)
-                )
-                if search_term:
-                    like_term = f"%{search_term}%"
-                    from sqlalchemy import or_
-                    query = query.filter(
-                        or_(
-                            Product.name.ilike(like_term),
-                            Product.short_name.ilike(like_term),
-                            Product.code.ilike(like_term),
-                        )
-                    )
-
-                products = query.order_by(Product.name).limit(500).all()
-
-            columns = ["Code", "Name", "Short Name", "Sale Price", "Stock", "Low Stock"]
-            rows = []
-            product_ids = []
-
-            for p in products:
-                low_stock_flag = "⚠" if (
-                    p.stock is not None
-                    and p.min_stock is not None
-                    and p.min_stock > 0
-                    and p.stock <= p.min_stock
-                ) else ""
-                rows.append([
-                    p.code or "",
-                    p.name or "",
-                    p.short_name or "",
-                    str(p.sale_price) if p.sale_price is not None else "0",
-                    str(p.stock) if p.stock is not None else "0",
-                    low_stock_flag,
-                ])
-                product_ids.append(str(p.id))
-
             for child in window.children():
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.STOCK_INQUIRY_DATAGRID.value:
-                        child.set_columns(columns)
-                        child.set_data(rows)
-                        child._product_ids = product_ids
+                        child.set_columns(STOCK_INQUIRY_COLUMNS)
+                        child.set_source(stock_inquiry_source(search_term))
                         break
 
-            logger.info("[STOCK_SEARCH] Found %s products for '%s'", len(rows), search_term)
+            logger.info("[STOCK_SEARCH] Listed products for '%s'", search_term)
             return True
 
         except Exception as exc:
@@ -190,10 +151,7 @@ class WarehouseEvent:
                 if isinstance(child, DataGrid):
                     name = getattr(child, "name", "")
                     if name == ControlName.STOCK_INQUIRY_DATAGRID.value:
-                        idx = child.get_selected_row_index()
-                        ids = getattr(child, "_product_ids", [])
-                        if 0 <= idx < len(ids):
-                            product_id = ids[idx]
+                        product_id = child.get_selected_key()
                         break
 
             if not product_id:
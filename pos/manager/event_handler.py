@@ -359,6 +359,23 @@ class EventHandler(GeneralEvent, SaleEvent, PaymentEvent, ConfigurationEvent,
             # Return None in case of any error during event handler assignment
             return None
     
+    def scan_batch_distributor(self, event_name):
+        """
+        Return the handler that books a batch of scanned barcodes for a NumPad whose
+        Enter event is ``event_name``, or None when the event has no batch form (the
+        NumPad then replays each barcode through the Enter handler).
+
+        Args:
+            event_name (str): Enter event of the NumPad, typically from EventName enum
+
+        Returns:
+            callable or None: Handler taking a list of barcode strings
+        """
+        batch_handler_map = {
+            EventName.SALE_PLU_BARCODE.name: self._sale_plu_scan_batch_event,
+        }
+        return batch_handler_map.get(event_name)
+
     def _not_defined_function(self):
         """
         Default handler for undefined or unimplemented events.
@@ -77,14 +77,18 @@ class IntegrationMixin:
 
         # Start the OFFICE push worker when running in 'office' mode.
         self._office_push_worker = self._start_office_push_worker()
+        # Start the GATE outbox / pull worker when GATE is enabled.
+        self._sync_worker = self._start_sync_worker()
 
         logger.info(
-            "[IntegrationMixin] initialised — gate_enabled=%s erp=%s payment=%s campaign=%s office_push=%s",
+            "[IntegrationMixin] initialised — gate_enabled=%s erp=%s payment=%s campaign=%s "
+            "office_push=%s gate_sync=%s",
             self._gate_enabled(),
             type(self._erp_connector).__name__,
             type(self._payment_gateway).__name__,
             type(self._campaign_connector).__name__,
             "active" if self._office_push_worker else "inactive",
+            "active" if self._sync_worker else "inactive",
         )
 
     # ------------------------------------------------------------------
@@ -242,6 +246,7 @@ class IntegrationMixin:
 
             # Connect signals before starting the thread so no emission is missed.
             worker.data_refresh_needed.connect(self._on_office_data_refresh_needed)
+            worker.data_rows_changed.connect(self._on_office_data_rows_changed)
 
             worker.start()
             logger.info(
@@ -255,6 +260,66 @@ class IntegrationMixin:
             )
             return None
 
+    def _start_sync_worker(self):
+        """
+        Start the SyncWorker background thread when GATE is enabled.
+
+        The worker flushes the GATE outbox (woken by the push hooks) and pulls
+        updates every ``[gate] sync_interval_minutes``.
+
+        Returns the running SyncWorker instance, or None when GATE is disabled
+        or the worker fails to start.
+        """
+        if not self._gate_enabled():
+            return None
+        try:
+            from settings.settings import Settings
+            from pos.manager.sync_worker import SyncWorker
+
+            interval_seconds = Settings().gate_sync_interval_seconds
+            worker = SyncWorker(interval_seconds=interval_seconds)
+            # Connect before starting so no notification is missed.
+            worker.cache_refresh_needed.connect(self._on_gate_cache_refresh_needed)
+            worker.start()
+            logger.info(
+                "[IntegrationMixin] SyncWorker started (interval=%ds)", interval_seconds
+            )
+            return worker
+        except Exception as exc:
+            logger.warning("[IntegrationMixin] Could not start SyncWorker: %s", exc)
+            return None
+
+    def _on_gate_cache_refresh_needed(self, cache_name: str, changed) -> None:
+        """
+        Slot connected to ``SyncWorker.cache_refresh_needed``.
+
+        Called in the main Qt thread after a GATE pull wrote changed products,
+        prices or campaigns to the database; only those rows are patched into
+        the caches (campaign rows reload ActiveCampaignCache).
+
+        Parameters
+        ----------
+        changed:
+            Model class name → ids of the rows the pull wrote.
+        """
+        logger.info(
+            "[IntegrationMixin] GATE %s update received – patching caches (%s)",
+            cache_name, ", ".join(f"{name}: {len(ids)}" for name, ids in changed.items()),
+        )
+        try:
+            self.patch_cached_rows(changed)
+        except Exception as exc:
+            logger.error(
+                "[IntegrationMixin] Cache patch after GATE update failed – reloading: %s",
+                exc,
+                exc_info=True,
+            )
+            try:
+                self.populate_product_data()
+                self.refresh_active_campaign_cache()
+            except Exception as reload_exc:
+                logger.error("[IntegrationMixin] Cache reload after GATE update failed: %s", reload_exc)
+
     def _on_office_data_refresh_needed(self, domains: str) -> None:
         """
         Slot connected to ``OfficePushWorker.data_refresh_needed``.
@@ -293,6 +358,33 @@ class IntegrationMixin:
                 exc_info=True,
             )
 
+    def _on_office_data_rows_changed(self, changed) -> None:
+        """
+        Slot connected to ``OfficePushWorker.data_rows_changed``.
+
+        Called in the main Qt thread after a delta refresh from OFFICE; patches
+        only the changed rows into the in-memory caches.
+
+        Parameters
+        ----------
+        changed:
+            Model class name → ids of the rows OFFICE changed or deleted.
+        """
+        logger.info(
+            "[IntegrationMixin] OFFICE delta refresh received – patching caches (%s)",
+            ", ".join(f"{name}: {len(ids)}" for name, ids in changed.items()),
+        )
+        try:
+            self.patch_cached_rows(changed)
+        except Exception as exc:
+            logger.error(
+                "[IntegrationMixin] Cache patch after OFFICE delta refresh failed – "
+                "reloading all caches: %s",
+                exc,
+                exc_info=True,
+            )
+            self._on_office_data_refresh_needed("all")
+
     def _build_campaign_connector(self):
         """
         Instantiate the configured campaign connector.
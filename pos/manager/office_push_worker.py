@@ -9,20 +9,28 @@ cashier.
 
 Retry strategy
 --------------
-1. Every time a document or closure is completed the worker is woken immediately.
-2. When the push fails (or no POS activity occurs), the worker waits
-   *retry_interval_seconds* (default 3600 s = 1 hour) before trying again.
-3. After a successful flush the timer resets to the configured interval.
+1. Every time a document or closure is completed the worker is woken
+   immediately; wakes arriving within a short coalescing window are flushed
+   together (e.g. the last receipt and the closure of an end-of-day).
+2. While OFFICE is unreachable the next attempt is delayed exponentially
+   ([office] retry_backoff_seconds, doubling up to retry_backoff_max_seconds,
+   with jitter) and new documents do not cut the delay short.
+3. Otherwise the worker checks again every *retry_interval_seconds*, which
+   retries items OFFICE rejected.  Whether anything is queued comes from the
+   push service's in-memory counter, so an idle terminal with an empty queue
+   does not query the database at all.
 
 Post-closure data refresh
 -------------------------
 After a flush cycle in which at least one **closure** was successfully delivered
-to OFFICE, the worker automatically calls ``GET /api/v1/pos/init`` and upserts
-the returned master-data (products, cashiers, campaigns, loyalty rules,
-sequences, etc.) into the local SQLite database.  This refresh is intentionally
+to OFFICE, the worker asks ``/api/v1/pos/changes`` for the master data changed
+since the last sync (falling back to the full ``GET /api/v1/pos/init``) and
+upserts it (products, cashiers, campaigns, loyalty rules, sequences, etc.) into
+the local SQLite database.  This refresh is intentionally
 scoped to closure events — it does **not** run after ordinary document pushes.
-On completion the ``data_refresh_needed("all")`` signal is emitted so the
-Application rebuilds its in-memory caches for the next sales period.
+On completion ``data_rows_changed`` (delta) or ``data_refresh_needed("all")``
+(full reseed) is emitted so the Application updates its in-memory caches for
+the next sales period.
 
 Lifecycle (managed by the application startup):
     worker = OfficePushWorker()
@@ -47,6 +55,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
+import random
 import threading
 
 from PySide6.QtCore import QThread, Signal
@@ -58,6 +67,9 @@ logger = get_logger(__name__)
 # Default retry interval: 1 hour between automatic flush attempts.
 _DEFAULT_RETRY_INTERVAL_SECONDS: int = 3600
 
+# After a wake, further wakes within this window join the same flush.
+_COALESCE_SECONDS: float = 0.5
+
 # Module-level reference to the running worker so document_manager and other
 # callers can request an immediate flush without knowing the Application object.
 _active_worker: "OfficePushWorker | None" = None
@@ -74,9 +86,16 @@ def set_push_worker(worker: "OfficePushWorker | None") -> None:
     _active_worker = worker
 
 
+def _retry_delay(failures: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential delay after *failures* unreachable flushes, with equal jitter."""
+    step = min(max_seconds, base_seconds * (2 ** max(0, failures - 1)))
+    return random.uniform(step / 2, step)
+
+
 class OfficePushWorker(QThread):
     """
-    Background QThread that flushes the OFFICE push queue on a fixed schedule.
+    Background QThread that flushes the OFFICE push queue when items are
+    enqueued, backing off while OFFICE is unreachable.
 
     Signals
     -------
@@ -89,11 +108,16 @@ class OfficePushWorker(QThread):
         is a comma-separated list of cache domains that must be reloaded
         (``"product,campaign,pos_data,all"``).  Connect this to the Application's
         ``_reload_cache`` slot to rebuild in-memory caches from the newly written DB rows.
+    data_rows_changed (dict):
+        Emitted instead of ``data_refresh_needed`` after a delta refresh.  Maps
+        model class names to the ids of the rows OFFICE changed or deleted, so
+        only those cache entries are patched.
     """
 
     push_completed     = Signal(bool)
     push_failed        = Signal(str)
     data_refresh_needed = Signal(str)
+    data_rows_changed  = Signal(object)
 
     def __init__(
         self,
@@ -105,6 +129,9 @@ class OfficePushWorker(QThread):
         # Event used to wake the worker early (e.g. immediately after a
         # document is closed) without waiting for the full retry interval.
         self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        # Consecutive flushes that found OFFICE unreachable
+        self._failures   = 0
 
     # ------------------------------------------------------------------
     # QThread entry point
@@ -120,6 +147,12 @@ class OfficePushWorker(QThread):
             )
             return
 
+        from settings.settings import Settings
+
+        settings = Settings()
+        backoff_base = settings.office_retry_backoff_seconds
+        backoff_max = settings.office_retry_backoff_max_seconds
+
         self._running = True
         set_push_worker(self)
         logger.info(
@@ -127,20 +160,25 @@ class OfficePushWorker(QThread):
         )
 
         while self._running:
-            self._flush_cycle()
-            # Wait for the retry interval or until wake() is called.
-            # _wake_event.wait(1.0) sleeps at most 1 second per tick so the
-            # thread can be stopped cleanly, but also wakes immediately when
-            # a document is closed and wake() sets the event.
+            # Wakes from here on belong to the next cycle
             self._wake_event.clear()
-            for _ in range(self._interval):
-                if not self._running:
-                    break
-                if self._wake_event.wait(timeout=1.0):
-                    # wake() was called – exit the sleep loop immediately
-                    logger.debug("[OfficePushWorker] Woken up early – flushing now")
-                    self._wake_event.clear()
-                    break
+            if self._flush_cycle():
+                self._failures += 1
+                delay = _retry_delay(self._failures, backoff_base, backoff_max)
+                logger.info(
+                    "[OfficePushWorker] OFFICE unreachable (%d in a row) – "
+                    "next attempt in %.0f s", self._failures, delay,
+                )
+                # New documents stay queued until the backoff has elapsed
+                self._stop_event.wait(delay)
+                continue
+
+            self._failures = 0
+            # Sleep until wake() or the retry interval; with an empty queue
+            # the interval tick costs no database query (see has_pending).
+            if self._wake_event.wait(timeout=self._interval) and self._running:
+                logger.debug("[OfficePushWorker] Woken up early – flushing shortly")
+                self._stop_event.wait(_COALESCE_SECONDS)
 
         set_push_worker(None)
         logger.info("[OfficePushWorker] Stopped")
@@ -152,6 +190,8 @@ class OfficePushWorker(QThread):
     def stop(self) -> None:
         """Request a graceful stop.  Call wait() after this to join the thread."""
         self._running = False
+        self._stop_event.set()
+        self._wake_event.set()
         logger.info("[OfficePushWorker] Stop requested")
 
     def wake(self) -> None:
@@ -174,13 +214,17 @@ class OfficePushWorker(QThread):
     # Flush cycle
     # ------------------------------------------------------------------
 
-    def _flush_cycle(self) -> None:
-        """Attempt to push all pending / failed queue items to OFFICE."""
+    def _flush_cycle(self) -> bool:
+        """
+        Attempt to push all pending / failed queue items to OFFICE.
+
+        Returns True when the flush stopped because OFFICE was unreachable.
+        """
         try:
             from pos.integration.office.office_push_service import OfficePushService
 
             if not OfficePushService.has_pending():
-                return
+                return False
 
             logger.info("[OfficePushWorker] Flushing pending OFFICE push queue...")
             # flush_pending() returns (all_success, closure_sent).
@@ -202,16 +246,25 @@ class OfficePushWorker(QThread):
                         "[OfficePushWorker] Closure was sent – "
                         "requesting post-closure data refresh from OFFICE..."
                     )
-                    refresh_ok = OfficePushService.refresh_from_office()
-                    if refresh_ok:
-                        # Signal the application to rebuild its in-memory caches
-                        # from the newly upserted database rows.  "all" covers
-                        # pos_data, product_data, and ActiveCampaignCache.
+                    refresh_ok, changed = OfficePushService.refresh_from_office()
+                    if refresh_ok and changed is None:
+                        # Full reseed: signal the application to rebuild its
+                        # in-memory caches from the newly upserted database
+                        # rows.  "all" covers pos_data, product_data, and
+                        # ActiveCampaignCache.
                         self.data_refresh_needed.emit("all")
                         logger.info(
                             "[OfficePushWorker] Post-closure OFFICE refresh complete – "
                             "cache-reload signal emitted"
                         )
+                    elif refresh_ok:
+                        # Delta sync: only the changed rows need patching
+                        if changed:
+                            self.data_rows_changed.emit(changed)
+                        logger.info(
+                            "[OfficePushWorker] Post-closure OFFICE delta refresh complete – "
+                            "%d model(s) changed", len(changed),
+                        )
                     else:
                         logger.warning(
                             "[OfficePushWorker] Post-closure OFFICE refresh failed – "
@@ -222,9 +275,11 @@ class OfficePushWorker(QThread):
                         "[OfficePushWorker] Flush succeeded (documents only) – "
                         "no closure sent, skipping post-closure data refresh"
                     )
+            elif OfficePushService.office_unreachable():
+                return True
             else:
                 logger.warning(
-                    "[OfficePushWorker] Flush partially or fully failed – "
+                    "[OfficePushWorker] Flush partially failed – "
                     "will retry in %d s", self._interval,
                 )
 
@@ -232,3 +287,4 @@ class OfficePushWorker(QThread):
             msg = str(exc)
             logger.error("[OfficePushWorker] Unexpected flush error: %s", msg)
             self.push_failed.emit(msg)
+        return False
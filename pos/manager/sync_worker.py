@@ -3,8 +3,11 @@ SaleFlex.PyPOS - Background synchronisation worker.
 Copyright (C) 2025-2026 Mousavi.Tech
 
 Runs as a PySide6 QThread so the main UI thread is never blocked by network
-operations.  Periodically calls GateSyncService.flush_pending_queue() to
-push queued events and GatePullService to fetch updates and notifications.
+operations.  Calls GateSyncService.flush_pending_queue() to push queued
+events – right after an event is queued (wake()) and whenever a retry falls
+due – and periodically GatePullService to fetch updates.  With
+``[gate] notification_enabled`` a listener thread holds a long-poll
+subscription open, so GATE notifications are acted on as they arrive.
 
 Lifecycle (managed by Application.__init__ and Application.run):
     worker = SyncWorker()
@@ -29,6 +32,9 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from __future__ import annotations
 
+import threading
+import time
+
 from PySide6.QtCore import QThread, Signal
 
 from core.logger import get_logger
@@ -39,32 +45,75 @@ logger = get_logger(__name__)
 # Default sync interval when not specified in settings.toml.
 _DEFAULT_INTERVAL_SECONDS: int = 1800  # 30 minutes
 
+# Shortest pause between push attempts, so a due item GATE keeps rejecting
+# cannot turn the loop into a busy wait.
+_MIN_PUSH_PAUSE_SECONDS: float = 1.0
+
+# Reconnect delays of the notification listener after GATE was unreachable
+_NOTIFY_BACKOFF_SECONDS: float = 2.0
+_NOTIFY_BACKOFF_MAX_SECONDS: float = 300.0
+# After falling back to polling, try the subscription again this often
+_NOTIFY_REPROBE_SECONDS: float = 900.0
+
+# Module-level reference to the running worker so hooks can request an
+# immediate flush without knowing the Application object.
+_active_worker: "SyncWorker | None" = None
+
+
+def get_sync_worker() -> "SyncWorker | None":
+    """Return the running SyncWorker instance, or None if not started."""
+    return _active_worker
+
+
+def set_sync_worker(worker: "SyncWorker | None") -> None:
+    """Register (or clear) the module-level worker reference."""
+    global _active_worker
+    _active_worker = worker
+
 
 class SyncWorker(QThread):
     """
-    Background QThread that drives GATE synchronisation on a fixed schedule.
+    Background QThread that drives GATE synchronisation.
+
+    The outbox is flushed when wake() is called, when the next backed-off
+    retry falls due and at least every ``interval_seconds``; updates are
+    pulled every ``interval_seconds``.
+
+    Notifications come through a listener thread: it long-polls GATE's
+    subscription endpoint and re-subscribes as soon as a request returns,
+    reconnecting with jittered exponential backoff while GATE is unreachable.
+    When GATE has no subscription endpoint it polls every
+    ``[gate] notification_poll_interval_seconds`` instead.  Without the
+    listener, notifications are polled with the periodic pull.
 
     Signals:
         sync_completed (str, bool): Emitted after each sync cycle.
                                     Args: connector_type, success.
         sync_failed    (str, str):  Emitted when a sync cycle raises an error.
                                     Args: connector_type, error_message.
-        cache_refresh_needed (str): Emitted when a pull response indicates that
-                                    a local cache must be rebuilt.
-                                    Arg: cache_name ("product" | "campaign" | "price").
+        cache_refresh_needed (str, object):
+                                    Emitted when a pull wrote GATE updates to
+                                    the database (periodically, or right after
+                                    a notification announced them).  Args:
+                                    cache_name ("product" | "campaign" |
+                                    "price"), model class name → ids of the
+                                    rows written.
         message_received (str, str):Emitted when GATE delivers a terminal message.
                                     Args: title, body.
     """
 
     sync_completed       = Signal(str, bool)
     sync_failed          = Signal(str, str)
-    cache_refresh_needed = Signal(str)
+    cache_refresh_needed = Signal(str, object)
     message_received     = Signal(str, str)
 
     def __init__(self, interval_seconds: int = _DEFAULT_INTERVAL_SECONDS) -> None:
         super().__init__()
         self._interval = interval_seconds
         self._running = False
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._listener: threading.Thread | None = None
 
     # ------------------------------------------------------------------
     # QThread entry point
@@ -73,14 +122,23 @@ class SyncWorker(QThread):
     def run(self) -> None:
         """Main loop executed in the background thread."""
         self._running = True
+        self._stop_event.clear()
+        set_sync_worker(self)
         logger.info("[SyncWorker] started (interval=%ds)", self._interval)
+        self._start_notification_listener()
 
+        next_pull = 0.0
         while self._running:
-            self._run_sync_cycle()
-            # Use QThread.sleep() instead of time.sleep() to allow
-            # the thread to be interrupted cleanly by stop().
-            self.sleep(self._interval)
+            self._push_cycle()
+            if time.monotonic() >= next_pull:
+                self._pull_cycle()
+                next_pull = time.monotonic() + self._interval
+
+            pause = min(next_pull - time.monotonic(), self._next_push_delay())
+            self._wake_event.wait(timeout=max(_MIN_PUSH_PAUSE_SECONDS, pause))
+            self._wake_event.clear()
 
+        set_sync_worker(None)
         logger.info("[SyncWorker] stopped")
 
     # ------------------------------------------------------------------
@@ -90,8 +148,19 @@ class SyncWorker(QThread):
     def stop(self) -> None:
         """Request a graceful stop.  Call wait() after this to join the thread."""
         self._running = False
+        self._stop_event.set()
+        self._wake_event.set()
         logger.info("[SyncWorker] stop requested")
 
+    def wake(self) -> None:
+        """
+        Flush the outbox now instead of at the next scheduled time.
+
+        Thread-safe; called after an event is queued.  The flush runs in this
+        thread so the caller is never blocked.
+        """
+        self._wake_event.set()
+
     # ------------------------------------------------------------------
     # Sync cycle
     # ------------------------------------------------------------------
@@ -101,6 +170,19 @@ class SyncWorker(QThread):
         self._push_cycle()
         self._pull_cycle()
 
+    def _next_push_delay(self) -> float:
+        """Seconds until the next outbox retry is due (interval when none is pending)."""
+        try:
+            from pos.integration.gate.gate_sync_service import get_default_gate_sync
+            sync = get_default_gate_sync()
+            if not sync.is_enabled():
+                return float(self._interval)
+            due_in = sync.seconds_until_due()
+        except Exception as e:
+            logger.warning("[SyncWorker] could not read outbox schedule: %s", e)
+            return float(self._interval)
+        return float(self._interval) if due_in is None else due_in
+
     def _push_cycle(self) -> None:
         """Flush all pending outbox items to GATE."""
         try:
@@ -118,31 +200,20 @@ class SyncWorker(QThread):
             self.sync_failed.emit("gate", str(e))
 
     def _pull_cycle(self) -> None:
-        """Fetch updates and notifications from GATE."""
+        """Fetch updates (and, without the listener, notifications) from GATE."""
         try:
             from pos.integration.gate.gate_pull_service import get_default_gate_pull
-            from pos.integration.gate.serializers.notification_serializer import (
-                NotificationSerializer,
-            )
 
             pull = get_default_gate_pull()
             if not pull.is_enabled():
                 return
 
             try:
-                pull.pull_product_updates()
-                pull.pull_campaign_updates()
-
-                notifications = pull.pull_notifications()
-                for notif in notifications:
-                    notif_type = notif.get("type", "")
-                    if NotificationSerializer.requires_cache_refresh(notif_type):
-                        self.cache_refresh_needed.emit(notif_type.replace("_update", ""))
-                    elif notif_type == "terminal_message":
-                        self.message_received.emit(
-                            notif.get("title", ""),
-                            notif.get("body", ""),
-                        )
+                self._emit_changed("product", pull.pull_product_updates())
+                self._emit_changed("campaign", pull.pull_campaign_updates())
+
+                if not self._listener_active():
+                    self._dispatch_notifications(pull, pull.pull_notifications())
             finally:
                 from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
 
@@ -152,3 +223,115 @@ class SyncWorker(QThread):
             logger.warning("[SyncWorker] pull cycle failed: %s", e)
         except Exception as e:
             logger.error("[SyncWorker] unexpected error in pull cycle: %s", e)
+
+    # ------------------------------------------------------------------
+    # Notification channel
+    # ------------------------------------------------------------------
+
+    def _listener_active(self) -> bool:
+        return self._listener is not None and self._listener.is_alive()
+
+    def _start_notification_listener(self) -> None:
+        """Start the notification listener thread when notifications are enabled."""
+        try:
+            from settings.settings import Settings
+            from pos.integration.gate.gate_pull_service import get_default_gate_pull
+
+            settings = Settings()
+            if not settings.gate_notification_enabled or not get_default_gate_pull().is_enabled():
+                return
+            self._listener = threading.Thread(
+                target=self._notification_loop,
+                args=(
+                    settings.gate_notification_long_poll_seconds,
+                    settings.gate_notification_poll_interval_seconds,
+                ),
+                name="GateNotificationListener",
+                daemon=True,
+            )
+            self._listener.start()
+        except Exception as e:
+            logger.warning("[SyncWorker] notification listener not started: %s", e)
+
+    def _notification_loop(self, long_poll_seconds: int, poll_interval: int) -> None:
+        """
+        Receive notifications until stop(): long-poll while GATE supports it,
+        otherwise poll every *poll_interval* seconds and re-probe the
+        subscription every _NOTIFY_REPROBE_SECONDS.
+        """
+        from pos.integration.gate.gate_pull_service import get_default_gate_pull
+        from pos.integration.gate.gate_sync_service import backoff_delay
+
+        pull = get_default_gate_pull()
+        failures = 0
+        polling_until = 0.0     # monotonic time until which the fallback polls
+        logger.info("[SyncWorker] notification listener started (long-poll %ds)", long_poll_seconds)
+
+        while self._running:
+            try:
+                if time.monotonic() >= polling_until:
+                    notifications = pull.listen_for_notifications(long_poll_seconds)
+                    if notifications is None:
+                        logger.info(
+                            "[SyncWorker] GATE has no notification subscription – polling every %ds",
+                            poll_interval,
+                        )
+                        polling_until = time.monotonic() + _NOTIFY_REPROBE_SECONDS
+                        continue
+                    pause = 0.0
+                else:
+                    notifications = pull.pull_notifications()
+                    pause = poll_interval
+                failures = 0
+                self._dispatch_notifications(pull, notifications)
+            except GATEConnectionError as e:
+                failures += 1
+                pause = backoff_delay(failures, _NOTIFY_BACKOFF_SECONDS, _NOTIFY_BACKOFF_MAX_SECONDS)
+                logger.warning(
+                    "[SyncWorker] notification channel lost (%s) – reconnecting in %.0fs", e, pause
+                )
+            except Exception as e:
+                logger.error("[SyncWorker] notification listener error: %s", e)
+                pause = poll_interval
+            if pause and self._stop_event.wait(pause):
+                break
+
+        logger.info("[SyncWorker] notification listener stopped")
+
+    def _emit_changed(self, cache_name: str, changed) -> None:
+        """Emit cache_refresh_needed when a pull wrote any rows."""
+        if changed:
+            self.cache_refresh_needed.emit(cache_name, changed)
+
+    def _dispatch_notifications(self, pull, notifications) -> None:
+        """
+        Act on received notifications: pull the updates that cache-refresh
+        notifications announce (each kind once per batch), emit
+        cache_refresh_needed with the rows written and mark those
+        notifications read; forward terminal messages.
+        """
+        from pos.integration.gate.serializers.notification_serializer import (
+            NotificationSerializer,
+        )
+
+        pending: dict = {}      # cache name -> record ids of its notifications
+        for notif in notifications or []:
+            notif_type = notif.get("type", "")
+            if NotificationSerializer.requires_cache_refresh(notif_type):
+                cache_name = NotificationSerializer.cache_name(notif_type)
+                pending.setdefault(cache_name, []).append(notif.get("record_id"))
+            elif notif_type == "terminal_message":
+                self.message_received.emit(
+                    notif.get("title", ""),
+                    notif.get("body", ""),
+                )
+
+        if "campaign" in pending:
+            self._emit_changed("campaign", pull.pull_campaign_updates())
+        products = [name for name in pending if name != "campaign"]
+        if products:
+            # price and product notifications are served by the same pull
+            self._emit_changed(products[0], pull.pull_product_updates())
+        NotificationSerializer.mark_read(
+            [record_id for ids in pending.values() for record_id in ids if record_id]
+        )
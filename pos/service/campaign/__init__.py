@@ -15,6 +15,7 @@ from pos.service.campaign.campaign_document_sync import (
     sync_campaign_discounts_on_document,
 )
 from pos.service.campaign.campaign_service import CampaignDiscountProposal, CampaignService, SUPPORTED_TYPE_CODES
+from pos.service.campaign.campaign_what_if import CampaignWhatIfService, WhatIfReport
 from pos.service.campaign.cart_snapshot import (
     CART_SNAPSHOT_SCHEMA_VERSION,
     CartLineSnapshot,
@@ -34,8 +35,10 @@ __all__ = [
     "CampaignDiscountProposal",
     "CampaignService",
     "CampaignUsageLimits",
+    "CampaignWhatIfService",
     "CouponActivationService",
     "SUPPORTED_TYPE_CODES",
+    "WhatIfReport",
     "gate_manages_campaign",
     "recompute_head_total_discount_amount",
     "sync_campaign_discounts_on_document",
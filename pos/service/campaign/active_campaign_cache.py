@@ -3,7 +3,14 @@ In-memory snapshot of campaign definitions for local evaluation (``CampaignServi
 
 Reload after GATE campaign pulls, ``campaign_update`` notifications, or any admin path
 that mutates ``Campaign`` / related rows. Usage limits still query ``CampaignUsage``
-from the database on each evaluation.
+from the database on each evaluation; a reload also drops the cached coupon usage
+counts (``CouponUsageCache``).
+
+Besides the full bundle the cache keeps the subset of campaigns whose date range and
+daily time window are currently open (:class:`ActiveCampaignWindow`). A daemon timer
+fires at the next start/end boundary of any campaign and swaps the subset, so
+happy-hour and ``TIME_BASED`` campaigns switch on and off on time while evaluations
+skip the per-campaign date checks.
 
 Copyright (c) 2025-2026 Ferhat Mousavi
 """
@@ -22,9 +29,19 @@ from data_layer.model.definition.campaign import Campaign
 from data_layer.model.definition.campaign_product import CampaignProduct
 from data_layer.model.definition.campaign_rule import CampaignRule
 from data_layer.model.definition.campaign_type import CampaignType
+from pos.service.campaign.campaign_schedule import partition_active
+from pos.service.campaign.coupon_usage_cache import CouponUsageCache
 
 logger = get_logger(__name__)
 
+# Upper bound for one timer wait; a long sleep is re-armed so wall-clock jumps
+# (NTP sync, manual clock changes) are picked up within this many seconds.
+_MAX_TIMER_SECONDS = 3600.0
+
+
+def _utc_now_naive() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 @dataclass(frozen=True)
 class ActiveCampaignEvalBundle:
@@ -37,6 +54,21 @@ class ActiveCampaignEvalBundle:
     loaded_at: datetime
 
 
+@dataclass(frozen=True)
+class ActiveCampaignWindow:
+    """Campaigns of ``bundle`` whose date/time filters hold on ``[valid_from, valid_until)``."""
+
+    bundle: ActiveCampaignEvalBundle
+    campaigns: List[Campaign]
+    valid_from: datetime
+    valid_until: Optional[datetime]
+
+    def covers(self, when: datetime) -> bool:
+        if when < self.valid_from:
+            return False
+        return self.valid_until is None or when < self.valid_until
+
+
 class ActiveCampaignCache:
     """
     Thread-safe cache of active ``Campaign`` / ``CampaignType`` / rules / ``CampaignProduct``.
@@ -47,12 +79,86 @@ class ActiveCampaignCache:
 
     _lock = threading.RLock()
     _bundle: Optional[ActiveCampaignEvalBundle] = None
+    _window: Optional[ActiveCampaignWindow] = None
+    _timer: Optional[threading.Timer] = None
 
     @classmethod
     def get(cls) -> Optional[ActiveCampaignEvalBundle]:
         with cls._lock:
             return cls._bundle
 
+    @classmethod
+    def active_campaigns(
+        cls, bundle: ActiveCampaignEvalBundle, when: datetime
+    ) -> Optional[List[Campaign]]:
+        """
+        Campaigns of ``bundle`` that pass the date range / daily window checks at
+        ``when`` (UTC-naive), or ``None`` when no precomputed subset applies (another
+        bundle, or ``when`` outside the current window, e.g. a historical replay).
+
+        If the boundary timer is late, the subset is rebuilt here, at the real
+        clock rather than ``when`` so a caller's clock skew never shifts the window.
+        """
+        with cls._lock:
+            window = cls._window
+            if window is None or window.bundle is not bundle:
+                return None
+            if window.covers(when):
+                return window.campaigns
+            if bundle is cls._bundle and when >= window.valid_from:
+                cls._reschedule()
+                if cls._window is not None and cls._window.covers(when):
+                    return cls._window.campaigns
+            return None
+
+    @classmethod
+    def stop_schedule(cls) -> None:
+        """Cancel the boundary timer (application shutdown)."""
+        with cls._lock:
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+
+    @classmethod
+    def _reschedule(cls) -> None:
+        """Recompute the active subset now and arm the timer for the next boundary."""
+        with cls._lock:
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+            bundle = cls._bundle
+            if bundle is None:
+                cls._window = None
+                return
+            when = _utc_now_naive()
+            active, upcoming = partition_active(bundle.campaigns, when)
+            cls._window = ActiveCampaignWindow(
+                bundle=bundle,
+                campaigns=active,
+                valid_from=when,
+                valid_until=upcoming,
+            )
+            if upcoming is None:
+                return
+            delay = (upcoming - _utc_now_naive()).total_seconds()
+            timer = threading.Timer(min(max(delay, 0.0), _MAX_TIMER_SECONDS), cls._on_boundary)
+            timer.daemon = True
+            cls._timer = timer
+            timer.start()
+        logger.debug(
+            "[ActiveCampaignCache] %d of %d campaigns in their time window until %s",
+            len(active),
+            len(bundle.campaigns),
+            upcoming,
+        )
+
+    @classmethod
+    def _on_boundary(cls) -> None:
+        try:
+            cls._reschedule()
+        except Exception as exc:
+            logger.error("[ActiveCampaignCache] time-window refresh failed: %s", exc)
+
     @classmethod
     def reload(cls) -> None:
         """Load from the database and replace the snapshot (expunged, session-independent)."""
@@ -63,6 +169,8 @@ class ActiveCampaignCache:
                 bundle = cls._load_bundle(session)
             with cls._lock:
                 cls._bundle = bundle
+                cls._reschedule()
+            CouponUsageCache.clear()
             logger.info(
                 "[ActiveCampaignCache] reloaded %d campaigns (rules=%d keys, products=%d keys)",
                 len(bundle.campaigns),
@@ -128,4 +236,5 @@ class ActiveCampaignCache:
 __all__ = [
     "ActiveCampaignCache",
     "ActiveCampaignEvalBundle",
+    "ActiveCampaignWindow",
 ]
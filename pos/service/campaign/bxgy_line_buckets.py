@@ -0,0 +1,218 @@
+"""
+Per-cart eligible line pools for BUY_X_GET_Y campaigns, kept sorted by unit price.
+
+``CampaignService`` evaluates the whole cart on every change. For buy-X-get-Y the
+expensive part used to be rebuilding each campaign's line pool (rules x lines x
+campaign products) and expanding/sorting every unit. :class:`BxgyLineBuckets` keeps,
+per campaign, the rule-eligible lines and the pool lines presorted by unit price, and
+only re-checks lines that were added, removed or changed since the previous evaluation
+of the same cart.
+
+Buckets are tied to one ``ActiveCampaignEvalBundle``; a new bundle (cache reload)
+means a fresh instance.
+
+Copyright (c) 2025-2026 Ferhat Mousavi
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from data_layer.model.definition.campaign_product import CampaignProduct
+    from data_layer.model.definition.campaign_rule import CampaignRule
+    from pos.service.campaign.campaign_service import _LineCtx
+
+LinePassesRules = Callable[["_LineCtx", Sequence["CampaignRule"], Optional[Mapping[UUID, Dict[str, Any]]]], bool]
+
+_ZERO = Decimal("0")
+
+
+def _fingerprint(line: "_LineCtx") -> Tuple[Any, ...]:
+    return (
+        line.fk_product_id,
+        line.fk_department_main_group_id,
+        line.fk_department_sub_group_id,
+        line.product_code,
+        line.line_total,
+        line.quantity,
+    )
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    if value is None:
+        return None
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+class BxgyCampaignBucket:
+    """
+    Eligible lines of one campaign; ``pool`` holds ``(unit_price, seq, line_id)`` sorted
+    and ``eligible_gross`` the running sum of the eligible lines' (non-negative) totals.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence["CampaignRule"],
+        cps: Sequence["CampaignProduct"],
+    ):
+        self.rules = list(rules)
+        self.cp_product_ids: Optional[Set[UUID]] = (
+            {UUID(str(cp.fk_product_id)) for cp in cps} if cps else None
+        )
+        self.eligible: Dict[UUID, "_LineCtx"] = {}
+        self.eligible_gross = _ZERO
+        self.pool: List[Tuple[Decimal, int, UUID]] = []
+        self._pool_keys: Dict[UUID, Tuple[Decimal, int, UUID]] = {}
+        self._units: Dict[UUID, int] = {}
+        self.unit_count = 0
+
+    def add(
+        self,
+        line: "_LineCtx",
+        seq: int,
+        product_ctx: Optional[Mapping[UUID, Dict[str, Any]]],
+        line_passes_rules: LinePassesRules,
+    ) -> None:
+        if not line_passes_rules(line, self.rules, product_ctx):
+            return
+        self.eligible[line.id] = line
+        self.eligible_gross += max(_ZERO, line.line_total)
+        if self.cp_product_ids is not None:
+            pid = _as_uuid(line.fk_product_id)
+            if pid is None or pid not in self.cp_product_ids:
+                return
+        units = int(line.quantity)
+        if units <= 0:
+            return
+        unit_price = max(_ZERO, line.line_total) / line.quantity
+        key = (unit_price, seq, line.id)
+        insort(self.pool, key)
+        self._pool_keys[line.id] = key
+        self._units[line.id] = units
+        self.unit_count += units
+
+    def remove(self, line_id: UUID) -> None:
+        line = self.eligible.pop(line_id, None)
+        if line is not None:
+            self.eligible_gross -= max(_ZERO, line.line_total)
+        key = self._pool_keys.pop(line_id, None)
+        if key is None:
+            return
+        idx = bisect_left(self.pool, key)
+        if idx < len(self.pool) and self.pool[idx] == key:
+            del self.pool[idx]
+        self.unit_count -= self._units.pop(line_id, 0)
+
+    def eligible_net_after_stack(self, line_accum: Mapping[UUID, Decimal], doc_accum: Decimal) -> Decimal:
+        """
+        Eligible total after earlier campaign amounts: the running gross, corrected
+        only for the lines that already carry a line-level amount (``line_accum``).
+        """
+        raw = self.eligible_gross
+        for line_id, amt in line_accum.items():
+            ln = self.eligible.get(line_id)
+            if ln is not None and amt:
+                raw += max(_ZERO, ln.line_total - amt) - max(_ZERO, ln.line_total)
+        return max(_ZERO, raw - doc_accum)
+
+    def cheapest_units_total(self, count: int, line_accum: Mapping[UUID, Decimal]) -> Decimal:
+        """
+        Sum of the ``count`` cheapest unit prices after earlier line-level campaign
+        amounts (``line_accum``). Lines without such amounts are walked in their presorted
+        order; the few adjusted lines are re-priced and merged in.
+        """
+        total: Any = 0
+        taken = 0
+        for unit_price, line_id in self._iter_units_sorted(line_accum):
+            take = min(self._units[line_id], count - taken)
+            total += unit_price * take
+            taken += take
+            if taken >= count:
+                break
+        return total
+
+    def _iter_units_sorted(self, line_accum: Mapping[UUID, Decimal]) -> Iterator[Tuple[Decimal, UUID]]:
+        adjusted: List[Tuple[Decimal, int, UUID]] = []
+        for line_id, amt in line_accum.items():
+            key = self._pool_keys.get(line_id)
+            if key is not None and amt:
+                ln = self.eligible[line_id]
+                net_line = max(_ZERO, ln.line_total - amt)
+                adjusted.append((net_line / ln.quantity, key[1], line_id))
+        if not adjusted:
+            for unit_price, _seq, line_id in self.pool:
+                yield unit_price, line_id
+            return
+        adjusted.sort()
+        skip = {a[2] for a in adjusted}
+        untouched = (k for k in self.pool if k[2] not in skip)
+        for unit_price, _seq, line_id in heapq.merge(untouched, adjusted):
+            yield unit_price, line_id
+
+
+class BxgyLineBuckets:
+    """All BUY_X_GET_Y buckets for one open cart under one campaign bundle."""
+
+    def __init__(self, bundle: Any, line_passes_rules: LinePassesRules):
+        self.bundle = bundle
+        self._line_passes_rules = line_passes_rules
+        self._lines: Dict[UUID, Tuple[int, Tuple[Any, ...], "_LineCtx"]] = {}
+        self._campaigns: Dict[Any, BxgyCampaignBucket] = {}
+        self._next_seq = 0
+
+    def sync_lines(
+        self,
+        lines: Sequence["_LineCtx"],
+        product_ctx: Optional[Mapping[UUID, Dict[str, Any]]],
+    ) -> None:
+        """Apply added / removed / changed lines to every registered campaign bucket."""
+        seen: Set[UUID] = set()
+        added: List[Tuple[int, "_LineCtx"]] = []
+        removed: List[UUID] = []
+        for line in lines:
+            seen.add(line.id)
+            fp = _fingerprint(line)
+            known = self._lines.get(line.id)
+            if known is not None and known[1] == fp:
+                continue
+            if known is not None:
+                removed.append(line.id)
+            seq = self._next_seq
+            self._next_seq += 1
+            self._lines[line.id] = (seq, fp, line)
+            added.append((seq, line))
+        if len(seen) != len(self._lines):
+            for line_id in [lid for lid in self._lines if lid not in seen]:
+                del self._lines[line_id]
+                removed.append(line_id)
+        if not added and not removed:
+            return
+        for bucket in self._campaigns.values():
+            for line_id in removed:
+                bucket.remove(line_id)
+            for seq, line in added:
+                bucket.add(line, seq, product_ctx, self._line_passes_rules)
+
+    def bucket(
+        self,
+        campaign_id: Any,
+        rules: Sequence["CampaignRule"],
+        cps: Sequence["CampaignProduct"],
+        product_ctx: Optional[Mapping[UUID, Dict[str, Any]]],
+    ) -> BxgyCampaignBucket:
+        """Return the campaign's bucket, building it from the synced lines on first use."""
+        b = self._campaigns.get(campaign_id)
+        if b is None:
+            b = BxgyCampaignBucket(rules, cps)
+            for seq, _fp, line in self._lines.values():
+                b.add(line, seq, product_ctx, self._line_passes_rules)
+            self._campaigns[campaign_id] = b
+        return b
+
+
+__all__ = ["BxgyCampaignBucket", "BxgyLineBuckets"]
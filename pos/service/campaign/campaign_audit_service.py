@@ -24,6 +24,7 @@ from data_layer.model.definition.transaction_status import TransactionType
 from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
 from pos.service.campaign.application_policy import CAMPAIGN_DISCOUNT_TYPE_CODE
 from pos.service.campaign.coupon_activation_service import CouponActivationService
+from pos.service.campaign.coupon_usage_cache import CouponUsageCache
 
 logger = get_logger(__name__)
 
@@ -247,6 +248,7 @@ class CampaignAuditService:
             co = session.query(Coupon).filter(Coupon.id == coupon_id).first()
             if co:
                 co.usage_count = max(0, int(getattr(co, "usage_count", 0) or 0) - int(n))
+        CouponUsageCache.forget(by_coupon)
 
 
 __all__ = ["CampaignAuditService"]
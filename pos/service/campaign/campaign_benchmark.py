@@ -0,0 +1,554 @@
+"""
+Headless benchmark and simulation harness for the local campaign engine.
+
+Generates synthetic campaigns of every ``SUPPORTED_TYPE_CODES`` type together with
+carts of varying size, runs them through ``build_cart_snapshot_from_document_data``
+and ``CampaignService.evaluate_proposals``, and reports p50/p99 latency and
+allocation peaks per scenario.
+
+Evaluation uses a private in-memory SQLite database and an explicit campaign bundle,
+so the terminal database and ``ActiveCampaignCache`` are never touched.
+
+Golden-output mode records the proposals of every scenario to a JSON file
+(``--write-golden``) and later verifies that an optimised engine still produces
+exactly the same proposals (``--check-golden``).
+
+Run from the project root::
+
+    python -m pos.service.campaign.campaign_benchmark --lines 5 25 100 --iterations 200
+    python -m pos.service.campaign.campaign_benchmark --write-golden campaign_golden.json
+    python -m pos.service.campaign.campaign_benchmark --check-golden campaign_golden.json
+
+Copyright (c) 2025-2026 Ferhat Mousavi
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from core.logger import get_logger
+from data_layer.model import metadata
+from data_layer.model.definition.campaign import Campaign
+from data_layer.model.definition.campaign_product import CampaignProduct
+from data_layer.model.definition.campaign_rule import CampaignRule
+from data_layer.model.definition.campaign_type import CampaignType
+from pos.service.campaign.active_campaign_cache import ActiveCampaignEvalBundle
+from pos.service.campaign.campaign_service import SUPPORTED_TYPE_CODES, CampaignService
+from pos.service.campaign.cart_snapshot import build_cart_snapshot_from_document_data
+
+logger = get_logger(__name__)
+
+GOLDEN_SCHEMA_VERSION = "1.0"
+
+DEFAULT_LINE_COUNTS = (5, 25, 100, 250)
+DEFAULT_CAMPAIGNS_PER_TYPE = 4
+DEFAULT_ITERATIONS = 200
+DEFAULT_WARMUP = 20
+DEFAULT_SEED = 20260101
+
+# Fixed evaluation moment so TIME_BASED windows and golden output are reproducible
+# (a Thursday, inside the synthetic happy-hour windows that start before noon).
+EVALUATED_AT = datetime(2026, 1, 15, 12, 30, 0)
+
+_PRODUCT_POOL_SIZE = 60
+_DEPARTMENT_POOL_SIZE = 8
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _money(rng: random.Random, low: int, high: int) -> Decimal:
+    return Decimal(rng.randint(low * 100, high * 100)) / Decimal("100")
+
+
+@dataclass
+class CatalogFixture:
+    """Synthetic product/department ids shared by campaigns and carts."""
+
+    product_ids: List[UUID]
+    department_by_product: Dict[UUID, UUID]
+    department_ids: List[UUID]
+    unit_price_by_product: Dict[UUID, Decimal]
+
+
+@dataclass
+class ScenarioResult:
+    """Latency and allocation figures for one cart size."""
+
+    name: str
+    line_count: int
+    campaign_count: int
+    proposal_count: int
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    snapshot_p50_ms: float
+    alloc_peak_p50_kib: float
+    alloc_peak_max_kib: float
+    proposals: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def build_catalog(rng: random.Random) -> CatalogFixture:
+    department_ids = [_uuid(rng) for _ in range(_DEPARTMENT_POOL_SIZE)]
+    product_ids = [_uuid(rng) for _ in range(_PRODUCT_POOL_SIZE)]
+    department_by_product = {pid: rng.choice(department_ids) for pid in product_ids}
+    unit_price_by_product = {pid: _money(rng, 1, 60) for pid in product_ids}
+    return CatalogFixture(
+        product_ids=product_ids,
+        department_by_product=department_by_product,
+        department_ids=department_ids,
+        unit_price_by_product=unit_price_by_product,
+    )
+
+
+def _campaign(
+    rng: random.Random,
+    type_row: CampaignType,
+    index: int,
+    **values: Any,
+) -> Campaign:
+    code = f"BENCH-{type_row.code[:8]}-{index:03d}"
+    values.setdefault("priority", rng.randint(1, 10))
+    values.setdefault("is_combinable", True)
+    c = Campaign(
+        code=code,
+        name=f"Benchmark {type_row.code} {index}",
+        fk_campaign_type_id=type_row.id,
+        is_active=True,
+        is_auto_apply=True,
+        **values,
+    )
+    c.id = _uuid(rng)
+    return c
+
+
+def _department_rule(rng: random.Random, campaign: Campaign, catalog: CatalogFixture) -> CampaignRule:
+    r = CampaignRule(
+        fk_campaign_id=campaign.id,
+        rule_type="DEPARTMENT",
+        fk_department_id=rng.choice(catalog.department_ids),
+        is_include=True,
+    )
+    r.id = _uuid(rng)
+    return r
+
+
+def _campaign_products(
+    rng: random.Random,
+    campaign: Campaign,
+    catalog: CatalogFixture,
+    count: int,
+    *,
+    with_discount: bool,
+) -> List[CampaignProduct]:
+    rows: List[CampaignProduct] = []
+    for pid in rng.sample(catalog.product_ids, count):
+        cp = CampaignProduct(
+            fk_campaign_id=campaign.id,
+            fk_product_id=pid,
+            discount_percentage=(Decimal(rng.choice((5, 10, 15, 20))) if with_discount else None),
+            is_active=True,
+        )
+        cp.id = _uuid(rng)
+        rows.append(cp)
+    return rows
+
+
+def build_campaign_bundle(
+    rng: random.Random,
+    catalog: CatalogFixture,
+    campaigns_per_type: int = DEFAULT_CAMPAIGNS_PER_TYPE,
+) -> ActiveCampaignEvalBundle:
+    """Synthetic campaigns (transient ORM rows) for every supported type code."""
+    types: Dict[Any, CampaignType] = {}
+    for order, code in enumerate(sorted(SUPPORTED_TYPE_CODES)):
+        ct = CampaignType(code=code, name=code.title(), is_active=True, display_order=order)
+        ct.id = _uuid(rng)
+        types[ct.id] = ct
+    by_code = {ct.code: ct for ct in types.values()}
+
+    campaigns: List[Campaign] = []
+    rules_by: Dict[Any, List[CampaignRule]] = {}
+    cp_by: Dict[Any, List[CampaignProduct]] = {}
+
+    for i in range(campaigns_per_type):
+        # The first basket campaign is a lowest-priority non-combinable one, so the
+        # stacking stop is exercised without hiding every other campaign type.
+        c = _campaign(
+            rng,
+            by_code["BASKET_DISCOUNT"],
+            i,
+            priority=0 if i == 0 else rng.randint(1, 10),
+            is_combinable=i != 0,
+            discount_type=rng.choice(("PERCENTAGE", "FIXED_AMOUNT")),
+            discount_percentage=Decimal(rng.choice((5, 10))),
+            discount_value=_money(rng, 1, 10),
+            min_purchase_amount=_money(rng, 20, 200),
+            max_discount_amount=_money(rng, 20, 50),
+        )
+        campaigns.append(c)
+        if i % 2:
+            rules_by[c.id] = [_department_rule(rng, c, catalog)]
+
+        c = _campaign(
+            rng,
+            by_code["PRODUCT_DISCOUNT"],
+            i,
+            discount_type="PERCENTAGE",
+            discount_percentage=Decimal("10"),
+        )
+        campaigns.append(c)
+        cp_by[c.id] = _campaign_products(rng, c, catalog, 6, with_discount=bool(i % 2))
+
+        c = _campaign(
+            rng,
+            by_code["BUY_X_GET_Y"],
+            i,
+            discount_type="BUY_X_GET_Y",
+            buy_quantity=rng.randint(1, 3),
+            get_quantity=1,
+        )
+        campaigns.append(c)
+        cp_by[c.id] = _campaign_products(rng, c, catalog, 10, with_discount=False)
+
+        c = _campaign(
+            rng,
+            by_code["PAYMENT_DISCOUNT"],
+            i,
+            discount_type=rng.choice(("PERCENTAGE", "FIXED_AMOUNT")),
+            discount_percentage=Decimal("3"),
+            discount_value=_money(rng, 1, 5),
+        )
+        campaigns.append(c)
+
+        start_hour = rng.randint(8, 14)
+        c = _campaign(
+            rng,
+            by_code["TIME_BASED"],
+            i,
+            discount_type="PERCENTAGE",
+            discount_percentage=Decimal(rng.choice((5, 15))),
+            start_date=EVALUATED_AT - timedelta(days=rng.randint(0, 30)),
+            end_date=EVALUATED_AT + timedelta(days=rng.randint(0, 30)),
+            start_time=dt_time(start_hour, 0),
+            end_time=dt_time(min(start_hour + 3, 23), 0),
+            days_of_week=rng.choice(("1,2,3,4,5", "4", "6,7", None)),
+        )
+        campaigns.append(c)
+
+    return ActiveCampaignEvalBundle(
+        types=types,
+        campaigns=campaigns,
+        rules_by=rules_by,
+        cp_by=cp_by,
+        loaded_at=EVALUATED_AT,
+    )
+
+
+def build_document_data(
+    rng: random.Random,
+    catalog: CatalogFixture,
+    line_count: int,
+    *,
+    with_payment: bool = True,
+) -> Dict[str, Any]:
+    """``DocumentManager``-shaped ``document_data`` with plain attribute objects."""
+    products = []
+    total = Decimal("0")
+    for line_no in range(1, line_count + 1):
+        pid = rng.choice(catalog.product_ids)
+        qty = Decimal(rng.choice((1, 1, 1, 2, 3)))
+        unit_price = catalog.unit_price_by_product[pid]
+        line_total = unit_price * qty
+        total += line_total
+        products.append(
+            SimpleNamespace(
+                id=_uuid(rng),
+                line_no=line_no,
+                fk_product_id=pid,
+                fk_department_main_group_id=catalog.department_by_product[pid],
+                fk_department_sub_group_id=None,
+                product_code=f"P{catalog.product_ids.index(pid):05d}",
+                product_name=f"Product {line_no}",
+                quantity=qty,
+                unit_price=unit_price,
+                total_price=line_total,
+                vat_rate=Decimal("18"),
+                is_cancel=False,
+                is_voided=False,
+            )
+        )
+    payments = []
+    if with_payment:
+        payments.append(
+            SimpleNamespace(
+                id=_uuid(rng),
+                line_no=1,
+                payment_type="CREDIT_PAYMENT",
+                payment_total=total,
+                is_cancel=False,
+            )
+        )
+    head = SimpleNamespace(
+        id=_uuid(rng),
+        transaction_unique_id=f"BENCH-{line_count}",
+        pos_id=1,
+        fk_store_id=None,
+        fk_customer_id=None,
+        loyalty_member_id=None,
+        base_currency="USD",
+        total_amount=total,
+        total_discount_amount=Decimal("0"),
+    )
+    return {"head": head, "products": products, "payments": payments, "discounts": []}
+
+
+def _percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (need not be sorted)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _evaluate_once(
+    session: Session,
+    document_data: Dict[str, Any],
+    bundle: ActiveCampaignEvalBundle,
+) -> tuple[float, float, list]:
+    t0 = time.perf_counter()
+    build_cart_snapshot_from_document_data(document_data, evaluated_at=EVALUATED_AT)
+    t1 = time.perf_counter()
+    proposals = CampaignService.evaluate_proposals(
+        document_data,
+        evaluated_at=EVALUATED_AT,
+        session=session,
+        bundle=bundle,
+    )
+    t2 = time.perf_counter()
+    return (t1 - t0) * 1000.0, (t2 - t0) * 1000.0, proposals
+
+
+def run_scenario(
+    session: Session,
+    bundle: ActiveCampaignEvalBundle,
+    document_data: Dict[str, Any],
+    *,
+    name: str,
+    iterations: int = DEFAULT_ITERATIONS,
+    warmup: int = DEFAULT_WARMUP,
+    measure_allocations: bool = True,
+) -> ScenarioResult:
+    """Time ``iterations`` evaluations of one cart, then sample allocation peaks."""
+    proposals: list = []
+    for _ in range(warmup):
+        _, _, proposals = _evaluate_once(session, document_data, bundle)
+
+    total_ms: List[float] = []
+    snapshot_ms: List[float] = []
+    for _ in range(iterations):
+        snap, tot, proposals = _evaluate_once(session, document_data, bundle)
+        snapshot_ms.append(snap)
+        total_ms.append(tot)
+
+    peaks_kib: List[float] = []
+    if measure_allocations:
+        # Separate pass: tracemalloc distorts timings, so it never overlaps the timed loop.
+        alloc_rounds = max(1, min(iterations, 50))
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_rounds):
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                _evaluate_once(session, document_data, bundle)
+                _, peak = tracemalloc.get_traced_memory()
+                peaks_kib.append(max(0, peak - before) / 1024.0)
+        finally:
+            tracemalloc.stop()
+
+    return ScenarioResult(
+        name=name,
+        line_count=len(document_data.get("products") or []),
+        campaign_count=len(bundle.campaigns),
+        proposal_count=len(proposals),
+        iterations=iterations,
+        p50_ms=_percentile(total_ms, 50),
+        p99_ms=_percentile(total_ms, 99),
+        mean_ms=(sum(total_ms) / len(total_ms)) if total_ms else 0.0,
+        snapshot_p50_ms=_percentile(snapshot_ms, 50),
+        alloc_peak_p50_kib=_percentile(peaks_kib, 50),
+        alloc_peak_max_kib=max(peaks_kib) if peaks_kib else 0.0,
+        proposals=[CampaignService.campaign_discount_proposal_to_dict(p) for p in proposals],
+    )
+
+
+def _open_scratch_session() -> Session:
+    """Empty schema in a private in-memory database (product/payment lookups find nothing)."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def run_benchmark(
+    *,
+    line_counts: Sequence[int] = DEFAULT_LINE_COUNTS,
+    campaigns_per_type: int = DEFAULT_CAMPAIGNS_PER_TYPE,
+    iterations: int = DEFAULT_ITERATIONS,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+    measure_allocations: bool = True,
+) -> List[ScenarioResult]:
+    """Run every cart size against one synthetic campaign set; deterministic for a seed."""
+    rng = random.Random(seed)
+    catalog = build_catalog(rng)
+    bundle = build_campaign_bundle(rng, catalog, campaigns_per_type)
+    session = _open_scratch_session()
+    results: List[ScenarioResult] = []
+    try:
+        for count in line_counts:
+            document_data = build_document_data(rng, catalog, int(count))
+            results.append(
+                run_scenario(
+                    session,
+                    bundle,
+                    document_data,
+                    name=f"lines_{count}",
+                    iterations=iterations,
+                    warmup=warmup,
+                    measure_allocations=measure_allocations,
+                )
+            )
+    finally:
+        session.close()
+    return results
+
+
+def golden_payload(results: Sequence[ScenarioResult], *, seed: int, campaigns_per_type: int) -> Dict[str, Any]:
+    return {
+        "schema_version": GOLDEN_SCHEMA_VERSION,
+        "seed": seed,
+        "campaigns_per_type": campaigns_per_type,
+        "scenarios": {r.name: r.proposals for r in results},
+    }
+
+
+def compare_golden(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """Return human-readable differences; empty when proposals match exactly."""
+    problems: List[str] = []
+    for key in ("schema_version", "seed", "campaigns_per_type"):
+        if expected.get(key) != actual.get(key):
+            problems.append(f"{key}: expected {expected.get(key)!r}, got {actual.get(key)!r}")
+    exp_sc = expected.get("scenarios") or {}
+    act_sc = actual.get("scenarios") or {}
+    for name in sorted(set(exp_sc) | set(act_sc)):
+        if name not in act_sc:
+            problems.append(f"{name}: missing from this run")
+            continue
+        if name not in exp_sc:
+            problems.append(f"{name}: not in golden file")
+            continue
+        if exp_sc[name] != act_sc[name]:
+            problems.append(
+                f"{name}: proposals differ ({len(exp_sc[name])} expected, {len(act_sc[name])} got)"
+            )
+    return problems
+
+
+def format_report(results: Sequence[ScenarioResult]) -> str:
+    header = (
+        f"{'scenario':<12} {'lines':>6} {'camps':>6} {'props':>6} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9} {'snap ms':>8} "
+        f"{'alloc KiB':>10} {'max KiB':>9}"
+    )
+    rows = [header, "-" * len(header)]
+    for r in results:
+        rows.append(
+            f"{r.name:<12} {r.line_count:>6} {r.campaign_count:>6} {r.proposal_count:>6} "
+            f"{r.p50_ms:>9.3f} {r.p99_ms:>9.3f} {r.mean_ms:>9.3f} {r.snapshot_p50_ms:>8.3f} "
+            f"{r.alloc_peak_p50_kib:>10.1f} {r.alloc_peak_max_kib:>9.1f}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pos.service.campaign.campaign_benchmark",
+        description="Benchmark CampaignService.evaluate_proposals on synthetic carts.",
+    )
+    parser.add_argument("--lines", type=int, nargs="+", default=list(DEFAULT_LINE_COUNTS))
+    parser.add_argument("--campaigns-per-type", type=int, default=DEFAULT_CAMPAIGNS_PER_TYPE)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    golden = parser.add_mutually_exclusive_group()
+    golden.add_argument("--write-golden", metavar="PATH", help="record proposals to PATH")
+    golden.add_argument("--check-golden", metavar="PATH", help="fail if proposals differ from PATH")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        line_counts=args.lines,
+        campaigns_per_type=args.campaigns_per_type,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        seed=args.seed,
+        measure_allocations=not args.no_alloc,
+    )
+    print(format_report(results))
+
+    payload = golden_payload(results, seed=args.seed, campaigns_per_type=args.campaigns_per_type)
+    if args.write_golden:
+        with open(args.write_golden, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2, sort_keys=True)
+        print(f"golden output written to {args.write_golden}")
+    elif args.check_golden:
+        with open(args.check_golden, "r", encoding="utf-8") as fh:
+            expected = json.load(fh)
+        problems = compare_golden(expected, payload)
+        if problems:
+            for line in problems:
+                print(f"GOLDEN MISMATCH {line}")
+            return 1
+        print(f"golden output matches {args.check_golden}")
+    return 0
+
+
+__all__ = [
+    "ScenarioResult",
+    "build_campaign_bundle",
+    "build_catalog",
+    "build_document_data",
+    "compare_golden",
+    "format_report",
+    "golden_payload",
+    "run_benchmark",
+    "run_scenario",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
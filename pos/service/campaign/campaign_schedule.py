@@ -0,0 +1,141 @@
+"""
+Date / time-window activity of campaigns and the instants at which it can flip.
+
+``CampaignService`` and ``ActiveCampaignCache`` share these rules. Times are compared
+as UTC-naive datetimes, like the rest of the local engine.
+
+* ``start_date`` / ``end_date`` are inclusive calendar days.
+* ``days_of_week`` is a comma-separated ISO weekday list (1 = Monday … 7 = Sunday).
+* ``start_time`` / ``end_time`` is an inclusive daily window; ``start > end`` wraps
+  past midnight (e.g. 22:00–02:00).
+
+Copyright (c) 2025-2026 Ferhat Mousavi
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+# A window that ends at ``end_time`` is still open at that instant; it closes just after.
+_END_EPSILON = timedelta(microseconds=1)
+
+
+def normalize_db_datetime(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def parse_days_of_week(raw: Any) -> Set[int]:
+    allowed: Set[int] = set()
+    if not raw:
+        return allowed
+    for part in str(raw).strip().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            allowed.add(int(part))
+        except ValueError:
+            continue
+    return allowed
+
+
+def in_date_range(campaign: Any, when: datetime) -> bool:
+    sd = normalize_db_datetime(campaign.start_date)
+    ed = normalize_db_datetime(campaign.end_date)
+    d = when.date()
+    if sd is not None and d < sd.date():
+        return False
+    if ed is not None and d > ed.date():
+        return False
+    return True
+
+
+def in_time_window(campaign: Any, when: datetime) -> bool:
+    allowed = parse_days_of_week(campaign.days_of_week)
+    if allowed and when.isoweekday() not in allowed:
+        return False
+
+    st = campaign.start_time
+    et = campaign.end_time
+    if st is not None and et is not None:
+        t = when.time()
+        if st <= et:
+            if not (st <= t <= et):
+                return False
+        else:
+            if not (t >= st or t <= et):
+                return False
+    return True
+
+
+def is_scheduled_active(campaign: Any, when: datetime) -> bool:
+    """Date range and daily window combined (the only time-dependent campaign filters)."""
+    return in_date_range(campaign, when) and in_time_window(campaign, when)
+
+
+def _midnight(d: date) -> datetime:
+    return datetime.combine(d, time.min)
+
+
+def _next_daily(when: datetime, at: time, offset: timedelta = timedelta(0)) -> datetime:
+    candidate = datetime.combine(when.date(), at) + offset
+    if candidate <= when:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def next_boundary(campaign: Any, when: datetime) -> Optional[datetime]:
+    """
+    Earliest instant after ``when`` at which :func:`is_scheduled_active` may change for
+    ``campaign``; ``None`` when its activity never depends on time.
+    """
+    candidates: List[datetime] = []
+    sd = normalize_db_datetime(campaign.start_date)
+    ed = normalize_db_datetime(campaign.end_date)
+    if sd is not None:
+        start = _midnight(sd.date())
+        if start > when:
+            candidates.append(start)
+    if ed is not None:
+        end = _midnight(ed.date()) + timedelta(days=1)
+        if end > when:
+            candidates.append(end)
+    if parse_days_of_week(campaign.days_of_week):
+        candidates.append(_midnight(when.date()) + timedelta(days=1))
+    st = campaign.start_time
+    et = campaign.end_time
+    if st is not None and et is not None:
+        candidates.append(_next_daily(when, st))
+        candidates.append(_next_daily(when, et, _END_EPSILON))
+    return min(candidates) if candidates else None
+
+
+def partition_active(
+    campaigns: Iterable[Any], when: datetime
+) -> Tuple[List[Any], Optional[datetime]]:
+    """Return ``(campaigns active at when, next instant any of them may flip)``."""
+    active: List[Any] = []
+    upcoming: Optional[datetime] = None
+    for c in campaigns:
+        if is_scheduled_active(c, when):
+            active.append(c)
+        nb = next_boundary(c, when)
+        if nb is not None and (upcoming is None or nb < upcoming):
+            upcoming = nb
+    return active, upcoming
+
+
+__all__ = [
+    "in_date_range",
+    "in_time_window",
+    "is_scheduled_active",
+    "next_boundary",
+    "normalize_db_datetime",
+    "parse_days_of_week",
+    "partition_active",
+]
@@ -8,7 +8,8 @@ from __future__ import annotations
 
 import fnmatch
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
@@ -26,8 +27,10 @@ from data_layer.model.definition.customer_segment_member import CustomerSegmentM
 from data_layer.model.definition.payment_type import PaymentType as PaymentTypeRow
 from data_layer.model.definition.product import Product
 from data_layer.model.definition.product_barcode import ProductBarcode
-from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
+from pos.service.campaign.active_campaign_cache import ActiveCampaignCache, ActiveCampaignEvalBundle
 from pos.service.campaign.application_policy import CAMPAIGN_DISCOUNT_TYPE_CODE
+from pos.service.campaign.bxgy_line_buckets import BxgyCampaignBucket, BxgyLineBuckets
+from pos.service.campaign.campaign_schedule import in_date_range, in_time_window, normalize_db_datetime
 from pos.service.campaign.campaign_usage_limits import CampaignUsageLimits
 
 logger = get_logger(__name__)
@@ -105,6 +108,28 @@ class CampaignService:
     ``campaign_document_sync.sync_campaign_discounts_on_document``.
     """
 
+    # BUY_X_GET_Y line buckets per open cart (keyed by head id), reused while the
+    # campaign bundle is unchanged; a few carts are kept for suspended/resumed sales.
+    _BXGY_MAX_CARTS = 4
+    _bxgy_lock = threading.Lock()
+    _bxgy_by_cart: "OrderedDict[str, BxgyLineBuckets]" = OrderedDict()
+
+    @classmethod
+    def _bxgy_buckets_for(
+        cls, cart_key: Optional[str], bundle: Optional[ActiveCampaignEvalBundle]
+    ) -> BxgyLineBuckets:
+        if cart_key is None or bundle is None:
+            return BxgyLineBuckets(bundle, cls._line_passes_rules)
+        with cls._bxgy_lock:
+            buckets = cls._bxgy_by_cart.get(cart_key)
+            if buckets is None or buckets.bundle is not bundle:
+                buckets = BxgyLineBuckets(bundle, cls._line_passes_rules)
+                cls._bxgy_by_cart[cart_key] = buckets
+            cls._bxgy_by_cart.move_to_end(cart_key)
+            while len(cls._bxgy_by_cart) > cls._BXGY_MAX_CARTS:
+                cls._bxgy_by_cart.popitem(last=False)
+            return buckets
+
     @staticmethod
     def campaign_discount_proposal_to_dict(p: CampaignDiscountProposal) -> Dict[str, Any]:
         """Serialize a proposal for API-style ``cart_data`` payloads (e.g. ``apply_campaign``)."""
@@ -138,6 +163,7 @@ class CampaignService:
         evaluated_at: Optional[datetime] = None,
         active_coupon_codes: Optional[Sequence[str]] = None,
         session: Optional[Session] = None,
+        bundle: Optional[ActiveCampaignEvalBundle] = None,
     ) -> List[CampaignDiscountProposal]:
         """
         Return proposed CAMPAIGN discounts sorted by application order (priority descending,
@@ -150,6 +176,8 @@ class CampaignService:
             evaluated_at: Defaults to UTC now.
             active_coupon_codes: Uppercased coupon/campaign codes entered for this cart (for ``requires_coupon``).
             session: Optional SQLAlchemy session; if omitted, opens a short read-only session.
+            bundle: Campaign definitions to evaluate instead of ``ActiveCampaignCache``
+                (benchmarks, what-if runs over candidate campaign sets).
         """
         if not document_data or not document_data.get("head"):
             return []
@@ -161,9 +189,12 @@ class CampaignService:
         coupon_set: Set[str] = {str(c).strip().upper() for c in (active_coupon_codes or ()) if str(c).strip()}
 
         lines = CampaignService._collect_lines(document_data)
+        pays = CampaignService._collect_payments(document_data)
+        head_id = getattr(head, "id", None)
+        cart_key = str(head_id) if head_id is not None else None
         if session is not None:
             return CampaignService._evaluate_with_session(
-                session, document_data, head, lines, when_cmp, coupon_set
+                session, head, lines, pays, when_cmp, coupon_set, bundle, cart_key
             )
 
         from data_layer.engine import Engine
@@ -171,12 +202,41 @@ class CampaignService:
         try:
             with Engine().get_session() as s:
                 return CampaignService._evaluate_with_session(
-                    s, document_data, head, lines, when_cmp, coupon_set
+                    s, head, lines, pays, when_cmp, coupon_set, bundle, cart_key
                 )
         except Exception as exc:
             logger.error("[CampaignService] evaluate_proposals: %s", exc)
             return []
 
+    @staticmethod
+    def evaluate_line_contexts(
+        head: Any,
+        lines: Sequence[_LineCtx],
+        payments: Sequence[_PayCtx],
+        *,
+        evaluated_at: datetime,
+        session: Session,
+        active_coupon_codes: Optional[Sequence[str]] = None,
+        bundle: Optional[ActiveCampaignEvalBundle] = None,
+    ) -> List[CampaignDiscountProposal]:
+        """
+        Like :meth:`evaluate_proposals` for callers that already hold line and payment
+        contexts (batch / what-if paths reading raw rows instead of ``document_data``).
+
+        ``head`` only needs ``fk_store_id`` and ``fk_customer_id`` attributes; cancelled
+        or voided lines must already be filtered out.
+        """
+        coupon_set: Set[str] = {str(c).strip().upper() for c in (active_coupon_codes or ()) if str(c).strip()}
+        return CampaignService._evaluate_with_session(
+            session,
+            head,
+            lines,
+            payments,
+            CampaignService._as_utc_naive(evaluated_at),
+            coupon_set,
+            bundle,
+        )
+
     @staticmethod
     def _collect_lines(document_data: Mapping[str, Any]) -> List[_LineCtx]:
         rows: List[_LineCtx] = []
@@ -316,19 +376,21 @@ class CampaignService:
     @staticmethod
     def _evaluate_with_session(
         session: Session,
-        document_data: Mapping[str, Any],
         head: Any,
         lines: Sequence[_LineCtx],
+        pays: Sequence[_PayCtx],
         when: datetime,
         coupon_set: Set[str],
+        bundle: Optional[ActiveCampaignEvalBundle] = None,
+        cart_key: Optional[str] = None,
     ) -> List[CampaignDiscountProposal]:
         fk_store = getattr(head, "fk_store_id", None)
         fk_customer = getattr(head, "fk_customer_id", None)
-        pays = CampaignService._collect_payments(document_data)
         product_ctx = CampaignService._load_product_rule_context(session, lines)
         event_to_pt_id = CampaignService._payment_event_to_type_id(session)
 
-        bundle = ActiveCampaignCache.get()
+        if bundle is None:
+            bundle = ActiveCampaignCache.get()
         if bundle is None:
             try:
                 ActiveCampaignCache.reload()
@@ -374,8 +436,13 @@ class CampaignService:
             ):
                 cp_by.setdefault(cp.fk_campaign_id, []).append(cp)
 
+        # Precomputed by the cache's boundary timer; None means check dates per campaign.
+        scheduled = (
+            ActiveCampaignCache.active_campaigns(bundle, when) if bundle is not None else None
+        )
+
         candidates: List[Tuple[Campaign, str]] = []
-        for c in campaigns:
+        for c in (scheduled if scheduled is not None else campaigns):
             ct = types.get(c.fk_campaign_type_id)
             if not ct or ct.code not in SUPPORTED_TYPE_CODES:
                 continue
@@ -386,10 +453,11 @@ class CampaignService:
                 continue
             if not CampaignService._store_ok(c, fk_store):
                 continue
-            if not CampaignService._in_date_range(c, when):
-                continue
-            if not CampaignService._in_time_window(c, when):
-                continue
+            if scheduled is None:
+                if not CampaignService._in_date_range(c, when):
+                    continue
+                if not CampaignService._in_time_window(c, when):
+                    continue
             if fk_customer and not CampaignService._segment_ok(session, c, fk_customer):
                 continue
             if not fk_customer and c.fk_customer_segment_id is not None:
@@ -401,6 +469,7 @@ class CampaignService:
         candidates.sort(key=lambda x: (-(x[0].priority or 0), str(x[0].code)))
 
         proposals: List[CampaignDiscountProposal] = []
+        bxgy: Optional[BxgyLineBuckets] = None
         stop_further = False
         doc_discount_accum = Decimal("0")
         line_discount_accum: DefaultDict[UUID, Decimal] = defaultdict(lambda: Decimal("0"))
@@ -426,12 +495,12 @@ class CampaignService:
                     camp, lines, line_rules, cps, product_ctx, line_discount_accum
                 )
             elif type_code == "BUY_X_GET_Y":
+                if bxgy is None:
+                    bxgy = CampaignService._bxgy_buckets_for(cart_key, bundle)
+                    bxgy.sync_lines(lines, product_ctx)
                 props = CampaignService._proposals_buy_x_get_y(
                     camp,
-                    lines,
-                    line_rules,
-                    cps,
-                    product_ctx,
+                    bxgy.bucket(camp.id, line_rules, cps, product_ctx),
                     line_discount_accum,
                     doc_discount_accum,
                 )
@@ -491,50 +560,15 @@ class CampaignService:
 
     @staticmethod
     def _normalize_db_datetime(dt: Optional[datetime]) -> Optional[datetime]:
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            return dt
-        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return normalize_db_datetime(dt)
 
     @staticmethod
     def _in_date_range(campaign: Campaign, when: datetime) -> bool:
-        sd = CampaignService._normalize_db_datetime(campaign.start_date)
-        ed = CampaignService._normalize_db_datetime(campaign.end_date)
-        d = when.date()
-        if sd is not None and d < sd.date():
-            return False
-        if ed is not None and d > ed.date():
-            return False
-        return True
+        return in_date_range(campaign, when)
 
     @staticmethod
     def _in_time_window(campaign: Campaign, when: datetime) -> bool:
-        if campaign.days_of_week:
-            raw = str(campaign.days_of_week).strip()
-            allowed: Set[int] = set()
-            for part in raw.split(","):
-                part = part.strip()
-                if not part:
-                    continue
-                try:
-                    allowed.add(int(part))
-                except ValueError:
-                    continue
-            if allowed and when.isoweekday() not in allowed:
-                return False
-
-        st = campaign.start_time
-        et = campaign.end_time
-        if st is not None and et is not None:
-            t = when.time()
-            if st <= et:
-                if not (st <= t <= et):
-                    return False
-            else:
-                if not (t >= st or t <= et):
-                    return False
-        return True
+        return in_time_window(campaign, when)
 
     @staticmethod
     def _barcode_matches_pattern(text: Optional[str], pattern: Optional[str]) -> bool:
@@ -831,34 +865,10 @@ class CampaignService:
 
         return []
 
-    @staticmethod
-    def _bxgy_line_pool(
-        lines: Sequence[_LineCtx],
-        rules: Sequence[CampaignRule],
-        cps: Sequence[CampaignProduct],
-        product_ctx: Optional[Mapping[UUID, Dict[str, Any]]],
-    ) -> List[_LineCtx]:
-        pool: List[_LineCtx] = []
-        for line in lines:
-            if not CampaignService._line_passes_rules(line, rules, product_ctx):
-                continue
-            if cps:
-                if line.fk_product_id is None:
-                    continue
-                if not any(
-                    UUID(str(cp.fk_product_id)) == UUID(str(line.fk_product_id)) for cp in cps
-                ):
-                    continue
-            pool.append(line)
-        return pool
-
     @staticmethod
     def _proposals_buy_x_get_y(
         campaign: Campaign,
-        lines: Sequence[_LineCtx],
-        rules: Sequence[CampaignRule],
-        cps: Sequence[CampaignProduct],
-        product_ctx: Optional[Mapping[UUID, Dict[str, Any]]],
+        bucket: BxgyCampaignBucket,
         line_accum: Mapping[UUID, Decimal],
         doc_accum: Decimal,
     ) -> List[CampaignDiscountProposal]:
@@ -870,9 +880,7 @@ class CampaignService:
         if buy_q <= 0 or get_q <= 0:
             return []
 
-        eligible_total = CampaignService._eligible_net_after_stack(
-            lines, rules, line_accum, doc_accum, product_ctx
-        )
+        eligible_total = bucket.eligible_net_after_stack(line_accum, doc_accum)
         if campaign.min_purchase_amount is not None:
             if eligible_total < Decimal(str(campaign.min_purchase_amount)):
                 return []
@@ -880,28 +888,16 @@ class CampaignService:
             if eligible_total > Decimal(str(campaign.max_purchase_amount)):
                 return []
 
-        pool_lines = CampaignService._bxgy_line_pool(lines, rules, cps, product_ctx)
-        units: List[Tuple[Decimal, _LineCtx]] = []
-        for ln in pool_lines:
-            n = int(ln.quantity)
-            if n <= 0:
-                continue
-            net_line = max(
-                Decimal("0"), ln.line_total - line_accum.get(ln.id, Decimal("0"))
-            )
-            up = net_line / ln.quantity if ln.quantity > 0 else Decimal("0")
-            for _ in range(n):
-                units.append((up, ln))
-        if not units:
+        unit_count = bucket.unit_count
+        if unit_count <= 0:
             return []
         group = buy_q + get_q
-        if len(units) < group:
+        if unit_count < group:
             return []
-        free_count = (len(units) // group) * get_q
+        free_count = (unit_count // group) * get_q
         if free_count <= 0:
             return []
-        units.sort(key=lambda x: x[0])
-        raw = sum(u[0] for u in units[:free_count])
+        raw = bucket.cheapest_units_total(free_count, line_accum)
         if campaign.max_discount_amount is not None:
             cap = Decimal(str(campaign.max_discount_amount))
             raw = min(raw, cap)
@@ -0,0 +1,470 @@
+"""
+Batch what-if evaluation of a candidate campaign set over historical receipts.
+
+Streams completed ``TransactionHead`` / ``TransactionProduct`` / ``TransactionPayment``
+rows in chunks as plain column tuples (no ORM hydration), builds the engine's line and
+payment contexts directly, and evaluates every receipt with
+``CampaignService.evaluate_line_contexts`` against an explicit campaign bundle.
+
+Nothing is written: live campaign definitions, ``ActiveCampaignCache`` and the
+transaction tables are only read. Chunks can be fanned out to a process pool; each
+worker opens its own read session.
+
+Copyright (c) 2025-2026 Ferhat Mousavi
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.logger import get_logger
+from data_layer.model.definition.campaign import Campaign
+from data_layer.model.definition.campaign_product import CampaignProduct
+from data_layer.model.definition.campaign_rule import CampaignRule
+from data_layer.model.definition.campaign_type import CampaignType
+from data_layer.model.definition.transaction_head import TransactionHead
+from data_layer.model.definition.transaction_payment import TransactionPayment
+from data_layer.model.definition.transaction_product import TransactionProduct
+from data_layer.model.definition.transaction_status import TransactionStatus, TransactionType
+from pos.service.campaign.active_campaign_cache import ActiveCampaignCache, ActiveCampaignEvalBundle
+from pos.service.campaign.campaign_service import CampaignService, _LineCtx, _PayCtx
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class WhatIfReceipt:
+    """One historical receipt reduced to what the campaign engine reads."""
+
+    head_id: UUID
+    transaction_date_time: datetime
+    fk_store_id: Optional[UUID]
+    fk_customer_id: Optional[UUID]
+    lines: List[_LineCtx] = field(default_factory=list)
+    payments: List[_PayCtx] = field(default_factory=list)
+
+    @property
+    def merchandise_total(self) -> Decimal:
+        return sum((ln.line_total for ln in self.lines), Decimal("0"))
+
+
+@dataclass
+class WhatIfCampaignStats:
+    """Per-campaign aggregate across the evaluated receipts."""
+
+    campaign_id: str
+    campaign_code: str
+    campaign_name: str
+    hit_count: int = 0
+    proposal_count: int = 0
+    discount_total: Decimal = Decimal("0")
+
+
+@dataclass
+class WhatIfReport:
+    """Aggregate discount cost and hit rates for a candidate campaign set."""
+
+    receipts_evaluated: int = 0
+    receipts_with_discount: int = 0
+    merchandise_total: Decimal = Decimal("0")
+    discount_total: Decimal = Decimal("0")
+    by_campaign: Dict[str, WhatIfCampaignStats] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.receipts_evaluated:
+            return 0.0
+        return self.receipts_with_discount / self.receipts_evaluated
+
+    def campaign_hit_rate(self, campaign_code: str) -> float:
+        stats = self.by_campaign.get(campaign_code)
+        if stats is None or not self.receipts_evaluated:
+            return 0.0
+        return stats.hit_count / self.receipts_evaluated
+
+    def merge(self, other: "WhatIfReport") -> None:
+        self.receipts_evaluated += other.receipts_evaluated
+        self.receipts_with_discount += other.receipts_with_discount
+        self.merchandise_total += other.merchandise_total
+        self.discount_total += other.discount_total
+        for code, st in other.by_campaign.items():
+            mine = self.by_campaign.get(code)
+            if mine is None:
+                self.by_campaign[code] = st
+                continue
+            mine.hit_count += st.hit_count
+            mine.proposal_count += st.proposal_count
+            mine.discount_total += st.discount_total
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "receipts_evaluated": self.receipts_evaluated,
+            "receipts_with_discount": self.receipts_with_discount,
+            "hit_rate": self.hit_rate,
+            "merchandise_total": str(self.merchandise_total),
+            "discount_total": str(self.discount_total),
+            "campaigns": [
+                {
+                    "campaign_id": st.campaign_id,
+                    "campaign_code": st.campaign_code,
+                    "campaign_name": st.campaign_name,
+                    "hit_count": st.hit_count,
+                    "hit_rate": self.campaign_hit_rate(code),
+                    "proposal_count": st.proposal_count,
+                    "discount_total": str(st.discount_total),
+                }
+                for code, st in sorted(self.by_campaign.items())
+            ],
+        }
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    if value is None:
+        return None
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _dec(value: Any) -> Decimal:
+    return Decimal(str(value if value is not None else 0))
+
+
+class CampaignWhatIfService:
+    """Replay historical receipts through the local campaign engine (read-only)."""
+
+    @staticmethod
+    def candidate_bundle(
+        campaigns: Sequence[Campaign],
+        *,
+        rules: Sequence[CampaignRule] = (),
+        campaign_products: Sequence[CampaignProduct] = (),
+        types: Optional[Dict[Any, CampaignType]] = None,
+    ) -> ActiveCampaignEvalBundle:
+        """
+        Wrap unsaved (or detached) campaign rows as an evaluation bundle.
+
+        ``types`` defaults to the campaign types of ``ActiveCampaignCache`` (reloaded
+        once if empty), so candidates only need a valid ``fk_campaign_type_id``.
+        """
+        if types is None:
+            live = ActiveCampaignCache.get()
+            if live is None:
+                ActiveCampaignCache.reload()
+                live = ActiveCampaignCache.get()
+            types = dict(live.types) if live is not None else {}
+        rules_by: Dict[Any, List[CampaignRule]] = {}
+        for r in rules:
+            rules_by.setdefault(r.fk_campaign_id, []).append(r)
+        cp_by: Dict[Any, List[CampaignProduct]] = {}
+        for cp in campaign_products:
+            cp_by.setdefault(cp.fk_campaign_id, []).append(cp)
+        return ActiveCampaignEvalBundle(
+            types=types,
+            campaigns=list(campaigns),
+            rules_by=rules_by,
+            cp_by=cp_by,
+            loaded_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+
+    @staticmethod
+    def iter_receipt_chunks(
+        session: Session,
+        *,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        fk_store_id: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[List[WhatIfReceipt]]:
+        """
+        Yield completed sale receipts in chunks of ``chunk_size``.
+
+        Heads are streamed with ``yield_per``; for each chunk the product and payment
+        rows are fetched with one ``IN (...)`` query each. Only the columns the engine
+        reads are selected, so no ORM entities are built.
+        """
+        chunk_size = max(1, int(chunk_size))
+        head_stmt = (
+            select(
+                TransactionHead.id,
+                TransactionHead.transaction_date_time,
+                TransactionHead.fk_store_id,
+                TransactionHead.fk_customer_id,
+            )
+            .where(
+                func.lower(TransactionHead.transaction_type) == TransactionType.SALE.value,
+                TransactionHead.transaction_status == TransactionStatus.COMPLETED.value,
+                TransactionHead.is_cancel.is_(False),
+            )
+            .order_by(TransactionHead.transaction_date_time, TransactionHead.id)
+        )
+        if date_from is not None:
+            head_stmt = head_stmt.where(TransactionHead.transaction_date_time >= date_from)
+        if date_to is not None:
+            head_stmt = head_stmt.where(TransactionHead.transaction_date_time < date_to)
+        if fk_store_id is not None:
+            head_stmt = head_stmt.where(TransactionHead.fk_store_id == fk_store_id)
+
+        result = session.execute(head_stmt.execution_options(yield_per=chunk_size))
+        for partition in result.partitions():
+            receipts: Dict[Any, WhatIfReceipt] = {}
+            for head_id, when, store_id, customer_id in partition:
+                receipts[head_id] = WhatIfReceipt(
+                    head_id=_as_uuid(head_id),
+                    transaction_date_time=when,
+                    fk_store_id=_as_uuid(store_id),
+                    fk_customer_id=_as_uuid(customer_id),
+                )
+            if not receipts:
+                continue
+            CampaignWhatIfService._attach_lines(session, receipts)
+            CampaignWhatIfService._attach_payments(session, receipts)
+            yield list(receipts.values())
+
+    @staticmethod
+    def _attach_lines(session: Session, receipts: Dict[Any, WhatIfReceipt]) -> None:
+        rows = session.execute(
+            select(
+                TransactionProduct.fk_transaction_head_id,
+                TransactionProduct.id,
+                TransactionProduct.line_no,
+                TransactionProduct.fk_product_id,
+                TransactionProduct.fk_department_main_group_id,
+                TransactionProduct.fk_department_sub_group_id,
+                TransactionProduct.product_code,
+                TransactionProduct.total_price,
+                TransactionProduct.quantity,
+            )
+            .where(
+                TransactionProduct.fk_transaction_head_id.in_(list(receipts)),
+                TransactionProduct.is_cancel.is_(False),
+                TransactionProduct.is_voided.is_(False),
+            )
+            .order_by(TransactionProduct.fk_transaction_head_id, TransactionProduct.line_no)
+        )
+        for head_id, line_id, line_no, pid, dept, sub, code, total, qty in rows:
+            rec = receipts.get(head_id)
+            if rec is None or dept is None:
+                continue
+            rec.lines.append(
+                _LineCtx(
+                    id=_as_uuid(line_id),
+                    line_no=int(line_no or 0),
+                    fk_product_id=_as_uuid(pid),
+                    fk_department_main_group_id=_as_uuid(dept),
+                    fk_department_sub_group_id=_as_uuid(sub),
+                    product_code=code or None,
+                    line_total=_dec(total),
+                    quantity=_dec(qty),
+                    is_cancel=False,
+                    is_voided=False,
+                )
+            )
+
+    @staticmethod
+    def _attach_payments(session: Session, receipts: Dict[Any, WhatIfReceipt]) -> None:
+        rows = session.execute(
+            select(
+                TransactionPayment.fk_transaction_head_id,
+                TransactionPayment.id,
+                TransactionPayment.line_no,
+                TransactionPayment.payment_type,
+                TransactionPayment.payment_total,
+            )
+            .where(
+                TransactionPayment.fk_transaction_head_id.in_(list(receipts)),
+                TransactionPayment.is_cancel.is_(False),
+            )
+            .order_by(TransactionPayment.fk_transaction_head_id, TransactionPayment.line_no)
+        )
+        for head_id, pay_id, line_no, ptype, total in rows:
+            rec = receipts.get(head_id)
+            if rec is None:
+                continue
+            rec.payments.append(
+                _PayCtx(
+                    id=_as_uuid(pay_id),
+                    line_no=int(line_no or 0),
+                    payment_type=str(ptype or ""),
+                    payment_total=_dec(total),
+                    is_cancel=False,
+                )
+            )
+
+    @staticmethod
+    def evaluate_chunk(
+        session: Session,
+        receipts: Sequence[WhatIfReceipt],
+        bundle: ActiveCampaignEvalBundle,
+        *,
+        active_coupon_codes: Optional[Sequence[str]] = None,
+    ) -> WhatIfReport:
+        """Evaluate each receipt at its own ``transaction_date_time`` and aggregate."""
+        report = WhatIfReport()
+        for rec in receipts:
+            if not rec.lines:
+                continue
+            head = SimpleNamespace(fk_store_id=rec.fk_store_id, fk_customer_id=rec.fk_customer_id)
+            proposals = CampaignService.evaluate_line_contexts(
+                head,
+                rec.lines,
+                rec.payments,
+                evaluated_at=rec.transaction_date_time,
+                session=session,
+                active_coupon_codes=active_coupon_codes,
+                bundle=bundle,
+            )
+            report.receipts_evaluated += 1
+            report.merchandise_total += rec.merchandise_total
+            if not proposals:
+                continue
+            report.receipts_with_discount += 1
+            hit_codes: Set[str] = set()
+            amounts: DefaultDict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+            for pr in proposals:
+                report.discount_total += pr.discount_amount
+                amounts[pr.campaign_code] += pr.discount_amount
+                st = report.by_campaign.get(pr.campaign_code)
+                if st is None:
+                    st = WhatIfCampaignStats(
+                        campaign_id=str(pr.campaign_id),
+                        campaign_code=pr.campaign_code,
+                        campaign_name=pr.campaign_name,
+                    )
+                    report.by_campaign[pr.campaign_code] = st
+                st.proposal_count += 1
+                hit_codes.add(pr.campaign_code)
+            for code in hit_codes:
+                st = report.by_campaign[code]
+                st.hit_count += 1
+                st.discount_total += amounts[code]
+        return report
+
+    @staticmethod
+    def simulate(
+        bundle: ActiveCampaignEvalBundle,
+        *,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        fk_store_id: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = 0,
+        active_coupon_codes: Optional[Sequence[str]] = None,
+    ) -> WhatIfReport:
+        """
+        Replay completed sales in ``[date_from, date_to)`` against ``bundle``.
+
+        Args:
+            bundle: Candidate campaign set, e.g. built from unsaved ``Campaign`` rows or a
+                copy of ``ActiveCampaignCache.get()`` with a new promotion added.
+            chunk_size: Receipts per streamed chunk (and per worker task).
+            workers: Process pool size; ``0`` or ``1`` evaluates in this process.
+            active_coupon_codes: Coupon codes treated as entered on every receipt, so
+                ``requires_coupon`` campaigns can be simulated too.
+        """
+        from data_layer.engine import Engine
+
+        report = WhatIfReport()
+        with Engine().get_session() as session:
+            chunks = CampaignWhatIfService.iter_receipt_chunks(
+                session,
+                date_from=date_from,
+                date_to=date_to,
+                fk_store_id=fk_store_id,
+                chunk_size=chunk_size,
+            )
+            if workers is None or int(workers) <= 1:
+                for chunk in chunks:
+                    report.merge(
+                        CampaignWhatIfService.evaluate_chunk(
+                            session, chunk, bundle, active_coupon_codes=active_coupon_codes
+                        )
+                    )
+            else:
+                CampaignWhatIfService._simulate_in_pool(
+                    report, chunks, bundle, int(workers), active_coupon_codes
+                )
+        logger.info(
+            "[CampaignWhatIfService] %d receipts, %d hit, discount total %s",
+            report.receipts_evaluated,
+            report.receipts_with_discount,
+            report.discount_total,
+        )
+        return report
+
+    @staticmethod
+    def _simulate_in_pool(
+        report: WhatIfReport,
+        chunks: Iterator[List[WhatIfReceipt]],
+        bundle: ActiveCampaignEvalBundle,
+        workers: int,
+        active_coupon_codes: Optional[Sequence[str]],
+    ) -> None:
+        _strip_engine_refs(bundle)
+        # At most two chunks per worker are queued so streaming stays bounded in memory.
+        max_in_flight = workers * 2
+        pending: Set[Future] = set()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_worker_init,
+            initargs=(bundle, tuple(active_coupon_codes or ())),
+        ) as pool:
+            for chunk in chunks:
+                pending.add(pool.submit(_worker_evaluate_chunk, chunk))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        report.merge(fut.result())
+            for fut in pending:
+                report.merge(fut.result())
+
+
+def _strip_engine_refs(bundle: ActiveCampaignEvalBundle) -> None:
+    """Drop the lazily re-created ``CRUD._engine`` handle so rows can be pickled."""
+    rows: List[Any] = list(bundle.types.values()) + list(bundle.campaigns)
+    for group in (bundle.rules_by, bundle.cp_by):
+        for items in group.values():
+            rows.extend(items)
+    for row in rows:
+        row.__dict__.pop("_engine", None)
+
+
+_worker_bundle: Optional[ActiveCampaignEvalBundle] = None
+_worker_coupons: Tuple[str, ...] = ()
+
+
+def _worker_init(bundle: ActiveCampaignEvalBundle, coupons: Tuple[str, ...]) -> None:
+    global _worker_bundle, _worker_coupons
+    from data_layer.engine import Engine
+
+    # A forked child must not reuse the parent's pooled SQLite connections.
+    Engine().engine.dispose(close=False)
+    _worker_bundle = bundle
+    _worker_coupons = coupons
+
+
+def _worker_evaluate_chunk(receipts: List[WhatIfReceipt]) -> WhatIfReport:
+    from data_layer.engine import Engine
+
+    with Engine().get_session() as session:
+        return CampaignWhatIfService.evaluate_chunk(
+            session, receipts, _worker_bundle, active_coupon_codes=_worker_coupons or None
+        )
+
+
+__all__ = [
+    "CampaignWhatIfService",
+    "WhatIfCampaignStats",
+    "WhatIfReceipt",
+    "WhatIfReport",
+]
@@ -12,7 +12,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import func, or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from core.logger import get_logger
@@ -21,8 +21,10 @@ from data_layer.model.definition.campaign import Campaign
 from data_layer.model.definition.coupon import Coupon
 from data_layer.model.definition.coupon_usage import CouponUsage
 from data_layer.model.definition.transaction_status import TransactionType
+from pos.service.campaign.active_campaign_cache import ActiveCampaignCache
 from pos.service.campaign.application_policy import CAMPAIGN_DISCOUNT_TYPE_CODE
 from pos.service.campaign.campaign_usage_limits import CampaignUsageLimits
+from pos.service.campaign.coupon_usage_cache import CouponUsageCache
 
 logger = get_logger(__name__)
 
@@ -60,15 +62,7 @@ class CouponActivationService:
 
     @staticmethod
     def _usage_count_for_coupon(session: Session, fk_coupon_id: Any) -> int:
-        return (
-            session.query(func.count(CouponUsage.id))
-            .filter(
-                CouponUsage.fk_coupon_id == fk_coupon_id,
-                CouponUsage.is_deleted.is_(False),
-            )
-            .scalar()
-            or 0
-        )
+        return CouponUsageCache.count(session, fk_coupon_id)
 
     @staticmethod
     def _usage_count_coupon_customer(
@@ -76,34 +70,33 @@ class CouponActivationService:
     ) -> int:
         if fk_customer_id is None:
             return 0
-        return (
-            session.query(func.count(CouponUsage.id))
-            .filter(
-                CouponUsage.fk_coupon_id == fk_coupon_id,
-                CouponUsage.fk_customer_id == fk_customer_id,
-                CouponUsage.is_deleted.is_(False),
-            )
-            .scalar()
-            or 0
-        )
+        return CouponUsageCache.count(session, fk_coupon_id, fk_customer_id)
 
     @staticmethod
     def find_coupon_by_raw(session: Session, raw: str) -> Optional[Coupon]:
+        """
+        Active coupon whose code matches ``raw`` case-insensitively, else whose barcode
+        equals ``raw`` as entered or uppercased.
+
+        Two point lookups instead of one ``OR`` so each side uses its index
+        (``idx_coupon_code_upper`` on ``upper(code)``, ``idx_coupon_barcode``).
+        """
         token = (raw or "").strip()
         if not token:
             return None
         token_u = token.upper()
+        live = (Coupon.is_deleted.is_(False), Coupon.is_active.is_(True))
+        coupon = (
+            session.query(Coupon)
+            .filter(func.upper(Coupon.code) == token_u, *live)
+            .first()
+        )
+        if coupon is not None:
+            return coupon
+        barcodes = {token, token_u}
         return (
             session.query(Coupon)
-            .filter(
-                Coupon.is_deleted.is_(False),
-                Coupon.is_active.is_(True),
-                or_(
-                    func.upper(Coupon.code) == token_u,
-                    Coupon.barcode == token,
-                    Coupon.barcode == token_u,
-                ),
-            )
+            .filter(Coupon.barcode.in_(barcodes), *live)
             .first()
         )
 
@@ -134,15 +127,7 @@ class CouponActivationService:
         if not coupon:
             return False, "Coupon code not found.", None
 
-        campaign = (
-            session.query(Campaign)
-            .filter(
-                Campaign.id == coupon.fk_campaign_id,
-                Campaign.is_deleted.is_(False),
-                Campaign.is_active.is_(True),
-            )
-            .first()
-        )
+        campaign = CouponActivationService._active_campaign(session, coupon.fk_campaign_id)
         if not campaign:
             return False, "Campaign for this coupon is not available.", None
         if not campaign.requires_coupon:
@@ -191,6 +176,24 @@ class CouponActivationService:
 
         return True, str(coupon.code or "").strip() or (campaign.code or ""), coupon.id
 
+    @staticmethod
+    def _active_campaign(session: Session, fk_campaign_id: Any) -> Optional[Campaign]:
+        bundle = ActiveCampaignCache.get()
+        if bundle is not None:
+            for c in bundle.campaigns:
+                if c.id == fk_campaign_id:
+                    return c
+            return None
+        return (
+            session.query(Campaign)
+            .filter(
+                Campaign.id == fk_campaign_id,
+                Campaign.is_deleted.is_(False),
+                Campaign.is_active.is_(True),
+            )
+            .first()
+        )
+
     @staticmethod
     def _coupon_valid_dates_campaign(campaign: Campaign, when: datetime) -> bool:
         sd = campaign.start_date
@@ -323,6 +326,8 @@ class CouponActivationService:
                 if row:
                     row.usage_count = int(getattr(row, "usage_count", 0) or 0) + 1
 
+        CouponUsageCache.forget(c.id for coupons in by_campaign.values() for c in coupons)
+
     @staticmethod
     def record_usages_after_completed_sale(
         document_data: Dict[str, Any],
@@ -0,0 +1,88 @@
+"""
+Cached ``CouponUsage`` counts for coupon validation.
+
+``CouponActivationService.validate_for_open_sale`` needs, per scanned coupon, the number
+of live redemptions (``usage_limit`` / ``SINGLE_USE`` checks). The count is read once
+with an indexed ``COUNT`` and then served from memory. Paths that add or soft-delete
+``CouponUsage`` rows call :meth:`CouponUsageCache.forget` so the next check re-reads
+the committed value; :meth:`CouponUsageCache.clear` drops everything (reference data
+reload).
+
+Copyright (c) 2025-2026 Ferhat Mousavi
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from data_layer.model.definition.coupon_usage import CouponUsage
+
+# Bulk coupon runs can be scanned in any order; keep the counts of the most recently
+# checked coupons only.
+_MAX_ENTRIES = 4096
+
+_CountKey = Tuple[UUID, Optional[UUID]]
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    if value is None:
+        return None
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+class CouponUsageCache:
+    """Thread-safe LRU of live ``CouponUsage`` counts per coupon (and per coupon + customer)."""
+
+    _lock = threading.RLock()
+    _counts: "OrderedDict[_CountKey, int]" = OrderedDict()
+
+    @classmethod
+    def count(cls, session: Session, fk_coupon_id: Any, fk_customer_id: Any = None) -> int:
+        """
+        Live redemptions of ``fk_coupon_id``; restricted to ``fk_customer_id`` when given.
+        """
+        key = (_as_uuid(fk_coupon_id), _as_uuid(fk_customer_id))
+        with cls._lock:
+            cached = cls._counts.get(key)
+            if cached is not None:
+                cls._counts.move_to_end(key)
+                return cached
+
+        query = session.query(func.count(CouponUsage.id)).filter(
+            CouponUsage.fk_coupon_id == fk_coupon_id,
+            CouponUsage.is_deleted.is_(False),
+        )
+        if fk_customer_id is not None:
+            query = query.filter(CouponUsage.fk_customer_id == fk_customer_id)
+        n = int(query.scalar() or 0)
+
+        with cls._lock:
+            cls._counts[key] = n
+            cls._counts.move_to_end(key)
+            while len(cls._counts) > _MAX_ENTRIES:
+                cls._counts.popitem(last=False)
+        return n
+
+    @classmethod
+    def forget(cls, coupon_ids: Iterable[Any]) -> None:
+        """Drop cached counts of ``coupon_ids`` (all customers) after their usages changed."""
+        ids = {_as_uuid(cid) for cid in coupon_ids}
+        if not ids:
+            return
+        with cls._lock:
+            for key in [k for k in cls._counts if k[0] in ids]:
+                del cls._counts[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._counts.clear()
+
+
+__all__ = ["CouponUsageCache"]
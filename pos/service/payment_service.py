@@ -547,7 +547,8 @@ class PaymentService:
                 if hasattr(head_temp, key):
                     setattr(head, key, getattr(head_temp, key))
             head.id = uuid4()
-            head.create()
+            # The head and its lines are written in one transaction below
+            records = [head]
 
             # Map temp ``discount_type`` string (e.g. LOYALTY, CAMPAIGN, PRODUCT) to FK.
             # ``CAMPAIGN`` requires a ``transaction_discount_type`` row (seed + startup patch).
@@ -588,7 +589,7 @@ class PaymentService:
                     disc.discount_rate = getattr(disc_temp, "discount_rate", None)
                     disc.discount_code = getattr(disc_temp, "discount_code", None)
                     disc.is_cancel = bool(getattr(disc_temp, "is_cancel", False))
-                    disc.create()
+                    records.append(disc)
 
             # Copy payments
             if document_data.get("payments"):
@@ -603,7 +604,7 @@ class PaymentService:
                             else:
                                 setattr(pay, key, getattr(pay_temp, key))
                     pay.id = uuid4()
-                    pay.create()
+                    records.append(pay)
 
             # Copy changes
             if document_data.get("changes"):
@@ -618,7 +619,7 @@ class PaymentService:
                             else:
                                 setattr(change, key, getattr(change_temp, key))
                     change.id = uuid4()
-                    change.create()
+                    records.append(change)
 
             if document_data.get("loyalty"):
                 for loy_temp in document_data["loyalty"]:
@@ -632,7 +633,19 @@ class PaymentService:
                             else:
                                 setattr(loy, key, getattr(loy_temp, key))
                     loy.id = uuid4()
-                    loy.create()
+                    records.append(loy)
+
+            # ---- Persist the sale, GATE outbox row included ----
+            # The outbox row commits with the sale or not at all; GATE is a
+            # no-op unless configured.
+            from data_layer.engine import Engine
+            from data_layer.model.crud_model import CRUD
+            from pos.integration.hooks import push_transaction_to_gate
+
+            with Engine().get_session() as session:
+                CRUD.save_all(records, session=session)
+                push_transaction_to_gate(None, head.id, session=session)
+                session.commit()
 
             from pos.service.campaign.campaign_audit_service import CampaignAuditService
 
@@ -0,0 +1,283 @@
+"""
+SaleFlex.PyPOS - Point of Sale Application
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Scale labels carry the weight in grams.
+_WEIGHT_SCALE = Decimal("1000")
+
+# GTIN lengths whose last digit is a mod-10 check digit.
+_GTIN_LENGTHS = (8, 12, 13, 14)
+
+_FIELDS = ("code", "quantity", "weight", "price")
+
+
+def gtin_check_digit(body: str) -> int:
+    """GS1 mod-10 check digit for the digits of ``body`` (GTIN without its check digit)."""
+    total = 0
+    for i, ch in enumerate(reversed(body)):
+        d = ord(ch) - 48
+        total += d * 3 if i % 2 == 0 else d
+    return (10 - total % 10) % 10
+
+
+def _is_live(row) -> bool:
+    return not (hasattr(row, "is_deleted") and row.is_deleted)
+
+
+@dataclass(frozen=True)
+class CompiledBarcodeMask:
+    """
+    One ``ProductBarcodeMask`` reduced to slices over the scanned text.
+
+    Positions are 0-based. ``has_check_digit`` is set for GTIN-length masks whose last
+    position is not claimed by any field.
+    """
+
+    mask: Any
+    length: int
+    prefix: str
+    code: Tuple[int, int]
+    quantity: Optional[Tuple[int, int]]
+    weight: Optional[Tuple[int, int]]
+    price: Optional[Tuple[int, int]]
+    has_check_digit: bool
+
+    @classmethod
+    def compile(cls, mask) -> Optional["CompiledBarcodeMask"]:
+        """Return the compiled mask, or ``None`` when its definition is unusable."""
+        slices: Dict[str, Optional[Tuple[int, int]]] = {}
+        for name in _FIELDS:
+            start = getattr(mask, f"{name}_started_at", None)
+            size = getattr(mask, f"{name}_length", None)
+            if start is None or not size or start < 0 or size < 0:
+                slices[name] = None
+            else:
+                slices[name] = (int(start), int(start) + int(size))
+        if slices["code"] is None:
+            return None
+
+        ends = [s[1] for s in slices.values() if s is not None]
+        length = int(mask.barcode_length or 0) or max(ends)
+        prefix = (mask.starting_digits or "").strip()
+        if max(ends) > length or len(prefix) > length:
+            return None
+
+        covered = set()
+        for s in slices.values():
+            if s is not None:
+                covered.update(range(*s))
+        return cls(
+            mask=mask,
+            length=length,
+            prefix=prefix,
+            code=slices["code"],
+            quantity=slices["quantity"],
+            weight=slices["weight"],
+            price=slices["price"],
+            has_check_digit=length in _GTIN_LENGTHS and (length - 1) not in covered,
+        )
+
+
+@dataclass(frozen=True)
+class ScaleBarcode:
+    """Fields decoded from a masked (scale / price-embedded) barcode."""
+
+    barcode: str
+    plu: str
+    quantity: Optional[int]
+    weight: Optional[Decimal]
+    price_minor: Optional[int]
+    mask: Any
+
+    def price(self, decimal_places: int = 2) -> Optional[Decimal]:
+        if self.price_minor is None:
+            return None
+        return Decimal(self.price_minor).scaleb(-decimal_places)
+
+
+class _TrieNode:
+    __slots__ = ("children", "masks")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.masks: Dict[int, CompiledBarcodeMask] = {}
+
+
+class BarcodeMaskTrie:
+    """
+    All barcode masks keyed by their starting digits.
+
+    :meth:`decode` walks the scanned text once through the trie; the mask with the
+    longest matching prefix and the scanned length wins.
+    """
+
+    def __init__(self, masks: Iterable[Any] = ()):
+        self._root = _TrieNode()
+        self.size = 0
+        for mask in masks:
+            if not _is_live(mask):
+                continue
+            compiled = CompiledBarcodeMask.compile(mask)
+            if compiled is None:
+                logger.warning("[BarcodeMaskTrie] Skipping unusable barcode mask %s", getattr(mask, "id", None))
+                continue
+            self._insert(compiled)
+
+    def _insert(self, compiled: CompiledBarcodeMask) -> None:
+        node = self._root
+        for ch in compiled.prefix:
+            node = node.children.setdefault(ch, _TrieNode())
+        # First definition wins for the same prefix and length
+        if compiled.length not in node.masks:
+            node.masks[compiled.length] = compiled
+            self.size += 1
+
+    def match(self, text: str) -> Optional[CompiledBarcodeMask]:
+        length = len(text)
+        node = self._root
+        best = node.masks.get(length)
+        for ch in text:
+            node = node.children.get(ch)
+            if node is None:
+                break
+            best = node.masks.get(length, best)
+        return best
+
+    def decode(self, text: str) -> Optional[ScaleBarcode]:
+        """Decode ``text`` with the matching mask; ``None`` if no mask fits or the check digit fails."""
+        if not self.size or not text or not text.isdigit():
+            return None
+        compiled = self.match(text)
+        if compiled is None:
+            return None
+        if compiled.has_check_digit and gtin_check_digit(text[:-1]) != ord(text[-1]) - 48:
+            return None
+
+        s, e = compiled.code
+        quantity = weight = price_minor = None
+        if compiled.quantity is not None:
+            quantity = int(text[compiled.quantity[0]:compiled.quantity[1]])
+        if compiled.weight is not None:
+            weight = Decimal(int(text[compiled.weight[0]:compiled.weight[1]])) / _WEIGHT_SCALE
+        if compiled.price is not None:
+            price_minor = int(text[compiled.price[0]:compiled.price[1]])
+        return ScaleBarcode(
+            barcode=text,
+            plu=text[s:e],
+            quantity=quantity,
+            weight=weight,
+            price_minor=price_minor,
+            mask=compiled.mask,
+        )
+
+
+@dataclass(frozen=True)
+class ProductLookup:
+    """Result of :meth:`ProductLookupIndex.resolve`."""
+
+    product: Any
+    product_barcode: Any
+    sale_type: str
+    scale: Optional[ScaleBarcode] = None
+
+
+class ProductLookupIndex:
+    """
+    Hash indexes over the ``product_data`` cache for numpad / scanner lookups.
+
+    Built from ``Product``, ``ProductBarcode`` and ``ProductBarcodeMask``; rebuild it
+    whenever those cached lists change (see ``CacheManager.product_lookup_index``).
+    """
+
+    def __init__(self, product_data: Dict[str, List[Any]]):
+        self.products_by_id: Dict[Any, Any] = {}
+        self.products_by_code: Dict[str, Any] = {}
+        self.barcodes: Dict[str, Any] = {}
+
+        for p in product_data.get("Product", []):
+            if not _is_live(p):
+                continue
+            self.products_by_id.setdefault(p.id, p)
+            if p.code is not None:
+                self.products_by_code.setdefault(p.code, p)
+        for pb in product_data.get("ProductBarcode", []):
+            if _is_live(pb) and pb.barcode is not None:
+                self.barcodes.setdefault(pb.barcode, pb)
+        self.masks = BarcodeMaskTrie(product_data.get("ProductBarcodeMask", []))
+
+    def resolve(self, lookup_text: str) -> Optional[ProductLookup]:
+        """
+        ``ProductBarcode.barcode`` then ``Product.code`` (exact), then a barcode mask
+        whose embedded PLU matches a product code or barcode.
+        """
+        text = (lookup_text or "").strip()
+        if not text:
+            return None
+
+        pb = self.barcodes.get(text)
+        if pb is not None:
+            product = self.products_by_id.get(pb.fk_product_id)
+            if product is not None:
+                return ProductLookup(product, pb, "PLU_BARCODE")
+
+        product = self.products_by_code.get(text)
+        if product is not None:
+            return ProductLookup(product, None, "PLU_CODE")
+
+        scale = self.masks.decode(text)
+        if scale is None:
+            return None
+        found = self._resolve_plu(scale.plu)
+        if found is None:
+            logger.debug("[ProductLookupIndex] Masked barcode %s: PLU %s not found", text, scale.plu)
+            return None
+        return ProductLookup(found[0], found[1], found[2], scale)
+
+    def _resolve_plu(self, plu: str) -> Optional[Tuple[Any, Any, str]]:
+        candidates = [plu]
+        trimmed = plu.lstrip("0")
+        if trimmed and trimmed != plu:
+            candidates.append(trimmed)
+        for code in candidates:
+            product = self.products_by_code.get(code)
+            if product is not None:
+                return product, None, "PLU_CODE"
+        for code in candidates:
+            pb = self.barcodes.get(code)
+            if pb is not None:
+                product = self.products_by_id.get(pb.fk_product_id)
+                if product is not None:
+                    return product, pb, "PLU_BARCODE"
+        return None
+
+
+__all__ = [
+    "BarcodeMaskTrie",
+    "CompiledBarcodeMask",
+    "ProductLookup",
+    "ProductLookupIndex",
+    "ScaleBarcode",
+    "gtin_check_digit",
+]
@@ -17,7 +17,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pos.service.vat_service import VatService
 
 
@@ -656,12 +656,126 @@ class SaleService:
             logger.error("[SaleService.add_sale_to_document] Error adding sale to document: %s", e)
             return False
     
+    @staticmethod
+    def add_sales_to_document(document_data: Dict[str, Any], items,
+                              product_data: Optional[Dict[str, Any]] = None,
+                              current_currency: Optional[str] = None,
+                              closure: Optional[Dict[str, Any]] = None,
+                              cashier_data=None) -> List[Any]:
+        """
+        Add several PLU lines to document_data in one go.
+
+        Bulk counterpart of add_sale_to_document for handheld batch uploads,
+        "repeat last order" or imported restaurant checks: the head is prepared once,
+        all TransactionProductTemp rows are written together with the updated head
+        in a single transaction, and totals and campaign evaluation run once.
+
+        Args:
+            document_data: Document data dictionary containing head, products, departments
+            items: Iterable of (product, quantity, unit_price) or
+                   (product, quantity, unit_price, product_barcode) tuples; a
+                   product_barcode makes the line a PLU_BARCODE sale
+            product_data: Product data cache dictionary
+            current_currency: Current currency sign (e.g., "GBP")
+            closure: Closure dictionary containing closure object
+            cashier_data: Cashier object for customer creation
+
+        Returns:
+            list: Created TransactionProductTemp records in item order (empty if
+                  nothing was added)
+        """
+        try:
+            from data_layer.auto_save import AutoSaveModel
+            from data_layer.model.crud_model import CRUD
+
+            if not document_data or not document_data.get("head"):
+                logger.debug("[SaleService.add_sales_to_document] No document_data or head found")
+                return []
+            if not product_data:
+                logger.debug("[SaleService.add_sales_to_document] product_data required for PLU sale")
+                return []
+
+            items = [tuple(item) for item in items or []]
+            if not items:
+                return []
+
+            head = document_data["head"]
+            if isinstance(head, AutoSaveModel):
+                head = head.unwrap()
+
+            if not SaleService.ensure_customer_for_head(head, cashier_data):
+                logger.error("[SaleService.add_sales_to_document] Failed to ensure customer")
+                return []
+            if not SaleService.update_document_head_for_sale(head, current_currency, closure):
+                logger.error("[SaleService.add_sales_to_document] Failed to update head")
+                return []
+
+            line_no = len(document_data.get("products", [])) + len(document_data.get("departments", []))
+            product_temps = []
+            for item in items:
+                product, quantity, unit_price = item[:3]
+                product_barcode = item[3] if len(item) > 3 else None
+                if not product:
+                    logger.debug("[SaleService.add_sales_to_document] Skipping item without product")
+                    continue
+
+                sale_calc = SaleService.calculate_plu_sale(
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    product=product,
+                    product_data=product_data,
+                    currency_sign=current_currency
+                )
+                line_no += 1
+                product_temps.append(SaleService.create_transaction_product_temp(
+                    head_id=head.id,
+                    line_no=line_no,
+                    product=product,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    total_price=sale_calc["total_price"],
+                    vat_rate=sale_calc["vat_rate"],
+                    total_vat=sale_calc["total_vat"],
+                    product_barcode=product_barcode
+                ))
+
+            if not product_temps:
+                return []
+
+            if "products" not in document_data:
+                document_data["products"] = []
+            document_data["products"].extend(product_temps)
+
+            totals = SaleService.calculate_document_totals(document_data)
+            head.total_amount = totals["total_amount"]
+            head.total_vat_amount = totals["total_vat_amount"]
+
+            try:
+                CRUD.save_all([head] + product_temps)
+                logger.info("[SaleService.add_sales_to_document] ✓ Saved %s TransactionProductTemp rows", len(product_temps))
+            except Exception as e:
+                logger.error("[SaleService.add_sales_to_document] Error saving TransactionProductTemp rows: %s", e)
+
+            from pos.service.campaign.campaign_document_sync import sync_campaign_discounts_on_document
+
+            sync_campaign_discounts_on_document(document_data)
+
+            logger.info("[SaleService.add_sales_to_document] ✓ Added %s PLU lines to document", len(product_temps))
+            return product_temps
+
+        except Exception as e:
+            logger.error("[SaleService.add_sales_to_document] Error adding sales to document: %s", e)
+            return []
+
     @staticmethod
     def update_sale_list_from_document(sale_list, document_data: Dict[str, Any], 
                                        pos_data: Optional[Dict[str, Any]] = None):
         """
         Update sale_list control with products and departments from document_data.
         Items are added in line_no order.
+
+        The rows are compared with what sale_list already shows, so only new, changed
+        or vanished lines produce model notifications.
         
         Args:
             sale_list: SaleList control instance
@@ -670,12 +784,11 @@ class SaleService:
         """
         try:
             from data_layer.auto_save import AutoSaveModel
-            
-            # Clear existing items
-            sale_list.clear_products()
+            from user_interface.control.sale_list.sale_list import SalesData
             
             # Get products and departments
-            products = document_data.get("products", [])
+            products = [p.unwrap() if isinstance(p, AutoSaveModel) else p
+                        for p in document_data.get("products", [])]
             departments = document_data.get("departments", [])
             discounts = document_data.get("discounts", [])
             
@@ -684,9 +797,6 @@ class SaleService:
             
             # Add products
             for prod in products:
-                if isinstance(prod, AutoSaveModel):
-                    prod = prod.unwrap()
-                
                 # Skip canceled products
                 if hasattr(prod, 'is_cancel') and prod.is_cancel:
                     continue
@@ -715,12 +825,15 @@ class SaleService:
             # Sort by line_no
             items_to_add.sort(key=lambda x: x['line_no'])
             
-            # Add items to sale_list in order
+            department_names = {}
+            if pos_data and departments:
+                department_names = {dmg.id: dmg.name for dmg in pos_data.get("DepartmentMainGroup", [])}
+            
+            # Build the rows in display order
+            rows = []
             for item in items_to_add:
                 if item['type'] == 'product':
                     prod = item['data']
-                    # Create SalesData object
-                    from user_interface.control.sale_list.sale_list import SalesData
                     sales_data = SalesData()
                     sales_data.reference_id = str(prod.id) if hasattr(prod, 'id') else 0
                     sales_data.transaction_type = "PLU"
@@ -736,22 +849,13 @@ class SaleService:
                     sales_data.price = float(prod.unit_price) if hasattr(prod, 'unit_price') else 0.0
                     sales_data.total_amount = float(prod.total_price) if hasattr(prod, 'total_price') else 0.0
                     sales_data.is_canceled = False
-                    
-                    sale_list.add_sale_with_data(sales_data)
+                    rows.append(sales_data)
                     
                 elif item['type'] == 'department':
                     dept = item['data']
                     # For departments, we need to get department name from pos_data
-                    dept_name = "Department Sale"
-                    if pos_data:
-                        dept_main_groups = pos_data.get("DepartmentMainGroup", [])
-                        for dmg in dept_main_groups:
-                            if dmg.id == dept.fk_department_main_group_id:
-                                dept_name = dmg.name or "Department Sale"
-                                break
+                    dept_name = department_names.get(dept.fk_department_main_group_id) or "Department Sale"
                     
-                    # Create SalesData object
-                    from user_interface.control.sale_list.sale_list import SalesData
                     sales_data = SalesData()
                     sales_data.reference_id = str(dept.id) if hasattr(dept, 'id') else 0
                     sales_data.transaction_type = "DEPARTMENT"
@@ -767,10 +871,10 @@ class SaleService:
                     sales_data.price = float(dept.total_department) if hasattr(dept, 'total_department') else 0.0
                     sales_data.total_amount = float(dept.total_department) if hasattr(dept, 'total_department') else 0.0
                     sales_data.is_canceled = False
-                    
-                    sale_list.add_sale_with_data(sales_data)
+                    rows.append(sales_data)
             
             # Add discounts if any
+            product_names = {prod.id: prod.product_name or "" for prod in products}
             for disc in discounts:
                 if isinstance(disc, AutoSaveModel):
                     disc = disc.unwrap()
@@ -784,22 +888,28 @@ class SaleService:
                     # Find associated product name if available
                     product_name = ""
                     if disc.fk_transaction_product_id:
-                        for prod in products:
-                            if isinstance(prod, AutoSaveModel):
-                                prod = prod.unwrap()
-                            if prod.id == disc.fk_transaction_product_id:
-                                product_name = prod.product_name or ""
-                                break
+                        product_name = product_names.get(disc.fk_transaction_product_id, "")
+                    if not product_name and rows:
+                        product_name = rows[-1].name_of_product
                     
+                    sales_data = SalesData()
+                    sales_data.reference_id = str(disc.id) if hasattr(disc, 'id') else 0
+                    sales_data.transaction_type = "DISCOUNT"
+                    sales_data.name_of_product = product_name
+                    sales_data.total_amount = -discount_amount  # Negative for discount
                     if disc.discount_rate:
                         # Percentage discount
                         discount_rate = float(disc.discount_rate) if hasattr(disc, 'discount_rate') else 0.0
-                        sale_list.add_discount_by_percent_line(discount_rate, discount_amount, product_name)
+                        sales_data.transaction = "DISC. %"
+                        sales_data.unit_quantity = f"%{discount_rate}"
                     else:
                         # Amount discount
-                        sale_list.add_discount_by_amount_line(discount_amount, product_name)
+                        sales_data.transaction = "DISC. AMT"
+                    rows.append(sales_data)
+            
+            structural = sale_list.sync_rows(rows)
             
-            logger.info("[SaleService.update_sale_list] Added %s items to sale_list", len(items_to_add))
+            logger.info("[SaleService.update_sale_list] Synced %s items to sale_list (rows changed: %s)", len(items_to_add), structural)
             
         except Exception as e:
             logger.error("[SaleService.update_sale_list] Error updating sale_list: %s", e)
@@ -90,6 +90,31 @@ class Settings:
         """Return the per-request HTTP timeout for OFFICE connections."""
         return int(self.office.get("timeout_seconds", 10))
 
+    @property
+    def office_push_workers(self) -> int:
+        """Return how many OFFICE push requests may be in flight at once."""
+        return max(1, int(self.office.get("push_workers", 4)))
+
+    @property
+    def office_retry_attempts(self) -> int:
+        """Return how often a failed OFFICE connection is retried (with backoff)."""
+        return max(0, int(self.office.get("retry_attempts", 3)))
+
+    @property
+    def office_retry_backoff_seconds(self) -> int:
+        """Return the first push retry delay while OFFICE is unreachable; it doubles per failure."""
+        return max(1, int(self.office.get("retry_backoff_seconds", 15)))
+
+    @property
+    def office_retry_backoff_max_seconds(self) -> int:
+        """Return the upper bound of the OFFICE push retry delay."""
+        return max(1, int(self.office.get("retry_backoff_max_seconds", 1800)))
+
+    @property
+    def office_compress_min_bytes(self) -> int:
+        """Return the request body size from which OFFICE uploads are gzipped (0 = never)."""
+        return max(0, int(self.office.get("compress_min_bytes", 8192)))
+
     @property
     def office_api_key(self) -> str:
         """Return the OFFICE API key."""
@@ -116,6 +141,11 @@ class Settings:
         """Return the OFFICE notification polling interval in seconds."""
         return int(self.office.get("notification_poll_interval_seconds", 30))
 
+    @property
+    def office_push_batch_size(self) -> int:
+        """Return how many queued transactions are sent to OFFICE per request."""
+        return max(1, int(self.office.get("push_batch_size", 50)))
+
     def office_manages(self, service: str) -> bool:
         """
         Return True when OFFICE is configured to manage *service*.
@@ -156,6 +186,26 @@ class Settings:
         minutes = self.gate.get("sync_interval_minutes", 30)
         return int(minutes) * 60
 
+    @property
+    def gate_retry_attempts(self) -> int:
+        """Return how many rejected pushes an outbox item gets before it is dead-lettered."""
+        return max(1, int(self.gate.get("retry_attempts", 3)))
+
+    @property
+    def gate_push_batch_size(self) -> int:
+        """Return how many outbox items are sent to GATE per request."""
+        return max(1, int(self.gate.get("push_batch_size", 50)))
+
+    @property
+    def gate_retry_backoff_seconds(self) -> int:
+        """Return the first retry delay; it doubles with every further failure."""
+        return max(1, int(self.gate.get("retry_backoff_seconds", 30)))
+
+    @property
+    def gate_retry_backoff_max_seconds(self) -> int:
+        """Return the upper bound of the retry delay."""
+        return max(1, int(self.gate.get("retry_backoff_max_seconds", 1800)))
+
     @property
     def gate_notification_enabled(self) -> bool:
         """Return True when GATE notification polling is enabled."""
@@ -166,6 +216,11 @@ class Settings:
         """Return the notification polling interval in seconds."""
         return int(self.gate.get("notification_poll_interval_seconds", 60))
 
+    @property
+    def gate_notification_long_poll_seconds(self) -> int:
+        """Return how long GATE may hold a notification subscription request open."""
+        return max(1, int(self.gate.get("notification_long_poll_seconds", 55)))
+
     def gate_manages(self, service: str) -> bool:
         """
         Return True when GATE is configured to manage *service*.
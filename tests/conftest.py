@@ -0,0 +1,54 @@
+"""
+SaleFlex.PyPOS - Shared test fixtures
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Settings reads settings.toml from the working directory
+sys.path.insert(0, REPO_ROOT)
+os.chdir(REPO_ROOT)
+
+
+@pytest.fixture(scope="session")
+def database(tmp_path_factory):
+    """
+    Point the Engine singleton at an empty SQLite file with every table
+    created, instead of the terminal's pos.sqlite3.
+    """
+    from settings.settings import Settings
+    from data_layer.engine import Engine
+    from data_layer.model.crud_model import Model
+    import data_layer.model  # noqa: F401  (registers every table)
+
+    path = tmp_path_factory.mktemp("db") / "pos.sqlite3"
+    original = Settings.db_name
+    Settings.db_name = property(lambda self: str(path))
+    Engine._instance = None
+    Engine._initialized = False
+    engine = Engine()
+    Model.metadata.create_all(engine.engine)
+    yield engine
+
+    engine.engine.dispose()
+    Settings.db_name = original
+    Engine._instance = None
+    Engine._initialized = False
@@ -0,0 +1,128 @@
+"""
+SaleFlex.PyPOS - Local fake SaleFlex.GATE server for tests
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGate:
+    """
+    In-process GATE stand-in speaking the endpoints GateClient uses.
+
+    - ``POST api/auth/token/`` issues a new bearer token on every call.
+    - ``POST <endpoint>/batch/`` answers ``{"results": [...]}`` with one entry
+      per item; items whose ``transaction_id`` / ``closure_id`` is in
+      :attr:`reject` get ``{"status": "error"}``.
+
+    - ``GET <resource>/updates/`` answers the body queued for it in
+      :attr:`updates` (keyed by ``"products"`` / ``"campaigns"``) once, then ``{}``.
+    - ``GET api/notifications/subscribe/`` answers the queued
+      :attr:`notifications` with cursor ``"c<n>"`` (n = notifications sent so
+      far), or an empty list at once.
+
+    Set :attr:`mode` to ``"down"`` to answer 503, or ``"expire"`` to reject the
+    current token once with 401.  Every accepted batch is recorded in
+    :attr:`batches` as ``(path, items)``, the query of every GET in
+    :attr:`gets` as ``(path, params)``.
+    """
+
+    def __init__(self):
+        self.mode = "ok"
+        self.reject: set = set()
+        self.batches: list = []
+        self.updates: dict = {}
+        self.notifications: list = []
+        self.delivered = 0
+        self.gets: list = []
+        self.tokens = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeGate":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        gate = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, code, body):
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                from urllib.parse import parse_qsl, urlsplit
+
+                url = urlsplit(self.path)
+                params = dict(parse_qsl(url.query))
+                with gate._lock:
+                    if gate.mode == "down":
+                        return self._send(503, {})
+                    if self.headers.get("Authorization") != f"Bearer t{gate.tokens}":
+                        return self._send(401, {})
+                    gate.gets.append((url.path, params))
+                    if url.path == "/api/notifications/subscribe/":
+                        results, gate.notifications = gate.notifications, []
+                        gate.delivered += len(results)
+                        return self._send(200, {"results": results, "cursor": f"c{gate.delivered}"})
+                    name = url.path.split("/")[2]
+                    return self._send(200, gate.updates.pop(name, {}))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with gate._lock:
+                    if self.path == "/api/auth/token/":
+                        gate.tokens += 1
+                        return self._send(200, {"access": f"t{gate.tokens}", "expires_in": 3600})
+                    if gate.mode == "down":
+                        return self._send(503, {})
+                    if self.headers.get("Authorization") != f"Bearer t{gate.tokens}":
+                        return self._send(401, {})
+                    if gate.mode == "expire":
+                        gate.mode = "ok"
+                        gate.tokens += 1
+                        return self._send(401, {})
+                    items = body.get("items", [])
+                    gate.batches.append((self.path, items))
+                    results = [
+                        {"status": "error", "error": "rejected by fake GATE"}
+                        if (item.get("transaction_id") or item.get("closure_id")) in gate.reject
+                        else {"status": "ok"}
+                        for item in items
+                    ]
+                return self._send(200, {"results": results})
+
+        return Handler
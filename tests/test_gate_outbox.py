@@ -0,0 +1,205 @@
+"""
+SaleFlex.PyPOS - Tests for the GATE outbox against a local fake GATE
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+import uuid
+
+import pytest
+
+from fake_gate import FakeGate
+
+
+@pytest.fixture
+def gate(database, monkeypatch):
+    """A running FakeGate with the default GATE client and sync service bound to it."""
+    import pos.integration.gate.gate_client as gate_client
+    import pos.integration.gate.gate_sync_service as gate_sync
+    from pos.integration import hooks
+    from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+    server = FakeGate().start()
+    monkeypatch.setattr(gate_client, "_session", None)
+    monkeypatch.setattr(
+        gate_client, "_default_gate_client",
+        gate_client.GateClient(base_url=server.url, api_key="key", terminal_id="T1", retry_attempts=0),
+    )
+    service = gate_sync.GateSyncService()
+    service._batch_size = 4
+    service._max_retries = 2
+    service._backoff_base = 0.01
+    service._backoff_max = 0.02
+    monkeypatch.setattr(gate_sync, "_default_gate_sync", service)
+    wakes = []
+    monkeypatch.setattr(hooks, "_wake_sync_worker", lambda: wakes.append(True))
+    server.service = service
+    server.wakes = wakes
+    yield server
+
+    server.stop()
+    from data_layer.model.definition.closure import Closure
+    from data_layer.model.definition.transaction_head import TransactionHead
+    from data_layer.model.definition.transaction_product import TransactionProduct
+
+    with database.get_session() as session:
+        for model in (SyncQueueItem, TransactionProduct, TransactionHead, Closure):
+            session.query(model).delete()
+
+
+def _sale(receipt_number=1, lines=1):
+    """Insert a completed TransactionHead with ``lines`` product lines; returns its id."""
+    from decimal import Decimal
+    from data_layer.engine import Engine
+    from data_layer.model.definition.transaction_head import TransactionHead
+    from data_layer.model.definition.transaction_product import TransactionProduct
+
+    head_id = uuid.uuid4()
+    with Engine().get_session() as session:
+        session.execute(TransactionHead.__table__.insert().values(
+            id=head_id, transaction_unique_id=f"T-{head_id}", pos_id=1, document_type="FISCAL_RECEIPT",
+            fk_store_id=uuid.uuid4(), closure_number=1, receipt_number=receipt_number,
+        ))
+        for line_no in range(1, lines + 1):
+            session.execute(TransactionProduct.__table__.insert().values(
+                id=uuid.uuid4(), fk_transaction_head_id=head_id, line_no=line_no,
+                fk_department_main_group_id=uuid.uuid4(), vat_rate=20, unit_price=Decimal("2.50"),
+                quantity=Decimal("2"), total_price=Decimal("5.00"), total_vat=Decimal("0.83"),
+            ))
+    return str(head_id)
+
+
+def _closure():
+    """Insert a Closure; returns its id."""
+    from datetime import date, datetime
+    from data_layer.engine import Engine
+    from data_layer.model.definition.closure import Closure
+
+    closure_id = uuid.uuid4()
+    with Engine().get_session() as session:
+        session.execute(Closure.__table__.insert().values(
+            id=closure_id, closure_unique_id=f"Z-{closure_id}", closure_number=1,
+            fk_store_id=uuid.uuid4(), fk_pos_id=uuid.uuid4(), closure_date=date.today(),
+            closure_start_time=datetime.now(), fk_base_currency_id=uuid.uuid4(),
+            fk_cashier_opened_id=uuid.uuid4(), fk_cashier_closed_id=uuid.uuid4(),
+        ))
+    return str(closure_id)
+
+
+def _items(status=None):
+    from data_layer.engine import Engine
+    from data_layer.model.definition.sync_queue_item import SyncQueueItem
+
+    with Engine().get_session() as session:
+        query = session.query(SyncQueueItem)
+        if status:
+            query = query.filter(SyncQueueItem.status == status)
+        return query.all()
+
+
+def test_outbox_row_commits_with_the_sale(gate):
+    from data_layer.engine import Engine
+    from pos.integration import hooks
+
+    rolled_back, committed = str(uuid.uuid4()), str(uuid.uuid4())
+    with Engine().get_session() as session:
+        hooks.push_transaction_to_gate(None, rolled_back, session=session)
+        session.rollback()
+    assert _items() == []
+    assert gate.wakes == []
+
+    with Engine().get_session() as session:
+        hooks.push_transaction_to_gate(None, committed, session=session)
+        assert gate.wakes == []
+        session.commit()
+    assert [item.get_payload_dict()["head_id"] for item in _items("pending")] == [committed]
+    assert gate.wakes == [True]
+
+
+def test_batches_and_per_item_rejection(gate):
+    from pos.integration import hooks
+
+    ids = [_sale(receipt_number=n) for n in range(10)]
+    for head_id in ids:
+        hooks.push_transaction_to_gate(None, head_id)
+    hooks.push_transaction_to_gate(None, ids[0])
+    gate.reject = {ids[3]}
+
+    assert gate.service.flush_pending_queue() == {"sent": 9, "retried": 1, "dead_letter": 0}
+    assert [len(items) for _path, items in gate.batches] == [4, 4, 2]
+    assert [item["transaction_id"] for _path, items in gate.batches for item in items] == ids
+
+    time.sleep(0.05)
+    assert gate.service.flush_pending_queue() == {"sent": 0, "retried": 0, "dead_letter": 1}
+    assert len(_items("sent")) == 9
+    assert len(_items("dead_letter")) == 1
+
+
+def test_unreachable_gate_backs_off_and_keeps_items(gate):
+    from core.exceptions import GATEConnectionError
+    from pos.integration import hooks
+
+    hooks.push_transaction_to_gate(None, _sale())
+    gate.service._backoff_base = gate.service._backoff_max = 60
+    gate.mode = "down"
+    with pytest.raises(GATEConnectionError):
+        gate.service.flush_pending_queue()
+    assert len(_items("pending")) == 1
+    assert _items("pending")[0].retry_count == 0
+
+    gate.mode = "ok"
+    assert gate.service.flush_pending_queue() == {"sent": 0, "retried": 0, "dead_letter": 0}
+    assert gate.batches == []
+    assert gate.service.seconds_until_due() > 0
+
+
+def test_expired_token_is_renewed_once(gate):
+    from pos.integration import hooks
+
+    hooks.push_closure_to_gate(None, _closure())
+    gate.service.flush_pending_queue()  # acquires the first token
+    hooks.push_transaction_to_gate(None, _sale())
+    gate.mode = "expire"
+
+    assert gate.service.flush_pending_queue()["sent"] == 1
+    assert len(_items("sent")) == 2
+
+
+def test_payloads_carry_the_stored_documents(gate):
+    from pos.integration import hooks
+
+    head_id, closure_id = _sale(receipt_number=7, lines=2), _closure()
+    hooks.push_transaction_to_gate(None, head_id)
+    hooks.push_closure_to_gate(None, closure_id)
+
+    assert gate.service.flush_pending_queue()["sent"] == 2
+    (closure_path, [closure]), (tx_path, [tx]) = sorted(gate.batches, key=lambda batch: batch[0])
+    assert closure_path == "/api/closures/batch/"
+    assert closure["closure_id"] == closure_id
+    assert closure["closure"]["closure_unique_id"] == f"Z-{closure_id}"
+    assert tx_path == "/api/transactions/batch/"
+    assert tx["transaction_id"] == head_id
+    assert tx["head"]["receipt_number"] == 7
+    assert [line["line_no"] for line in tx["products"]] == [1, 2]
+
+
+def test_missing_document_is_never_marked_sent(gate):
+    from pos.integration import hooks
+
+    hooks.push_transaction_to_gate(None, str(uuid.uuid4()))
+    assert gate.service.flush_pending_queue() == {"sent": 0, "retried": 1, "dead_letter": 0}
+    assert gate.batches == []
+    assert "not found" in _items("pending")[0].error_message
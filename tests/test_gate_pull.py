@@ -0,0 +1,139 @@
+"""
+SaleFlex.PyPOS - Tests for GATE update pulls and notifications against a local fake GATE
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from fake_gate import FakeGate
+
+
+@pytest.fixture
+def gate(database, monkeypatch):
+    """A running FakeGate with the default GATE client bound to it."""
+    import pos.integration.gate.gate_client as gate_client
+    from data_layer.model.definition.gate_notification import GateNotification
+    from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
+    from data_layer.model.definition.product import Product
+
+    server = FakeGate().start()
+    monkeypatch.setattr(gate_client, "_session", None)
+    monkeypatch.setattr(
+        gate_client, "_default_gate_client",
+        gate_client.GateClient(base_url=server.url, api_key="key", terminal_id="T1", retry_attempts=0),
+    )
+    yield server
+
+    server.stop()
+    with database.get_session() as session:
+        for model in (Product, GateNotification, OfficeSyncWatermark):
+            session.query(model).delete()
+
+
+def _pull_service():
+    from pos.integration.gate.gate_pull_service import GatePullService
+
+    return GatePullService()
+
+
+def _product(name="Tea", code="P1", price="2.50", product_id=None):
+    return {
+        "id": str(product_id or uuid.uuid4()), "name": name, "code": code, "sale_price": price,
+        "fk_department_main_group_id": str(uuid.uuid4()),
+        "fk_department_sub_group_id": str(uuid.uuid4()),
+    }
+
+
+def _price(product_id):
+    from data_layer.engine import Engine
+    from data_layer.model.definition.product import Product
+
+    with Engine().get_session() as session:
+        return session.get(Product, uuid.UUID(product_id)).sale_price
+
+
+def test_product_pull_writes_rows_and_resumes_from_the_watermark(gate):
+    tea = _product()
+    gate.updates["products"] = {"resources": {"products": {"changed": [tea]}}, "watermark": "w1"}
+    changed = _pull_service().pull_product_updates()
+    assert changed == {"Product": [uuid.UUID(tea["id"])]}
+    assert _price(tea["id"]) == Decimal("2.50")
+
+    gate.updates["products"] = {"results": [dict(tea, sale_price="2.75")], "watermark": "w2"}
+    _pull_service().pull_product_updates()
+    assert _price(tea["id"]) == Decimal("2.75")
+    assert [params.get("since") for _path, params in gate.gets] == [None, "w1"]
+
+    _pull_service().pull_product_updates()
+    assert gate.gets[-1][1]["since"] == "w2"
+
+
+def test_product_pull_does_not_write_other_tables(gate):
+    gate.updates["products"] = {"resources": {
+        "products": {"changed": [_product()]},
+        "cashiers": {"changed": [{"id": str(uuid.uuid4()), "user_name": "intruder"}]},
+    }}
+    assert list(_pull_service().pull_product_updates()) == ["Product"]
+
+
+def test_product_pull_with_skipped_rows_keeps_the_watermark(gate):
+    gate.updates["products"] = {"resources": {"products": {"changed": [_product()]}}, "watermark": "w1"}
+    _pull_service().pull_product_updates()
+    gate.updates["products"] = {
+        "resources": {"products": {"changed": [_product(code="P2"), _product(name=None, code="P3")]}},
+        "watermark": "w2",
+    }
+    _pull_service().pull_product_updates()
+    _pull_service().pull_product_updates()
+    assert gate.gets[-1][1]["since"] == "w1"
+
+
+def test_notification_cursor_survives_a_restart(gate):
+    gate.notifications = [{"id": 1, "type": "terminal_message", "title": "Hi", "body": "there"}]
+    assert [n["title"] for n in _pull_service().listen_for_notifications(1)] == ["Hi"]
+
+    # A new service (restart) resumes from the stored cursor
+    assert _pull_service().listen_for_notifications(1) == []
+    assert [params.get("cursor") for _path, params in gate.gets] == [None, "c1"]
+
+    # GATE redelivering an already stored notification dispatches nothing
+    gate.notifications = [{"id": 1, "type": "terminal_message", "title": "Hi", "body": "there"}]
+    assert _pull_service().listen_for_notifications(1) == []
+
+
+def test_price_notification_pulls_and_reports_the_changed_rows(gate):
+    from data_layer.model.definition.gate_notification import GateNotification
+    from pos.manager.sync_worker import SyncWorker
+
+    tea = _product()
+    gate.updates["products"] = {"resources": {"products": {"changed": [tea]}}, "watermark": "w1"}
+    gate.notifications = [
+        {"id": 7, "type": "price_change", "ids": [tea["id"]]},
+        {"id": 8, "type": "product_update"},
+    ]
+    pull = _pull_service()
+    worker = SyncWorker()
+    emitted = []
+    worker.cache_refresh_needed.connect(lambda name, changed: emitted.append((name, changed)))
+
+    worker._dispatch_notifications(pull, pull.listen_for_notifications(1))
+    assert emitted == [("price", {"Product": [uuid.UUID(tea["id"])]})]
+    assert [path for path, _params in gate.gets].count("/api/products/updates/") == 1
+    assert _price(tea["id"]) == Decimal("2.50")
+    assert GateNotification.get_unread() == []
@@ -0,0 +1,71 @@
+"""
+SaleFlex.PyPOS - Tests for the incremental OFFICE JSON reader
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+
+import pytest
+
+from integration.json_stream import ResourceStream
+
+PAYLOADS = [
+    '{"status":"ok","data":{"ids":[12.5, 3]}}',
+    '{"data":{"ids":[1E2]}}',
+    '{"data":{"ids":[1e-2, -0.5E+3, 120, 7]}}',
+    '{"server_time":1700000000.25,"status":"ok","data":{"store":{"id":1}}}',
+    '{"status":"ok","data":{"products":[{"code":"P1","price":9.99,"stock":-3},'
+    '{"code":"Ü2","price":1.5e1,"active":true,"tags":[]}],"empty":[],'
+    '"store":{"name":"Maïn"},"flag":false},"count":12}',
+]
+
+
+def _document(chunks, chunk_rows=2):
+    """Rebuild the document from a ResourceStream as json.loads would return it."""
+    stream = ResourceStream(chunks, chunk_rows=chunk_rows)
+    data = {}
+    for resource, value in stream:
+        if isinstance(value, list) and isinstance(data.get(resource), list):
+            data[resource].extend(value)
+        else:
+            data[resource] = value
+    return {**stream.header, "data": data}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_every_split_offset_matches_json_loads(payload):
+    raw = payload.encode("utf-8")
+    expected = json.loads(payload)
+    for offset in range(len(raw) + 1):
+        assert _document([raw[:offset], raw[offset:]]) == expected, offset
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_byte_by_byte_matches_json_loads(payload):
+    raw = payload.encode("utf-8")
+    assert _document([raw[i:i + 1] for i in range(len(raw))]) == json.loads(payload)
+
+
+def test_list_resources_are_chunked():
+    raw = b'{"data":{"rows":[1,2,3,4,5],"none":[]}}'
+    assert list(ResourceStream([raw], chunk_rows=2)) == [
+        ("rows", [1, 2]), ("rows", [3, 4]), ("rows", [5]), ("none", []),
+    ]
+
+
+def test_trailing_data_is_rejected():
+    with pytest.raises(ValueError):
+        list(ResourceStream([b'{"data":{}} x']))
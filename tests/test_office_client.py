@@ -0,0 +1,117 @@
+"""
+SaleFlex.PyPOS - Tests for the OFFICE HTTP client
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _Office(BaseHTTPRequestHandler):
+    """
+    Records every POST.  ``refuse_gzip`` is None (gzip accepted) or the
+    ``(status, message)`` gzip bodies are answered with; ``reject`` answers
+    every body with 400 and a validation error.
+    """
+
+    refuse_gzip = None
+    reject = False
+    requests: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        encoding = self.headers.get("Content-Encoding")
+        type(self).requests.append(encoding)
+        if encoding == "gzip":
+            if self.refuse_gzip:
+                status, message = self.refuse_gzip
+                return self._send(status, {"detail": message})
+            body = gzip.decompress(body)
+        if self.reject:
+            return self._send(400, {"detail": "rows[3].code: field required"})
+        self._send(200, {"status": "ok", "received": len(json.loads(body)["rows"])})
+
+
+@pytest.fixture
+def office(monkeypatch):
+    import integration.office_client as office_client
+    from settings.settings import Settings
+
+    _Office.requests = []
+    _Office.refuse_gzip = None
+    _Office.reject = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Office)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(Settings, "office_base_url", property(lambda self: url))
+    monkeypatch.setattr(Settings, "office_compress_min_bytes", property(lambda self: 1024))
+    monkeypatch.setattr(Settings, "office_retry_attempts", property(lambda self: 0))
+    monkeypatch.setattr(office_client, "_session", None)
+    monkeypatch.setattr(office_client, "_gzip_refused", False)
+    yield office_client.OfficeClient(), url
+    server.shutdown()
+    server.server_close()
+
+
+PAYLOAD = {"rows": [{"code": f"P{i}", "name": "Product"} for i in range(200)]}
+
+
+def test_large_bodies_are_gzipped(office):
+    client, url = office
+    assert client._post_json(f"{url}/push", PAYLOAD).json()["received"] == 200
+    assert client._post_json(f"{url}/push", {"rows": []}).json()["received"] == 0
+    assert _Office.requests == ["gzip", None]
+
+
+@pytest.mark.parametrize("refusal", [
+    (415, "Unsupported Media Type"),
+    (400, "Unsupported Content-Encoding: gzip"),
+])
+def test_refused_gzip_is_resent_plain_and_not_used_again(office, refusal):
+    client, url = office
+    _Office.refuse_gzip = refusal
+    assert client._post_json(f"{url}/push", PAYLOAD).json()["received"] == 200
+    assert client._post_json(f"{url}/push", PAYLOAD).json()["received"] == 200
+    assert _Office.requests == ["gzip", None, None]
+
+
+def test_validation_error_does_not_disable_gzip(office):
+    import integration.office_client as office_client
+
+    client, url = office
+    _Office.reject = True
+    assert client._post_json(f"{url}/push", PAYLOAD).status_code == 400
+    assert _Office.requests == ["gzip"]
+    assert office_client._gzip_refused is False
+
+    _Office.reject = False
+    assert client._post_json(f"{url}/push", PAYLOAD).json()["received"] == 200
+    assert _Office.requests == ["gzip", "gzip"]
@@ -0,0 +1,104 @@
+"""
+SaleFlex.PyPOS - Tests for the ordering of one OFFICE push lane
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+
+import pytest
+
+
+class _Office:
+    """push_transactions stand-in; uids in ``reject`` get an error result."""
+
+    def __init__(self, reject=(), partial=False):
+        self.reject = set(reject)
+        self.partial = partial
+        self.pushed: list = []
+
+    def push_transactions(self, pos_id, transactions, sequences):
+        uids = [payload["uid"] for payload in transactions]
+        self.pushed.append(uids)
+        if self.partial:
+            return {"status": "ok", "accepted": len(uids) - 1}
+        return {"status": "ok", "results": [
+            {"transaction_unique_id": uid, "status": "error" if uid in self.reject else "ok"}
+            for uid in uids
+        ]}
+
+
+@pytest.fixture
+def lane(monkeypatch):
+    """Run a lane of ``count`` documents of one closure; returns the marked outcomes."""
+    import pos.integration.office.office_push_service as push
+
+    marked = {"sent": [], "failed": {}, "unconfirmed": []}
+    missing: set = set()
+    monkeypatch.setattr(push, "_build_transaction_payloads", lambda ids: {
+        str(head_id): None if head_id in missing else {"uid": head_id} for head_id in ids
+    })
+    monkeypatch.setattr(push, "_get_current_sequences", lambda: [])
+    monkeypatch.setattr(push, "_mark_queue_sent", lambda ids: marked["sent"].extend(ids))
+    monkeypatch.setattr(push, "_mark_queue_failed", lambda errors: marked["failed"].update(errors))
+    monkeypatch.setattr(push, "_mark_queue_unconfirmed", lambda ids: marked["unconfirmed"].extend(ids))
+
+    def run(client, count=9, closure_number=7, batch_size=3):
+        items = [
+            {"id": i, "fk_transaction_head_id": f"r{i}", "transaction_unique_id": f"r{i}",
+             "closure_number": closure_number}
+            for i in range(count)
+        ]
+        result = push._flush_transaction_lane(
+            client, 1, items, batch_size, threading.Lock(), threading.Event()
+        )
+        return result, marked
+
+    run.missing = missing
+    return run
+
+
+def test_lane_stops_at_a_rejected_document(lane):
+    office = _Office(reject={"r4"})
+    (sent, ok), marked = lane(office)
+    assert (sent, ok) == (5, False)
+    assert office.pushed == [["r0", "r1", "r2"], ["r3", "r4", "r5"]]
+    assert list(marked["failed"]) == [4]
+
+
+def test_lane_stops_at_an_unconfirmed_batch(lane):
+    office = _Office(partial=True)
+    (sent, ok), marked = lane(office)
+    assert (sent, ok) == (0, False)
+    assert office.pushed == [["r0", "r1", "r2"]]
+    assert marked["unconfirmed"] == [0, 1, 2]
+
+
+def test_lane_does_not_send_past_a_missing_document(lane):
+    lane.missing.add("r1")
+    office = _Office()
+    (sent, ok), marked = lane(office)
+    assert (sent, ok) == (1, False)
+    assert office.pushed == [["r0"]]
+    assert list(marked["failed"]) == [1]
+
+
+def test_rows_without_a_closure_are_all_attempted(lane):
+    lane.missing.update({"r0", "r4"})
+    office = _Office()
+    (sent, ok), marked = lane(office, count=6, closure_number=None)
+    assert (sent, ok) == (4, False)
+    assert office.pushed == [["r1", "r2"], ["r3", "r5"]]
+    assert sorted(marked["failed"]) == [0, 4]
@@ -0,0 +1,75 @@
+"""
+SaleFlex.PyPOS - Tests for OFFICE delta sync watermarks
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import uuid
+
+import pytest
+
+
+@pytest.fixture
+def seeder(database):
+    from data_layer import office_seeder
+    from data_layer.model.definition.country import Country
+    from data_layer.model.definition.office_sync_watermark import OfficeSyncWatermark
+
+    yield office_seeder
+    with database.get_session() as session:
+        session.query(Country).delete()
+        session.query(OfficeSyncWatermark).delete()
+
+
+def _country(code, name="Country"):
+    return {"id": str(uuid.uuid4()), "name": name, "iso_alpha2": code}
+
+
+def test_delta_with_skipped_rows_keeps_the_old_watermark(seeder, database):
+    seeder.apply_office_changes(database, {"resources": {
+        "countries": {"changed": [_country("AA")], "watermark": "w1"},
+        "cities": {"changed": [], "watermark": "c1"},
+    }})
+    assert seeder.load_sync_watermarks(database) == {"countries": "w1", "cities": "c1"}
+
+    result = seeder.apply_office_changes(database, {"resources": {
+        "countries": {"changed": [_country("BB"), _country("CC", name=None)], "watermark": "w2"},
+        "cities": {"changed": [], "watermark": "c2"},
+    }})
+    assert (result["upserted"], result["skipped"]) == (1, 1)
+    assert seeder.load_sync_watermarks(database) == {"countries": "w1", "cities": "c2"}
+
+
+def test_delta_with_failed_delete_keeps_the_old_watermark(seeder, database, monkeypatch):
+    seeder.apply_office_changes(database, {"resources": {
+        "countries": {"changed": [_country("AA")], "watermark": "w1"},
+    }})
+    monkeypatch.setattr(seeder, "_delete_rows", lambda *args, **kwargs: None)
+    seeder.apply_office_changes(database, {"resources": {
+        "countries": {"deleted": [str(uuid.uuid4())], "watermark": "w2"},
+    }})
+    assert seeder.load_sync_watermarks(database) == {"countries": "w1"}
+
+
+def test_reseed_with_skipped_rows_clears_the_watermark(seeder, database):
+    seeder.apply_office_changes(database, {"resources": {
+        "countries": {"changed": [_country("AA")], "watermark": "w1"},
+    }})
+    seeder.reseed_from_office_stream(database, [
+        ("countries", [_country("BB"), _country("CC", name=None)]),
+        ("cities", []),
+        ("sync_watermarks", {"countries": "w3", "cities": "c3"}),
+    ])
+    assert seeder.load_sync_watermarks(database) == {"cities": "c3"}
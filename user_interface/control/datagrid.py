@@ -16,54 +16,300 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
+from PySide6.QtWidgets import QTableView, QHeaderView
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont
 
-class DataGrid(QTableWidget):
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# SQLite virtual machine instructions between two polls of a fetch's cancel callback
+_CANCEL_CHECK_OPCODES = 1000
+
+
+class FetchCancelled(Exception):
+    """Raised by :meth:`QueryPageSource.fetch` when its ``cancelled`` callback fired."""
+
+
+class QueryPageSource:
+    """
+    Pages DataGrid rows out of a SQLAlchemy query.
+
+    Only the rows the user scrolls to are loaded, ``page_size`` at a time, with
+    ``ORDER BY ... LIMIT/OFFSET`` evaluated by the database.
+
+    Args:
+        build_query: ``build_query(session)`` returns the filtered (unordered) query
+        to_row: ``to_row(record)`` returns ``(key, [cell, ...])`` for one query result
+        sort_columns: SQL expression per grid column used when that column is sorted;
+                      ``None`` marks a column as not sortable
+        default_order: ORDER BY clauses used while no column is sorted
+        tie_breaker: Unique column appended to every ORDER BY so OFFSET paging is stable
+    """
+
+    def __init__(self, build_query: Callable, to_row: Callable,
+                 sort_columns: Sequence[Any] = (), default_order: Sequence[Any] = (),
+                 tie_breaker: Any = None):
+        self.build_query = build_query
+        self.to_row = to_row
+        self.sort_columns = list(sort_columns)
+        self.default_order = list(default_order)
+        self.tie_breaker = tie_breaker
+
+    def can_sort(self, column: int) -> bool:
+        return 0 <= column < len(self.sort_columns) and self.sort_columns[column] is not None
+
+    def fetch(self, offset: int, limit: int, sort_column: int = -1,
+              descending: bool = False,
+              cancelled: Optional[Callable[[], bool]] = None) -> List[Tuple[Any, List[Any]]]:
+        """
+        Return up to ``limit`` ``(key, row)`` pairs starting at ``offset``.
+
+        ``cancelled`` is polled while SQLite executes the query; once it returns
+        True the statement is interrupted and :class:`FetchCancelled` is raised.
+        """
+        from data_layer.engine import Engine
+
+        if self.can_sort(sort_column):
+            expr = self.sort_columns[sort_column]
+            order = [expr.desc() if descending else expr.asc()]
+        else:
+            order = list(self.default_order)
+        if self.tie_breaker is not None:
+            order.append(self.tie_breaker)
+
+        with Engine().get_session() as session:
+            query = self.build_query(session)
+            if order:
+                query = query.order_by(*order)
+            query = query.offset(offset).limit(limit)
+            if cancelled is None:
+                return [self.to_row(record) for record in query.all()]
+
+            if cancelled():
+                raise FetchCancelled()
+            raw = session.connection().connection.dbapi_connection
+            progress = getattr(raw, "set_progress_handler", None)
+            if progress is not None:
+                # A non-zero return makes SQLite abort the running statement
+                progress(lambda: 1 if cancelled() else 0, _CANCEL_CHECK_OPCODES)
+            try:
+                records = query.all()
+            except Exception:
+                if cancelled():
+                    raise FetchCancelled()
+                raise
+            finally:
+                if progress is not None:
+                    progress(None, 0)
+            if cancelled():
+                raise FetchCancelled()
+            return [self.to_row(record) for record in records]
+
+
+class DataGridModel(QAbstractTableModel):
+    """
+    Rows of a DataGrid: either a fixed list (``set_rows``) or pages pulled on demand
+    from a :class:`QueryPageSource` through ``canFetchMore`` / ``fetchMore``.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns: List[str] = []
+        self.rows: List[List[str]] = []
+        self.keys: List[Any] = []
+        self.source: Optional[QueryPageSource] = None
+        self.page_size = self.PAGE_SIZE
+        self.sort_column = -1
+        self.sort_descending = False
+        self._exhausted = True
+
+    # ── QAbstractTableModel ─────────────────────────────────────────────
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.columns):
+            return self.columns[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            row = self.rows[index.row()]
+            return row[index.column()] if index.column() < len(row) else ""
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.source is not None and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        try:
+            # One extra row tells whether another page exists
+            page = self.source.fetch(len(self.rows), self.page_size + 1,
+                                     self.sort_column, self.sort_descending)
+        except Exception as e:
+            logger.error("[DataGrid] Error fetching rows: %s", e)
+            self._exhausted = True
+            return
+        self._append_page(page)
+
+    def _append_page(self, page) -> None:
+        self._exhausted = len(page) <= self.page_size
+        page = page[:self.page_size]
+        if not page:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for key, row in page:
+            self.keys.append(key)
+            self.rows.append([str(cell) for cell in row])
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        descending = order == Qt.DescendingOrder
+        if self.source is not None:
+            if column >= 0 and not self.source.can_sort(column):
+                return
+            if (column, descending) == (self.sort_column, self.sort_descending) and self.rows:
+                return
+            self.sort_column, self.sort_descending = column, descending
+            self._reload()
+            return
+        if column < 0 or column >= len(self.columns) or not self.rows:
+            return
+        self.layoutAboutToBeChanged.emit()
+        order_idx = sorted(range(len(self.rows)),
+                           key=lambda i: _sort_key(self.rows[i][column] if column < len(self.rows[i]) else ""),
+                           reverse=descending)
+        self.rows = [self.rows[i] for i in order_idx]
+        if self.keys:
+            self.keys = [self.keys[i] for i in order_idx]
+        self.layoutChanged.emit()
+
+    # ── Content ─────────────────────────────────────────────────────────
+
+    def set_columns(self, columns: Sequence[str]) -> None:
+        self.beginResetModel()
+        self.columns = [str(c) for c in columns]
+        self.endResetModel()
+
+    def set_rows(self, data, keys=None) -> None:
+        self.beginResetModel()
+        self.source = None
+        self._exhausted = True
+        self.rows = [[str(cell) for cell in row] for row in (data or [])]
+        self.keys = list(keys) if keys is not None else []
+        self.endResetModel()
+
+    def set_source(self, source: Optional[QueryPageSource], first_page=None) -> None:
+        """
+        Page rows from ``source``. ``first_page`` is an already fetched
+        ``source.fetch(0, page_size + 1)`` result (e.g. from a worker thread),
+        shown instead of querying again.
+        """
+        self.source = source
+        self.sort_column, self.sort_descending = -1, False
+        self._reload(first_page)
+
+    def append_row(self, row_data, key=None) -> None:
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first)
+        self.rows.append([str(cell) for cell in row_data])
+        if key is not None or self.keys:
+            self.keys.extend([None] * (first - len(self.keys)))
+            self.keys.append(key)
+        self.endInsertRows()
+
+    def _reload(self, first_page=None) -> None:
+        self.beginResetModel()
+        self.rows = []
+        self.keys = []
+        self._exhausted = self.source is None
+        self.endResetModel()
+        # First page right away; later pages as the view scrolls
+        if first_page is not None and self.source is not None:
+            self._append_page(first_page)
+        else:
+            self.fetchMore()
+
+
+def _sort_key(text: str):
+    """Numbers before text, numbers compared by value."""
+    try:
+        return 0, float(text), ""
+    except (TypeError, ValueError):
+        return 1, 0.0, text.lower()
+
+
+class DataGrid(QTableView):
     """
     A custom DataGrid control for displaying tabular data.
     Supports dynamic column and row management with customizable styling.
+
+    Rows come from a DataGridModel. Small fixed lists are passed with
+    :meth:`set_data`; large lists are given as a :class:`QueryPageSource` via
+    :meth:`set_source`, which loads pages as the user scrolls and sorts on the
+    database when a header is clicked.
     """
-    
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setFont(QFont("Verdana", 10))
-        
+
+        self.grid_model = DataGridModel(self)
+        self.setModel(self.grid_model)
+
         # Set default properties
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Read-only by default
-        
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Read-only by default
+
         # Set header properties
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.verticalHeader().setVisible(False)
-        
+        # Rows share one height so the view never measures their contents
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
         # Apply default styling
         self._apply_default_style()
-    
+
     def _apply_default_style(self):
         """Apply default styling to the DataGrid"""
         style = """
-            QTableWidget {
+            QTableView {
                 background-color: #FFFFFF;
                 color: #000000;
                 border: 2px solid #888888;
                 border-radius: 4px;
                 gridline-color: #CCCCCC;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border-bottom: 1px solid #EEEEEE;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #4682B4;
                 color: #FFFFFF;
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #E0E0E0;
             }
             QHeaderView::section {
@@ -74,16 +320,16 @@ class DataGrid(QTableWidget):
                 font-weight: bold;
                 font-size: 11px;
             }
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #F5F5F5;
             }
         """
         self.setStyleSheet(style)
-    
+
     def set_color(self, background_color, foreground_color):
         """
         Set custom colors for the DataGrid
-        
+
         Args:
             background_color: Background color as integer (hex)
             foreground_color: Foreground color as integer (hex)
@@ -92,24 +338,24 @@ class DataGrid(QTableWidget):
             background_color = 0xFFFFFF
         if foreground_color is None:
             foreground_color = 0x000000
-            
+
         style = f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: #{background_color:06X};
                 color: #{foreground_color:06X};
                 border: 2px solid #{self._darken_color(background_color, 0.7):06X};
                 border-radius: 4px;
                 gridline-color: #{self._darken_color(background_color, 0.85):06X};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 8px;
                 border-bottom: 1px solid #{self._darken_color(background_color, 0.9):06X};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: #4682B4;
                 color: #FFFFFF;
             }}
-            QTableWidget::item:hover {{
+            QTableView::item:hover {{
                 background-color: #{self._lighten_color(background_color, 0.95):06X};
             }}
             QHeaderView::section {{
@@ -120,113 +366,135 @@ class DataGrid(QTableWidget):
                 font-weight: bold;
                 font-size: 11px;
             }}
-            QTableWidget::item:alternate {{
+            QTableView::item:alternate {{
                 background-color: #{self._lighten_color(background_color, 0.97):06X};
             }}
         """
         self.setStyleSheet(style)
-    
+
     def _darken_color(self, color, factor):
         """Darken the color by factor"""
         r = int(((color >> 16) & 0xFF) * factor)
         g = int(((color >> 8) & 0xFF) * factor)
         b = int((color & 0xFF) * factor)
         return (r << 16) | (g << 8) | b
-    
+
     def _lighten_color(self, color, factor):
         """Lighten the color by factor"""
         r = min(255, int(((color >> 16) & 0xFF) / factor))
         g = min(255, int(((color >> 8) & 0xFF) / factor))
         b = min(255, int((color & 0xFF) / factor))
         return (r << 16) | (g << 8) | b
-    
+
     def set_columns(self, columns):
         """
         Set the column headers for the DataGrid
-        
+
         Args:
             columns: List of column names (strings)
         """
-        self.setColumnCount(len(columns))
-        self.setHorizontalHeaderLabels(columns)
-    
-    def set_data(self, data):
+        self.grid_model.set_columns(columns)
+
+    def set_data(self, data, keys=None):
         """
         Set the data for the DataGrid
-        
+
         Args:
             data: List of lists, where each inner list represents a row
                  Example: [['ID', 'Name', 'Amount'], ['1', 'John', '100.00']]
+            keys: Optional list with one key (e.g. record id) per row,
+                 returned by get_selected_key()
         """
-        if not data:
-            self.setRowCount(0)
-            return
-        
-        self.setRowCount(len(data))
-        
-        for row_idx, row_data in enumerate(data):
-            for col_idx, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_data))
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.setItem(row_idx, col_idx, item)
-    
-    def add_row(self, row_data):
+        self._set_sorting(False)
+        self.grid_model.set_rows(data, keys)
+
+    def set_source(self, source, first_page=None):
+        """
+        Load rows page by page from ``source`` (a QueryPageSource).
+
+        The first page is read immediately, further pages when the view scrolls
+        near the end. Clicking a sortable column header re-queries the database
+        in that order.
+
+        Args:
+            source: QueryPageSource, or None to empty the grid
+            first_page: Optional result of ``source.fetch(0, PAGE_SIZE + 1)``
+                        already read off the UI thread
+        """
+        self._set_sorting(False)
+        self.grid_model.set_source(source, first_page)
+        if source is not None and any(source.can_sort(c) for c in range(self.grid_model.columnCount())):
+            self._set_sorting(True)
+
+    def _set_sorting(self, enabled):
+        header = self.horizontalHeader()
+        if enabled:
+            # No indicator: keep the source's default order until a header is clicked
+            header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.setSortingEnabled(enabled)
+        header.setSortIndicatorShown(enabled)
+
+    def add_row(self, row_data, key=None):
         """
         Add a single row to the DataGrid
-        
+
         Args:
             row_data: List of cell values for the new row
+            key: Optional key for the row (see get_selected_key)
         """
-        row_position = self.rowCount()
-        self.insertRow(row_position)
-        
-        for col_idx, cell_data in enumerate(row_data):
-            item = QTableWidgetItem(str(cell_data))
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_position, col_idx, item)
-    
+        self.grid_model.append_row(row_data, key)
+
     def clear_data(self):
         """Clear all data from the DataGrid"""
-        self.setRowCount(0)
-    
+        self.grid_model.set_rows([])
+
     def get_selected_row(self):
         """
         Get the currently selected row data
-        
+
         Returns:
             List of cell values from the selected row, or None if no selection
         """
-        selected_items = self.selectedItems()
-        if not selected_items:
+        row = self.get_selected_row_index()
+        if row < 0:
             return None
-        
-        row = selected_items[0].row()
-        row_data = []
-        for col in range(self.columnCount()):
-            item = self.item(row, col)
-            row_data.append(item.text() if item else '')
-        
+
+        row_data = list(self.grid_model.rows[row])
+        row_data.extend([''] * (self.grid_model.columnCount() - len(row_data)))
         return row_data
-    
+
     def get_selected_row_index(self):
         """
         Get the index of the currently selected row
-        
+
         Returns:
             Row index (int) or -1 if no selection
         """
-        selected_items = self.selectedItems()
-        if not selected_items:
+        selection_model = self.selectionModel()
+        selected_rows = selection_model.selectedRows() if selection_model else []
+        if not selected_rows:
             return -1
-        
-        return selected_items[0].row()
-    
+
+        return selected_rows[0].row()
+
+    def get_selected_key(self):
+        """
+        Get the key of the currently selected row (see set_data / QueryPageSource)
+
+        Returns:
+            The row key, or None if no selection or the row has no key
+        """
+        row = self.get_selected_row_index()
+        keys = self.grid_model.keys
+        if 0 <= row < len(keys):
+            return keys[row]
+        return None
+
     def set_event(self, function):
         """
         Set a click/selection event handler for the DataGrid
-        
+
         Args:
             function: Callback function to be called when a row is selected
         """
-        self.itemSelectionChanged.connect(function)
-
+        self.selectionModel().selectionChanged.connect(lambda *_: function())
@@ -22,6 +22,7 @@ from PySide6.QtWidgets import QWidget, QGridLayout, QSizePolicy, QVBoxLayout, QL
 
 from core.logger import get_logger
 from user_interface.control.numpad.numpad_button import NumPadButton
+from user_interface.control.numpad.scanner_input import ScannerInputStage
 
 logger = get_logger(__name__)
 
@@ -44,7 +45,14 @@ class NumPad(QWidget):
         # Receives the full accumulated text (self.current_text).
         # When set, it is called instead of callback_function for Enter.
         self.enter_callback_function = None
+        # Optional callback receiving a list of barcodes read by a keyboard-wedge
+        # scanner (see ScannerInputStage). Without it each barcode goes through
+        # the Enter callback.
+        self.scan_batch_callback_function = None
         self.current_text = ""
+
+        # Physical keyboard input is split into cashier typing and scanner bursts
+        self.scanner_input = ScannerInputStage(self, batch_callback=self._on_scanned_batch)
         
         # Set a flag to track if we're in the process of regaining focus
         # This helps prevent focus loops
@@ -333,22 +341,22 @@ class NumPad(QWidget):
             
             # Number keys
             if key.isdigit():
-                self._on_button_clicked(key)
+                self._on_keyboard_key(key)
                 return True
                 
             # Enter key
             elif key_code in (Qt.Key_Return, Qt.Key_Enter):
-                self._on_button_clicked('Enter')
+                self._on_keyboard_key('Enter')
                 return True
                 
             # Backspace key
             elif key_code == Qt.Key_Backspace:
-                self._on_button_clicked('Backspace')
+                self._on_keyboard_key('Backspace')
                 return True
                 
             # Clear - Escape key
             elif key_code == Qt.Key_Escape:
-                self._on_button_clicked('Clear')
+                self._on_keyboard_key('Clear')
                 return True
                 
         # Let other events pass through
@@ -367,25 +375,25 @@ class NumPad(QWidget):
         key_code = event.key()
         
         if key.isdigit():
-            self._on_button_clicked(key)
+            self._on_keyboard_key(key)
             event.accept()
             return
             
         # Enter key
         if key_code in (Qt.Key_Return, Qt.Key_Enter):
-            self._on_button_clicked('Enter')
+            self._on_keyboard_key('Enter')
             event.accept()
             return
             
         # Backspace key
         if key_code == Qt.Key_Backspace:
-            self._on_button_clicked('Backspace')
+            self._on_keyboard_key('Backspace')
             event.accept()
             return
             
         # Clear - Escape key
         if key_code == Qt.Key_Escape:
-            self._on_button_clicked('Clear')
+            self._on_keyboard_key('Clear')
             event.accept()
             return
             
@@ -539,6 +547,32 @@ class NumPad(QWidget):
             max_height=int(max_height) if max_height is not None else None,
         )
 
+    def _on_keyboard_key(self, key):
+        """Physical keyboard / scanner key: let the scanner stage claim complete bursts."""
+        if key == 'Enter':
+            start = self.scanner_input.take_barcode(self.current_text)
+            if start is not None:
+                barcode = self.current_text[start:]
+                self.set_text(self.current_text[:start])
+                self.scanner_input.enqueue(barcode)
+                return
+        elif key.isdigit():
+            self.scanner_input.note_key(len(self.current_text))
+        else:
+            self.scanner_input.reset()
+        self._on_button_clicked(key)
+
+    def _on_scanned_batch(self, barcodes):
+        """Hand barcodes queued by the scanner stage to the form, one batch at a time."""
+        if self.scan_batch_callback_function:
+            self.scan_batch_callback_function(barcodes)
+            return
+        callback = self.enter_callback_function or self.callback_function
+        for barcode in barcodes:
+            if callback:
+                callback(barcode)
+            self.numpad_signal.emit(barcode)
+
     def _on_button_clicked(self, key):
         # Handle button click internally
         logger.debug("NumPad button clicked: %s", key)
@@ -603,6 +637,18 @@ class NumPad(QWidget):
         """
         self.enter_callback_function = function
         
+    def set_scan_batch_event(self, function):
+        """Set the callback for barcodes read by a keyboard-wedge scanner.
+
+        Parameters
+        ----------
+        function : callable
+            Called with a list of barcodes (oldest first) once the scanner has
+            been quiet briefly. When unset, each barcode is passed to the Enter
+            callback as if it had been typed and confirmed.
+        """
+        self.scan_batch_callback_function = function
+        
     def get_text(self):
         """Get the current text in display
         
@@ -0,0 +1,131 @@
+"""
+SaleFlex.PyPOS - Point of Sale Application
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import deque
+
+from PySide6 import QtCore
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScannerInputStage(QtCore.QObject):
+    """
+    Separates keyboard-wedge scanner bursts from cashier typing on a NumPad.
+
+    A scanner types a whole barcode followed by Enter with a few milliseconds between
+    keys; a person needs far longer. Keys are still echoed to the NumPad as they
+    arrive. When Enter closes a fast burst of at least ``min_length`` keys, the burst
+    is cut from the NumPad text and queued as a barcode instead of being processed
+    on the spot.
+
+    Queued barcodes are handed over together once the keyboard has been quiet for
+    ``quiet_ms``, so a handheld uploading many codes is read completely before the
+    first sale is booked and the UI is refreshed once per batch.
+    """
+
+    # Gap between two scanner keystrokes; keyboard wedges typically send every 2-20 ms.
+    MAX_INTER_KEY_MS = 40
+    MIN_LENGTH = 4
+    QUIET_MS = 60
+
+    def __init__(self, parent=None, batch_callback=None,
+                 max_inter_key_ms=MAX_INTER_KEY_MS, min_length=MIN_LENGTH, quiet_ms=QUIET_MS):
+        super().__init__(parent)
+        self.batch_callback = batch_callback
+        self.max_inter_key = max_inter_key_ms / 1000.0
+        self.min_length = min_length
+
+        self._queue = deque()
+        self._draining = False
+        self._last_key_at = None
+        self._burst_start = None
+        self._burst_length = 0
+
+        self._quiet_timer = QtCore.QTimer(self)
+        self._quiet_timer.setSingleShot(True)
+        self._quiet_timer.setInterval(quiet_ms)
+        self._quiet_timer.timeout.connect(self._drain)
+
+    def note_key(self, text_length):
+        """
+        Record a printable key about to be appended at position ``text_length`` of the
+        NumPad text.
+        """
+        now = time.monotonic()
+        if self._burst_start is not None and self._is_fast(now):
+            self._burst_length += 1
+        else:
+            self._burst_start = text_length
+            self._burst_length = 1
+        self._last_key_at = now
+        if self._queue:
+            self._quiet_timer.start()
+
+    def take_barcode(self, current_text):
+        """
+        Called on Enter. Return the index in ``current_text`` where a scanned barcode
+        starts, or ``None`` if the pending keys were typed by hand.
+        """
+        now = time.monotonic()
+        start = self._burst_start
+        scanned = (
+            start is not None
+            and self._burst_length >= self.min_length
+            and self._is_fast(now)
+            and start + self._burst_length == len(current_text)
+        )
+        self.reset()
+        return start if scanned else None
+
+    def reset(self):
+        """Forget the current burst (Backspace, Clear, or any non-scanner key)."""
+        self._last_key_at = None
+        self._burst_start = None
+        self._burst_length = 0
+
+    def enqueue(self, barcode):
+        self._queue.append(barcode)
+        self._quiet_timer.start()
+
+    def pending_count(self):
+        return len(self._queue)
+
+    def _is_fast(self, now):
+        return self._last_key_at is not None and (now - self._last_key_at) <= self.max_inter_key
+
+    def _drain(self):
+        # Scans that arrive while a batch is being booked (e.g. during a message box)
+        # stay queued and form the next batch.
+        if self._draining or not self._queue:
+            return
+        self._draining = True
+        try:
+            batch = list(self._queue)
+            self._queue.clear()
+            logger.debug("[SCANNER] Processing %s scanned barcode(s)", len(batch))
+            if self.batch_callback:
+                self.batch_callback(batch)
+        except Exception as e:
+            logger.error("[SCANNER] Error processing scanned barcodes: %s", e)
+        finally:
+            self._draining = False
+        if self._queue:
+            self._quiet_timer.start()
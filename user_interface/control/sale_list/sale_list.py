@@ -16,13 +16,15 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QTableView, QHeaderView,
                                QDialog, QPushButton, QHBoxLayout, QLabel)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import QTimer
 from typing import List, Optional, Dict, Any
 
 from core.logger import get_logger
+from user_interface.control.sale_list.sale_list_model import (
+    SaleListModel, COL_REFERENCE_ID, COL_TRANSACTION_TYPE, COL_TRANSACTION, COL_NAME_OF_PRODUCT,
+    COL_UNIT_QUANTITY, COL_UNIT, COL_PRICE, COL_TOTAL_AMOUNT)
 
 logger = get_logger(__name__)
 
@@ -205,7 +207,7 @@ class ItemActionPopup(QDialog):
 class SaleList(QWidget):
     """
     Advanced sales list widget for Point of Sale (POS) applications.
-    
+
     Features:
     - Multi-column table display with products, quantities, prices, and totals
     - Interactive popup for item actions (repeat, cancel, delete)
@@ -213,12 +215,16 @@ class SaleList(QWidget):
     - Automatic subtotal calculations and updates
     - Row cancellation with visual strikethrough effects
     - Keyboard navigation and selection tracking
+
+    Rows live in a SaleListModel shown by a QTableView. Every change is a row-level
+    model notification; repaints and the scroll to the selected row are coalesced
+    to once per event loop tick.
     """
     def __init__(self, parent=None, width=970, height=315, location_x=0, location_y=0,
                  background_color=0x778D45, foreground_color=0xFFFFFF, *args, **kwargs):
         """
         Initialize the SaleList widget.
-        
+
         Args:
             parent: Parent widget
             width: Widget width in pixels
@@ -229,79 +235,69 @@ class SaleList(QWidget):
             foreground_color: Text/foreground color in hex format (default: 0xFFFFFF)
         """
         super(SaleList, self).__init__(parent)
-        
+
         # Configure widget size and position
         self.setGeometry(location_x, location_y, width, height)
         self.setMinimumSize(width, height)
         self.parent = parent
-        
+
         # Event handling callback function (set by external code)
         self.event_func = None
-        
+
         # Store pending action context so the event handler can sync business logic
         self.last_action: str = None        # "REPEAT" or "DELETE"
         self.last_action_data: SalesData = None  # The SalesData row that was acted on
-        
-        # Core data storage for all sales list items
-        self.custom_sales_data_list: List[SalesData] = []
-        
+
+        # Core data storage for all sales list items (see custom_sales_data_list)
+        self.model = SaleListModel(self)
+
         # Track currently selected row index for navigation
         self.selected_index: int = 0
-        
+
         # Store color scheme for consistent theming
         self.background_color = background_color
         self.foreground_color = foreground_color
-        
+
         # Apply color palette to the widget
         palette = self.palette()
         palette.setColor(self.backgroundRole(), background_color)
         palette.setColor(self.foregroundRole(), foreground_color)
         self.setPalette(palette)
         self.setAutoFillBackground(True)
-        
+
         # Create main layout container
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)  # Remove margins for full widget usage
         self.setLayout(self.layout)
-        
-        # Create the main table widget with comprehensive column structure
-        self.table_widget = QTableWidget(self)
-        self.table_widget.setColumnCount(8)
-        self.table_widget.setHorizontalHeaderLabels([
-            "Ref ID",       # Database reference ID (hidden from display)
-            "Type",         # Transaction type (PLU, DEPARTMENT, etc.)
-            "Transaction",  # Transaction description (Sale, Return, etc.)
-            "Product Name", # Product or item name
-            "Unit Qty",     # Formatted quantity display
-            "Unit",         # Unit type
-            "Price",        # Unit price
-            "Total"         # Total amount (quantity × price)
-        ])
-        
+
+        # Create the table view over the sales model
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.model)
+
         # Define column indices as constants for maintainable code
-        self.COL_REFERENCE_ID = 0      # Database reference column
-        self.COL_TRANSACTION_TYPE = 1  # Transaction type column
-        self.COL_TRANSACTION = 2       # Transaction name column
-        self.COL_NAME_OF_PRODUCT = 3   # Product name column
-        self.COL_UNIT_QUANTITY = 4     # Quantity display column
-        self.COL_UNIT = 5              # Unit type column
-        self.COL_PRICE = 6             # Unit price column
-        self.COL_TOTAL_AMOUNT = 7      # Total amount column
-        
+        self.COL_REFERENCE_ID = COL_REFERENCE_ID          # Database reference column
+        self.COL_TRANSACTION_TYPE = COL_TRANSACTION_TYPE  # Transaction type column
+        self.COL_TRANSACTION = COL_TRANSACTION            # Transaction name column
+        self.COL_NAME_OF_PRODUCT = COL_NAME_OF_PRODUCT    # Product name column
+        self.COL_UNIT_QUANTITY = COL_UNIT_QUANTITY        # Quantity display column
+        self.COL_UNIT = COL_UNIT                          # Unit type column
+        self.COL_PRICE = COL_PRICE                        # Unit price column
+        self.COL_TOTAL_AMOUNT = COL_TOTAL_AMOUNT          # Total amount column
+
         # Hide Ref ID column from display (kept in data for background operations)
-        self.table_widget.setColumnHidden(self.COL_REFERENCE_ID, True)
-        
+        self.table_view.setColumnHidden(self.COL_REFERENCE_ID, True)
+
         # Configure table behavior and appearance
-        header = self.table_widget.horizontalHeader()
-        
+        header = self.table_view.horizontalHeader()
+
         # Set fixed widths for small columns (must be set before resize mode)
-        self.table_widget.setColumnWidth(self.COL_TRANSACTION_TYPE, 60)   # Type - small
-        self.table_widget.setColumnWidth(self.COL_TRANSACTION, 80)       # Transaction - medium-small
-        self.table_widget.setColumnWidth(self.COL_UNIT_QUANTITY, 70)     # Unit Qty - medium-small
-        self.table_widget.setColumnWidth(self.COL_UNIT, 50)               # Unit - small
-        self.table_widget.setColumnWidth(self.COL_PRICE, 90)              # Price - medium
-        self.table_widget.setColumnWidth(self.COL_TOTAL_AMOUNT, 90)       # Total - medium
-        
+        self.table_view.setColumnWidth(self.COL_TRANSACTION_TYPE, 60)   # Type - small
+        self.table_view.setColumnWidth(self.COL_TRANSACTION, 80)       # Transaction - medium-small
+        self.table_view.setColumnWidth(self.COL_UNIT_QUANTITY, 70)     # Unit Qty - medium-small
+        self.table_view.setColumnWidth(self.COL_UNIT, 50)               # Unit - small
+        self.table_view.setColumnWidth(self.COL_PRICE, 90)              # Price - medium
+        self.table_view.setColumnWidth(self.COL_TOTAL_AMOUNT, 90)       # Total - medium
+
         # Set resize modes: Fixed for small/medium columns
         header.setSectionResizeMode(self.COL_TRANSACTION_TYPE, QHeaderView.Fixed)
         header.setSectionResizeMode(self.COL_TRANSACTION, QHeaderView.Fixed)
@@ -309,26 +305,26 @@ class SaleList(QWidget):
         header.setSectionResizeMode(self.COL_UNIT, QHeaderView.Fixed)
         header.setSectionResizeMode(self.COL_PRICE, QHeaderView.Fixed)
         header.setSectionResizeMode(self.COL_TOTAL_AMOUNT, QHeaderView.Fixed)
-        
+
         # Set Product Name to stretch (takes all remaining space - largest column)
         header.setSectionResizeMode(self.COL_NAME_OF_PRODUCT, QHeaderView.Stretch)
-        
-        self.table_widget.setSelectionBehavior(QTableWidget.SelectRows)               # Select entire rows, not individual cells
-        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)               # Prevent direct cell editing
-        
-        # Apply color theme to the table widget
-        table_palette = self.table_widget.palette()
-        table_palette.setColor(self.table_widget.backgroundRole(), background_color)
-        table_palette.setColor(self.table_widget.foregroundRole(), foreground_color)
-        self.table_widget.setPalette(table_palette)
-        
+
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)               # Select entire rows, not individual cells
+        self.table_view.setSelectionMode(QTableView.SingleSelection)
+        self.table_view.setEditTriggers(QTableView.NoEditTriggers)               # Prevent direct cell editing
+
+        # Apply color theme to the table view
+        table_palette = self.table_view.palette()
+        table_palette.setColor(self.table_view.backgroundRole(), background_color)
+        table_palette.setColor(self.table_view.foregroundRole(), foreground_color)
+        self.table_view.setPalette(table_palette)
+
         # Style the table header with matching colors
-        header = self.table_widget.horizontalHeader()
         header_palette = header.palette()
         header_palette.setColor(header.backgroundRole(), background_color)
         header_palette.setColor(header.foregroundRole(), foreground_color)
         header.setPalette(header_palette)
-        
+
         # Calculate lightened color for selected row (for better readability)
         def lighten_color(color):
             """Lighten color for selected row"""
@@ -339,19 +335,19 @@ class SaleList(QWidget):
             g = min(255, g + 60)
             b = min(255, b + 60)
             return (r << 16) | (g << 8) | b
-        
+
         selected_bg_color = lighten_color(background_color)
-        
+
         # Enable alternating row colors and apply comprehensive styling
-        self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setStyleSheet(f"""
-            QTableWidget {{
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setStyleSheet(f"""
+            QTableView {{
                 background-color: #{background_color:06x};
                 color: #{foreground_color:06x};
                 gridline-color: #{foreground_color:06x};
                 border: 1px solid #{foreground_color:06x};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 color: #{foreground_color:06x};
             }}
             QHeaderView::section {{
@@ -360,53 +356,67 @@ class SaleList(QWidget):
                 border: 1px solid #{foreground_color:06x};
                 padding: 4px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: #{selected_bg_color:06x};
                 color: #{foreground_color:06x};
             }}
         """)
-        
+
+        # Selection / scroll requested by row changes, applied once per event loop tick
+        self._pending_selection: Optional[int] = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._apply_pending_selection)
+
         # Connect table click events to the item action handler
-        self.table_widget.itemClicked.connect(self.on_item_clicked)
-        
+        self.table_view.clicked.connect(self.on_item_clicked)
+
         # Add the configured table to the main layout
-        self.layout.addWidget(self.table_widget)
-        
+        self.layout.addWidget(self.table_view)
+
+    @property
+    def custom_sales_data_list(self) -> List[SalesData]:
+        """The SalesData rows in display order (owned by the model)."""
+        return self.model.rows
+
     def set_event(self, function):
         """
         Set the external event handler function.
-        
+
         Args:
             function: Callback function that will be called when popup actions occur.
                      Function signature should be: func(row_index, action_string)
         """
         self.event_func = function
-        
-    def on_item_clicked(self, item):
+
+    def on_item_clicked(self, index):
         """
         Handle table item click events by showing the action popup dialog.
-        
+
         When a user clicks on any item in the table, this method:
         1. Updates the selected row index
         2. Extracts the product name for display
         3. Shows the ItemActionPopup dialog
         4. Processes the user's selected action (REPEAT, CANCEL, DELETE)
         5. Calls external event handler if configured
-        
+
         Args:
-            item: QTableWidgetItem that was clicked
+            index: QModelIndex of the clicked cell
         """
-        selected_row = item.row()
+        selected_row = index.row()
         self.selected_index = selected_row  # Track the currently selected row
-        
+
         # Extract product name from the clicked row for popup display
-        product_name_item = self.table_widget.item(selected_row, self.COL_NAME_OF_PRODUCT)
-        product_name = product_name_item.text() if product_name_item else "Unknown Product"
-        
+        if 0 <= selected_row < len(self.custom_sales_data_list):
+            product_name = self.custom_sales_data_list[selected_row].name_of_product
+        else:
+            product_name = "Unknown Product"
+
         # Create and display the action selection popup
         popup = ItemActionPopup(self, product_name, self.background_color, self.foreground_color)
         result = popup.exec()
-        
+
         # Process the selected action internally
         if result == QDialog.Accepted and popup.action:
             if popup.action == "DELETE":
@@ -436,14 +446,14 @@ class SaleList(QWidget):
                 # Notify event handler to persist the new line to document_data / DB
                 if self.event_func:
                     self.event_func()
-            
+
     def add_product(self, product_name, quantity, unit_price, **kwargs):
         """
         Add a product to the sales list (simplified interface for backward compatibility).
-        
+
         This is a convenience method that creates a SalesData object with default values
         and delegates to add_sale_with_data() for the actual insertion.
-        
+
         Args:
             product_name: Display name of the product
             quantity: Quantity being purchased (will be converted to float)
@@ -454,130 +464,112 @@ class SaleList(QWidget):
                 - plu_no: Product lookup number
                 - department_no: Department classification
                 - id: Internal product ID
-        
+
         Returns:
             bool: True if product was added successfully, False otherwise
         """
         # Create new sales data object with provided information
         custom_sales_data = SalesData()
-        
+
         # Set core product information
         custom_sales_data.name_of_product = product_name
         custom_sales_data.quantity = float(quantity)
         custom_sales_data.price = float(unit_price)
         custom_sales_data.total_amount = custom_sales_data.quantity * custom_sales_data.price
-        
+
         # Set default transaction properties
         custom_sales_data.transaction = "Sale"      # Default to sale transaction
         custom_sales_data.transaction_type = kwargs.get('transaction_type', "PLU")  # Default to PLU (product lookup) type
         custom_sales_data.unit_quantity = str(custom_sales_data.quantity)
-        
+
         # Apply optional parameters from keyword arguments
         custom_sales_data.reference_id = kwargs.get('reference_id', 0)
         custom_sales_data.barcode = kwargs.get('barcode', "")
         custom_sales_data.plu_no = kwargs.get('plu_no', "")
         custom_sales_data.department_no = kwargs.get('department_no', 0)
         custom_sales_data.id = kwargs.get('id', 0)
-        
+
         # Delegate to the comprehensive add method
         return self.add_sale_with_data(custom_sales_data)
-    
+
     def add_sale_with_data(self, custom_sales_data: SalesData) -> bool:
         """
         Add a sales item using a complete SalesData object.
-        
+
         This is the comprehensive method for adding items to the sales list.
-        It handles row numbering, data storage, table insertion, and UI updates.
-        
+        It assigns the row number, appends the row to the model and selects it.
+
         Args:
             custom_sales_data: Complete SalesData object with all transaction details
-            
+
         Returns:
             bool: True if the item was added successfully, False if an error occurred
         """
         try:
             # Automatically assign the next sequential row number (for internal tracking)
-            if len(self.custom_sales_data_list) == 0:
-                custom_sales_data.row_number = 1  # First row starts at 1
-            else:
-                # Fallback to data list length + 1
-                custom_sales_data.row_number = len(self.custom_sales_data_list) + 1
-            
-            # Store the sales data in our internal list for later reference
-            self.custom_sales_data_list.append(custom_sales_data)
-            
-            # Create a new row in the table widget
-            row_index = self.table_widget.rowCount()
-            self.table_widget.insertRow(row_index)
-            
-            # Populate all table columns with data from the SalesData object
-            self.table_widget.setItem(row_index, self.COL_REFERENCE_ID, 
-                                    QTableWidgetItem(str(custom_sales_data.reference_id)))
-            self.table_widget.setItem(row_index, self.COL_TRANSACTION_TYPE, 
-                                    QTableWidgetItem(custom_sales_data.transaction_type))
-            self.table_widget.setItem(row_index, self.COL_TRANSACTION, 
-                                    QTableWidgetItem(custom_sales_data.transaction))
-            self.table_widget.setItem(row_index, self.COL_NAME_OF_PRODUCT, 
-                                    QTableWidgetItem(custom_sales_data.name_of_product))
-            self.table_widget.setItem(row_index, self.COL_UNIT_QUANTITY, 
-                                    QTableWidgetItem(custom_sales_data.unit_quantity))
-            
-            # Handle different column displays based on transaction type
-            if custom_sales_data.transaction_type == "SUBTOTAL":
-                # Subtotal rows don't show unit or price information - only total
-                self.table_widget.setItem(row_index, self.COL_UNIT, QTableWidgetItem(""))
-                self.table_widget.setItem(row_index, self.COL_PRICE, QTableWidgetItem(""))
-            else:
-                # Regular product rows show unit and price information
-                self.table_widget.setItem(row_index, self.COL_UNIT, 
-                                        QTableWidgetItem(str(custom_sales_data.unit)))
-                self.table_widget.setItem(row_index, self.COL_PRICE, 
-                                        QTableWidgetItem(f"{custom_sales_data.price:.2f}"))
-            
-            # Always show the total amount (formatted to 2 decimal places)
-            self.table_widget.setItem(row_index, self.COL_TOTAL_AMOUNT, 
-                                    QTableWidgetItem(f"{custom_sales_data.total_amount:.2f}"))
-            
+            custom_sales_data.row_number = len(self.custom_sales_data_list) + 1
+
+            # Append to the model (one row-inserted notification)
+            row_index = self.model.append_row(custom_sales_data)
+
             # Update UI state: select the new row and ensure it's visible
-            self.table_widget.selectRow(row_index)
-            self.table_widget.scrollToItem(self.table_widget.item(row_index, 0))
-            self.selected_index = row_index
-            
+            self._select_row_later(row_index)
+
             return True
-            
+
         except Exception as e:
             # Log error and return failure status
             logger.error("Error adding sale: %s", e)
             return False
-    
+
+    def sync_rows(self, rows: List[SalesData]) -> bool:
+        """
+        Show exactly ``rows``, touching only the lines that differ from what is displayed.
+
+        Used when the list is refreshed from document_data: unchanged lines stay as
+        they are, changed lines are repainted, and new or vanished lines are inserted
+        or removed. The last row is selected afterwards, as after adding rows one by one.
+
+        Args:
+            rows: SalesData objects in display order
+
+        Returns:
+            bool: True if rows were inserted or removed
+        """
+        structural = self.model.sync_rows(rows)
+        if self.custom_sales_data_list:
+            self._select_row_later(len(self.custom_sales_data_list) - 1)
+        else:
+            self.selected_index = 0
+        return structural
+
     def add_subtotal(self, total_price: float = None) -> bool:
         """
         Add a subtotal line to the sales list.
-        
+
         A subtotal line displays the sum of all non-canceled product amounts.
         It appears as a special row type with no unit or price information.
-        
+
         Args:
             total_price: Optional pre-calculated total. If None, will be calculated
                         automatically from current non-canceled products.
-        
+
         Returns:
             bool: True if subtotal was added successfully, False if table is empty
                   or a subtotal already exists as the last row.
         """
         # Don't add subtotal to empty tables
-        if self.table_widget.rowCount() == 0:
+        if not self.custom_sales_data_list:
             return False
-            
+
         # Prevent duplicate subtotals by checking if last row is already a subtotal
-        last_transaction_item = self.table_widget.item(self.table_widget.rowCount() - 1, self.COL_TRANSACTION)
-        if last_transaction_item and last_transaction_item.text() == "Subtotal":
+        if self.custom_sales_data_list[-1].transaction == "Subtotal":
             return False
-        
+
         # Auto-calculate subtotal if not provided
         if total_price is None:
             total_price = self.calculate_subtotal()
-            
+
         # Create subtotal entry with special formatting
         custom_sales_data = SalesData()
         custom_sales_data.transaction_type = "SUBTOTAL"
@@ -587,17 +579,17 @@ class SaleList(QWidget):
         custom_sales_data.price = 0.0         # Subtotals don't display unit prices
         custom_sales_data.unit = 0            # Subtotals don't display units
         custom_sales_data.unit_quantity = ""  # Subtotals don't display quantities
-        
+
         return self.add_sale_with_data(custom_sales_data)
-    
+
     def calculate_subtotal(self) -> float:
         """
         Calculate the current subtotal from all active (non-canceled) product rows.
-        
+
         This method sums the total_amount of all items that are:
         - Product transactions (PLU or DEPARTMENT type)
         - Not marked as canceled
-        
+
         Returns:
             float: Sum of all active product totals
         """
@@ -607,306 +599,254 @@ class SaleList(QWidget):
             if data.transaction_type in ["PLU", "DEPARTMENT"] and not data.is_canceled:
                 subtotal += data.total_amount
         return subtotal
-    
+
     def update_subtotals(self):
         """
         Update all existing subtotal rows with recalculated values.
-        
+
         This method is called after product modifications (add, delete, repeat)
         to ensure subtotal rows always reflect the current product totals.
-        It also ensures subtotal rows maintain their special formatting.
+        Only subtotal rows whose value changed are repainted.
         """
+        new_subtotal = None
         for i, data in enumerate(self.custom_sales_data_list):
             if data.transaction_type == "SUBTOTAL":
-                # Recalculate the subtotal based on current active products
-                new_subtotal = self.calculate_subtotal()
-                data.total_amount = new_subtotal
-                
-                # Update the table display if the row exists
-                if i < self.table_widget.rowCount():
-                    self.table_widget.setItem(i, self.COL_TOTAL_AMOUNT, 
-                                            QTableWidgetItem(f"{new_subtotal:.2f}"))
-                    # Ensure subtotal rows don't show price/unit information
-                    self.table_widget.setItem(i, self.COL_PRICE, QTableWidgetItem(""))
-                    self.table_widget.setItem(i, self.COL_UNIT, QTableWidgetItem(""))
-                    self.table_widget.setItem(i, self.COL_UNIT_QUANTITY, QTableWidgetItem(""))
-    
+                if new_subtotal is None:
+                    # Recalculate the subtotal based on current active products
+                    new_subtotal = self.calculate_subtotal()
+                if data.total_amount != new_subtotal:
+                    data.total_amount = new_subtotal
+                    self.model.mark_dirty(i)
+
     def delete_transaction(self, row_index: int) -> bool:
         """
         Handle delete action based on row type.
-        
+
         This method implements smart deletion behavior:
         - For product rows: Apply strikethrough formatting and mark as canceled
         - For non-product rows: Remove the row completely from the table
-        
+
         After deleting products, subtotals are automatically updated to reflect
         the change in active product totals.
-        
+
         Args:
             row_index: Index of the row to delete
-            
+
         Returns:
             bool: True if deletion was successful, False if row index is invalid
                   or an error occurred
         """
         try:
             # Validate row index
-            if row_index < 0 or row_index >= self.table_widget.rowCount():
+            if row_index < 0 or row_index >= len(self.custom_sales_data_list):
                 return False
-            
+
             # Determine appropriate action based on row type
-            if row_index < len(self.custom_sales_data_list):
-                row_data = self.custom_sales_data_list[row_index]
-                
-                # Product rows: cancel with strikethrough (soft delete)
-                if row_data.transaction_type in ["PLU", "DEPARTMENT"]:
-                    success = self.cancel_transaction(row_index)
-                    if success:
-                        # Recalculate subtotals since product was removed from calculations
-                        self.update_subtotals()
-                    return success
-                else:
-                    # Non-product rows: remove completely (hard delete)
-                    return self.remove_product_at_row(row_index)
+            row_data = self.custom_sales_data_list[row_index]
+
+            # Product rows: cancel with strikethrough (soft delete)
+            if row_data.transaction_type in ["PLU", "DEPARTMENT"]:
+                success = self.cancel_transaction(row_index)
+                if success:
+                    # Recalculate subtotals since product was removed from calculations
+                    self.update_subtotals()
+                return success
             else:
-                # Fallback for rows not in data list: remove from table
+                # Non-product rows: remove completely (hard delete)
                 return self.remove_product_at_row(row_index)
-                
+
         except Exception as e:
             logger.error("Error deleting transaction: %s", e)
             return False
-    
+
     def add_discount_by_amount_line(self, discount_amount: float, product_name: str = "") -> bool:
         """
         Add a discount line with a fixed amount reduction.
-        
+
         Creates a discount entry that shows a negative amount, reducing the total.
         If no product name is provided, uses the name from the last product in the list.
-        
+
         Args:
             discount_amount: Amount to discount (will be shown as negative)
             product_name: Optional product name to associate with discount
-            
+
         Returns:
             bool: True if discount was added successfully
         """
         custom_sales_data = SalesData()
         custom_sales_data.transaction_type = "DISCOUNT"
         custom_sales_data.transaction = "DISC. AMT"
-        
+
         if not product_name and len(self.custom_sales_data_list) > 0:
             product_name = self.custom_sales_data_list[-1].name_of_product
             custom_sales_data.row_number = self.custom_sales_data_list[-1].row_number
-        
+
         custom_sales_data.name_of_product = product_name
         custom_sales_data.total_amount = -discount_amount  # Negative for discount
-        
+
         return self.add_sale_with_data(custom_sales_data)
-    
+
     def add_discount_by_percent_line(self, discount_percent: float, discount_result: float, product_name: str = "") -> bool:
         """
         Add a discount line with percentage-based reduction.
-        
+
         Creates a discount entry showing both the percentage and calculated discount amount.
         The discount percentage is displayed in the unit quantity column, and the
         calculated discount amount is shown as a negative total.
-        
+
         Args:
             discount_percent: Percentage of discount applied
             discount_result: Calculated discount amount (will be shown as negative)
             product_name: Optional product name to associate with discount
-            
+
         Returns:
             bool: True if discount was added successfully
         """
         custom_sales_data = SalesData()
         custom_sales_data.transaction_type = "DISCOUNT"
         custom_sales_data.transaction = "DISC. %"
-        
+
         if not product_name and len(self.custom_sales_data_list) > 0:
             product_name = self.custom_sales_data_list[-1].name_of_product
             custom_sales_data.row_number = self.custom_sales_data_list[-1].row_number
-        
+
         custom_sales_data.name_of_product = product_name
         custom_sales_data.unit_quantity = f"%{discount_percent}"
         custom_sales_data.total_amount = -discount_result  # Negative for discount
-        
+
         return self.add_sale_with_data(custom_sales_data)
-        
+
     def clear_products(self):
         """
         Clear all items from the sales list.
-        
+
         This method removes all products, subtotals, discounts, and other items
-        from both the internal data storage and the table display. It also resets
-        the selected row index to 0.
-        
+        from the model. It also resets the selected row index to 0.
+
         Returns:
             bool: Always returns True to indicate successful clearing
         """
-        self.custom_sales_data_list.clear()  # Clear internal data storage
-        self.table_widget.setRowCount(0)     # Remove all rows from table display
+        self.model.clear()                   # Single model reset
+        self._pending_selection = None
         self.selected_index = 0              # Reset selection tracking
         return True
-        
+
     def get_total_amount(self):
         """
         Calculate the grand total of all rows in the sales list.
-        
+
         This method sums up ALL total amounts from every row in the table,
         including products, subtotals, discounts, etc. It's different from
         calculate_subtotal() which only includes active products.
-        
+
         Returns:
-            float: Sum of all row totals, or 0.0 if no valid totals found
+            float: Sum of all row totals (as displayed, rounded to 2 decimals)
         """
         total = 0.0
-        for row in range(self.table_widget.rowCount()):
+        for data in self.custom_sales_data_list:
             try:
-                # Attempt to parse the total amount from each row
-                amount_text = self.table_widget.item(row, self.COL_TOTAL_AMOUNT).text()
-                total += float(amount_text)
-            except (ValueError, TypeError, AttributeError):
-                # Skip rows with invalid or missing total values
+                total += round(float(data.total_amount), 2)
+            except (ValueError, TypeError):
+                # Skip rows with invalid total values
                 continue
         return total
-        
+
     def get_product_at_row(self, row):
         """Get product details at the specified row"""
-        if row < 0 or row >= self.table_widget.rowCount():
-            return None
-            
-        try:
-            # Get from CustomSalesData if available
-            if row < len(self.custom_sales_data_list):
-                return self.custom_sales_data_list[row].to_dict()
-            
-            # Fallback to reading from table
-            product_name = self.table_widget.item(row, self.COL_NAME_OF_PRODUCT).text()
-            quantity_text = self.table_widget.item(row, self.COL_UNIT_QUANTITY).text()
-            unit_price = float(self.table_widget.item(row, self.COL_PRICE).text())
-            total = float(self.table_widget.item(row, self.COL_TOTAL_AMOUNT).text())
-            
-            return {
-                "name": product_name,
-                "quantity": quantity_text,
-                "unit_price": unit_price,
-                "total": total
-            }
-        except (ValueError, TypeError):
+        if row < 0 or row >= len(self.custom_sales_data_list):
             return None
-            
+        return self.custom_sales_data_list[row].to_dict()
+
     def remove_product_at_row(self, row):
         """Remove product at the specified row"""
-        if row >= 0 and row < self.table_widget.rowCount():
-            # Remove from data list if exists
-            if row < len(self.custom_sales_data_list):
-                self.custom_sales_data_list.pop(row)
-            
-            # Remove from table
-            self.table_widget.removeRow(row)
-            
+        if 0 <= row < len(self.custom_sales_data_list):
+            self.model.remove_rows(row)
+
             # Update selected index
             if self.selected_index >= row and self.selected_index > 0:
                 self.selected_index -= 1
-                
+
             return True
         return False
-    
+
     def get_selected_sale(self) -> Optional[Dict[str, Any]]:
         """Get selected sale data - equivalent to C# iGetSelectedSale"""
         try:
-            if self.table_widget.currentRow() >= 0:
-                selected_row = self.table_widget.currentRow()
-                return self.get_product_at_row(selected_row)
+            current_row = self.table_view.currentIndex().row()
+            if current_row >= 0:
+                return self.get_product_at_row(current_row)
         except Exception as e:
             logger.error("Error getting selected sale: %s", e)
         return None
-    
+
     def get_last_sale(self) -> Optional[Dict[str, Any]]:
         """Get last sale data - equivalent to C# iGetLastSale"""
         try:
-            if self.table_widget.rowCount() > 0:
-                row_index = self.table_widget.rowCount() - 1
-                
-                # Skip canceled rows (similar to C# logic)
-                while row_index >= 0:
-                    row_data = self.get_product_at_row(row_index)
-                    if row_data and not row_data.get('is_canceled', False):
-                        return row_data
-                    row_index -= 1
-                    
+            # Skip canceled rows (similar to C# logic)
+            for row_data in reversed(self.custom_sales_data_list):
+                if not row_data.is_canceled:
+                    return row_data.to_dict()
         except Exception as e:
             logger.error("Error getting last sale: %s", e)
         return None
-    
+
     def cancel_transaction(self, row_index: int) -> bool:
         """Cancel transaction - equivalent to C# bCancelTransaction"""
         try:
-            if row_index < 0 or row_index >= self.table_widget.rowCount():
+            if row_index < 0 or row_index >= len(self.custom_sales_data_list):
                 return False
-            
+
             # Get row number from data to cancel all related rows
-            if row_index >= len(self.custom_sales_data_list):
-                return False
-                
-            row_data = self.custom_sales_data_list[row_index]
-            row_number = row_data.row_number
-            
+            row_number = self.custom_sales_data_list[row_index].row_number
+
             # Cancel all rows with the same row number
-            for row in range(self.table_widget.rowCount()):
-                if row < len(self.custom_sales_data_list):
-                    current_row_data = self.custom_sales_data_list[row]
-                    if current_row_data.row_number == row_number:
-                        self._apply_canceled_style(row)
-                        # Mark as canceled in data
-                        current_row_data.is_canceled = True
-            
+            for row, current_row_data in enumerate(self.custom_sales_data_list):
+                if current_row_data.row_number == row_number:
+                    # Mark as canceled in data; the model draws the strikethrough style
+                    current_row_data.is_canceled = True
+                    self.model.mark_dirty(row)
+
             return True
-            
+
         except Exception as e:
             logger.error("Error canceling transaction: %s", e)
             return False
-    
+
     def repeat_transaction(self, row_index: int) -> bool:
         """
         Repeat a transaction by adding a duplicate row with the same quantity.
-        
+
         This method implements the "repeat" functionality by:
         1. Getting the sales data from the selected row
         2. Creating a new SalesData object with the same properties
         3. Adding it as a new row to the table
         4. Refreshing all subtotal calculations
-        
+
         Only works on product rows (PLU/DEPARTMENT) that are not canceled.
         If a row has 5 items, repeating it will add another row with 5 items.
-        
+
         Args:
             row_index: Index of the row to repeat
-            
+
         Returns:
             bool: True if transaction was successfully repeated, False if row is invalid,
                   not a product, or already canceled
         """
         try:
             # Validate row index
-            if row_index < 0 or row_index >= self.table_widget.rowCount():
-                return False
-            
-            # Get the sales data for this row
-            if row_index >= len(self.custom_sales_data_list):
+            if row_index < 0 or row_index >= len(self.custom_sales_data_list):
                 return False
-                
+
             current_data = self.custom_sales_data_list[row_index]
-            
+
             # Only allow repeat on actual product rows
             if current_data.transaction_type not in ["PLU", "DEPARTMENT"]:
                 return False
-            
+
             # Don't repeat canceled items
             if current_data.is_canceled:
                 return False
-            
+
             # Create a new SalesData object with the same properties
             new_sales_data = SalesData()
             new_sales_data.reference_id = current_data.reference_id
@@ -924,90 +864,85 @@ class SaleList(QWidget):
             new_sales_data.total_amount = current_data.total_amount  # Same total
             new_sales_data.is_canceled = False
             new_sales_data.discount_surcharge_datamodel_list = current_data.discount_surcharge_datamodel_list
-            
+
             # Add the new row using the existing add method
             success = self.add_sale_with_data(new_sales_data)
-            
+
             if success:
                 # Recalculate subtotals since a new product was added
                 self.update_subtotals()
-            
+
             return success
-            
+
         except Exception as e:
             logger.error("Error repeating transaction: %s", e)
             return False
-    
+
     def error_correction(self, row_index: int) -> bool:
         """
         Apply error correction to a specific row.
-        
+
         This method marks a row as corrected by applying strikethrough formatting
         and setting its canceled status. Unlike delete_transaction, this method
         is specifically for error correction scenarios.
-        
+
         Args:
             row_index: Index of the row to mark as error-corrected
-            
+
         Returns:
             bool: True if error correction was applied successfully
         """
         try:
-            if row_index < 0 or row_index >= self.table_widget.rowCount():
+            if row_index < 0 or row_index >= len(self.custom_sales_data_list):
                 return False
-                
-            self._apply_canceled_style(row_index)
-            
-            # Mark as canceled in data
-            if row_index < len(self.custom_sales_data_list):
-                self.custom_sales_data_list[row_index].is_canceled = True
-            
+
+            # Mark as canceled in data; the model draws the strikethrough style
+            self.custom_sales_data_list[row_index].is_canceled = True
+            self.model.mark_dirty(row_index)
+
             return True
-            
+
         except Exception as e:
             logger.error("Error in error correction: %s", e)
             return False
-    
-    def _apply_canceled_style(self, row_index: int):
-        """Apply canceled/strikethrough style to a row"""
-        try:
-            # Create strikethrough font
-            font = QFont()
-            font.setStrikeOut(True)
-            
-            # Apply gray colors and strikethrough to all cells in row
-            for col in range(self.table_widget.columnCount()):
-                item = self.table_widget.item(row_index, col)
-                if item:
-                    item.setBackground(QColor(211, 211, 211))  # Light gray
-                    item.setForeground(QColor(245, 245, 245))  # White smoke
-                    item.setFont(font)
-                    
-        except Exception as e:
-            logger.error("Error applying canceled style: %s", e)
-    
+
+    def _select_row_later(self, row_index: int):
+        """Select and reveal ``row_index`` on the next event loop tick."""
+        self.selected_index = row_index
+        self._pending_selection = row_index
+        if not self._selection_timer.isActive():
+            self._selection_timer.start()
+
+    def _apply_pending_selection(self):
+        row_index = self._pending_selection
+        self._pending_selection = None
+        if row_index is None or row_index >= self.model.rowCount():
+            return
+        self.table_view.selectRow(row_index)
+        self.table_view.scrollTo(self.model.index(row_index, 0))
+
     def move_selection_up(self):
         """
         Move the selection up by one row.
-        
+
         This method provides keyboard navigation support by moving the selection
         to the previous row and ensuring it's visible in the table view.
         Does nothing if already at the top row or table is empty.
         """
-        if self.table_widget.rowCount() > 0 and self.selected_index > 0:
+        if self.model.rowCount() > 0 and self.selected_index > 0:
             self.selected_index -= 1                                               # Update internal tracking
-            self.table_widget.selectRow(self.selected_index)                      # Update table selection
-            self.table_widget.scrollToItem(self.table_widget.item(self.selected_index, 0))  # Ensure visibility
-    
+            self.table_view.selectRow(self.selected_index)                        # Update table selection
+            self.table_view.scrollTo(self.model.index(self.selected_index, 0))    # Ensure visibility
+
     def move_selection_down(self):
         """
         Move the selection down by one row.
-        
+
         This method provides keyboard navigation support by moving the selection
         to the next row and ensuring it's visible in the table view.
         Does nothing if already at the bottom row or table is empty.
         """
-        if self.table_widget.rowCount() > 0 and self.selected_index < self.table_widget.rowCount() - 1:
+        if self.model.rowCount() > 0 and self.selected_index < self.model.rowCount() - 1:
             self.selected_index += 1                                               # Update internal tracking
-            self.table_widget.selectRow(self.selected_index)                      # Update table selection
-            self.table_widget.scrollToItem(self.table_widget.item(self.selected_index, 0))  # Ensure visibility
+            self.table_view.selectRow(self.selected_index)                        # Update table selection
+            self.table_view.scrollTo(self.model.index(self.selected_index, 0))    # Ensure visibility
@@ -0,0 +1,242 @@
+"""
+SaleFlex.PyPOS - Point of Sale Application
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QFont, QColor
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Column order shown by SaleList (Ref ID is hidden)
+COL_REFERENCE_ID = 0
+COL_TRANSACTION_TYPE = 1
+COL_TRANSACTION = 2
+COL_NAME_OF_PRODUCT = 3
+COL_UNIT_QUANTITY = 4
+COL_UNIT = 5
+COL_PRICE = 6
+COL_TOTAL_AMOUNT = 7
+
+HEADERS = ["Ref ID", "Type", "Transaction", "Product Name", "Unit Qty", "Unit", "Price", "Total"]
+
+# Fields compared by sync_rows to decide whether a kept row needs a redraw
+_DISPLAY_FIELDS = (
+    "reference_id", "transaction_type", "transaction", "name_of_product", "barcode",
+    "plu_no", "department_no", "id", "quantity", "unit_quantity", "unit", "price",
+    "total_amount", "is_canceled",
+)
+
+_CANCELED_BACKGROUND = QColor(211, 211, 211)  # Light gray
+_CANCELED_FOREGROUND = QColor(245, 245, 245)  # White smoke
+
+
+def _row_key(data) -> Tuple[Any, ...]:
+    """Identity of a row across document refreshes."""
+    if data.reference_id:
+        return data.transaction_type, str(data.reference_id)
+    return data.transaction_type, data.transaction, data.name_of_product
+
+
+class SaleListModel(QAbstractTableModel):
+    """
+    Table model over the ``SalesData`` rows of a SaleList.
+
+    Inserts and removals are announced row by row as they happen. Value changes
+    (totals, cancel flags, subtotal recalculation) only mark rows dirty; a single
+    ``dataChanged`` covering the dirty range is emitted on the next event loop tick,
+    so any number of edits in one handler cost one repaint.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[Any] = []
+
+        self._dirty_first: Optional[int] = None
+        self._dirty_last: Optional[int] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self._strike_font = QFont()
+        self._strike_font.setStrikeOut(True)
+
+    # ── QAbstractTableModel ─────────────────────────────────────────────
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(HEADERS):
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self._display_text(row, index.column())
+        if row.is_canceled:
+            if role == Qt.BackgroundRole:
+                return _CANCELED_BACKGROUND
+            if role == Qt.ForegroundRole:
+                return _CANCELED_FOREGROUND
+            if role == Qt.FontRole:
+                return self._strike_font
+        return None
+
+    @staticmethod
+    def _display_text(row, column: int) -> str:
+        if column == COL_REFERENCE_ID:
+            return str(row.reference_id)
+        if column == COL_TRANSACTION_TYPE:
+            return row.transaction_type
+        if column == COL_TRANSACTION:
+            return row.transaction
+        if column == COL_NAME_OF_PRODUCT:
+            return row.name_of_product
+        if column == COL_UNIT_QUANTITY:
+            # Subtotal rows only show their total
+            return "" if row.transaction_type == "SUBTOTAL" else row.unit_quantity
+        if column == COL_UNIT:
+            return "" if row.transaction_type == "SUBTOTAL" else str(row.unit)
+        if column == COL_PRICE:
+            return "" if row.transaction_type == "SUBTOTAL" else f"{row.price:.2f}"
+        if column == COL_TOTAL_AMOUNT:
+            return f"{row.total_amount:.2f}"
+        return ""
+
+    # ── Row-level changes ───────────────────────────────────────────────
+
+    def append_row(self, data) -> int:
+        """Append one row and return its index."""
+        row_index = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row_index, row_index)
+        self.rows.append(data)
+        self.endInsertRows()
+        return row_index
+
+    def insert_rows(self, row_index: int, items: List[Any]) -> None:
+        if not items:
+            return
+        self.beginInsertRows(QModelIndex(), row_index, row_index + len(items) - 1)
+        self.rows[row_index:row_index] = items
+        self.endInsertRows()
+
+    def remove_rows(self, row_index: int, count: int = 1) -> None:
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row_index, row_index + count - 1)
+        del self.rows[row_index:row_index + count]
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        if not self.rows:
+            return
+        self.beginResetModel()
+        self.rows.clear()
+        self._dirty_first = self._dirty_last = None
+        self.endResetModel()
+
+    def mark_dirty(self, row_index: int) -> None:
+        """Schedule a repaint of ``row_index`` for the next event loop tick."""
+        if row_index < 0 or row_index >= len(self.rows):
+            return
+        if self._dirty_first is None:
+            self._dirty_first = self._dirty_last = row_index
+        else:
+            self._dirty_first = min(self._dirty_first, row_index)
+            self._dirty_last = max(self._dirty_last, row_index)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Emit the pending ``dataChanged`` now."""
+        self._flush_timer.stop()
+        first, last = self._dirty_first, self._dirty_last
+        self._dirty_first = self._dirty_last = None
+        if first is None or not self.rows:
+            return
+        last = min(last, len(self.rows) - 1)
+        if first > last:
+            return
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(HEADERS) - 1))
+
+    def sync_rows(self, new_rows: List[Any], key: Callable[[Any], Tuple[Any, ...]] = _row_key) -> bool:
+        """
+        Make the model show ``new_rows`` with the fewest row notifications.
+
+        Rows are matched by ``key`` in order: matching rows keep their object and are
+        only repainted when a displayed value changed, rows missing from ``new_rows``
+        are removed and new ones are inserted in runs. Returns True when rows were
+        inserted or removed.
+        """
+        wanted = {key(r) for r in new_rows}
+        structural = False
+        i = j = 0
+        run: List[Any] = []
+
+        def insert_run():
+            nonlocal i, run, structural
+            if run:
+                self.insert_rows(i, run)
+                i += len(run)
+                run = []
+                structural = True
+
+        while j < len(new_rows):
+            new = new_rows[j]
+            if not run and i < len(self.rows):
+                old = self.rows[i]
+                if key(old) == key(new):
+                    if any(getattr(old, f) != getattr(new, f) for f in _DISPLAY_FIELDS):
+                        for f in _DISPLAY_FIELDS:
+                            setattr(old, f, getattr(new, f))
+                        old.discount_surcharge_datamodel_list = new.discount_surcharge_datamodel_list
+                        self.mark_dirty(i)
+                    i += 1
+                    j += 1
+                    continue
+                if key(old) not in wanted:
+                    self.remove_rows(i)
+                    structural = True
+                    continue
+            if run and i < len(self.rows) and key(self.rows[i]) == key(new):
+                insert_run()
+                continue
+            run.append(new)
+            j += 1
+        insert_run()
+
+        if i < len(self.rows):
+            self.remove_rows(i, len(self.rows) - i)
+            structural = True
+
+        for n, r in enumerate(self.rows, start=1):
+            r.row_number = n
+        return structural
+
+
+__all__ = ["SaleListModel"]
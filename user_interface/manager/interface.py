@@ -23,6 +23,15 @@ from data_layer.model import Form
 from data_layer.enums import FormName
 
 
+# Forms visited many times per sale: their widget trees are built once and
+# parked/restored on navigation instead of being destroyed and recreated.
+KEEP_ALIVE_FORMS = frozenset({
+    FormName.SALE.name,
+    FormName.PAYMENT.name,
+    FormName.MAIN_MENU.name,
+})
+
+
 class Interface:
     """
     User Interface Manager for SaleFlex POS.
@@ -41,6 +50,35 @@ class Interface:
         self.app = app
         self.window = BaseWindow(app=self.app)
         self.active_dialogs = []  # Track modal dialogs
+        self._drawn_layout = None  # FormLayout currently shown in the main window
+        self._drawn_stamp = None   # its keep-alive stamp, taken when it was drawn
+
+    def _form_layout(self, form_id=None, form_name=None):
+        """Compiled layout of a form, from the application's layout cache when available."""
+        if hasattr(self.app, "form_layout"):
+            return self.app.form_layout(form_id=form_id, form_name=form_name)
+        return DynamicFormRenderer(form_id=form_id, form_name=form_name).compile()
+
+    @staticmethod
+    def _keep_alive_key(layout):
+        """Key under which ``layout``'s widgets are kept alive, or None for ordinary forms."""
+        if layout is None or layout.form is None or layout.form.name not in KEEP_ALIVE_FORMS:
+            return None
+        return str(layout.form.id)
+
+    def _keep_alive_stamp(self, layout):
+        """
+        What a kept form's widgets depend on besides the layout: the logged-in
+        cashier (admin-only buttons) and the product data (PLU captions).
+        """
+        cashier = getattr(self.app, "cashier_data", None)
+        if cashier is not None and hasattr(cashier, "unwrap"):
+            cashier = cashier.unwrap()
+        return (
+            layout,
+            str(getattr(cashier, "id", None)),
+            getattr(self.app, "product_data_version", 0),
+        )
 
     def draw(self, form_id=None, form_name=None, skip_history_update=False):
         """
@@ -53,16 +91,16 @@ class Interface:
             form_name (str): The name of the form to draw
             skip_history_update (bool): If True, don't update form history (used for back navigation)
         """
-        renderer = DynamicFormRenderer(form_id=form_id, form_name=form_name)
+        layout = self._form_layout(form_id=form_id, form_name=form_name)
         
         # Update CurrentStatus with form information
-        if renderer.form:
+        if layout.form:
             # Set current_form_id
-            self.app.current_form_id = renderer.form.id
+            self.app.current_form_id = layout.form.id
             
             # Set current_form_type based on form name
             try:
-                form_name_enum = FormName[renderer.form.name.upper()]
+                form_name_enum = FormName[layout.form.name.upper()]
                 
                 # Only update if it's different from current, or if skip_history_update is False
                 if skip_history_update:
@@ -76,18 +114,34 @@ class Interface:
                 # If form name doesn't match enum, try to keep current or set to NONE
                 pass
         
-        self.window.draw_window(renderer.settings, renderer.toolbar_settings, renderer.design)
+        keep_alive_key = self._keep_alive_key(layout)
+        stamp = self._keep_alive_stamp(layout) if keep_alive_key else None
+        restored = keep_alive_key is not None and self.window.restore_form(
+            keep_alive_key, stamp, layout.settings, layout.toolbar_settings
+        )
+        if not restored:
+            self.window.draw_window(layout.settings, layout.toolbar_settings, layout.design,
+                                    keep_alive_key=keep_alive_key)
+        self._drawn_layout, self._drawn_stamp = layout, stamp
         self.window.show()
         self.window.focus_text_box()
 
         # After widgets exist: sync AMOUNTSTABLE, PAYMENTLIST, and (on SALE) SALESLIST from
         # document_data so PAYMENT↔SALE navigation and BACK keep the same ticket state in view.
-        if renderer.form and getattr(self.app, "login_succeed", False):
-            fname = renderer.form.name
+        # A restored form already has its widgets, so its bindings are refreshed right away;
+        # without an active ticket it is emptied like a freshly drawn form.
+        bound = False
+        if layout.form and getattr(self.app, "login_succeed", False):
+            fname = layout.form.name
             if fname in (FormName.SALE.name, FormName.PAYMENT.name):
-                from PySide6.QtCore import QTimer
+                if restored:
+                    bound = self.app._update_sale_screen_controls()
+                else:
+                    from PySide6.QtCore import QTimer
 
-                QTimer.singleShot(100, self.app._update_sale_screen_controls)
+                    QTimer.singleShot(100, self.app._update_sale_screen_controls)
+        if restored and not bound:
+            self.window.reset_form_data()
 
     def redraw(self, form_id=None, form_name=None, skip_history_update=False):
         """
@@ -100,7 +154,10 @@ class Interface:
             form_name (str): The name of the form to draw
             skip_history_update (bool): If True, don't update form history (used for back navigation)
         """
-        self.window.clear()
+        current, stamp = self._drawn_layout, self._drawn_stamp
+        self._drawn_layout = self._drawn_stamp = None
+        if not self.window.park_form(self._keep_alive_key(current), stamp):
+            self.window.clear()
         self.draw(form_id=form_id, form_name=form_name, skip_history_update=skip_history_update)
     
     def show_modal(self, form_id=None, form_name=None):
@@ -114,11 +171,11 @@ class Interface:
         Returns:
             int: Dialog result code (QDialog.Accepted or QDialog.Rejected)
         """
-        renderer = DynamicFormRenderer(form_id=form_id, form_name=form_name)
+        layout = self._form_layout(form_id=form_id, form_name=form_name)
         
         # Create and configure dialog
         dialog = DynamicDialog(self.app, parent=self.window)
-        dialog.draw_window(renderer.settings, renderer.toolbar_settings, renderer.design)
+        dialog.draw_window(layout.settings, layout.toolbar_settings, layout.design)
         dialog.focus_text_box()
         
         # Track active dialog
@@ -16,11 +16,27 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
 from data_layer.model import Form, FormControl
 from data_layer.model.definition.form_control_tab import FormControlTab
 from data_layer.enums import FormName
 
 
+@dataclass(frozen=True)
+class FormLayout:
+    """
+    A form compiled for drawing: the ``Form`` record plus the ``settings``,
+    ``toolbar_settings`` and ``design`` passed to ``draw_window``. Layouts are
+    cached and shared between draws, so callers must not modify them.
+    """
+    form: Any
+    settings: Dict[str, Any]
+    toolbar_settings: Optional[Dict[str, Any]]
+    design: List[Dict[str, Any]]
+
+
 class DynamicFormRenderer:
     """
     Renders forms dynamically from database definitions.
@@ -30,32 +46,72 @@ class DynamicFormRenderer:
     with BaseWindow.draw_window().
     """
     
-    def __init__(self, form_id=None, form_name=None):
+    def __init__(self, form_id=None, form_name=None, pos_data=None):
         """
         Initialize the renderer with either form_id or form_name.
         
         Args:
             form_id (UUID): The UUID of the form to render
             form_name (str): The name of the form to render
+            pos_data (dict): Optional ``CurrentData.pos_data`` cache; when it holds
+                             the form, its controls (and tabs) are taken from there
+                             instead of the database
         """
         self.form = None
         self.controls = []
-        
+        self._tabs_by_control = None
+
+        if pos_data and pos_data.get("Form") and "FormControl" in pos_data:
+            self._load_from_cache(pos_data, form_id, form_name)
+
         # Load form from database
-        if form_id:
-            self.form = Form.get_by_id(form_id)
-        elif form_name:
-            forms = Form.filter_by(name=form_name, is_deleted=False)
-            if forms and len(forms) > 0:
-                self.form = forms[0]
-        
-        # Load form controls if form was found
-        if self.form:
-            self.controls = FormControl.filter_by(
-                fk_form_id=self.form.id, 
-                is_deleted=False,
-                is_visible=True
-            )
+        if self.form is None:
+            if form_id:
+                self.form = Form.get_by_id(form_id)
+            elif form_name:
+                forms = Form.filter_by(name=form_name, is_deleted=False)
+                if forms and len(forms) > 0:
+                    self.form = forms[0]
+
+            # Load form controls if form was found
+            if self.form:
+                self.controls = FormControl.filter_by(
+                    fk_form_id=self.form.id,
+                    is_deleted=False,
+                    is_visible=True
+                )
+
+        self._controls_by_id = {control.id: control for control in self.controls}
+
+    def _load_from_cache(self, pos_data, form_id, form_name):
+        """Resolve the form, its visible controls and tabs from ``pos_data``."""
+        for form in pos_data["Form"]:
+            if form.is_deleted:
+                continue
+            if (form_id and str(form.id) == str(form_id)) or (not form_id and form_name and form.name == form_name):
+                self.form = form
+                break
+        if self.form is None:
+            return
+
+        self.controls = [
+            control for control in pos_data["FormControl"]
+            if control.fk_form_id == self.form.id and not control.is_deleted and control.is_visible
+        ]
+        if "FormControlTab" in pos_data:
+            self._tabs_by_control = {}
+            for tab in pos_data["FormControlTab"]:
+                if not tab.is_deleted and tab.is_visible:
+                    self._tabs_by_control.setdefault(tab.fk_form_control_id, []).append(tab)
+
+    def compile(self) -> FormLayout:
+        """Build the form's settings, toolbar settings and design list once."""
+        return FormLayout(
+            form=self.form,
+            settings=self.settings,
+            toolbar_settings=self.toolbar_settings,
+            design=self.design,
+        )
     
     @property
     def settings(self):
@@ -239,14 +295,17 @@ class DynamicFormRenderer:
             list[dict]: Each dict has keys id, tab_index, tab_title, tab_tooltip,
                         back_color, fore_color.
         """
-        try:
-            tabs = FormControlTab.filter_by(
-                fk_form_control_id=control_id,
-                is_deleted=False,
-                is_visible=True,
-            )
-        except Exception:
-            tabs = []
+        if self._tabs_by_control is not None:
+            tabs = self._tabs_by_control.get(control_id, [])
+        else:
+            try:
+                tabs = FormControlTab.filter_by(
+                    fk_form_control_id=control_id,
+                    is_deleted=False,
+                    is_visible=True,
+                )
+            except Exception:
+                tabs = []
 
         return [
             {
@@ -395,10 +454,7 @@ class DynamicFormRenderer:
         Returns:
             FormControl or None: The found control or None
         """
-        for control in self.controls:
-            if control.id == control_id:
-                return control
-        return None
+        return self._controls_by_id.get(control_id)
     
     def _get_default_settings(self):
         """
@@ -22,12 +22,29 @@ from PySide6.QtWidgets import QMainWindow
 from core.logger import get_logger
 
 logger = get_logger(__name__)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject
 from PySide6.QtGui import QIcon, QColor, QLinearGradient, QBrush, QPalette
 
 from user_interface.control import TextBox, CheckBox, Button, ToolBar, StatusBar, NumPad, PaymentList, SaleList, ComboBox, AmountTable, Label, DataGrid, Panel, TabControl
 from user_interface.control import VirtualKeyboard
 
+# Control types owned by a drawn form (removed by clear(), hidden by park_form())
+_FORM_CONTROL_TYPES = (TextBox, CheckBox, Button, Label, ToolBar, StatusBar, NumPad, PaymentList,
+                       SaleList, ComboBox, AmountTable, DataGrid, Panel, TabControl)
+# Recreated on every draw: QMainWindow tool/status bars cannot be detached and re-attached
+_REBUILT_CONTROL_TYPES = (ToolBar, StatusBar)
+# Window attributes pointing at one form's widgets
+_FORM_WIDGET_ATTRS = ("sale_list", "payment_list", "amount_table")
+
+
+class _KeptForm:
+    """Controls of a form parked by :meth:`BaseWindow.park_form`."""
+
+    def __init__(self, stamp, widgets, state):
+        self.stamp = stamp
+        self.widgets = widgets      # [(widget, was_visible)] in original stacking order
+        self.state = state          # window attributes restored with the form
+
 
 class BaseWindow(QMainWindow):
     def __init__(self, app):
@@ -45,6 +62,12 @@ class BaseWindow(QMainWindow):
         self._dual_function_buttons = []
         self._func_mode_active = False
 
+        # Keep-alive forms: key of the drawn form, the parked forms and their
+        # (hidden) controls, which children() leaves out
+        self._drawn_key = None
+        self._kept_forms = {}
+        self._parked_widgets = set()
+
         # Set window icon from settings
         self._set_window_icon()
 
@@ -64,8 +87,7 @@ class BaseWindow(QMainWindow):
         for btn in self._dual_function_buttons:
             btn.reset_to_primary_state()
 
-    def draw_window(self, settings: dict, toolbar_settings: dict, design: list):
-        self.setUpdatesEnabled(False)
+    def _apply_form_settings(self, settings: dict, toolbar_settings: dict):
         self.setWindowTitle(settings["name"])
         self.move(0, 0)
         self.setFixedSize(settings["width"], settings["height"])
@@ -79,6 +101,18 @@ class BaseWindow(QMainWindow):
         if settings["statusbar"]:
             self._create_status_bar()
 
+    def draw_window(self, settings: dict, toolbar_settings: dict, design: list, keep_alive_key=None):
+        """
+        Build the form's controls from ``design``.
+
+        Args:
+            keep_alive_key: Set for forms whose widget tree is kept between visits;
+                            the controls can then be parked with :meth:`park_form`
+                            instead of being destroyed by :meth:`clear`.
+        """
+        self.setUpdatesEnabled(False)
+        self._apply_form_settings(settings, toolbar_settings)
+
         # Always reset panels/tab dictionaries at the start of each draw so stale
         # references from a previous form do not leak into the new one.
         self._panels = {}
@@ -86,6 +120,9 @@ class BaseWindow(QMainWindow):
         self._tab_pages = {}   # str(tab_id) → QWidget (tab page)
         self._dual_function_buttons = []
         self._func_mode_active = False
+        for attr in _FORM_WIDGET_ATTRS:
+            setattr(self, attr, None)
+        self._drawn_key = keep_alive_key
 
         for control_design_data in design:
             if control_design_data["type"] == "textbox":
@@ -288,15 +325,151 @@ class BaseWindow(QMainWindow):
         if hasattr(self, '_tab_controls'):
             self._tab_controls.clear()
 
+        self._delete_controls(_FORM_CONTROL_TYPES)
+        self._drawn_key = None
+        self.hide()
+
+    def _delete_controls(self, types):
         for item in list(self.children()):
-            if type(item) in [TextBox, CheckBox, Button, Label, ToolBar, StatusBar, NumPad, PaymentList, SaleList, ComboBox, AmountTable, DataGrid, Panel, TabControl]:
+            if type(item) in types:
                 try:
                     item.blockSignals(True)
                     item.setParent(None)
                     item.deleteLater()
                 except RuntimeError:
                     pass
-        self.hide()
+
+    # ------------------------------------------------------------------ #
+    # Keep-alive forms                                                     #
+    # ------------------------------------------------------------------ #
+
+    def children(self):
+        """Child objects of the window, without the controls of parked forms."""
+        items = super().children()
+        if not self._parked_widgets:
+            return items
+        return [item for item in items if item not in self._parked_widgets]
+
+    def findChildren(self, *args, **kwargs):
+        """Recursive child lookup that, like :meth:`children`, skips parked forms."""
+        items = super().findChildren(*args, **kwargs)
+        if not self._parked_widgets:
+            return items
+        return [item for item in items if not self._is_parked(item)]
+
+    def _is_parked(self, item) -> bool:
+        while item is not None and item is not self:
+            if item in self._parked_widgets:
+                return True
+            item = QObject.parent(item)
+        return False
+
+    def park_form(self, key, stamp) -> bool:
+        """
+        Hide the drawn form's controls instead of destroying them, so
+        :meth:`restore_form` can show the form again without rebuilding it.
+
+        Parked controls stay children of the window (re-parenting would re-polish
+        every style sheet) but are hidden and left out of :meth:`children`, so
+        lookups and :meth:`clear` only see the form on screen.
+
+        Only works for the form drawn with ``keep_alive_key=key``; otherwise
+        nothing is parked and False is returned (call :meth:`clear`). ``stamp``
+        identifies what the widgets were built from (layout, cashier, data
+        version); a restore with a different stamp rebuilds the form.
+        """
+        if key is None or self._drawn_key != key:
+            return False
+
+        self.setUpdatesEnabled(False)
+        self._delete_controls(_REBUILT_CONTROL_TYPES)
+        if self.keyboard and not self.keyboard.isHidden():
+            self.keyboard.hide()
+
+        widgets = []
+        for item in self.children():
+            if type(item) in _FORM_CONTROL_TYPES:
+                widgets.append((item, not item.isHidden()))
+                item.hide()
+                self._parked_widgets.add(item)
+        state = {
+            "_panels": self._panels,
+            "_tab_controls": self._tab_controls,
+            "_tab_pages": self._tab_pages,
+            "_dual_function_buttons": self._dual_function_buttons,
+        }
+        for attr in _FORM_WIDGET_ATTRS:
+            state[attr] = getattr(self, attr, None)
+
+        self._kept_forms[key] = _KeptForm(stamp, widgets, state)
+        self._panels, self._tab_controls, self._tab_pages = {}, {}, {}
+        self._dual_function_buttons = []
+        self._drawn_key = None
+        return True
+
+    def restore_form(self, key, stamp, settings: dict, toolbar_settings: dict) -> bool:
+        """
+        Show a form parked under ``key`` again. Returns False (and drops the parked
+        widgets when they are outdated) if the form must be drawn from scratch.
+
+        Input controls come back empty and dual-function buttons in their primary
+        state, as after a fresh draw; lists and tables keep their widgets and are
+        refreshed by the caller's data binding.
+        """
+        kept = self._kept_forms.pop(key, None)
+        if kept is None:
+            return False
+        if kept.stamp != stamp:
+            self._destroy_kept_form(kept)
+            return False
+
+        self.setUpdatesEnabled(False)
+        self._apply_form_settings(settings, toolbar_settings)
+        for item, visible in kept.widgets:
+            self._parked_widgets.discard(item)
+            if type(item) is TextBox:
+                item.blockSignals(True)
+                item.clear()
+                item.blockSignals(False)
+            elif type(item) is NumPad:
+                item.set_text("")
+            if visible:
+                item.show()
+
+        for attr, value in kept.state.items():
+            setattr(self, attr, value)
+        self._reset_all_dual_buttons_to_primary()
+        self._drawn_key = key
+        self.setUpdatesEnabled(True)
+
+        self.keyboard.resize_from_parent()
+        self.keyboard.raise_()
+        return True
+
+    def reset_form_data(self) -> None:
+        """Empty the sale list, payment list and amount table, as after a fresh draw."""
+        if getattr(self, "sale_list", None):
+            self.sale_list.clear_products()
+        if getattr(self, "payment_list", None):
+            self.payment_list.clear_payments()
+        if getattr(self, "amount_table", None):
+            self.amount_table.clear()
+
+    def discard_kept_forms(self) -> None:
+        """Destroy every parked form (called on logout, when their cashier stamp goes stale)."""
+        for kept in self._kept_forms.values():
+            self._destroy_kept_form(kept)
+        self._kept_forms.clear()
+
+    def _destroy_kept_form(self, kept) -> None:
+        for item, _visible in kept.widgets:
+            self._parked_widgets.discard(item)
+            try:
+                item.blockSignals(True)
+                item.setParent(None)
+                item.deleteLater()
+            except RuntimeError:
+                pass
 
     def _create_button(self, design_data):
         # Resolve parent: panel content widget or window
@@ -461,6 +634,8 @@ class BaseWindow(QMainWindow):
         # set_event (regular callback) is left unset for the numpad in the SALE
         # form; other forms that need per-key callbacks can override this.
         numpad.set_enter_event(self.app.event_distributor(design_data["function"]))
+        # Keyboard-wedge scanner bursts are booked in batches where the form supports it.
+        numpad.set_scan_batch_event(self.app.scan_batch_distributor(design_data["function"]))
 
     def _create_payment_list(self, design_data):
         # Ensure payment list has appropriate dimensions
@@ -620,6 +795,10 @@ class BaseWindow(QMainWindow):
             if enter_handler:
                 textbox.enter_function = enter_handler
 
+        # List search boxes query as the user types, off the UI thread
+        from user_interface.window.incremental_search import attach_incremental_search
+        attach_incremental_search(textbox)
+
         # Add to panel if parent exists
         if parent_panel:
             parent_panel.add_child_control(textbox)
@@ -956,63 +1135,15 @@ class BaseWindow(QMainWindow):
 
         if name_key == ControlName.CLOSURE.value:
             try:
-                from data_layer.model import Closure, Cashier
-                closures = Closure.get_all(is_deleted=False)
-                closures = sorted(
-                    closures,
-                    key=lambda c: c.closure_start_time if c.closure_start_time else c.closure_date,
-                    reverse=True
-                )
-
-                datagrid.set_columns([
-                    "Closure No",
-                    "Date",
-                    "Cashier",
-                    "Gross Sales",
-                    "Opening Cash",
-                    "Closing Cash"
-                ])
-
-                data_rows = []
-                closure_ids = []
-                for closure in closures:
-                    cashier_name = ""
-                    if closure.fk_cashier_closed_id:
-                        cashier = Cashier.get_by_id(closure.fk_cashier_closed_id)
-                        if cashier:
-                            cashier_name = cashier.user_name or ""
-
-                    date_str = ""
-                    if closure.closure_start_time:
-                        date_str = closure.closure_start_time.strftime("%Y-%m-%d %H:%M")
-                    elif closure.closure_date:
-                        date_str = closure.closure_date.strftime("%Y-%m-%d")
-
-                    def _num(val):
-                        if val is None:
-                            return "0.00"
-                        return f"{float(val):.2f}"
-
-                    row = [
-                        str(closure.closure_number),
-                        date_str,
-                        cashier_name,
-                        _num(closure.gross_sales_amount),
-                        _num(closure.opening_cash_amount),
-                        _num(closure.closing_cash_amount)
-                    ]
-                    data_rows.append(row)
-                    closure_ids.append(str(closure.id))
-
-                datagrid.set_data(data_rows)
-                datagrid._closure_ids = closure_ids
+                from user_interface.window.datagrid_source import CLOSURE_COLUMNS, closure_list_source
+                datagrid.set_columns(CLOSURE_COLUMNS)
+                datagrid.set_source(closure_list_source())
 
             except Exception as e:
                 import traceback
                 logger.exception("Error loading closure data: %s", e)
                 datagrid.set_columns(["No Data Available"])
                 datagrid.set_data([])
-                datagrid._closure_ids = []
 
         elif name_key == ControlName.CLOSURE_DETAIL_GRID.value:
             self._populate_closure_detail_grid(datagrid)
@@ -1041,7 +1172,6 @@ class BaseWindow(QMainWindow):
             # Start with column headers only; rows are populated by PRODUCT_SEARCH event
             datagrid.set_columns(["Code", "Name", "Short Name", "Sale Price", "Stock"])
             datagrid.set_data([])
-            datagrid._product_ids = []
 
         elif name_key == ControlName.PRODUCT_INFO_GRID.value:
             self._populate_product_info_grid(datagrid)
@@ -1390,69 +1520,30 @@ class BaseWindow(QMainWindow):
         Fill the CLOSURE_RECEIPTS datagrid with transaction heads that belong to
         the closure identified by ``self.app.current_closure_id``.
 
-        Also stores the ordered receipt UUID list as ``datagrid._receipt_ids``.
+        Rows are paged from the database; each row's key is the receipt UUID string.
         """
-        datagrid.set_columns([
-            "Receipt No", "Date/Time", "Type", "Total", "Payment", "Change", "Status"
-        ])
+        from user_interface.window.datagrid_source import CLOSURE_RECEIPTS_COLUMNS, closure_receipts_source
+
+        datagrid.set_columns(CLOSURE_RECEIPTS_COLUMNS)
         closure_id = getattr(self.app, "current_closure_id", None)
         if not closure_id:
             datagrid.set_data([])
-            datagrid._receipt_ids = []
             return
         try:
             from uuid import UUID as _UUID
-            from data_layer.model import Closure, TransactionHead
+            from data_layer.model import Closure
 
             if isinstance(closure_id, str):
                 closure_id = _UUID(closure_id)
             closure = Closure.get_by_id(closure_id)
             if not closure:
                 datagrid.set_data([])
-                datagrid._receipt_ids = []
                 return
 
-            heads = TransactionHead.filter_by(
-                closure_number=closure.closure_number,
-                is_deleted=False,
-            ) or []
-            heads = sorted(
-                heads,
-                key=lambda h: h.transaction_date_time if h.transaction_date_time else h.receipt_number,
-                reverse=False,
-            )
-
-            def _num(val):
-                if val is None:
-                    return "0.00"
-                try:
-                    return f"{float(val):.2f}"
-                except (TypeError, ValueError):
-                    return str(val)
-
-            data_rows = []
-            receipt_ids = []
-            for head in heads:
-                dt_str = ""
-                if head.transaction_date_time:
-                    dt_str = head.transaction_date_time.strftime("%Y-%m-%d %H:%M")
-                data_rows.append([
-                    str(head.receipt_number or ""),
-                    dt_str,
-                    head.document_type or "",
-                    _num(head.total_amount),
-                    _num(head.total_payment_amount),
-                    _num(head.total_change_amount),
-                    head.transaction_status or "",
-                ])
-                receipt_ids.append(str(head.id))
-
-            datagrid.set_data(data_rows)
-            datagrid._receipt_ids = receipt_ids
+            datagrid.set_source(closure_receipts_source(closure.closure_number))
         except Exception as exc:
             logger.exception("[CLOSURE_RECEIPTS_GRID] Error: %s", exc)
             datagrid.set_data([])
-            datagrid._receipt_ids = []
 
     def _populate_closure_receipt_detail_grid(self, datagrid):
         """
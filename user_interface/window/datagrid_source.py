@@ -0,0 +1,330 @@
+"""
+SaleFlex.PyPOS - Point of Sale Application
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from user_interface.control.datagrid import QueryPageSource
+
+
+CLOSURE_COLUMNS = ["Closure No", "Date", "Cashier", "Gross Sales", "Opening Cash", "Closing Cash"]
+CLOSURE_RECEIPTS_COLUMNS = ["Receipt No", "Date/Time", "Type", "Total", "Payment", "Change", "Status"]
+PRODUCT_LIST_COLUMNS = ["Code", "Name", "Short Name", "Sale Price", "Stock"]
+STOCK_INQUIRY_COLUMNS = ["Code", "Name", "Short Name", "Sale Price", "Stock", "Low Stock"]
+CAMPAIGN_LIST_COLUMNS = ["Code", "Name", "Active", "Type id", "Priority", "Coupon"]
+CUSTOMER_LIST_COLUMNS = ["First Name", "Last Name", "Phone", "E-mail", "City"]
+
+
+def _num(val):
+    if val is None:
+        return "0.00"
+    try:
+        return f"{float(val):.2f}"
+    except (TypeError, ValueError):
+        return str(val)
+
+
+def closure_list_source() -> QueryPageSource:
+    """Closures (newest first) with the closing cashier's user name; keys are closure id strings."""
+    from data_layer.model import Closure, Cashier
+
+    def build_query(session):
+        return (
+            session.query(Closure, Cashier.user_name)
+            .outerjoin(Cashier, Cashier.id == Closure.fk_cashier_closed_id)
+            .filter(Closure.is_deleted.is_(False))
+        )
+
+    def to_row(record):
+        closure, cashier_name = record
+        date_str = ""
+        if closure.closure_start_time:
+            date_str = closure.closure_start_time.strftime("%Y-%m-%d %H:%M")
+        elif closure.closure_date:
+            date_str = closure.closure_date.strftime("%Y-%m-%d")
+        return str(closure.id), [
+            str(closure.closure_number),
+            date_str,
+            cashier_name or "",
+            _num(closure.gross_sales_amount),
+            _num(closure.opening_cash_amount),
+            _num(closure.closing_cash_amount),
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[
+            Closure.closure_number,
+            Closure.closure_start_time,
+            Cashier.user_name,
+            Closure.gross_sales_amount,
+            Closure.opening_cash_amount,
+            Closure.closing_cash_amount,
+        ],
+        # closures without a start time fall back to their closure date
+        default_order=[Closure.closure_start_time.desc(), Closure.closure_date.desc()],
+        tie_breaker=Closure.id,
+    )
+
+
+def closure_receipts_source(closure_number) -> QueryPageSource:
+    """Receipts (TransactionHead) of one closure in time order; keys are receipt id strings."""
+    from data_layer.model import TransactionHead
+
+    def build_query(session):
+        return session.query(TransactionHead).filter(
+            TransactionHead.closure_number == closure_number,
+            TransactionHead.is_deleted.is_(False),
+        )
+
+    def to_row(head):
+        dt_str = head.transaction_date_time.strftime("%Y-%m-%d %H:%M") if head.transaction_date_time else ""
+        return str(head.id), [
+            str(head.receipt_number or ""),
+            dt_str,
+            head.document_type or "",
+            _num(head.total_amount),
+            _num(head.total_payment_amount),
+            _num(head.total_change_amount),
+            head.transaction_status or "",
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[
+            TransactionHead.receipt_number,
+            TransactionHead.transaction_date_time,
+            TransactionHead.document_type,
+            TransactionHead.total_amount,
+            TransactionHead.total_payment_amount,
+            TransactionHead.total_change_amount,
+            TransactionHead.transaction_status,
+        ],
+        default_order=[TransactionHead.transaction_date_time, TransactionHead.receipt_number],
+        tie_breaker=TransactionHead.id,
+    )
+
+
+def _product_search(search_term: str):
+    """
+    ``(apply, default_order)`` for searching products by ``search_term``.
+
+    ``apply(query)`` restricts a Product query; with the FTS5 product index every
+    word must prefix-match the name, short name, code, a barcode or the
+    description and ``default_order`` puts the best matches first. Without the
+    index (SQLite lacking FTS5) ``apply`` is None and the order is by name.
+    """
+    from data_layer.model.definition.product import Product
+    from data_layer import product_search
+
+    use_index = bool(search_term) and product_search.match_expression(search_term) is not None
+    if use_index:
+        from data_layer.engine import Engine
+        with Engine().get_session() as session:
+            use_index = product_search.is_available(session)
+    if use_index:
+        return (
+            lambda query: product_search.filter_products(query, Product, search_term),
+            [product_search.search_table.c.rank, Product.name],
+        )
+    return None, [Product.name]
+
+
+def _product_like_filter(search_term: str, like_columns):
+    from sqlalchemy import or_
+
+    like_term = f"%{search_term}%"
+    return lambda query: query.filter(or_(*(c.ilike(like_term) for c in like_columns)))
+
+
+def product_list_source(search_term: str = "") -> QueryPageSource:
+    """
+    Non-deleted products matching ``search_term``; keys are product id strings.
+
+    With the FTS5 product index every word of the term must prefix-match the name,
+    short name, code, a barcode or the description, best matches first. Without it
+    (SQLite lacking FTS5) name / short name are matched with a case-insensitive
+    LIKE and ordered by name.
+    """
+    from data_layer.model.definition.product import Product
+
+    apply, default_order = _product_search(search_term)
+    if apply is None and search_term:
+        apply = _product_like_filter(search_term, [Product.name, Product.short_name])
+
+    def build_query(session):
+        query = session.query(Product).filter(Product.is_deleted.is_(False))
+        return apply(query) if apply else query
+
+    def to_row(p):
+        return str(p.id), [
+            p.code or "",
+            p.name or "",
+            p.short_name or "",
+            str(p.sale_price) if p.sale_price is not None else "",
+            str(p.stock) if p.stock is not None else "",
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[Product.code, Product.name, Product.short_name, Product.sale_price, Product.stock],
+        default_order=default_order,
+        tie_breaker=Product.id,
+    )
+
+
+def stock_inquiry_source(search_term: str = "") -> QueryPageSource:
+    """
+    Non-deleted products matching ``search_term`` with their stock and a low-stock
+    flag; keys are product id strings. Matching is the same as
+    :func:`product_list_source`, with the code included in the LIKE fallback.
+    """
+    from data_layer.model.definition.product import Product
+
+    apply, default_order = _product_search(search_term)
+    if apply is None and search_term:
+        apply = _product_like_filter(search_term, [Product.name, Product.short_name, Product.code])
+
+    def build_query(session):
+        query = session.query(Product).filter(Product.is_deleted.is_(False))
+        return apply(query) if apply else query
+
+    def to_row(p):
+        low_stock_flag = "⚠" if (
+            p.stock is not None
+            and p.min_stock is not None
+            and p.min_stock > 0
+            and p.stock <= p.min_stock
+        ) else ""
+        return str(p.id), [
+            p.code or "",
+            p.name or "",
+            p.short_name or "",
+            str(p.sale_price) if p.sale_price is not None else "0",
+            str(p.stock) if p.stock is not None else "0",
+            low_stock_flag,
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[Product.code, Product.name, Product.short_name, Product.sale_price, Product.stock, None],
+        default_order=default_order,
+        tie_breaker=Product.id,
+    )
+
+
+def campaign_list_source(search_term: str = "") -> QueryPageSource:
+    """Non-deleted campaigns whose code or name contains ``search_term``, by code; keys are campaign id strings."""
+    from sqlalchemy import or_
+    from data_layer.model.definition.campaign import Campaign
+
+    def build_query(session):
+        query = session.query(Campaign).filter(Campaign.is_deleted.is_(False))
+        if search_term:
+            like = f"%{search_term}%"
+            query = query.filter(or_(Campaign.code.ilike(like), Campaign.name.ilike(like)))
+        return query
+
+    def to_row(c):
+        return str(c.id), [
+            c.code or "",
+            c.name or "",
+            "Y" if c.is_active else "N",
+            str(c.fk_campaign_type_id) if c.fk_campaign_type_id else "",
+            str(c.priority) if c.priority is not None else "",
+            "Y" if c.requires_coupon else "N",
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[Campaign.code, Campaign.name, Campaign.is_active, None, Campaign.priority, Campaign.requires_coupon],
+        default_order=[Campaign.code],
+        tie_breaker=Campaign.id,
+    )
+
+
+def customer_list_source(search_term: str = "") -> QueryPageSource:
+    """
+    Active customers (walk-in excluded) matching ``search_term``, by last name
+    then first name; keys are customer id strings.
+
+    With the FTS5 customer index every word must prefix-match a name, last name
+    or e-mail token, and a phone-like term must prefix-match the number as typed
+    or its normalized form. Without it the previous case-insensitive LIKE over
+    name, last name, phone and e-mail (plus an exact normalized phone) is used.
+    """
+    from sqlalchemy import or_
+    from data_layer.model.definition.customer import Customer
+    from data_layer import customer_search
+    from pos.service.loyalty_service import LoyaltyService
+
+    normalized = None
+    if search_term:
+        cc = LoyaltyService.default_phone_country_for_search()
+        normalized = LoyaltyService.normalize_phone(search_term, cc)
+
+    use_index = bool(search_term) and customer_search.match_expression(search_term, normalized) is not None
+    if use_index:
+        from data_layer.engine import Engine
+        with Engine().get_session() as session:
+            use_index = customer_search.is_available(session)
+
+    def build_query(session):
+        query = session.query(Customer).filter(
+            Customer.is_deleted.is_(False),
+            Customer.is_walkin.is_(False),
+        )
+        if use_index:
+            query = customer_search.filter_customers(query, Customer, search_term, normalized)
+        elif search_term:
+            like_term = f"%{search_term}%"
+            or_clauses = [
+                Customer.name.ilike(like_term),
+                Customer.last_name.ilike(like_term),
+                Customer.phone_number.ilike(like_term),
+                Customer.email_address.ilike(like_term),
+            ]
+            if normalized:
+                or_clauses.append(Customer.phone_normalized == normalized)
+            query = query.filter(or_(*or_clauses))
+        return query
+
+    def to_row(c):
+        return str(c.id), [
+            c.name or "",
+            c.last_name or "",
+            c.phone_number or "",
+            c.email_address or "",
+            c.address_line_3 or "",
+        ]
+
+    return QueryPageSource(
+        build_query,
+        to_row,
+        sort_columns=[
+            Customer.name,
+            Customer.last_name,
+            Customer.phone_number,
+            Customer.email_address,
+            Customer.address_line_3,
+        ],
+        default_order=[Customer.last_name, Customer.name],
+        tie_breaker=Customer.id,
+    )
@@ -569,56 +569,28 @@ class DynamicDialog(QDialog):
 
     def _populate_closure_receipts_grid(self, datagrid):
         """Fill the CLOSURE_RECEIPTS grid with transaction heads for the selected closure."""
-        datagrid.set_columns([
-            "Receipt No", "Date/Time", "Type", "Total", "Payment", "Change", "Status"
-        ])
+        from user_interface.window.datagrid_source import CLOSURE_RECEIPTS_COLUMNS, closure_receipts_source
+
+        datagrid.set_columns(CLOSURE_RECEIPTS_COLUMNS)
         closure_id = getattr(self.app, "current_closure_id", None)
         if not closure_id:
             datagrid.set_data([])
-            datagrid._receipt_ids = []
             return
         try:
             from uuid import UUID as _UUID
-            from data_layer.model import Closure, TransactionHead
+            from data_layer.model import Closure
 
             if isinstance(closure_id, str):
                 closure_id = _UUID(closure_id)
             closure = Closure.get_by_id(closure_id)
             if not closure:
                 datagrid.set_data([])
-                datagrid._receipt_ids = []
                 return
 
-            heads = TransactionHead.filter_by(
-                closure_number=closure.closure_number,
-                is_deleted=False,
-            ) or []
-            heads = sorted(
-                heads,
-                key=lambda h: h.transaction_date_time if h.transaction_date_time else h.receipt_number,
-            )
-
-            def _num(val):
-                return "0.00" if val is None else f"{float(val):.2f}"
-
-            data_rows = []
-            receipt_ids = []
-            for head in heads:
-                dt_str = head.transaction_date_time.strftime("%Y-%m-%d %H:%M") if head.transaction_date_time else ""
-                data_rows.append([
-                    str(head.receipt_number or ""), dt_str,
-                    head.document_type or "",
-                    _num(head.total_amount), _num(head.total_payment_amount),
-                    _num(head.total_change_amount), head.transaction_status or "",
-                ])
-                receipt_ids.append(str(head.id))
-
-            datagrid.set_data(data_rows)
-            datagrid._receipt_ids = receipt_ids
+            datagrid.set_source(closure_receipts_source(closure.closure_number))
         except Exception as exc:
             logger.exception("[CLOSURE_RECEIPTS_GRID] Error: %s", exc)
             datagrid.set_data([])
-            datagrid._receipt_ids = []
 
     def _populate_customer_activity_grid(self, datagrid):
         """
@@ -1478,47 +1450,13 @@ class DynamicDialog(QDialog):
 
         if name_key == ControlName.CLOSURE.value:
             try:
-                from data_layer.model import Closure, Cashier
-                closures = Closure.get_all(is_deleted=False)
-                closures = sorted(
-                    closures,
-                    key=lambda c: c.closure_start_time if c.closure_start_time else c.closure_date,
-                    reverse=True
-                )
-                datagrid.set_columns([
-                    "Closure No", "Date", "Cashier",
-                    "Gross Sales", "Opening Cash", "Closing Cash"
-                ])
-                data_rows = []
-                closure_ids = []
-                for closure in closures:
-                    cashier_name = ""
-                    if closure.fk_cashier_closed_id:
-                        cashier = Cashier.get_by_id(closure.fk_cashier_closed_id)
-                        if cashier:
-                            cashier_name = cashier.user_name or ""
-                    date_str = ""
-                    if closure.closure_start_time:
-                        date_str = closure.closure_start_time.strftime("%Y-%m-%d %H:%M")
-                    elif closure.closure_date:
-                        date_str = closure.closure_date.strftime("%Y-%m-%d")
-                    def _num(val):
-                        return "0.00" if val is None else f"{float(val):.2f}"
-                    row = [
-                        str(closure.closure_number), date_str, cashier_name,
-                        _num(closure.gross_sales_amount),
-                        _num(closure.opening_cash_amount),
-                        _num(closure.closing_cash_amount)
-                    ]
-                    data_rows.append(row)
-                    closure_ids.append(str(closure.id))
-                datagrid.set_data(data_rows)
-                datagrid._closure_ids = closure_ids
+                from user_interface.window.datagrid_source import CLOSURE_COLUMNS, closure_list_source
+                datagrid.set_columns(CLOSURE_COLUMNS)
+                datagrid.set_source(closure_list_source())
             except Exception as e:
                 logger.exception("Error loading closure data: %s", e)
                 datagrid.set_columns(["No Data Available"])
                 datagrid.set_data([])
-                datagrid._closure_ids = []
 
         elif name_key == ControlName.CLOSURE_DETAIL_GRID.value:
             self._populate_closure_detail_grid(datagrid)
@@ -0,0 +1,185 @@
+"""
+SaleFlex.PyPOS - Point of Sale Application
+Copyright (C) 2025-2026 Mousavi.Tech
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from core.logger import get_logger
+from data_layer.enums import ControlName
+from user_interface.control.datagrid import DataGrid, DataGridModel, FetchCancelled, QueryPageSource
+from user_interface.window.datagrid_source import (
+    CAMPAIGN_LIST_COLUMNS,
+    CUSTOMER_LIST_COLUMNS,
+    PRODUCT_LIST_COLUMNS,
+    STOCK_INQUIRY_COLUMNS,
+    campaign_list_source,
+    customer_list_source,
+    product_list_source,
+    stock_inquiry_source,
+)
+
+logger = get_logger(__name__)
+
+# Quiet time after the last keystroke before a search is started
+DEBOUNCE_MS = 250
+
+# Search textbox -> (datagrid it fills, page source factory, grid columns)
+SEARCHES: Dict[str, Tuple[str, Callable[[str], QueryPageSource], List[str]]] = {
+    ControlName.PRODUCT_SEARCH_TEXTBOX.value:
+        (ControlName.PRODUCT_LIST_DATAGRID.value, product_list_source, PRODUCT_LIST_COLUMNS),
+    ControlName.CUSTOMER_SEARCH_TEXTBOX.value:
+        (ControlName.CUSTOMER_LIST_DATAGRID.value, customer_list_source, CUSTOMER_LIST_COLUMNS),
+    ControlName.CAMPAIGN_SEARCH_TEXTBOX.value:
+        (ControlName.CAMPAIGN_LIST_DATAGRID.value, campaign_list_source, CAMPAIGN_LIST_COLUMNS),
+    ControlName.STOCK_SEARCH_TEXTBOX.value:
+        (ControlName.STOCK_INQUIRY_DATAGRID.value, stock_inquiry_source, STOCK_INQUIRY_COLUMNS),
+}
+
+# One search thread: a new query queues behind the (interrupted) stale one
+# instead of competing with it for the database.
+_pool: Optional[QThreadPool] = None
+
+
+def _search_pool() -> QThreadPool:
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(1)
+    return _pool
+
+
+class _SearchSignals(QObject):
+    # generation, search term, QueryPageSource, first page
+    finished = Signal(int, str, object, object)
+    failed = Signal(int, str)
+
+
+class _SearchTask(QRunnable):
+    """Builds the page source and reads its first page off the UI thread."""
+
+    def __init__(self, search: "IncrementalSearch", generation: int, term: str):
+        super().__init__()
+        self._search = search
+        self._generation = generation
+        self._term = term
+        # Parentless and held here, so emitting stays safe if the form is gone
+        self.signals = _SearchSignals()
+
+    def run(self):
+        generation = self._generation
+        is_stale = lambda: self._search.generation != generation
+        if is_stale():
+            return
+        try:
+            source = self._search.make_source(self._term)
+            page = source.fetch(0, DataGridModel.PAGE_SIZE + 1, cancelled=is_stale)
+        except FetchCancelled:
+            return
+        except Exception as e:
+            if not is_stale():
+                self.signals.failed.emit(generation, str(e))
+            return
+        if not is_stale():
+            self.signals.finished.emit(generation, self._term, source, page)
+
+
+class IncrementalSearch(QObject):
+    """
+    Search-as-you-type for a search textbox and the DataGrid it fills.
+
+    Every edit restarts a short debounce timer; when typing pauses the query runs
+    on the search thread and its first page is handed to the grid, which pages
+    the rest as it scrolls. Each new search bumps ``generation``, which drops
+    queued stale searches and interrupts a running one inside SQLite, so only
+    the latest term ever reaches the grid.
+    """
+
+    def __init__(self, textbox, grid_name: str, make_source: Callable[[str], QueryPageSource],
+                 columns: List[str], debounce_ms: int = DEBOUNCE_MS):
+        super().__init__(textbox)
+        self.textbox = textbox
+        self.grid_name = grid_name
+        self.make_source = make_source
+        self.columns = columns
+        self.generation = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.search_now)
+        textbox.textChanged.connect(self._on_text_changed)
+
+    def _on_text_changed(self, _text):
+        # Stop the running search at once; the next starts when typing pauses
+        self.generation += 1
+        self._timer.start()
+
+    def _grid(self) -> Optional[DataGrid]:
+        window = self.textbox.window()
+        for grid in window.findChildren(DataGrid) if window else []:
+            if getattr(grid, "name", "") == self.grid_name:
+                return grid
+        return None
+
+    def search_now(self) -> bool:
+        """Start a search for the current text right away. False when the form has no target grid."""
+        self._timer.stop()
+        self.generation += 1
+        if self._grid() is None:
+            return False
+        task = _SearchTask(self, self.generation, self.textbox.text().strip())
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        _search_pool().start(task)
+        return True
+
+    def cancel(self) -> None:
+        """Drop the pending and running search."""
+        self._timer.stop()
+        self.generation += 1
+
+    def _on_finished(self, generation, term, source, page):
+        if generation != self.generation:
+            return
+        grid = self._grid()
+        if grid is None:
+            return
+        grid.set_columns(self.columns)
+        grid.set_source(source, first_page=page)
+        logger.debug("[SEARCH] %s: %s row(s) for '%s'", self.grid_name, grid.grid_model.rowCount(), term)
+
+    def _on_failed(self, generation, message):
+        if generation == self.generation:
+            logger.error("[SEARCH] %s: %s", self.grid_name, message)
+
+
+def attach_incremental_search(textbox) -> Optional[IncrementalSearch]:
+    """
+    Give ``textbox`` search-as-you-type when it is one of the list search boxes
+    (see ``SEARCHES``); the controller is kept as ``textbox.incremental_search``.
+    """
+    entry = SEARCHES.get(getattr(textbox, "name", None) or "")
+    if entry is None:
+        return None
+    grid_name, make_source, columns = entry
+    textbox.incremental_search = IncrementalSearch(textbox, grid_name, make_source, columns)
+    return textbox.incremental_search
+
+
+__all__ = ["DEBOUNCE_MS", "IncrementalSearch", "SEARCHES", "attach_incremental_search"]